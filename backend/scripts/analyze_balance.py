@@ -4,146 +4,414 @@ AWS CTO Game - Balance Analysis Script
 게임 밸런싱 분석 스크립트
 """
 
+import argparse
+import hashlib
 import json
-import statistics
-from typing import Dict, List, Tuple
-from collections import defaultdict
-
-def load_game_data(filepath: str) -> List[Dict]:
-    """게임 데이터 로드"""
-    with open(filepath, 'r', encoding='utf-8') as f:
-        return json.load(f)
-
-def analyze_choice_effects(data: List[Dict]) -> Dict:
-    """선택지 효과 분석"""
-    all_users = []
-    all_cash = []
-    all_trust = []
+import math
+import os
+import random
+import time
+from typing import Dict, List, Optional, Tuple
+from collections import Counter, defaultdict
+
+from game_engine import (
+    CONSTANTS_HASH, DIFFICULTIES, VICTORY_PATHS, VICTORY_STATUS, Choice, GameState, GameStatus, Lumping,
+    Policy, Rules, STRATEGIES, choice_preference, compile_turns, greedy_policy, load_game_data, new_game, play,
+    random_policy, step, weighted_policy,
+)
+from choice_table import load_choice_table
+from stream_stats import RunningStats, StatsTable
+from profiler import PROFILER, add_arguments as add_profile_arguments, enable_from_args, finish_from_args
+
+EFFECT_METRICS = ('users', 'cash', 'trust')
+ALL_CHOICES = ('all',)
+
+# numpy Monte Carlo 가 한 번에 진행하는 게임 수 (게임당 상태 배열 약 200바이트)
+MC_BATCH_SIZE = 200_000
+
+DEFAULT_CACHE = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.cache', 'analysis_cache.json')
+
+def turn_digest(turn_data: Dict) -> str:
+    """턴의 선택지 내용 해시 (텍스트/효과/next_turn 중 하나라도 바뀌면 달라짐)"""
+    payload = json.dumps(turn_data['choices'], sort_keys=True, ensure_ascii=False)
+    return hashlib.sha1(payload.encode('utf-8')).hexdigest()[:16]
+
+class AnalysisCache:
+    """콘텐츠 해시 기반 증분 분석 캐시
+
+    - turns: 턴 선택지 해시 → 턴 통계 (바뀐 턴만 다시 계산)
+    - paths: (상수, 난이도, 전략, 지나온 턴 해시들) 체인 해시 → 그 시점의 게임 상태
+      선택지가 바뀐 턴 이전까지의 경로 접두사는 그대로 재사용하고,
+      바뀐 턴부터만 다시 시뮬레이션합니다.
+    """
 
+    def __init__(self, path: str = None):
+        self.path = path
+        self.turns: Dict[str, Dict] = {}
+        self.paths: Dict[str, Dict] = {}
+        self.hits = defaultdict(int)
+        self.misses = defaultdict(int)
+        self._dirty = False
+        if path and os.path.exists(path):
+            with open(path, 'r', encoding='utf-8') as f:
+                stored = json.load(f)
+            self.turns = stored.get('turns', {})
+            self.paths = stored.get('paths', {})
+
+    def lookup(self, table: str, key: str):
+        value = getattr(self, table).get(key)
+        if value is None:
+            self.misses[table] += 1
+        else:
+            self.hits[table] += 1
+        PROFILER.cache(f'analysis:{table}', value is not None)
+        return value
+
+    def store(self, table: str, key: str, value):
+        getattr(self, table)[key] = value
+        self._dirty = True
+
+    def reset_counters(self):
+        self.hits.clear()
+        self.misses.clear()
+
+    def save(self):
+        if not self.path or not self._dirty:
+            return
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        tmp = self.path + '.tmp'
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump({'turns': self.turns, 'paths': self.paths}, f, ensure_ascii=False)
+        os.replace(tmp, self.path)
+        self._dirty = False
+
+def _turn_effects(turn_data: Dict, cache: AnalysisCache = None) -> StatsTable:
+    """턴 하나의 효과 누산기 — 턴 전체와 카테고리별 그룹 (캐시에 있으면 재사용)"""
+    key = f'stats:{turn_digest(turn_data)}' if cache is not None else None
+    if key is not None:
+        cached = cache.lookup('turns', key)
+        if cached is not None:
+            return StatsTable.from_dict(cached)
+
+    table = StatsTable(EFFECT_METRICS)
+    for choice in turn_data['choices']:
+        table.push((ALL_CHOICES, ('category', choice.get('category') or '-')), choice['effects'])
+
+    if key is not None:
+        cache.store('turns', key, table.to_dict())
+    return table
+
+def analyze_choice_effects(data: List[Dict], cache: AnalysisCache = None) -> Dict:
+    """선택지 효과 분석
+
+    선택지를 한 번만 순회하며 턴별 누산기에 쌓고, 전체/카테고리 통계는
+    턴 누산기를 병합해서 구합니다 (값 목록을 다시 만들거나 정렬하지 않음).
+    """
+    overall = StatsTable(EFFECT_METRICS)
     turn_stats = {}
 
     for turn_data in data:
-        turn_num = turn_data['turn']
-        choices = turn_data['choices']
-
-        turn_users = []
-        turn_cash = []
-        turn_trust = []
-
-        for choice in choices:
-            effects = choice['effects']
-            turn_users.append(effects.get('users', 0))
-            turn_cash.append(effects.get('cash', 0))
-            turn_trust.append(effects.get('trust', 0))
-
-            all_users.append(effects.get('users', 0))
-            all_cash.append(effects.get('cash', 0))
-            all_trust.append(effects.get('trust', 0))
-
-        turn_stats[turn_num] = {
-            'users': {
-                'min': min(turn_users),
-                'max': max(turn_users),
-                'avg': statistics.mean(turn_users),
-                'median': statistics.median(turn_users)
-            },
-            'cash': {
-                'min': min(turn_cash),
-                'max': max(turn_cash),
-                'avg': statistics.mean(turn_cash),
-                'median': statistics.median(turn_cash)
-            },
-            'trust': {
-                'min': min(turn_trust),
-                'max': max(turn_trust),
-                'avg': statistics.mean(turn_trust),
-                'median': statistics.median(turn_trust)
-            },
-            'choice_count': len(choices)
-        }
+        if not turn_data['choices']:
+            continue
+        table = _turn_effects(turn_data, cache)
+        turn_stats[turn_data['turn']] = dict(table.summary(ALL_CHOICES),
+                                             choice_count=len(turn_data['choices']))
+        overall.merge(table)
 
     return {
-        'overall': {
-            'users': {
-                'min': min(all_users),
-                'max': max(all_users),
-                'avg': statistics.mean(all_users),
-                'median': statistics.median(all_users),
-                'stdev': statistics.stdev(all_users) if len(all_users) > 1 else 0
-            },
-            'cash': {
-                'min': min(all_cash),
-                'max': max(all_cash),
-                'avg': statistics.mean(all_cash),
-                'median': statistics.median(all_cash),
-                'stdev': statistics.stdev(all_cash) if len(all_cash) > 1 else 0
-            },
-            'trust': {
-                'min': min(all_trust),
-                'max': max(all_trust),
-                'avg': statistics.mean(all_trust),
-                'median': statistics.median(all_trust),
-                'stdev': statistics.stdev(all_trust) if len(all_trust) > 1 else 0
-            }
-        },
+        'overall': overall.summary(ALL_CHOICES, with_stdev=True),
+        'by_category': {key[1]: dict(overall.summary(key, with_stdev=True),
+                                     choice_count=overall.groups[key]['users'].count)
+                        for key in sorted(k for k in overall.groups if k != ALL_CHOICES)},
         'by_turn': turn_stats
     }
 
-def simulate_path(data: List[Dict], strategy: str) -> Dict:
-    """경로 시뮬레이션
+def _snapshot(state) -> Dict:
+    return {'turn': state.turn, 'users': state.users, 'cash': state.cash,
+            'trust': state.trust, 'status': state.status}
+
+def simulate_path(data: List[Dict], strategy: str, difficulty: str = 'NORMAL',
+                  cache: AnalysisCache = None, max_steps: int = 200) -> Dict:
+    """경로 시뮬레이션 (game_engine 의 GameService 턴 규칙 적용)
 
     Args:
         strategy: 'best_users', 'worst_users', 'best_cash', 'worst_cash',
                   'best_trust', 'balanced'
+        difficulty: 'EASY', 'NORMAL', 'HARD'
+        cache: 주어지면 바뀌지 않은 경로 접두사의 중간 상태를 재사용
     """
-    initial_state = {
-        'users': 0,
-        'cash': 10_000_000,
-        'trust': 50
-    }
-
-    current_state = initial_state.copy()
-    history = [current_state.copy()]
+    rules = Rules(difficulty)
+    turns = compile_turns(data)
+    digests = {t['turn']: turn_digest(t) for t in data} if cache is not None else {}
+    policy = greedy_policy(strategy)
+
+    state = new_game(rules)
+    initial_state = _snapshot(state)
+    chain = f'{CONSTANTS_HASH}:{difficulty}:{strategy}'
+    history = []
+
+    while state.status == GameStatus.PLAYING and state.steps < max_steps:
+        choices = turns.get(state.turn)
+        if not choices:
+            break
+        if PROFILER.enabled:
+            PROFILER.count(f'simulate_path:turn {state.turn}')
+        if cache is not None:
+            chain = hashlib.sha1(f'{chain}:{digests[state.turn]}'.encode('utf-8')).hexdigest()
+            cached = cache.lookup('paths', chain)
+            if cached is not None:
+                state = GameState.from_dict(cached)
+                history.append(_snapshot(state))
+                continue
+        step(state, policy(state, choices), rules)
+        if cache is not None:
+            cache.store('paths', chain, state.to_dict())
+        history.append(_snapshot(state))
 
-    for turn_data in data:
-        choices = turn_data['choices']
-
-        if strategy == 'best_users':
-            choice = max(choices, key=lambda c: c['effects'].get('users', 0))
-        elif strategy == 'worst_users':
-            choice = min(choices, key=lambda c: c['effects'].get('users', 0))
-        elif strategy == 'best_cash':
-            choice = max(choices, key=lambda c: c['effects'].get('cash', 0))
-        elif strategy == 'worst_cash':
-            choice = min(choices, key=lambda c: c['effects'].get('cash', 0))
-        elif strategy == 'best_trust':
-            choice = max(choices, key=lambda c: c['effects'].get('trust', 0))
-        elif strategy == 'balanced':
-            # 균형잡힌 선택: 각 지표를 정규화해서 합산
-            def score(c):
-                users_score = c['effects'].get('users', 0) / 20000  # 정규화
-                cash_score = c['effects'].get('cash', 0) / 1000000  # 정규화
-                trust_score = c['effects'].get('trust', 0) / 10  # 정규화
-                return users_score + cash_score + trust_score
-            choice = max(choices, key=score)
-        else:
-            choice = choices[0]  # 첫 번째 선택
-
-        effects = choice['effects']
-        current_state['users'] += effects.get('users', 0)
-        current_state['cash'] += effects.get('cash', 0)
-        current_state['trust'] += effects.get('trust', 0)
+    return {
+        'strategy': strategy,
+        'difficulty': difficulty,
+        'initial': initial_state,
+        'final': dict(_snapshot(state), grade=state.grade),
+        'history': [initial_state] + history
+    }
 
-        # 신뢰도는 0-100 범위로 제한
-        current_state['trust'] = max(0, min(100, current_state['trust']))
+def _weighted_percentiles(values: List[Tuple[int, int]], percentiles: List[int]) -> Dict[str, int]:
+    values.sort()
+    total = sum(count for _, count in values)
+    result = {}
+    cumulative = 0
+    index = 0
+    for p in percentiles:
+        target = total * p / 100
+        while index < len(values) - 1 and cumulative + values[index][1] < target:
+            cumulative += values[index][1]
+            index += 1
+        result[f'p{p}'] = values[index][0]
+    return result
+
+def _finished(state: GameState, turns: Dict[int, List[Choice]], max_steps: int) -> bool:
+    """play() 의 종료 조건 (승패 판정, 선택지 없는 턴, max_steps 도달)"""
+    return state.status != GameStatus.PLAYING or not turns.get(state.turn) or state.steps >= max_steps
+
+# 정확 모드에서 한 단계에 허용하는 상태 수 (넘으면 StateLimitExceeded — 근사 모드로 다시 실행)
+DEFAULT_MAX_STATES = 250_000
+# 정확 탐색이 상한을 넘을 때 CLI 가 대신 쓰는 근사 버킷 크기
+APPROXIMATE_RESOLUTION = 0.2
+
+class StateLimitExceeded(ValueError):
+    """정확한 경로 탐색의 상태 수가 max_states 를 넘음"""
+
+def enumerate_paths(data: List[Dict], difficulty: str = 'NORMAL', resolution: float = 0.0,
+                    trust_resolution: int = 5, percentiles: Tuple[int, ...] = (10, 25, 50, 75, 90),
+                    turns: Dict[int, List[Choice]] = None, max_steps: int = 200,
+                    max_states: Optional[int] = DEFAULT_MAX_STATES) -> Dict:
+    """next_turn 그래프를 따라 모든 선택 경로의 결과 분포 계산 (game_engine.step 규칙)
+
+    매 step 마다 모든 선택지를 펼치고, 같은 키의 상태는 경로 수와 확률을 더해서 하나로 합칩니다.
+
+    - resolution <= 0 (기본, 정확): 전치 테이블 키는 GameState.key() — 턴/유저/현금/신뢰도/인프라와
+      규칙이 보는 나머지 필드가 모두 같은 상태만 합치므로 모든 경로에 대해 정확한 분포/최소/최대입니다.
+      한 단계의 상태 수가 max_states 를 넘으면 StateLimitExceeded 를 냅니다.
+    - resolution > 0 (근사): game_engine.Lumping 키로 버킷이 같은 상태를 처음 들어온 대표 상태로
+      합칩니다. 결과는 버킷 크기만큼의 근사 오차가 있으며 report['exact'] 가 False 입니다.
+
+    지배 상태 가지치기(유저/현금/신뢰도가 모두 작은 상태 제거)는 쓰지 않습니다. 엔진 규칙은 이 세 값에
+    단조롭지 않아서(수확 체감, 역전 배율, 용량 초과 페널티) 가지치기가 실제 최소/최대 경로를 지울 수 있습니다.
+
+    - status: 경로 수 기준 비율 (선택지가 많은 긴 게임일수록 경로 수가 많아 비중이 큼)
+    - random_status: 매 턴 균등 무작위로 고를 때의 확률 (Monte Carlo random 정책과 같은 기준)
 
-        history.append(current_state.copy())
+    Args:
+        resolution: 유저/현금 버킷의 상대 크기 (0 = 정확, 0.2 = 20% 근사)
+        trust_resolution: 근사 모드의 신뢰도 버킷 크기
+        turns: 미리 컴파일된 {턴: [Choice, ...]} (없으면 data 에서 컴파일)
+        max_states: 정확 모드의 단계별 상태 수 상한 (None 이면 제한 없음)
+    """
+    rules = Rules(difficulty)
+    turns = turns or compile_turns(data)
+    exact = resolution <= 0
+    # 같은 단계(BFS 층)의 상태는 steps 가 모두 같으므로 steps 없는 키로 합쳐도 됨
+    key_of = GameState.key if exact else Lumping(rules, resolution, trust_resolution).key
+
+    # 전치 테이블: 키 → [대표 상태, 경로 수, 균등 무작위 확률]
+    initial = new_game(rules)
+    frontier = {None: [initial, 1, 1.0]}
+    outcomes = {'users': [], 'cash': [], 'trust': []}
+    statuses = Counter()
+    probabilities = defaultdict(float)
+    total_paths = 0
+    expanded = 0
+    peak_states = 1
+
+    if _finished(initial, turns, max_steps):
+        frontier = {}
+        statuses[initial.status] = total_paths = 1
+        probabilities[initial.status] = 1.0
+        for metric in outcomes:
+            outcomes[metric].append((getattr(initial, metric), 1))
+
+    while frontier:
+        merged = {}
+        for state, count, probability in frontier.values():
+            expanded += 1
+            choices = turns[state.turn]
+            probability /= len(choices)
+            for choice in choices:
+                next_state = step(state.copy(), choice, rules)
+                if _finished(next_state, turns, max_steps):
+                    total_paths += count
+                    statuses[next_state.status] += count
+                    probabilities[next_state.status] += probability
+                    for metric in outcomes:
+                        outcomes[metric].append((getattr(next_state, metric), count))
+                    continue
+                key = key_of(next_state)
+                entry = merged.get(key)
+                if entry is None:
+                    if exact and max_states is not None and len(merged) >= max_states:
+                        raise StateLimitExceeded(
+                            f'정확한 경로 탐색이 {state.steps + 1}단계에서 상태 {max_states:,}개를 넘었습니다 '
+                            f'(resolution > 0 으로 근사 탐색)')
+                    merged[key] = [next_state, count, probability]
+                else:
+                    entry[1] += count
+                    entry[2] += probability
+        frontier = merged
+        peak_states = max(peak_states, len(frontier))
+
+    report = {
+        'difficulty': difficulty,
+        'exact': exact,
+        'resolution': None if exact else resolution,
+        'trust_resolution': None if exact else trust_resolution,
+        'total_paths': total_paths,
+        'peak_states': peak_states,
+        'expanded_states': expanded,
+        'status': {status: count / total_paths for status, count in statuses.most_common()},
+        'random_status': dict(sorted(probabilities.items(), key=lambda item: -item[1])),
+    }
+    for metric in ('users', 'cash', 'trust'):
+        values = outcomes[metric]
+        report[metric] = {'min': min(v for v, _ in values), 'max': max(v for v, _ in values)}
+        report[metric].update(_weighted_percentiles(values, list(percentiles)))
+    return report
+
+def softmax_weights(turns: Dict[int, List[Choice]], strategy: str, sharpness: float) -> Dict:
+    """선택지 id → 전략 점수의 softmax 가중치 (sharpness 가 클수록 탐욕적)"""
+    weights = {}
+    for choices in turns.values():
+        if not choices:
+            continue
+        scores = [choice_preference(choice, strategy) for choice in choices]
+        spread = (max(scores) - min(scores)) or 1.0
+        for choice, score in zip(choices, scores):
+            weights[choice.id] = math.exp(sharpness * (score - max(scores)) / spread)
+    return weights
+
+def softmax_policy(rng, turns: Dict[int, List[Choice]], strategy: str, sharpness: float) -> Policy:
+    """전략 점수의 softmax 가중치로 고르는 무작위 정책"""
+    return weighted_policy(rng, softmax_weights(turns, strategy, sharpness))
+
+def _monte_carlo_report(statuses: Counter, games: int, summaries: Dict[str, Dict]) -> Dict:
+    """판정 상태별 비율, 승리 경로별 비율, 최종 지표 요약"""
+    wins = sum(statuses[status] for status in VICTORY_STATUS.values())
+    unfinished = statuses[GameStatus.PLAYING]
+    report = {
+        'win_rate': wins / games,
+        'loss_rate': (games - wins - unfinished) / games,
+        'unfinished_rate': unfinished / games,
+        'victory_paths': {path: statuses[status] / games for path, status in VICTORY_STATUS.items()},
+        'status': {status: count / games for status, count in statuses.most_common()},
+    }
+    report.update(summaries)
+    return report
+
+def _monte_carlo_difficulty(turns: Dict[int, List[Choice]], games: int, policy: str, difficulty: str,
+                            seed: int, sharpness: float, percentiles: Tuple[int, ...]) -> Dict:
+    """난이도 하나의 결과 분포 — game_engine.play 로 한 판씩 진행"""
+    rules = Rules(difficulty)
+    rng = random.Random(f'{seed}:{difficulty}')
+    pick = random_policy(rng) if policy == 'random' else softmax_policy(rng, turns, policy, sharpness)
+
+    statuses = Counter()
+    stats = {metric: RunningStats() for metric in ('users', 'cash', 'trust')}
+    with PROFILER.stage(difficulty):
+        for _ in range(games):
+            final = play(turns, rules, pick)
+            statuses[final.status] += 1
+            for metric, values in stats.items():
+                values.push(getattr(final, metric))
+
+    return _monte_carlo_report(statuses, games, {metric: values.summary(percentiles=percentiles)
+                                                 for metric, values in stats.items()})
+
+def _monte_carlo_batch(table, games: int, policy: str, difficulty: str, seed: int, sharpness: float,
+                       percentiles: Tuple[int, ...], batch_size: int) -> Dict:
+    """난이도 하나의 결과 분포 — batch_engine 으로 batch_size 판씩 한 턴을 한꺼번에 진행"""
+    import numpy as np
+    from batch_engine import play_batch, uniform_picker, weighted_picker
+
+    rules = Rules(difficulty)
+    rng = np.random.default_rng([seed, DIFFICULTIES.index(difficulty)])
+    if policy == 'random':
+        pick = uniform_picker(table, rng)
+    else:
+        pick = weighted_picker(table, rng, softmax_weights(dict(enumerate(table.choices)), policy, sharpness))
+
+    statuses = Counter()
+    finals = {metric: [] for metric in ('users', 'cash', 'trust')}
+    with PROFILER.stage(difficulty):
+        for start in range(0, games, batch_size):
+            batch = play_batch(table, rules, min(batch_size, games - start), pick)
+            statuses.update(batch.status_counts())
+            for metric, values in finals.items():
+                values.append(getattr(batch, metric))
+
+    summaries = {}
+    for metric, chunks in finals.items():
+        values = np.concatenate(chunks)
+        # RunningStats.summary 와 같은 형식 (정확한 분위수 — 스케치의 정확 모드와 같은 선형 보간)
+        summary = {'min': int(values.min()), 'max': int(values.max()), 'avg': float(values.mean()),
+                   'median': float(np.median(values))}
+        for p in percentiles:
+            summary[f'p{p}'] = float(np.quantile(values, p / 100))
+        summaries[metric] = summary
+    return _monte_carlo_report(statuses, games, summaries)
+
+def monte_carlo(data: List[Dict], games: int, policy: str = 'random',
+                difficulties: Tuple[str, ...] = DIFFICULTIES, seed: int = 0, sharpness: float = 3.0,
+                percentiles: Tuple[int, ...] = (10, 25, 50, 75, 90),
+                turns: Dict[int, List[Choice]] = None, engine: str = 'numpy',
+                batch_size: int = MC_BATCH_SIZE) -> Dict:
+    """Monte Carlo 플레이스루 — 난이도별 승률/패배/승리 경로 분포
 
+    Args:
+        games: 난이도당 게임 수
+        policy: 'random' (균등) 또는 simulate_path 전략 이름
+                (해당 전략 점수의 softmax 가중치로 선택)
+        sharpness: 전략 가중치의 선명도 (클수록 탐욕적)
+        turns: 미리 컴파일된 {턴: [Choice, ...]} (없으면 data 에서 컴파일)
+        engine: 'numpy' (batch_engine — 게임 상태를 배열로 들고 한 턴을 모든 게임에 한 번에 진행)
+                또는 'python' (game_engine.play 로 한 판씩, 기준 구현)
+        batch_size: numpy 엔진이 한 번에 진행하는 게임 수 (메모리 상한)
+    """
+    turns = turns or compile_turns(data)
+    if engine == 'numpy':
+        from batch_engine import BatchTable
+        table = BatchTable(turns)
+        by_difficulty = {difficulty: _monte_carlo_batch(table, games, policy, difficulty, seed, sharpness,
+                                                        percentiles, batch_size)
+                         for difficulty in difficulties}
+    else:
+        by_difficulty = {difficulty: _monte_carlo_difficulty(turns, games, policy, difficulty, seed,
+                                                             sharpness, percentiles)
+                         for difficulty in difficulties}
     return {
-        'strategy': strategy,
-        'initial': initial_state,
-        'final': current_state,
-        'history': history
+        'games': games,
+        'policy': policy,
+        'engine': engine,
+        'by_difficulty': by_difficulty,
     }
 
 def identify_balance_issues(stats: Dict, simulations: Dict) -> List[str]:
@@ -168,11 +436,22 @@ def identify_balance_issues(stats: Dict, simulations: Dict) -> List[str]:
     if user_diff > 500_000:
         issues.append(f"⚠️ 최적/최악 경로의 유저 수 차이가 큽니다 ({user_diff:,}명)")
 
-    # 4. 현금 파산 가능성
-    if worst['final']['cash'] < 0:
-        issues.append(f"❌ 최악의 선택 시 파산 가능 (최종 현금: {worst['final']['cash']:,}원)")
+    # 4. 파산/장애로 끝나는 전략 (GameService 판정 기준)
+    for strategy, sim in simulations.items():
+        final = sim['final']
+        if final['status'] == GameStatus.LOST_BANKRUPT:
+            issues.append(f"❌ {strategy} 전략은 턴 {final['turn']}에서 파산합니다 (현금: {final['cash']:,}원)")
+        elif final['status'] == GameStatus.LOST_OUTAGE:
+            issues.append(f"❌ {strategy} 전략은 턴 {final['turn']}에서 서비스 장애로 종료됩니다 (신뢰도: {final['trust']})")
+
+        elif final['status'] == GameStatus.PLAYING:
+            issues.append(f"⚠️ {strategy} 전략은 턴 {final['turn']}에서 게임이 끝나지 않습니다 (선택지 없음 또는 같은 턴 반복)")
 
-    # 5. 신뢰도 범위
+    # 5. 승리 경로 도달 여부
+    if not any(s['final']['status'].startswith('WON_') for s in simulations.values()):
+        issues.append("❌ 어떤 전략으로도 승리 조건을 달성하지 못합니다")
+
+    # 6. 신뢰도 범위
     trust_min = min([s['final']['trust'] for s in simulations.values()])
     trust_max = max([s['final']['trust'] for s in simulations.values()])
     if trust_max - trust_min > 80:
@@ -180,12 +459,47 @@ def identify_balance_issues(stats: Dict, simulations: Dict) -> List[str]:
 
     return issues
 
-def main():
+def parse_args():
+    parser = argparse.ArgumentParser(description='AWS CTO Game 밸런싱 분석')
+    parser.add_argument('--data', default='../game_choices_db.json', help='게임 데이터 JSON 경로')
+    parser.add_argument('--output', default='../balance_analysis.json', help='분석 결과 저장 경로')
+    parser.add_argument('--difficulty', default='NORMAL', choices=DIFFICULTIES,
+                        help='경로 시뮬레이션/경로 탐색 난이도')
+    parser.add_argument('--enumerate', action='store_true',
+                        help='next_turn 그래프의 모든 경로 결과 분포 계산')
+    parser.add_argument('--resolution', type=float, default=0.0,
+                        help='경로 탐색 시 유저/현금 버킷의 상대 크기 (0이면 정확한 상태 — 기본)')
+    parser.add_argument('--max-states', type=int, default=DEFAULT_MAX_STATES,
+                        help=f'정확한 경로 탐색의 단계별 상태 수 상한 (넘으면 resolution '
+                             f'{APPROXIMATE_RESOLUTION} 근사로 전환)')
+    parser.add_argument('--monte-carlo', type=int, default=0, metavar='GAMES',
+                        help='난이도당 Monte Carlo 플레이스루 수 (0이면 생략)')
+    parser.add_argument('--mc-engine', default='numpy', choices=('numpy', 'python'),
+                        help="Monte Carlo 엔진: 'numpy' (batch_engine 배열 진행) 또는 'python' (game_engine.play)")
+    parser.add_argument('--difficulties', nargs='+', default=list(DIFFICULTIES), choices=DIFFICULTIES,
+                        help='Monte Carlo 승률 분포를 계산할 난이도')
+    parser.add_argument('--policy', default='random',
+                        help="Monte Carlo 선택 정책: 'random' 또는 전략 이름 (예: balanced)")
+    parser.add_argument('--seed', type=int, default=0, help='Monte Carlo 난수 시드')
+    parser.add_argument('--cache', default=DEFAULT_CACHE, help='증분 분석 캐시 파일')
+    parser.add_argument('--no-cache', action='store_true', help='캐시 없이 전체 재분석')
+    parser.add_argument('--watch', action='store_true', help='데이터 파일이 바뀔 때마다 다시 분석')
+    parser.add_argument('--interval', type=float, default=0.5, help='--watch 감시 주기 (초)')
+    add_profile_arguments(parser)
+    return parser.parse_args()
+
+def run_analysis(args, cache: AnalysisCache = None):
+    started = time.perf_counter()
+    if cache is not None:
+        cache.reset_counters()
+
     print("🎮 AWS CTO Game - Balance Analysis")
     print("=" * 60)
 
     # 데이터 로드
-    data = load_game_data('../game_choices_db.json')
+    with PROFILER.stage('load'):
+        data = load_game_data(args.data)
+        turns = load_choice_table(args.data).turns()
     total_turns = len(data)
     total_choices = sum(len(turn['choices']) for turn in data)
 
@@ -196,7 +510,8 @@ def main():
 
     # 효과 분석
     print("\n📈 효과 분석:")
-    stats = analyze_choice_effects(data)
+    with PROFILER.stage('effects'):
+        stats = analyze_choice_effects(data, cache=cache)
 
     print("\n전체 통계:")
     for metric in ['users', 'cash', 'trust']:
@@ -208,22 +523,29 @@ def main():
         print(f"    - 중앙값: {s['median']:,.1f}")
         print(f"    - 표준편차: {s['stdev']:,.1f}")
 
+    print("\n카테고리별 평균 (유저 / 현금 / 신뢰도):")
+    for category, s in stats['by_category'].items():
+        print(f"  - {category} ({s['choice_count']}개): "
+              f"{s['users']['avg']:,.0f} / {s['cash']['avg']:,.0f} / {s['trust']['avg']:,.1f}")
+
     # 경로 시뮬레이션
-    print("\n\n🎯 경로 시뮬레이션:")
-    strategies = ['best_users', 'worst_users', 'best_cash', 'worst_cash', 'best_trust', 'balanced']
+    print(f"\n\n🎯 경로 시뮬레이션 ({args.difficulty}):")
     simulations = {}
 
-    for strategy in strategies:
-        sim = simulate_path(data, strategy)
+    for strategy in STRATEGIES:
+        with PROFILER.stage('simulate'), PROFILER.stage(strategy):
+            sim = simulate_path(data, strategy, difficulty=args.difficulty, cache=cache)
         simulations[strategy] = sim
         print(f"\n  {strategy}:")
+        print(f"    - 결과: {sim['final']['status']} (턴 {sim['final']['turn']}, 등급 {sim['final']['grade']})")
         print(f"    - 최종 유저: {sim['final']['users']:,}명")
         print(f"    - 최종 현금: {sim['final']['cash']:,}원")
         print(f"    - 최종 신뢰도: {sim['final']['trust']}%")
 
     # 밸런싱 이슈
     print("\n\n⚖️ 밸런싱 이슈:")
-    issues = identify_balance_issues(stats, simulations)
+    with PROFILER.stage('issues'):
+        issues = identify_balance_issues(stats, simulations)
     if issues:
         for issue in issues:
             print(f"  {issue}")
@@ -238,6 +560,57 @@ def main():
         turn_stat = stats['by_turn'][turn_num]
         print(f"{turn_num}\t{turn_stat['users']['avg']:,.0f}\t\t{turn_stat['cash']['avg']:,.0f}\t\t{turn_stat['trust']['avg']:.1f}")
 
+    # 전체 경로 탐색
+    enumeration = None
+    if args.enumerate:
+        print(f"\n\n🌳 전체 경로 탐색 ({args.difficulty}):")
+        with PROFILER.stage('enumerate'):
+            try:
+                enumeration = enumerate_paths(data, difficulty=args.difficulty, resolution=args.resolution,
+                                              turns=turns, max_states=args.max_states)
+            except StateLimitExceeded as e:
+                print(f"  ⚠️ {e}")
+                enumeration = enumerate_paths(data, difficulty=args.difficulty,
+                                              resolution=APPROXIMATE_RESOLUTION, turns=turns)
+        if enumeration['exact']:
+            print("  - 방식: 정확 (같은 상태만 병합)")
+        else:
+            print(f"  - 방식: ⚠️ 근사 (유저/현금 {enumeration['resolution']:.0%} 로그 버킷, "
+                  f"신뢰도 {enumeration['trust_resolution']} 단위 버킷으로 병합 — 아래 값은 근사치)")
+        print(f"  - 총 경로 수: {enumeration['total_paths']:,}")
+        print(f"  - 확장한 상태 수: {enumeration['expanded_states']:,} (최대 동시 상태 {enumeration['peak_states']:,})")
+        print("  - 결과 (경로 수 기준 / 균등 무작위 확률):")
+        for status in sorted(set(enumeration['status']) | set(enumeration['random_status']),
+                             key=lambda s: -enumeration['random_status'].get(s, 0)):
+            print(f"    - {status}: {enumeration['status'].get(status, 0):.1%} / "
+                  f"{enumeration['random_status'].get(status, 0):.1%}")
+        print("\n지표\t최소\t\tp10\t\tp50\t\tp90\t\t최대")
+        print("-" * 60)
+        for metric in ['users', 'cash', 'trust']:
+            e = enumeration[metric]
+            print(f"{metric}\t{e['min']:,}\t\t{e['p10']:,}\t\t{e['p50']:,}\t\t{e['p90']:,}\t\t{e['max']:,}")
+
+    # Monte Carlo 시뮬레이션
+    mc = None
+    if args.monte_carlo:
+        print(f"\n\n🎲 Monte Carlo 시뮬레이션 (난이도당 {args.monte_carlo:,}게임, 정책: {args.policy}, "
+              f"엔진: {args.mc_engine}):")
+        with PROFILER.stage('monte_carlo'):
+            mc = monte_carlo(data, args.monte_carlo, policy=args.policy, difficulties=args.difficulties,
+                             seed=args.seed, turns=turns, engine=args.mc_engine)
+        print("\n난이도\t승리\t패배\t미종료\t" + "\t".join(VICTORY_PATHS))
+        print("-" * 60)
+        for difficulty, d in mc['by_difficulty'].items():
+            paths = "\t".join(f"{d['victory_paths'][path]:.2%}" for path in VICTORY_PATHS)
+            print(f"{difficulty}\t{d['win_rate']:.2%}\t{d['loss_rate']:.2%}\t{d['unfinished_rate']:.2%}\t{paths}")
+        for difficulty, d in mc['by_difficulty'].items():
+            print(f"\n  {difficulty}:")
+            for status, rate in d['status'].items():
+                print(f"    - {status}: {rate:.2%}")
+            for metric in ['users', 'cash', 'trust']:
+                m = d[metric]
+                print(f"    - {metric}: p10 {m['p10']:,.0f} / p50 {m['p50']:,.0f} / p90 {m['p90']:,.0f}")
+
     # 결과를 JSON으로 저장
     output = {
         'basic_info': {
@@ -248,15 +621,52 @@ def main():
         'statistics': stats,
         'simulations': {k: {
             'strategy': v['strategy'],
+            'difficulty': v['difficulty'],
             'final': v['final']
         } for k, v in simulations.items()},
         'balance_issues': issues
     }
+    if enumeration is not None:
+        output['path_enumeration'] = enumeration
+    if mc is not None:
+        output['monte_carlo'] = mc
+
+    with PROFILER.stage('save'):
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(output, f, ensure_ascii=False, indent=2)
+        if cache is not None:
+            cache.save()
 
-    with open('../balance_analysis.json', 'w', encoding='utf-8') as f:
-        json.dump(output, f, ensure_ascii=False, indent=2)
+    if cache is not None:
+        print(f"\n♻️ 증분 캐시: 턴 통계 {cache.hits['turns']}/{cache.hits['turns'] + cache.misses['turns']} 재사용, "
+              f"경로 상태 {cache.hits['paths']}/{cache.hits['paths'] + cache.misses['paths']} 재사용")
 
-    print("\n\n✅ 분석 완료! 결과가 balance_analysis.json에 저장되었습니다.")
+    print(f"\n\n✅ 분석 완료 ({time.perf_counter() - started:.2f}초)! 결과가 {args.output}에 저장되었습니다.")
+
+def main():
+    args = parse_args()
+    cache = None if args.no_cache else AnalysisCache(args.cache)
+    enable_from_args(args)
+
+    if not args.watch:
+        with PROFILER.stage('analysis'):
+            run_analysis(args, cache)
+        finish_from_args(args)
+        return
+
+    last_mtime = None
+    try:
+        while True:
+            mtime = os.stat(args.data).st_mtime_ns
+            if mtime != last_mtime:
+                last_mtime = mtime
+                with PROFILER.stage('analysis'):
+                    run_analysis(args, cache)
+                print(f"\n👀 {args.data} 변경 감시 중 (Ctrl+C 로 종료)")
+            time.sleep(args.interval)
+    except KeyboardInterrupt:
+        pass
+    finish_from_args(args)
 
 if __name__ == '__main__':
     main()
@@ -0,0 +1,514 @@
+#!/usr/bin/env python3
+"""
+AWS CTO Game - Play Log Analytics
+실제 플레이 기록(choice_history / trust_history / leaderboard / games 테이블 덤프) 분석
+
+덤프(JSONL, CSV, JSON 배열 — .gz 압축 가능)를 제너레이터로 한 레코드씩 읽으며 (JSON 배열도 증분 파싱)
+- 턴별 실제 선택 비율 (pick rate) 과 거의 선택되지 않는/지배적인 선택지
+- 턴별 생존율 (해당 턴까지 진행한 게임 비율)
+- 파산/CTO 해임 등 패배가 일어난 턴, 신뢰도가 깎이는 턴
+을 계산하고 game_engine 시뮬레이션(무작위 정책, 실제 선택 비율 정책)의 예측과 비교합니다.
+
+게임 단위 집계는 gameId 해시 파티션 파일로 한 번 흘려보낸 뒤 파티션별로만 메모리에
+올리므로, 수 GB 덤프도 (덤프 크기 / 파티션 수) 수준의 메모리로 처리합니다.
+
+사용 예:
+    python3 analyze_playlogs.py --choice-history choice_history.jsonl.gz \\
+        --trust-history trust_history.csv --games games.csv \\
+        --leaderboard ../leaderboard_backup_20251010_120131.json
+"""
+
+import argparse
+import csv
+import gzip
+import json
+import os
+import random
+import re
+import tempfile
+import zlib
+from collections import Counter, defaultdict
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from game_engine import (
+    DIFFICULTIES, DIFFICULTY_CONFIGS, GameStatus, Rules,
+    is_special_turn, play, random_policy, weighted_policy,
+)
+from choice_table import load_choice_table
+from stream_stats import StatsTable
+
+# 선택 비율이 이 값보다 낮으면 '거의 안 고르는', 높으면 '지배적인' 선택지로 표시
+RARE_PICK_RATE = 0.05
+DOMINANT_PICK_RATE = 0.7
+# 통계를 내기에 너무 적은 표본은 선택지 플래그에서 제외
+MIN_TURN_SAMPLES = 20
+
+_SNAKE = re.compile(r'_([a-z])')
+
+def _open_text(path: str):
+    if path.endswith('.gz'):
+        return gzip.open(path, 'rt', encoding='utf-8', newline='')
+    return open(path, 'r', encoding='utf-8', newline='')
+
+def _normalize(record: Dict) -> Dict:
+    """pg_dump/CSV 의 snake_case 컬럼명을 엔티티 필드명(camelCase)으로 통일"""
+    return {_SNAKE.sub(lambda m: m.group(1).upper(), key): value for key, value in record.items()}
+
+_JSON_CHUNK = 1 << 16
+
+def _iter_json_array(f, chunk_size: int = _JSON_CHUNK) -> Iterator:
+    """JSON 배열 파일을 원소 단위로 증분 파싱 (파일 전체를 메모리에 올리지 않음)
+
+    버퍼에 chunk_size 씩 읽어 붙이면서 JSONDecoder.raw_decode 로 원소를 하나씩 꺼내고,
+    원소가 버퍼 끝에서 잘려 있으면 더 읽은 뒤 다시 시도합니다. 메모리는 가장 큰 원소 하나 + 청크 수준입니다.
+    """
+    decoder = json.JSONDecoder()
+    buffer = ''
+    pos = 0
+    eof = False
+    started = False
+
+    def fill() -> bool:
+        nonlocal buffer, pos, eof
+        chunk = f.read(chunk_size)
+        buffer = buffer[pos:] + chunk
+        pos = 0
+        eof = not chunk
+        return bool(chunk)
+
+    while True:
+        # 공백, 여는 괄호, 구분 쉼표 건너뛰기
+        while True:
+            while pos < len(buffer) and buffer[pos] in ' \t\r\n':
+                pos += 1
+            if pos == len(buffer):
+                if not fill():
+                    raise ValueError('JSON 배열이 닫히지 않았습니다' if started else 'JSON 배열이 아닙니다')
+                continue
+            if not started:
+                if buffer[pos] != '[':
+                    raise ValueError('JSON 배열이 아닙니다 (최상위가 [ 로 시작해야 함)')
+                started = True
+                pos += 1
+            elif buffer[pos] == ',':
+                pos += 1
+            elif buffer[pos] == ']':
+                return
+            else:
+                break
+        try:
+            value, end = decoder.raw_decode(buffer, pos)
+        except json.JSONDecodeError:
+            if eof or not fill():
+                raise
+            continue
+        if end == len(buffer) and not eof and not isinstance(value, (dict, list, str)):
+            # 숫자/리터럴은 버퍼 끝에서 잘렸을 수 있으므로 더 읽은 뒤 다시 파싱
+            fill()
+            continue
+        pos = end
+        yield value
+
+def iter_records(path: str) -> Iterator[Dict]:
+    """덤프 파일을 레코드 단위로 스트리밍
+
+    .csv 는 헤더 기준 DictReader, .json 은 JSON 배열(백업 파일 — 원소 단위 증분 파싱),
+    그 밖(.jsonl/.ndjson)은 한 줄에 한 레코드로 읽습니다. .gz 는 투명하게 압축 해제합니다.
+    """
+    name = path[:-3] if path.endswith('.gz') else path
+    with _open_text(path) as f:
+        if name.endswith('.csv'):
+            for row in csv.DictReader(f):
+                yield _normalize(row)
+        elif name.endswith('.json'):
+            for row in _iter_json_array(f):
+                yield _normalize(row)
+        else:
+            for line in f:
+                line = line.strip()
+                if line:
+                    yield _normalize(json.loads(line))
+
+def _int(value, default: int = 0) -> int:
+    """CSV 문자열/bigint 문자열/None 을 정수로"""
+    if value is None or value == '':
+        return default
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return int(float(value))
+
+# ---------------------------------------------------------------------------
+# 게임 단위 그룹화 (외부 해시 파티션)
+# ---------------------------------------------------------------------------
+
+def _partition_of(game_id: str, partitions: int) -> int:
+    return zlib.crc32(game_id.encode('utf-8')) % partitions
+
+# 게임 단위로 묶을 기록 테이블별 (순서 id 필드, 시각 필드, 값 필드)
+CHOICE_FIELDS = ('historyId', 'timestamp', 'choiceId')
+TRUST_FIELDS = ('id', 'createdAt', 'change')
+
+def iter_games(choice_records: Iterable[Dict], game_records: Iterable[Dict],
+               partitions: int = 32, workdir: Optional[str] = None,
+               fields: Tuple[str, str, str] = CHOICE_FIELDS) -> Iterator[Tuple[str, List, Optional[Dict]]]:
+    """choice_history(또는 trust_history) 와 games 레코드를 gameId 로 조인해서 게임 단위로 반환
+
+    Yields:
+        (gameId, [(순서, 턴, 값), ...] 순서대로 정렬, games 레코드 요약 또는 None)
+        값은 fields 의 값 필드 — choice_history 는 선택지 id, trust_history(TRUST_FIELDS) 는 신뢰도 변화
+
+    partitions <= 1 이면 모든 게임을 메모리에서 묶고, 그 외에는 gameId 해시로
+    파티션 파일에 나눠 쓴 뒤 파티션 하나씩 읽어서 묶습니다.
+    """
+    if partitions <= 1:
+        yield from _group_partition(_compact_records(choice_records, game_records, fields))
+        return
+
+    with tempfile.TemporaryDirectory(dir=workdir, prefix='playlogs-') as tmp:
+        files = [open(os.path.join(tmp, f'part-{i:04d}.jsonl'), 'w', encoding='utf-8')
+                 for i in range(partitions)]
+        try:
+            for row in _compact_records(choice_records, game_records, fields):
+                files[_partition_of(row[1], partitions)].write(json.dumps(row, ensure_ascii=False) + '\n')
+        finally:
+            for f in files:
+                f.close()
+
+        for i in range(partitions):
+            with open(os.path.join(tmp, f'part-{i:04d}.jsonl'), 'r', encoding='utf-8') as f:
+                yield from _group_partition(json.loads(line) for line in f)
+
+def _compact_records(choice_records: Iterable[Dict], game_records: Iterable[Dict],
+                     fields: Tuple[str, str, str] = CHOICE_FIELDS) -> Iterator[List]:
+    """조인에 필요한 필드만 남긴 작은 행으로 변환 (파티션 파일 크기 절감)"""
+    id_field, time_field, value_field = fields
+    for record in choice_records:
+        # 자동 증가 id 가 있으면 그것으로, 없으면 시각으로 순서를 정함 — 정수와 문자열이 섞여도 비교되도록
+        # (0, id) / (1, 시각) 튜플 키 (파티션 파일을 거치면 리스트가 되지만 비교 순서는 같음)
+        history_id = record.get(id_field)
+        if history_id not in (None, ''):
+            order = (0, _int(history_id))
+        else:
+            order = (1, str(record.get(time_field, '')))
+        yield ['c', record['gameId'], order, _int(record.get('turnNumber')), _int(record.get(value_field))]
+    for record in game_records:
+        yield ['g', record['gameId'], {
+            'status': record.get('status') or GameStatus.PLAYING,
+            'turn': _int(record.get('currentTurn')),
+            # GameService 와 같이 비어 있으면 NORMAL
+            'difficulty': record.get('difficultyMode') or 'NORMAL',
+        }]
+
+def _group_partition(rows: Iterable[List]) -> Iterator[Tuple[str, List, Optional[Dict]]]:
+    picks = defaultdict(list)
+    games = {}
+    for row in rows:
+        if row[0] == 'c':
+            picks[row[1]].append((row[2], row[3], row[4]))
+        else:
+            games[row[1]] = row[2]
+    for game_id in picks.keys() | games.keys():
+        history = picks.get(game_id, [])
+        history.sort(key=lambda pick: pick[0])
+        yield game_id, history, games.get(game_id)
+
+# ---------------------------------------------------------------------------
+# 실제 플레이 집계
+# ---------------------------------------------------------------------------
+
+class PlayLogReport:
+    """실제 기록과 시뮬레이션이 같은 형식으로 채우는 집계기"""
+
+    def __init__(self, max_turns: int):
+        self.max_turns = max_turns
+        self.games = 0
+        self.picks = Counter()            # (턴, 선택지 id) → 선택 횟수
+        self.reach = Counter()            # 턴 → 그 턴에서 선택한 게임 수
+        self.endings = Counter()          # (상태, 턴) → 게임 수
+        self.last_turns = Counter()       # 마지막으로 선택한 턴 → 게임 수
+        self.skipped = 0                  # 난이도가 달라서(또는 알 수 없어서) 제외한 게임 수
+        self.trust_skipped = 0            # 같은 이유로 제외한 신뢰도 기록 수
+        self.trust = StatsTable(('change',))
+
+    def add_game(self, turns: List[int], status: Optional[str] = None, end_turn: Optional[int] = None):
+        self.games += 1
+        for turn in set(turns):
+            if not is_special_turn(turn) and 1 <= turn <= self.max_turns:
+                self.reach[turn] += 1
+        last = turns[-1] if turns else None
+        if last is not None:
+            self.last_turns[last] += 1
+        if status is not None:
+            self.endings[(status, end_turn if end_turn is not None else last)] += 1
+
+    def add_trust_change(self, turn: int, change: int):
+        self.trust.push((('turn', turn),), {'change': change})
+
+    def survival(self) -> Dict[int, float]:
+        if not self.games:
+            return {}
+        return {turn: self.reach[turn] / self.games for turn in range(1, self.max_turns + 1)}
+
+    def loss_turns(self) -> Dict[str, Dict[int, int]]:
+        """패배 상태별 턴 분포"""
+        losses = defaultdict(Counter)
+        for (status, turn), count in self.endings.items():
+            if status.startswith('LOST_'):
+                losses[status][turn] += count
+        return {status: dict(sorted(turns.items())) for status, turns in sorted(losses.items())}
+
+    def pick_rates(self) -> Dict[int, Dict[int, float]]:
+        totals = Counter()
+        for (turn, _), count in self.picks.items():
+            totals[turn] += count
+        rates = defaultdict(dict)
+        for (turn, choice_id), count in sorted(self.picks.items()):
+            rates[turn][choice_id] = count / totals[turn]
+        return dict(rates)
+
+    def trust_by_turn(self) -> Dict[int, Dict]:
+        result = {}
+        for key in sorted(self.trust.groups, key=lambda k: k[1]):
+            stats = self.trust.groups[key]['change']
+            result[key[1]] = {'count': stats.count, 'avg': stats.mean, 'min': stats.min,
+                              'p10': stats.quantile(0.1), 'total': stats.total}
+        return result
+
+def ingest_choice_history(report: PlayLogReport, choice_records: Iterable[Dict],
+                          game_records: Iterable[Dict] = (), partitions: int = 32,
+                          workdir: Optional[str] = None, difficulty: Optional[str] = None) -> PlayLogReport:
+    """difficulty 가 주어지면 games 레코드의 difficultyMode 가 같은 게임만 집계
+
+    choice_history 에는 난이도가 없으므로 games 레코드가 없는 게임도 이때는 제외합니다.
+    """
+    for _, history, game in iter_games(choice_records, game_records, partitions, workdir):
+        if difficulty is not None and (game is None or game['difficulty'] != difficulty):
+            report.skipped += 1
+            continue
+        turns = [turn for _, turn, _ in history]
+        for _, turn, choice_id in history:
+            report.picks[(turn, choice_id)] += 1
+        if not turns and game is None:
+            continue
+        if game is None:
+            report.add_game(turns)
+        else:
+            report.add_game(turns, status=game['status'], end_turn=game['turn'])
+    return report
+
+def ingest_trust_history(report: PlayLogReport, records: Iterable[Dict],
+                         game_records: Iterable[Dict] = (), partitions: int = 32,
+                         workdir: Optional[str] = None, difficulty: Optional[str] = None) -> PlayLogReport:
+    """trust_history 집계 — difficulty 가 주어지면 ingest_choice_history 와 같이 games 레코드로 걸러냄
+
+    trust_history 에도 난이도가 없으므로 이때는 gameId 로 games 레코드와 조인하며,
+    games 레코드가 없거나 난이도가 다른 게임의 기록은 제외합니다.
+    """
+    if difficulty is None:
+        for record in records:
+            report.add_trust_change(_int(record.get('turnNumber')), _int(record.get('change')))
+        return report
+
+    for _, history, game in iter_games(records, game_records, partitions, workdir, TRUST_FIELDS):
+        if game is None or game['difficulty'] != difficulty:
+            report.trust_skipped += len(history)
+            continue
+        for _, turn, change in history:
+            report.add_trust_change(turn, change)
+    return report
+
+def summarize_leaderboard(records: Iterable[Dict]) -> Dict:
+    """리더보드(승리 기록) 난이도/승리 경로별 최종 지표 요약"""
+    table = StatsTable(('score', 'finalTurn', 'finalUsers', 'finalCash', 'finalTrust'))
+    paths = Counter()
+    for record in records:
+        difficulty = record.get('difficulty') or 'NORMAL'
+        path = record.get('victoryPath') or GameStatus.WON_IPO
+        paths[(difficulty, path)] += 1
+        values = {metric: _int(record.get(metric)) for metric in table.metrics}
+        table.push((('difficulty', difficulty), ('path', difficulty, path)), values)
+
+    summary = {}
+    for key in table.groups:
+        if key[0] != 'difficulty':
+            continue
+        difficulty = key[1]
+        summary[difficulty] = {
+            'entries': table.groups[key]['score'].count,
+            'victory_paths': {path: count for (d, path), count in paths.most_common() if d == difficulty},
+            'final': table.summary(key, percentiles=(10, 90)),
+        }
+    return summary
+
+# ---------------------------------------------------------------------------
+# 시뮬레이션 예측
+# ---------------------------------------------------------------------------
+
+def simulate_report(turns: Dict, rules: Rules, games: int, seed: int = 0,
+                    weights: Optional[Dict[int, float]] = None) -> PlayLogReport:
+    """엔진으로 games 판을 진행해서 실제 기록과 같은 형식으로 집계
+
+    weights 가 주어지면 선택지 id 별 가중치(실제 선택 비율) 정책, 없으면 균등 무작위 정책
+    """
+    rng = random.Random(seed)
+    policy = weighted_policy(rng, weights) if weights else random_policy(rng)
+    report = PlayLogReport(rules.max_turns)
+    for _ in range(games):
+        visited = []
+        trust = [rules.initial_trust]
+
+        def on_step(state, choice):
+            visited.append(choice.turn)
+            report.picks[(choice.turn, choice.id)] += 1
+            # GameService 와 같은 기록 규칙: 턴 진행 후 currentTurn - 1 에, 변화가 있을 때만 기록
+            # (실제 기록은 변화 0 이어도 요인이 있으면 남지만 엔진에는 요인 목록이 없음)
+            change = state.trust - trust[0]
+            if change:
+                report.add_trust_change(state.turn - 1, change)
+            trust[0] = state.trust
+
+        state = play(turns, rules, policy, on_step=on_step)
+        report.add_game(visited, status=state.status, end_turn=state.turn)
+    return report
+
+def compare(real: PlayLogReport, predictions: Dict[str, PlayLogReport], choice_text: Dict[int, str]) -> Dict:
+    """실제 기록과 예측의 차이 (생존율, 패배 턴, 선택 비율)"""
+    real_survival = real.survival()
+    survival = {}
+    for turn, rate in real_survival.items():
+        row = {'real': rate}
+        for name, predicted in predictions.items():
+            row[name] = predicted.survival().get(turn, 0.0)
+        survival[turn] = row
+
+    flagged = []
+    turn_samples = Counter()
+    for (turn, _), count in real.picks.items():
+        turn_samples[turn] += count
+    for turn, rates in real.pick_rates().items():
+        if turn_samples[turn] < MIN_TURN_SAMPLES:
+            continue
+        for choice_id, rate in rates.items():
+            if rate < RARE_PICK_RATE or rate > DOMINANT_PICK_RATE:
+                flagged.append({'turn': turn, 'choice_id': choice_id, 'pick_rate': rate,
+                                'kind': 'rare' if rate < RARE_PICK_RATE else 'dominant',
+                                'text': choice_text.get(choice_id, '')[:60]})
+
+    real_trust = real.trust_by_turn()
+    trust = {turn: dict({'real': s['avg']},
+                        **{name: predicted.trust_by_turn().get(turn, {}).get('avg')
+                           for name, predicted in predictions.items()})
+             for turn, s in real_trust.items()}
+
+    return {
+        'survival': survival,
+        'trust_change': trust,
+        'loss_turns': {'real': real.loss_turns(),
+                       **{name: predicted.loss_turns() for name, predicted in predictions.items()}},
+        'flagged_choices': flagged,
+    }
+
+def parse_args():
+    parser = argparse.ArgumentParser(description='AWS CTO Game 실제 플레이 기록 분석')
+    parser.add_argument('--choice-history', nargs='*', default=[], help='choice_history 덤프 (JSONL/CSV/JSON, .gz 가능)')
+    parser.add_argument('--trust-history', nargs='*', default=[], help='trust_history 덤프')
+    parser.add_argument('--games', nargs='*', default=[], help='games 테이블 덤프 (최종 상태/난이도)')
+    parser.add_argument('--leaderboard', nargs='*', default=[], help='leaderboard 덤프/백업')
+    parser.add_argument('--data', default='../game_choices_db.json', help='시뮬레이션용 게임 데이터 JSON')
+    parser.add_argument('--difficulty', default='NORMAL', choices=DIFFICULTIES, help='시뮬레이션 난이도')
+    parser.add_argument('--sim-games', type=int, default=5000, help='정책별 시뮬레이션 게임 수 (0이면 비교 생략)')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--partitions', type=int, default=32,
+                        help='게임 단위 집계용 해시 파티션 수 (1이면 메모리에서 처리)')
+    parser.add_argument('--workdir', default=None, help='파티션 임시 파일 디렉터리')
+    parser.add_argument('--output', default='../playlog_report.json', help='리포트 저장 경로')
+    return parser.parse_args()
+
+def _chain(paths: List[str]) -> Iterator[Dict]:
+    for path in paths:
+        yield from iter_records(path)
+
+def main():
+    args = parse_args()
+
+    print("🎮 AWS CTO Game - Play Log Analytics")
+    print("=" * 60)
+
+    max_turns = DIFFICULTY_CONFIGS[args.difficulty]['maxTurns']
+    real = PlayLogReport(max_turns)
+    # 시뮬레이션은 한 난이도이므로 실제 기록도 같은 난이도 게임만 비교 (난이도는 games 덤프에만 있음)
+    ingest_choice_history(real, _chain(args.choice_history), _chain(args.games),
+                          partitions=args.partitions, workdir=args.workdir,
+                          difficulty=args.difficulty if args.games else None)
+    ingest_trust_history(real, _chain(args.trust_history), _chain(args.games),
+                         partitions=args.partitions, workdir=args.workdir,
+                         difficulty=args.difficulty if args.games else None)
+    leaderboard = summarize_leaderboard(_chain(args.leaderboard))
+
+    print(f"\n📂 실제 기록: 게임 {real.games:,}판, 선택 {sum(real.picks.values()):,}회, "
+          f"신뢰도 기록 {sum(g['change'].count for g in real.trust.groups.values()):,}건")
+    if real.skipped or real.trust_skipped:
+        print(f"   ({args.difficulty} 가 아니거나 games 레코드가 없는 게임 {real.skipped:,}판, "
+              f"신뢰도 기록 {real.trust_skipped:,}건 제외)")
+    elif not args.games and (args.choice_history or args.trust_history):
+        print("   ⚠️ --games 덤프가 없어 난이도를 구분하지 못했습니다 (모든 난이도의 기록이 섞여 있음)")
+
+    # 엔진의 선택지 id 는 숫자면 int 라서 실제 기록의 choiceId(선택 비율 weights 키)와 그대로 맞음
+    turns = load_choice_table(args.data).turns()
+    choice_text = {c.id: c.text for choices in turns.values() for c in choices}
+    predictions = {}
+    if args.sim_games > 0:
+        rules = Rules(args.difficulty)
+        predictions['sim_random'] = simulate_report(turns, rules, args.sim_games, args.seed)
+        if real.picks:
+            weights = {choice_id: count for (_, choice_id), count in real.picks.items()}
+            predictions['sim_observed'] = simulate_report(turns, rules, args.sim_games, args.seed, weights)
+
+    comparison = compare(real, predictions, choice_text)
+
+    if real.games:
+        print("\n📉 턴별 생존율 (실제 / " + ' / '.join(predictions) + "):")
+        for turn, row in comparison['survival'].items():
+            predicted = ' / '.join(f"{row[name]:.0%}" for name in predictions)
+            print(f"  턴 {turn:>2}: {row['real']:.0%}" + (f" / {predicted}" if predicted else ''))
+
+    losses = comparison['loss_turns']['real']
+    if losses:
+        print("\n💀 실제 패배 턴:")
+        for status, by_turn in losses.items():
+            top = sorted(by_turn.items(), key=lambda item: -item[1])[:5]
+            print(f"  {status}: " + ', '.join(f"턴 {turn} ({count}판)" for turn, count in top))
+
+    trust = real.trust_by_turn()
+    if trust:
+        print("\n📉 신뢰도 하락이 큰 턴:")
+        for turn, s in sorted(trust.items(), key=lambda item: item[1]['avg'])[:5]:
+            print(f"  턴 {turn}: 평균 {s['avg']:+.1f}, 최저 {s['min']:+d} ({s['count']:,}건)")
+
+    if comparison['flagged_choices']:
+        print("\n🎯 선택 비율 이상 선택지:")
+        for item in comparison['flagged_choices']:
+            mark = '🔻' if item['kind'] == 'rare' else '🔺'
+            print(f"  {mark} 턴 {item['turn']} #{item['choice_id']}: {item['pick_rate']:.0%} {item['text']}")
+
+    for difficulty, s in leaderboard.items():
+        print(f"\n🏆 리더보드 {difficulty}: {s['entries']}건, 평균 점수 {s['final']['score']['avg']:,.0f}")
+
+    report = {
+        'difficulty': args.difficulty,
+        'games': real.games,
+        'skipped_games': real.skipped,
+        'pick_rates': real.pick_rates(),
+        'trust_by_turn': trust,
+        'last_turns': dict(sorted(real.last_turns.items())),
+        'leaderboard': leaderboard,
+        'comparison': comparison,
+    }
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+
+    print(f"\n\n✅ 분석 완료! 결과가 {args.output}에 저장되었습니다.")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,228 @@
+#!/usr/bin/env python3
+"""
+AWS CTO Game - Balance Sweep
+데이터 파일 × 난이도 × 전략 × 시드 일괄 시뮬레이션 (멀티코어)
+
+--events 를 주면 매 턴 끝에 랜덤 이벤트(event_matcher.py, EventService 이식)를 발동시킵니다.
+이벤트가 있으면 결정적 전략도 결과가 달라지므로 전략마다 --games 판을 진행합니다.
+
+사용 예:
+    python3 balance_sweep.py --data '../game_choices_db*.json' --seeds 8 --games 2000
+    python3 balance_sweep.py --events --difficulties NORMAL --seeds 2
+"""
+
+import argparse
+import glob
+import json
+import os
+import random
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+from game_engine import (
+    DIFFICULTIES, STRATEGIES, Rules, greedy_policy, play, random_policy,
+)
+from choice_table import load_choice_table
+from event_matcher import EVENTS_FILE, EventMatcher, EventRunner, chain_hooks, load_events
+from stream_stats import RunningStats
+from profiler import PROFILER, add_arguments as add_profile_arguments, enable, enable_from_args, finish_from_args
+
+OUTCOME_METRICS = ('users', 'cash', 'trust', 'steps')
+OUTCOME_PERCENTILES = (10, 50, 90)
+
+RANDOM_STRATEGY = 'random'
+
+# 워커 프로세스 전역 상태: 선택지 표와 규칙은 프로세스당 한 번만 만들어지고
+# 작업(job)에는 파일 경로/난이도 같은 키만 전달되므로 작업마다 다시 pickle 되지 않습니다.
+_TABLES: Dict[str, Dict] = {}
+_RULES: Dict[str, Rules] = {}
+_EVENTS: Optional[EventMatcher] = None
+_IN_WORKER = False
+
+def _load_tables(paths: List[str], events_path: Optional[str] = None):
+    global _EVENTS
+    for path in paths:
+        if path not in _TABLES:
+            _TABLES[path] = load_choice_table(path).turns()
+    for mode in DIFFICULTIES:
+        _RULES.setdefault(mode, Rules(mode))
+    if events_path and _EVENTS is None:
+        _EVENTS = EventMatcher(load_events(events_path))
+
+def _init_worker(paths: List[str], profile: bool = False, events_path: Optional[str] = None):
+    """fork 로 부모의 표를 상속했다면 그대로 쓰고, spawn 이면 한 번만 다시 로드"""
+    global _IN_WORKER
+    _IN_WORKER = True
+    if profile:
+        enable()
+    _load_tables(paths, events_path)
+
+def _count_step(state, choice):
+    PROFILER.count(f'play:turn {choice.turn}')
+
+def _run_job(job: Tuple[str, str, str, int, int]) -> Tuple[Tuple[str, str, str], Dict]:
+    path, difficulty, strategy, seed, games = job
+    started = time.perf_counter()
+    turns = _TABLES[path]
+    rules = _RULES[difficulty]
+    if strategy == RANDOM_STRATEGY:
+        policy = random_policy(random.Random(seed))
+    else:
+        policy = greedy_policy(strategy)
+        if _EVENTS is None:
+            games = 1  # 결정적 전략은 한 판이면 충분
+
+    result = {'games': 0, 'status': Counter(), 'grade': Counter(), 'events': Counter()}
+    result.update((metric, RunningStats()) for metric in OUTCOME_METRICS)
+    runner = None
+    if _EVENTS is not None:
+        runner = EventRunner(_EVENTS, difficulty, random.Random(f'events:{seed}'),
+                             None if strategy == RANDOM_STRATEGY else strategy)
+    on_step = chain_hooks(_count_step if PROFILER.enabled else None, runner)
+    with PROFILER.stage('job'), PROFILER.stage(strategy):
+        for _ in range(games):
+            if runner is not None:
+                runner.reset()
+            final = play(turns, rules, policy, on_step=on_step)
+            result['games'] += 1
+            result['status'][final.status] += 1
+            result['grade'][final.grade or '-'] += 1
+            for metric in OUTCOME_METRICS:
+                result[metric].push(getattr(final, metric))
+    if runner is not None:
+        result['events'] = runner.fired
+    if PROFILER.enabled:
+        PROFILER.worker_task(os.getpid(), time.perf_counter() - started)
+        if _IN_WORKER:
+            result['profile'] = PROFILER.drain()  # 부모 프로세스에서 병합
+    return (path, difficulty, strategy), result
+
+def build_jobs(paths: List[str], difficulties: List[str], strategies: List[str],
+               seeds: int, games: int) -> List[Tuple[str, str, str, int, int]]:
+    jobs = []
+    for path in paths:
+        for difficulty in difficulties:
+            for strategy in strategies:
+                seed_count = seeds if strategy == RANDOM_STRATEGY else 1
+                for seed in range(seed_count):
+                    jobs.append((path, difficulty, strategy, seed, games))
+    return jobs
+
+def merge_results(results) -> Dict:
+    """작업별 결과를 (파일, 난이도, 전략) 단위로 합산 (통계 누산기는 병합)"""
+    merged = {}
+    for key, result in results:
+        profile = result.pop('profile', None)
+        if profile is not None:
+            PROFILER.merge(profile)
+        entry = merged.get(key)
+        if entry is None:
+            merged[key] = result
+            continue
+        entry['games'] += result['games']
+        for metric in OUTCOME_METRICS:
+            entry[metric].merge(result[metric])
+        entry['status'].update(result['status'])
+        entry['grade'].update(result['grade'])
+        entry['events'].update(result['events'])
+
+    report = {}
+    for (path, difficulty, strategy), entry in sorted(merged.items()):
+        games = entry['games']
+        wins = sum(count for status, count in entry['status'].items() if status.startswith('WON_'))
+        # 다른 디렉터리의 같은 파일 이름이 서로 덮어쓰지 않도록 상대 경로로 구분
+        report.setdefault(os.path.relpath(path), {}).setdefault(difficulty, {})[strategy] = {
+            'games': games,
+            'win_rate': wins / games,
+            'status': {s: c / games for s, c in entry['status'].most_common()},
+            'grade': {g: c / games for g, c in sorted(entry['grade'].items())},
+            'avg_users': entry['users'].mean,
+            'avg_cash': entry['cash'].mean,
+            'avg_trust': entry['trust'].mean,
+            'avg_steps': entry['steps'].mean,
+            'events_per_game': sum(entry['events'].values()) / games,
+            'events': {e: c / games for e, c in entry['events'].most_common()},
+            'outcomes': {metric: entry[metric].summary(with_stdev=True, percentiles=OUTCOME_PERCENTILES)
+                         for metric in OUTCOME_METRICS},
+        }
+    return report
+
+def run_sweep(paths: List[str], difficulties: List[str], strategies: List[str],
+              seeds: int = 4, games: int = 1000, workers: int = 0,
+              events_path: Optional[str] = None) -> Dict:
+    """작업을 프로세스 풀에 분산하고 결과를 하나의 리포트로 병합"""
+    jobs = build_jobs(paths, difficulties, strategies, seeds, games)
+    _load_tables(paths, events_path)  # fork 시 워커가 그대로 상속
+    workers = workers or os.cpu_count() or 1
+    PROFILER.pool_start('sweep')
+    started = time.perf_counter()
+
+    if workers == 1:
+        report = merge_results(map(_run_job, jobs))
+    else:
+        chunksize = max(1, len(jobs) // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(paths, PROFILER.enabled, events_path)) as pool:
+            report = merge_results(pool.map(_run_job, jobs, chunksize=chunksize))
+
+    PROFILER.pool('sweep', workers, time.perf_counter() - started)
+    return report
+
+def parse_args():
+    parser = argparse.ArgumentParser(description='AWS CTO Game 밸런스 일괄 시뮬레이션')
+    parser.add_argument('--data', nargs='+', default=['../game_choices_db*.json'],
+                        help='게임 데이터 JSON 경로 (glob 패턴 가능)')
+    parser.add_argument('--difficulties', nargs='+', default=list(DIFFICULTIES), choices=DIFFICULTIES)
+    parser.add_argument('--strategies', nargs='+', default=STRATEGIES + [RANDOM_STRATEGY],
+                        choices=STRATEGIES + [RANDOM_STRATEGY])
+    parser.add_argument('--seeds', type=int, default=4, help='random 전략의 시드 수')
+    parser.add_argument('--games', type=int, default=1000, help='random 전략의 시드당 게임 수')
+    parser.add_argument('--workers', type=int, default=0, help='워커 프로세스 수 (0이면 CPU 코어 수)')
+    parser.add_argument('--events', nargs='?', const=EVENTS_FILE,
+                        help='랜덤 이벤트 발동 포함 (이벤트 정의 JSON, 값 생략 시 random_events.json)')
+    parser.add_argument('--output', default='../balance_sweep.json', help='리포트 저장 경로')
+    add_profile_arguments(parser)
+    return parser.parse_args()
+
+def main():
+    args = parse_args()
+    enable_from_args(args)
+
+    print("🎮 AWS CTO Game - Balance Sweep")
+    print("=" * 60)
+
+    paths = sorted({os.path.normpath(path) for pattern in args.data for path in glob.glob(pattern)})
+    if not paths:
+        print(f"❌ 데이터 파일을 찾을 수 없습니다: {' '.join(args.data)}")
+        return
+
+    jobs = len(build_jobs(paths, args.difficulties, args.strategies, args.seeds, args.games))
+    print(f"\n📂 데이터 파일 {len(paths)}개 × 난이도 {len(args.difficulties)}개 × 전략 {len(args.strategies)}개")
+    print(f"   작업 {jobs}개, 워커 {args.workers or os.cpu_count()}개")
+
+    started = time.perf_counter()
+    report = run_sweep(paths, args.difficulties, args.strategies,
+                       seeds=args.seeds, games=args.games, workers=args.workers,
+                       events_path=args.events)
+    elapsed = time.perf_counter() - started
+
+    print("\n🏆 승률 (파일 / 난이도 / 전략):")
+    header = '\t'.join(s[:10] for s in args.strategies)
+    for filename, by_difficulty in report.items():
+        print(f"\n  {filename}")
+        print(f"    난이도\t{header}")
+        for difficulty in args.difficulties:
+            rates = by_difficulty.get(difficulty, {})
+            row = '\t'.join(f"{rates[s]['win_rate']:.0%}" if s in rates else '-' for s in args.strategies)
+            print(f"    {difficulty}\t{row}")
+
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+
+    print(f"\n\n✅ 완료 ({elapsed:.1f}초)! 결과가 {args.output}에 저장되었습니다.")
+    finish_from_args(args)
+
+if __name__ == '__main__':
+    main()
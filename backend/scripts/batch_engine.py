@@ -0,0 +1,444 @@
+#!/usr/bin/env python3
+"""
+AWS CTO Game - Batch Turn Engine (NumPy)
+game_engine.step 턴 진행 규칙의 NumPy 배치 이식본
+
+게임 N 판의 상태를 필드별 길이 N 배열로 들고, 한 턴을 모든 진행 중인 게임에 대해
+배열 연산 한 번으로 진행합니다. 선택지는 (턴 행 × 선택지 열) 로 채운 표로 컴파일해서
+게임별 (행, 열) 인덱스로 효과를 한꺼번에 읽습니다.
+
+규칙(회복/투자 배율/컴백/직원 채용/컨설팅/긴급 턴/IPO 우회/용량 페널티/승패 판정)과
+floor 순서는 game_engine.step 과 한 줄씩 대응하며, 같은 선택 순서를 주면 play() 와
+같은 최종 상태가 나옵니다 (tests/test_batch_engine.py 가 확인).
+
+사용 예:
+    table = BatchTable(compile_turns(data))
+    batch = play_batch(table, Rules('NORMAL'), 1_000_000, uniform_picker(table, np.random.default_rng(0)))
+    batch.status_counts()   # {'WON_IPO': ..., 'LOST_BANKRUPT': ..., ...}
+"""
+
+from typing import Callable, Dict, List
+
+import numpy as np
+
+from game_engine import (
+    _C, _CAPACITY_BITS, _CAPACITY_TABLE, _DIMINISHING, _DR_BIT, _GRADES, _IPO_REQUIRED_INFRA,
+    _PENALTY_TIERS, _RECOVERY, _RESILIENCE, _STABLE, _TIER_PENALTIES,
+    Choice, GameState, GameStatus, Rules, VICTORY_STATUS, new_game,
+)
+
+# 상태 코드 (배열에는 int8 로 저장)
+STATUSES = (GameStatus.PLAYING, GameStatus.WON_IPO, GameStatus.WON_ACQUISITION, GameStatus.WON_PROFITABILITY,
+            GameStatus.WON_TECH_LEADER, GameStatus.LOST_BANKRUPT, GameStatus.LOST_OUTAGE,
+            GameStatus.LOST_FAILED_IPO, GameStatus.LOST_EQUITY, GameStatus.LOST_FIRED_CTO)
+STATUS_CODES = {status: code for code, status in enumerate(STATUSES)}
+PLAYING = STATUS_CODES[GameStatus.PLAYING]
+
+# 직원 채용 순서 (apply_staff_hiring 과 같은 순서로 인원 수 보너스가 붙음)
+STAFF = ('개발자', '디자이너', '기획자')
+
+_CAPACITY = np.array(_CAPACITY_TABLE, dtype=np.int64)
+_PENALTIES = np.array(_TIER_PENALTIES, dtype=np.int64)
+_POPCOUNT8 = np.array([bin(i).count('1') for i in range(256)], dtype=np.int64)
+
+def _floor(values) -> np.ndarray:
+    """math.floor 와 같은 정수 내림 (2^53 미만 정수는 float64 에서 정확)"""
+    return np.floor(values).astype(np.int64)
+
+def _popcount(masks: np.ndarray) -> np.ndarray:
+    counts = np.zeros(masks.shape, dtype=np.int64)
+    shift = 0
+    while shift < 63 and masks.size and (masks.max() >> shift):
+        counts += _POPCOUNT8[(masks >> shift) & 0xFF]
+        shift += 8
+    return counts
+
+def _is_emergency(turn: np.ndarray) -> np.ndarray:
+    return (turn >= _C['EMERGENCY_TURN_START']) & (turn <= _C['EMERGENCY_TURN_END'])
+
+def _is_special(turn: np.ndarray) -> np.ndarray:
+    return _is_emergency(turn) | (turn == _C['IPO_SELECTION_TURN'])
+
+class BatchTable:
+    """{턴: [Choice, ...]} → (턴 행 × 선택지 열) 패딩 배열
+
+    turn_row[턴] 은 그 턴의 행 번호 (선택지가 없는 턴은 -1), count[행] 은 선택지 수입니다.
+    빈 칸(열 >= count)은 0 으로 채워 두며 선택 함수가 고르지 않습니다.
+    """
+
+    def __init__(self, turns: Dict[int, List[Choice]]):
+        rows = [(turn, choices) for turn, choices in sorted(turns.items()) if choices]
+        width = max((len(choices) for _, choices in rows), default=1)
+        targets = [c.next_turn for _, choices in rows for c in choices]
+        size = max([turn for turn, _ in rows] + targets + [_C['IPO_FINAL_SUCCESS_TURN']]) + 2
+        self.choices: List[List[Choice]] = [choices for _, choices in rows]
+        self.turn_row = np.full(size, -1, dtype=np.int64)
+        self.count = np.array([len(choices) for _, choices in rows], dtype=np.int64)
+
+        def column(get, dtype):
+            values = np.zeros((len(rows), width), dtype=dtype)
+            for r, (_, choices) in enumerate(rows):
+                values[r, :len(choices)] = [get(choice) for choice in choices]
+            return values
+
+        for r, (turn, _) in enumerate(rows):
+            self.turn_row[turn] = r
+        self.users = column(lambda c: c.users, np.int64)
+        self.cash = column(lambda c: c.cash, np.int64)
+        self.trust = column(lambda c: c.trust, np.int64)
+        self.infra = column(lambda c: c.infra, np.int64)
+        self.next_turn = column(lambda c: c.next_turn, np.int64)
+        self.transparency = column(lambda c: 'transparency' in c.tags, bool)
+        self.hires = [column(lambda c: c.hires_developer, bool),
+                      column(lambda c: c.hires_designer, bool),
+                      column(lambda c: c.hires_planner, bool)]
+        self.early_pitch = column(lambda c: c.id == _C['EARLY_PITCH_CHOICE_ID'], bool)
+        self.consulting = column(lambda c: c.id == _C['CONSULTING_CHOICE_ID'], bool)
+        self.ipo_continue = column(lambda c: c.id == _C['IPO_CONTINUE_CHOICE_ID'], bool)
+
+    def rows(self, turn: np.ndarray) -> np.ndarray:
+        """턴 배열 → 행 번호 배열 (표 밖의 턴은 -1)"""
+        inside = turn < len(self.turn_row)
+        return np.where(inside, self.turn_row[np.where(inside, turn, 0)], -1)
+
+class BatchState:
+    """GameState 의 필드별 배열 (인덱스 i = i 번째 게임)
+
+    hired_staff 는 채용 여부(직원별 bool)와 인원 수로, ipo_achieved_turn 의 None 은 0 으로,
+    status 는 STATUSES 의 코드로 저장합니다.
+    """
+
+    def __init__(self, rules: Rules, games: int):
+        initial = new_game(rules)
+        self.rules = rules
+        self.turn = np.full(games, initial.turn, dtype=np.int64)
+        self.users = np.full(games, initial.users, dtype=np.int64)
+        self.cash = np.full(games, initial.cash, dtype=np.int64)
+        self.trust = np.full(games, initial.trust, dtype=np.int64)
+        self.infra = np.full(games, initial.infra, dtype=np.int64)
+        self.status = np.full(games, PLAYING, dtype=np.int8)
+        self.max_capacity = np.full(games, initial.max_capacity, dtype=np.int64)
+        self.has_dr = np.zeros(games, dtype=bool)
+        self.has_consulting = np.zeros(games, dtype=bool)
+        self.user_multiplier = np.full(games, initial.user_multiplier, dtype=np.float64)
+        self.trust_multiplier = np.full(games, initial.trust_multiplier, dtype=np.float64)
+        self.staff = np.zeros((len(STAFF), games), dtype=bool)
+        self.staff_count = np.zeros(games, dtype=np.int64)
+        self.multi_choice = np.zeros(games, dtype=bool)
+        self.equity = np.full(games, initial.equity, dtype=np.int64)
+        self.resilience_stacks = np.zeros(games, dtype=np.int64)
+        self.negative_cash_turns = np.zeros(games, dtype=np.int64)
+        self.capacity_warning = np.zeros(games, dtype=bool)
+        self.capacity_exceeded_streak = np.zeros(games, dtype=np.int64)
+        self.capacity_exceeded_count = np.zeros(games, dtype=np.int64)
+        self.stable_turns = np.zeros(games, dtype=np.int64)
+        self.ipo_condition_met = np.zeros(games, dtype=bool)
+        self.ipo_achieved_turn = np.zeros(games, dtype=np.int64)
+        self.steps = np.zeros(games, dtype=np.int64)
+
+    def __len__(self) -> int:
+        return len(self.turn)
+
+    def status_counts(self) -> Dict[str, int]:
+        counts = np.bincount(self.status, minlength=len(STATUSES))
+        return {status: int(count) for status, count in zip(STATUSES, counts) if count}
+
+    def grades(self) -> np.ndarray:
+        """calculate_grade 결과 (종료된 게임만, 진행 중이면 None)"""
+        grade = np.full(len(self), 'F', dtype=object)
+        for name, min_users, min_cash, min_trust in reversed(_GRADES):
+            grade[(self.users >= min_users) & (self.cash >= min_cash) & (self.trust >= min_trust)] = name
+        grade[self.status == PLAYING] = None
+        return grade
+
+    def state(self, i: int) -> GameState:
+        """i 번째 게임의 GameState (hired_staff 는 STAFF 순서 — 실제 채용 순서는 보존하지 않음)"""
+        state = GameState()
+        for name in ('turn', 'users', 'cash', 'trust', 'infra', 'max_capacity', 'resilience_stacks',
+                     'negative_cash_turns', 'capacity_exceeded_streak', 'capacity_exceeded_count',
+                     'stable_turns', 'equity', 'steps'):
+            setattr(state, name, int(getattr(self, name)[i]))
+        for name in ('has_dr', 'has_consulting', 'multi_choice', 'capacity_warning', 'ipo_condition_met'):
+            setattr(state, name, bool(getattr(self, name)[i]))
+        for name in ('user_multiplier', 'trust_multiplier'):
+            setattr(state, name, float(getattr(self, name)[i]))
+        state.status = STATUSES[self.status[i]]
+        state.hired_staff = [name for s, name in enumerate(STAFF) if self.staff[s, i]]
+        state.ipo_achieved_turn = int(self.ipo_achieved_turn[i]) or None
+        state.grade = self.grades()[i]
+        return state
+
+# ---------------------------------------------------------------------------
+# 규칙 (game_engine 의 같은 이름 함수를 배열로)
+# ---------------------------------------------------------------------------
+
+def comeback_multiplier(users, cash, trust, rules: Rules) -> np.ndarray:
+    ratio = _C['COMEBACK']['DANGER_ZONE_RATIO']
+    in_danger = ((users / rules.ipo_min_users < ratio)
+                 | (cash / rules.ipo_min_cash < ratio)
+                 | (trust / rules.ipo_min_trust < ratio))
+    return np.where(in_danger, _C['COMEBACK']['COMEBACK_MULTIPLIER'], 1.0)
+
+def diminishing_multiplier(trust: np.ndarray) -> np.ndarray:
+    tiers = _DIMINISHING['TIERS']
+    multiplier = np.full(trust.shape, float(tiers[-1]['multiplier']))
+    for tier in reversed(tiers):
+        inside = (trust >= tier['minTrust']) & (trust < tier['maxTrust'])
+        multiplier = np.where(inside, tier['multiplier'], multiplier)
+    return multiplier
+
+def capacity_penalty(users: np.ndarray, max_capacity: np.ndarray) -> np.ndarray:
+    positive = max_capacity > 0
+    excess = (users - max_capacity) / np.where(positive, max_capacity, 1)
+    tier = sum((excess >= ratio).astype(np.int64) for ratio, _ in _PENALTY_TIERS)
+    return np.where(positive, _PENALTIES[tier], _C['CAPACITY_EXCEEDED_TRUST_PENALTY'])
+
+def full_ipo_conditions(users, cash, trust, infra, rules: Rules) -> np.ndarray:
+    return ((users >= rules.ipo_min_users) & (cash >= rules.ipo_min_cash) & (trust >= rules.ipo_min_trust)
+            & (infra & _IPO_REQUIRED_INFRA == _IPO_REQUIRED_INFRA))
+
+def best_victory_status(users, cash, trust, infra, rules: Rules) -> np.ndarray:
+    """find_best_victory_path → 승리 상태 코드 (조건을 만족하는 경로가 없으면 -1)"""
+    count = _popcount(infra)
+    result = np.full(users.shape, -1, dtype=np.int8)
+    for path, min_users, min_cash, min_trust, min_infra, required in reversed(rules.victory_paths):
+        ok = ((users >= min_users) & (cash >= min_cash) & (trust >= min_trust)
+              & (count >= min_infra) & (infra & required == required))
+        result = np.where(ok, STATUS_CODES[VICTORY_STATUS[path]], result).astype(np.int8)
+    return result
+
+def check_game_status(turn, users, cash, trust, infra, equity, negative_cash_turns, rules: Rules) -> np.ndarray:
+    fired = ((turn >= rules.max_turns) & ~_is_emergency(turn)
+             & (best_victory_status(users, cash, trust, infra, rules) < 0))
+    ipo_won = ((turn != _C['IPO_SELECTION_TURN']) & full_ipo_conditions(users, cash, trust, infra, rules)
+               & (turn == _C['IPO_FINAL_SUCCESS_TURN']))
+    return np.select(
+        [cash < rules.bankruptcy_threshold,
+         (cash < 0) & (negative_cash_turns >= _C['BANKRUPTCY_GRACE']['GRACE_TURNS']),
+         (users > 0) & (trust < rules.trust_outage_threshold),
+         equity < _C['EQUITY_MIN_THRESHOLD'],
+         fired,
+         ipo_won],
+        [STATUS_CODES[GameStatus.LOST_BANKRUPT], STATUS_CODES[GameStatus.LOST_BANKRUPT],
+         STATUS_CODES[GameStatus.LOST_OUTAGE], STATUS_CODES[GameStatus.LOST_EQUITY],
+         STATUS_CODES[GameStatus.LOST_FIRED_CTO], STATUS_CODES[GameStatus.WON_IPO]],
+        PLAYING).astype(np.int8)
+
+# ---------------------------------------------------------------------------
+# Turn step (game_engine.step 을 게임 묶음에 한 번에)
+# ---------------------------------------------------------------------------
+
+def step_batch(batch: BatchState, table: BatchTable, games: np.ndarray, rows: np.ndarray,
+               cols: np.ndarray) -> None:
+    """games 번째 게임들에 (rows, cols) 선택지를 적용하고 다음 턴으로 진행 (batch 를 제자리 수정)"""
+    rules = batch.rules
+    at = (rows, cols)
+    previous_turn = batch.turn[games]
+    users = batch.users[games]
+    cash = batch.cash[games]
+    trust = batch.trust[games]
+    stacks = batch.resilience_stacks[games]
+    choice_users = table.users[at]
+    choice_cash = table.cash[at]
+    choice_trust = table.trust[at]
+    choice_infra = table.infra[at]
+
+    # 자연 신뢰도 회복 + 부채 이자 (apply_turn_start_recovery)
+    recover = (trust < _RECOVERY['THRESHOLD']) & (trust < _RECOVERY['MAX_NATURAL'])
+    amount = (np.where(trust < _RECOVERY['DANGER_THRESHOLD'],
+                       _RECOVERY['DANGER_RECOVERY_AMOUNT'], _RECOVERY['RECOVERY_AMOUNT'])
+              + stacks * _RESILIENCE['TRUST_RECOVERY_PER_STACK'])
+    trust = np.where(recover, np.maximum(trust, np.minimum(_RECOVERY['MAX_NATURAL'], trust + amount)), trust)
+    in_debt = cash < 0
+    cash = np.where(in_debt, cash - _floor(np.abs(cash) * _C['BANKRUPTCY_GRACE']['DEBT_INTEREST_RATE']), cash)
+    batch.negative_cash_turns[games] = np.where(in_debt, batch.negative_cash_turns[games] + 1, 0)
+
+    early_pitch_failed = ((previous_turn == _C['EARLY_PITCH_TURN']) & table.early_pitch[at]
+                          & (trust < rules.early_pitch_trust_threshold))
+    scale = np.ones(len(games))
+    for turn, (min_cash_effect, target_trust) in rules.series_min_trust.items():
+        if target_trust <= 0:
+            continue
+        investing = (previous_turn == turn) & (choice_cash > min_cash_effect)
+        scale = np.where(investing, np.clip(trust / target_trust, _C['INVESTMENT_MIN_SCALE'],
+                                            _C['INVESTMENT_MAX_SCALE']), scale)
+
+    infra = batch.infra[games] | choice_infra
+    has_dr = batch.has_dr[games] | (choice_infra & _DR_BIT != 0)
+    has_consulting = batch.has_consulting[games]
+    base_capacity = _CAPACITY[infra & _CAPACITY_BITS]
+    base_capacity = np.where(has_consulting, base_capacity * _C['CONSULTING_CAPACITY_MULTIPLIER'], base_capacity)
+    max_capacity = _floor(base_capacity * (1 + stacks * _RESILIENCE['CAPACITY_BONUS_PER_STACK']))
+
+    comeback = comeback_multiplier(users, cash, trust, rules)
+    user_multiplier = batch.user_multiplier[games]
+    trust_multiplier = batch.trust_multiplier[games]
+
+    gained_users = _floor(choice_users * user_multiplier)
+    gained_users = np.where(gained_users >= 0, _floor(gained_users * rules.positive_multiplier),
+                            _floor(gained_users * rules.negative_multiplier))
+    gained_users = np.where((gained_users > 0) & (comeback > 1.0), _floor(gained_users * comeback), gained_users)
+    new_users = users + gained_users
+
+    gained_cash = np.where((scale != 1.0) & (choice_cash > 0), _floor(choice_cash * scale), choice_cash)
+    gained_cash = np.where((gained_cash > 0) & (comeback > 1.0), _floor(gained_cash * comeback), gained_cash)
+    new_cash = cash + gained_cash
+
+    # 유저/현금이 반영된 뒤 위험 구간 여부를 다시 판정
+    positive = np.minimum(trust_multiplier * rules.positive_multiplier
+                          * comeback_multiplier(new_users, new_cash, trust, rules), _C['TRUST_MULTIPLIER_CAP'])
+    multiplier = np.where(choice_trust > 0, positive,
+                          np.where(choice_trust < 0, rules.negative_multiplier, trust_multiplier))
+    gain = _floor(choice_trust * multiplier)
+    transparent = table.transparency[at] & batch.capacity_warning[games] & (gain > 0)
+    gain = np.where(transparent, np.minimum(_floor(gain * _C['TRANSPARENCY']['EFFECT_MULTIPLIER']),
+                                            _floor(choice_trust * _C['TRUST_MULTIPLIER_CAP'])), gain)
+    if _DIMINISHING['ENABLED']:
+        gain = np.where(gain > 0, _floor(gain * diminishing_multiplier(trust)), gain)
+    new_trust = trust + gain
+
+    failed_trust = np.maximum(0, trust - np.maximum(5, _floor(trust * 0.5)))
+    users = np.where(early_pitch_failed, users, new_users)
+    cash = np.where(early_pitch_failed, cash, new_cash)
+    trust = np.where(early_pitch_failed, failed_trust, new_trust)
+
+    # 직원 채용 (apply_staff_hiring)
+    staff = batch.staff[:, games]
+    staff_count = batch.staff_count[games]
+    bonus = _C['STAFF_HIRE_BONUS']
+    multipliers = _C['STAFF_MULTIPLIERS']
+    developer, designer, planner = (hires[at] for hires in table.hires)
+    multi_choice = batch.multi_choice[games] | developer
+    for s, hired in enumerate((developer, designer, planner)):
+        if s == 1:
+            user_multiplier = np.where(hired, np.minimum(
+                2.5, user_multiplier + multipliers['DESIGNER_USERS'] - 1.0 + bonus * staff_count), user_multiplier)
+        elif s == 2:
+            trust_multiplier = np.where(hired, np.minimum(
+                2.5, trust_multiplier + multipliers['PLANNER_TRUST'] - 1.0 + bonus * staff_count), trust_multiplier)
+        new_hire = hired & ~staff[s]
+        staff[s] |= hired
+        staff_count = staff_count + new_hire
+
+    consulting = table.consulting[at] & ~has_consulting
+    has_consulting = has_consulting | consulting
+    max_capacity = np.where(consulting, max_capacity * _C['CONSULTING_CAPACITY_MULTIPLIER'], max_capacity)
+
+    # --- 턴 진행 ---
+    max_turns = rules.max_turns
+    status = batch.status[games]
+    ipo_condition_met = batch.ipo_condition_met[games]
+    ipo_achieved_turn = batch.ipo_achieved_turn[games]
+    next_turn = table.next_turn[at]
+    next_turn = np.where((next_turn > max_turns) & ~_is_special(next_turn), max_turns, next_turn)
+
+    ipo_continue = table.ipo_continue[at]
+    return_turn = np.where(ipo_achieved_turn != 0, ipo_achieved_turn, previous_turn + 1)
+    status = np.where(ipo_continue & (return_turn > max_turns), STATUS_CODES[GameStatus.WON_IPO], status)
+    next_turn = np.where(ipo_continue, np.where(return_turn > max_turns, max_turns, return_turn), next_turn)
+    ipo_condition_met &= ~(ipo_continue & (return_turn <= max_turns))
+
+    redirect = (next_turn == _C['EMERGENCY_TRIGGER_NEXT_TURN']) & ~has_dr & ~_is_emergency(previous_turn)
+    next_turn = np.where(redirect, _C['EMERGENCY_REDIRECT_TURN'], next_turn)
+
+    ipo = ((previous_turn != _C['IPO_SELECTION_TURN']) & ~ipo_condition_met
+           & full_ipo_conditions(users, cash, trust, infra, rules))
+    ipo_condition_met |= ipo
+    ipo_achieved_turn = np.where(ipo, next_turn, ipo_achieved_turn)
+    next_turn = np.where(ipo, _C['IPO_SELECTION_TURN'], next_turn)
+
+    next_turn = np.where((next_turn > max_turns) & ~_is_special(next_turn), max_turns, next_turn)
+    multi_choice &= next_turn != max_turns
+
+    # --- 용량 체크 (EPIC-09 3단계 페널티) ---
+    streak = batch.capacity_exceeded_streak[games]
+    stable_turns = batch.stable_turns[games]
+    over = users > max_capacity
+    full_penalty = capacity_penalty(users, max_capacity)
+    penalty = np.where(streak == 0, _floor(full_penalty * 0.33),
+                       np.where(streak == 1, _floor(full_penalty * 0.67), full_penalty))
+    over_trust = np.maximum(0, trust - penalty)
+    over_stacks = np.where(stacks < _RESILIENCE['MAX_STACKS'], stacks + 1, stacks)
+    over_trust = np.where(over_stacks > 0,
+                          np.minimum(100, over_trust + _RECOVERY['CRISIS_RECOVERY_BONUS']), over_trust)
+
+    ratio = np.where(max_capacity > 0, users / np.where(max_capacity > 0, max_capacity, 1), 0)
+    stable = ratio <= _STABLE['CAPACITY_THRESHOLD']
+    stable_turns = np.where(stable, stable_turns + 1, 0)
+    bonus_turn = stable_turns >= _STABLE['REQUIRED_TURNS']
+    calm_trust = np.where(bonus_turn, np.minimum(100, trust + _STABLE['TRUST_BONUS']), trust)
+    stable_turns = np.where(bonus_turn, 0, stable_turns)
+
+    trust = np.where(over, over_trust, calm_trust)
+    users = np.where(over, np.maximum(0, users - _floor(users * 0.20)), users)
+    batch.resilience_stacks[games] = np.where(over, over_stacks, stacks)
+    batch.capacity_exceeded_count[games] += over
+    batch.capacity_warning[games] = over
+    batch.capacity_exceeded_streak[games] = np.where(over, streak + 1, 0)
+    batch.stable_turns[games] = np.where(over, 0, stable_turns)
+
+    # --- 승패 판정 ---
+    judged = next_turn != _C['IPO_SELECTION_TURN']
+    status = np.where(judged, check_game_status(next_turn, users, cash, trust, infra, batch.equity[games],
+                                                batch.negative_cash_turns[games], rules), status)
+    final_turn = (previous_turn == max_turns) & (status == PLAYING)
+    victory = best_victory_status(users, cash, trust, infra, rules)
+    status = np.where(final_turn, np.where(victory >= 0, victory, STATUS_CODES[GameStatus.LOST_FIRED_CTO]), status)
+
+    batch.turn[games] = next_turn
+    batch.users[games] = users
+    batch.cash[games] = cash
+    batch.trust[games] = trust
+    batch.infra[games] = infra
+    batch.status[games] = status
+    batch.max_capacity[games] = max_capacity
+    batch.has_dr[games] = has_dr
+    batch.has_consulting[games] = has_consulting
+    batch.user_multiplier[games] = user_multiplier
+    batch.trust_multiplier[games] = trust_multiplier
+    batch.staff[:, games] = staff
+    batch.staff_count[games] = staff_count
+    batch.multi_choice[games] = multi_choice
+    batch.ipo_condition_met[games] = ipo_condition_met
+    batch.ipo_achieved_turn[games] = ipo_achieved_turn
+    batch.steps[games] += 1
+
+# 선택 함수: (batch, 진행할 게임 인덱스, 각 게임의 행 번호) → 열 번호
+Picker = Callable[[BatchState, np.ndarray, np.ndarray], np.ndarray]
+
+def uniform_picker(table: BatchTable, rng: np.random.Generator) -> Picker:
+    """균등 무작위 선택 (game_engine.random_policy 와 같은 분포)"""
+    return lambda batch, games, rows: rng.integers(0, table.count[rows])
+
+def weighted_picker(table: BatchTable, rng: np.random.Generator, weights: Dict) -> Picker:
+    """선택지 id 별 가중치에 비례한 선택 (game_engine.weighted_policy 와 같은 분포)
+
+    행의 모든 가중치가 0 이면 균등 선택으로 대체합니다.
+    """
+    cumulative = np.zeros(table.users.shape)
+    for r, choices in enumerate(table.choices):
+        w = [weights.get(c.id, 0) for c in choices]
+        if not any(w):
+            w = [1.0] * len(choices)
+        cumulative[r, :len(choices)] = np.cumsum(w)
+        cumulative[r, len(choices):] = np.inf
+    totals = cumulative[np.arange(len(table.choices)), table.count - 1]
+
+    def pick(batch: BatchState, games: np.ndarray, rows: np.ndarray) -> np.ndarray:
+        u = rng.random(len(rows)) * totals[rows]
+        return (cumulative[rows] <= u[:, None]).sum(axis=1)
+    return pick
+
+def play_batch(table: BatchTable, rules: Rules, games: int, pick: Picker, max_steps: int = 200) -> BatchState:
+    """게임 games 판을 끝까지 진행 (play 와 같은 종료 조건)
+
+    매 반복마다 진행 중이고 현재 턴에 선택지가 있는 게임 전부를 한 턴 진행합니다.
+    """
+    batch = BatchState(rules, games)
+    while True:
+        rows = table.rows(batch.turn)
+        active = np.flatnonzero((batch.status == PLAYING) & (batch.steps < max_steps) & (rows >= 0))
+        if not active.size:
+            return batch
+        rows = rows[active]
+        step_batch(batch, table, active, rows, pick(batch, active, rows))
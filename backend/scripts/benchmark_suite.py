@@ -0,0 +1,261 @@
+#!/usr/bin/env python3
+"""
+AWS CTO Game - Balance Tool Benchmarks
+밸런스 도구의 크기별 실행 시간 측정 + 기준선 대비 회귀 검출
+
+synthetic_scenarios.py 로 만든 크기별 데이터(실제 데이터 포함)에 대해 각 단계를 반복 실행하고
+최소/중앙값 시간을 JSON 으로 기록합니다. 저장된 기준선(--baseline)보다 중앙값이
+허용 비율(--tolerance)과 최소 차이(--min-delta)를 모두 넘게 느려지면 회귀로 표시하고
+종료 코드 1 을 돌려줍니다. 네트워크/DB 없이 로컬에서만 동작합니다.
+
+단계:
+- load: JSON 파싱
+- choice_table: 열 단위 선택지 표 컴파일 (choice_table.py)
+- effects: 선택지 효과 통계 (analyze_balance.analyze_choice_effects)
+- simulate: 전략별 경로 시뮬레이션 (analyze_balance.simulate_path)
+- playthrough: 마지막 턴까지 이어지는 긴 플레이 (game_engine.play, max_turns 확장)
+- monte_carlo: game_engine.play 기반 Monte Carlo (analyze_balance.monte_carlo, engine='python')
+- monte_carlo_numpy: batch_engine 배열 진행 Monte Carlo (analyze_balance.monte_carlo, engine='numpy')
+- rebalance: 기본 재조정 파이프라인 + 변경 내역 (rebalance_game.py)
+- snapshot: 스냅샷 매니페스트 생성 (snapshot_store.py, 디스크에 쓰지 않음)
+
+사용 예:
+    python3 benchmark_suite.py --sizes real,small,medium          # 측정 + 기준선 비교
+    python3 benchmark_suite.py --sizes real,small,medium,large --save-baseline
+    python3 benchmark_suite.py --stages load,simulate --repeat 5
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+from typing import Callable, Dict, List, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # 환경 기록용 (없어도 측정에는 영향 없음)
+    np = None
+
+from analyze_balance import analyze_choice_effects, monte_carlo, simulate_path
+from choice_table import compile_choice_table
+from game_engine import CONSTANTS_HASH, STRATEGIES, Rules, compile_turns, greedy_policy, load_game_data, play
+from rebalance_game import DEFAULT_PIPELINE, diff_data, run_pipeline
+from snapshot_store import SnapshotStore
+from synthetic_scenarios import DEFAULT_TEMPLATE, PRESETS, generate, reserved_turns, save_game_data
+
+CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.cache', 'benchmarks')
+DEFAULT_BASELINE = os.path.join(CACHE_DIR, 'baseline.json')
+DEFAULT_OUTPUT = os.path.join(CACHE_DIR, 'latest.json')
+
+# ---------------------------------------------------------------------------
+# 데이터 준비
+# ---------------------------------------------------------------------------
+
+def prepare_dataset(size: str, seed: int) -> str:
+    """크기 이름 → 데이터 파일 경로 ('real' 은 실제 데이터, 합성 데이터는 캐시에 한 번만 생성)"""
+    if size == 'real':
+        return DEFAULT_TEMPLATE
+    turns, choices = PRESETS[size]
+    with open(DEFAULT_TEMPLATE, 'rb') as f:
+        template_hash = hashlib.sha256(f.read()).hexdigest()[:12]
+    path = os.path.join(CACHE_DIR, f'synthetic_{size}_{turns}x{choices}_s{seed}_{template_hash}.json')
+    if not os.path.exists(path):
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        save_game_data(path, generate(turns, choices, seed))
+    return path
+
+# ---------------------------------------------------------------------------
+# 단계
+# ---------------------------------------------------------------------------
+
+class Context:
+    """한 크기에 대한 단계 입력 (파싱/컴파일 결과는 단계 사이에서 재사용)"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.data = load_game_data(path)
+        self.table = compile_choice_table(self.data)
+        self.turns = compile_turns(self.data)
+        reserved = reserved_turns()
+        self.last_turn = max(t['turn'] for t in self.data if t['turn'] not in reserved)
+
+def stage_load(ctx: Context):
+    load_game_data(ctx.path)
+
+def stage_choice_table(ctx: Context):
+    compile_choice_table(ctx.data)
+
+def stage_effects(ctx: Context):
+    analyze_choice_effects(ctx.data)
+
+def stage_simulate(ctx: Context):
+    for strategy in STRATEGIES:
+        simulate_path(ctx.data, strategy, 'NORMAL')
+
+def stage_playthrough(ctx: Context) -> Dict:
+    """max_turns 를 데이터의 마지막 일반 턴으로 늘려 그래프 끝까지 진행"""
+    rules = Rules('NORMAL')
+    rules.max_turns = ctx.last_turn
+    steps = 0
+    for strategy in ('best_cash', 'balanced'):
+        state = play(ctx.turns, rules, greedy_policy(strategy), max_steps=4 * len(ctx.turns))
+        steps += state.steps
+    return {'steps': steps}
+
+def stage_monte_carlo(ctx: Context):
+    monte_carlo(ctx.data, games=2_000, difficulties=('NORMAL',), turns=ctx.turns, engine='python')
+
+def stage_monte_carlo_numpy(ctx: Context):
+    monte_carlo(ctx.data, games=20_000, difficulties=('NORMAL',), turns=ctx.turns, engine='numpy')
+
+def stage_rebalance(ctx: Context):
+    diff_data(ctx.data, run_pipeline(ctx.data, DEFAULT_PIPELINE))
+
+def stage_snapshot(ctx: Context):
+    SnapshotStore(os.path.join(CACHE_DIR, 'snapshot_bench')).snapshot(ctx.data, persist=False)
+
+STAGES: Dict[str, Callable[[Context], object]] = {
+    'load': stage_load,
+    'choice_table': stage_choice_table,
+    'effects': stage_effects,
+    'simulate': stage_simulate,
+    'playthrough': stage_playthrough,
+    'monte_carlo': stage_monte_carlo,
+    'monte_carlo_numpy': stage_monte_carlo_numpy,
+    'rebalance': stage_rebalance,
+    'snapshot': stage_snapshot,
+}
+
+def time_stage(fn: Callable, ctx: Context, repeat: int) -> Dict:
+    times, extra = [], None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        extra = fn(ctx)
+        times.append(time.perf_counter() - start)
+    result = {'min': min(times), 'median': statistics.median(times), 'runs': repeat}
+    if isinstance(extra, dict):
+        result.update(extra)
+    return result
+
+def run_benchmarks(sizes: List[str], stages: List[str], repeat: int, seed: int) -> Dict:
+    results = {}
+    for size in sizes:
+        path = prepare_dataset(size, seed)
+        start = time.perf_counter()
+        ctx = Context(path)
+        print(f"\n📐 {size}: 턴 {len(ctx.data)}개, 선택지 {len(ctx.table)}개, "
+              f"{os.path.getsize(path) / 1024:.0f}KB (준비 {time.perf_counter() - start:.2f}초)")
+        entry = {'turns': len(ctx.data), 'choices': len(ctx.table),
+                 'bytes': os.path.getsize(path), 'stages': {}}
+        for name in stages:
+            entry['stages'][name] = timing = time_stage(STAGES[name], ctx, repeat)
+            extra = f" ({timing['steps']} steps)" if 'steps' in timing else ''
+            print(f"   ⏱️  {name:<13} median {timing['median'] * 1000:9.1f}ms  "
+                  f"min {timing['min'] * 1000:9.1f}ms{extra}")
+        results[size] = entry
+    return results
+
+# ---------------------------------------------------------------------------
+# 기준선 비교
+# ---------------------------------------------------------------------------
+
+def environment() -> Dict:
+    return {
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'machine': platform.machine(),
+        'cpus': os.cpu_count(),
+        'numpy': getattr(np, '__version__', None),
+        'constants': CONSTANTS_HASH,
+    }
+
+def compare(current: Dict, baseline: Dict, tolerance: float, min_delta: float) -> Tuple[List[Tuple], int]:
+    """→ ((크기, 단계, 기준선, 현재, 비율) 회귀 목록, 비교한 단계 수)
+
+    기준선에 없는 크기나 선택지 수가 다른 데이터는 비교하지 않습니다.
+    """
+    regressions, compared = [], 0
+    for size, entry in current['results'].items():
+        base_entry = baseline.get('results', {}).get(size)
+        if not base_entry or base_entry.get('choices') != entry['choices']:
+            continue
+        for stage, timing in entry['stages'].items():
+            base = base_entry['stages'].get(stage)
+            if not base:
+                continue
+            compared += 1
+            ratio = timing['median'] / base['median'] if base['median'] else float('inf')
+            if ratio > 1 + tolerance and timing['median'] - base['median'] > min_delta:
+                regressions.append((size, stage, base['median'], timing['median'], ratio))
+    return regressions, compared
+
+def parse_args():
+    parser = argparse.ArgumentParser(description='밸런스 도구 크기별 벤치마크')
+    parser.add_argument('--sizes', default='real,small,medium',
+                        help=f"쉼표로 구분 (real, {', '.join(PRESETS)})")
+    parser.add_argument('--stages', default=','.join(STAGES), help='쉼표로 구분한 단계')
+    parser.add_argument('--repeat', type=int, default=3, help='단계별 반복 횟수 (중앙값 사용)')
+    parser.add_argument('--seed', type=int, default=0, help='합성 데이터 시드')
+    parser.add_argument('--output', default=DEFAULT_OUTPUT, help='결과 JSON 경로')
+    parser.add_argument('--baseline', default=DEFAULT_BASELINE, help='기준선 JSON 경로')
+    parser.add_argument('--save-baseline', action='store_true', help='이번 결과를 기준선으로 저장')
+    parser.add_argument('--tolerance', type=float, default=0.25, help='허용 비율 (0.25 = 25%% 느려짐까지 허용)')
+    parser.add_argument('--min-delta', type=float, default=0.005, help='회귀로 볼 최소 차이 (초)')
+    return parser.parse_args()
+
+def main():
+    args = parse_args()
+    sizes = [s for s in args.sizes.split(',') if s]
+    stages = [s for s in args.stages.split(',') if s]
+    unknown = [s for s in sizes if s != 'real' and s not in PRESETS] + [s for s in stages if s not in STAGES]
+    if unknown:
+        raise SystemExit(f"❌ 알 수 없는 크기/단계: {', '.join(unknown)}")
+
+    print('=' * 60)
+    print('🏁 밸런스 도구 벤치마크')
+    print('=' * 60)
+
+    current = {
+        'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'environment': environment(),
+        'settings': {'repeat': args.repeat, 'seed': args.seed},
+        'results': run_benchmarks(sizes, stages, args.repeat, args.seed),
+    }
+
+    os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(current, f, ensure_ascii=False, indent=2)
+    print(f"\n💾 결과 저장: {args.output}")
+
+    status = 0
+    if os.path.exists(args.baseline) and not args.save_baseline:
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+        if baseline.get('environment') != current['environment']:
+            print("⚠️  기준선과 실행 환경이 다릅니다 (비교 결과는 참고용)")
+        regressions, compared = compare(current, baseline, args.tolerance, args.min_delta)
+        if not compared:
+            print("ℹ️  기준선에 같은 크기의 결과가 없어 비교하지 않았습니다")
+        elif regressions:
+            status = 1
+            print(f"\n🚨 회귀 {len(regressions)}건 (기준선 {args.baseline}):")
+            for size, stage, base, now, ratio in regressions:
+                print(f"   - {size}/{stage}: {base * 1000:.1f}ms → {now * 1000:.1f}ms (×{ratio:.2f})")
+        else:
+            print(f"✅ 기준선 대비 회귀 없음 ({compared}개 단계, 허용 {args.tolerance:.0%})")
+    elif args.save_baseline:
+        os.makedirs(os.path.dirname(os.path.abspath(args.baseline)), exist_ok=True)
+        with open(args.baseline, 'w', encoding='utf-8') as f:
+            json.dump(current, f, ensure_ascii=False, indent=2)
+        print(f"📌 기준선 저장: {args.baseline}")
+    else:
+        print("ℹ️  기준선이 없습니다 (--save-baseline 으로 저장)")
+
+    sys.exit(status)
+
+if __name__ == '__main__':
+    main()
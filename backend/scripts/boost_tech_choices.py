@@ -4,29 +4,8 @@
 인프라 카테고리 또는 특정 기술 키워드가 포함된 선택지를 대상으로 함
 """
 import json
-import sys
 
-# 기술 관련 키워드
-TECH_KEYWORDS = [
-    'RDS', 'Aurora', 'ECS', 'EKS', 'CloudFront', 'Lambda', 'WAF',
-    'Auto Scaling', 'Redis', 'CloudWatch', 'CodePipeline', 'S3',
-    'CDN', 'Bedrock', 'X-Ray', 'Shield', 'DevOps', 'CI/CD',
-    '컨테이너', '모니터링', '인프라', '보안', '암호화', '데이터베이스'
-]
-
-def is_tech_choice(choice):
-    """선택지가 기술적 선택인지 판단"""
-    # 카테고리가 "인프라"인 경우
-    if choice.get('category') == '인프라':
-        return True
-
-    # 텍스트에 기술 키워드가 포함된 경우
-    text = choice.get('text', '')
-    for keyword in TECH_KEYWORDS:
-        if keyword in text:
-            return True
-
-    return False
+from keyword_matcher import is_tech_choice  # 키워드 표는 keyword_matcher.py 와 공유
 
 def boost_tech_choices(data):
     """기술적 선택지에 신뢰도 +2 추가"""
@@ -0,0 +1,344 @@
+#!/usr/bin/env python3
+"""
+AWS CTO Game - Choice Sensitivity Analysis
+선택지별 민감도 분석 (공통 난수 Common Random Numbers)
+
+모든 선택지의 users/cash/trust 효과를 ±step 만큼 바꿨을 때 승률과 리더보드 점수
+(game_engine.final_score)가 얼마나 움직이는지 계산해서 순위를 매깁니다.
+identify_balance_issues 가 "어떤 경로가 너무 쉽다" 고 알려 주면, 이 리포트는 어느 선택지를
+조정해야 하는지 알려 줍니다.
+
+공통 난수:
+- 게임 g 의 k 번째 선택은 항상 같은 난수 draws[g][k] 로 정합니다 (기준선과 변경 실행이 공유).
+  같은 게임끼리 짝지어 차이를 재므로, 독립 표본으로 두 승률을 따로 추정할 때보다 분산이 훨씬 작습니다.
+- 선택지 효과는 그 선택지를 고르기 전까지 게임에 영향을 주지 않으므로, 기준선 실행에서
+  그 선택지를 처음 고르기 직전 상태(정책이 'random' 이 아니면 그 턴에 처음 도착한 상태)를
+  저장해 두고, 변경 실행은 그 게임들만 그 지점부터 다시 진행합니다.
+  전략 가중 정책은 효과가 선택 확률도 바꾸므로, 그 턴에서 바뀐 선택지를 고르거나 같은 난수로
+  고르는 순번이 달라지는 게임만 다시 진행합니다. 나머지 게임의 차이는 정확히 0 입니다.
+
+step 은 지표별로 (일반 턴 선택지의 0 이 아닌 |효과| 중앙값 × --step) 이며 최소 1 입니다.
+
+사용 예:
+    python3 choice_sensitivity.py                                   # random 정책, 1,000게임
+    python3 choice_sensitivity.py --games 4000 --policy balanced --difficulty HARD
+    python3 choice_sensitivity.py --top 30 --output ../choice_sensitivity.json
+"""
+
+import argparse
+import json
+import math
+import os
+import random
+import statistics
+import time
+from bisect import bisect_right
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+from game_engine import (
+    DIFFICULTIES, STRATEGIES, Choice, GameState, GameStatus, Rules, choice_preference,
+    compile_turns, final_score, is_special_turn, load_game_data, new_game, step,
+)
+from profiler import PROFILER, add_arguments as add_profile_arguments, enable_from_args, finish_from_args
+
+METRICS = ('users', 'cash', 'trust')
+RANDOM_POLICY = 'random'
+
+# ---------------------------------------------------------------------------
+# 공통 난수 플레이
+# ---------------------------------------------------------------------------
+
+def _cumulative(choices: List[Choice], policy: str, sharpness: float) -> List[float]:
+    """턴 선택지의 누적 선택 확률 (random 은 균등, 전략 이름이면 선호 점수의 softmax)"""
+    if policy == RANDOM_POLICY:
+        weights = [1.0] * len(choices)
+    else:
+        scores = [choice_preference(choice, policy) for choice in choices]
+        spread = (max(scores) - min(scores)) or 1.0
+        weights = [math.exp(sharpness * (score - max(scores)) / spread) for score in scores]
+    total = sum(weights)
+    running, cumulative = 0.0, []
+    for weight in weights:
+        running += weight / total
+        cumulative.append(running)
+    cumulative[-1] = 1.0
+    return cumulative
+
+def _play_from(state: GameState, turns: Dict[int, List[Choice]], cumulative: Dict[int, List[float]],
+               rules: Rules, draws: List[float], checkpoints: Optional[Dict] = None,
+               by_choice: bool = True, path: Optional[List] = None) -> GameState:
+    """state 부터 끝까지 진행 — k 번째 선택은 draws[k] 로 결정
+
+    checkpoints 가 주어지면 선택지 id(by_choice) 또는 턴별로 처음 만난 직전 상태를,
+    path 가 주어지면 (턴, 고른 순번) 을 기록합니다.
+    """
+    max_steps = len(draws)
+    while state.status == GameStatus.PLAYING and state.steps < max_steps:
+        choices = turns.get(state.turn)
+        if not choices:
+            break
+        index = bisect_right(cumulative[state.turn], draws[state.steps])
+        index = min(index, len(choices) - 1)
+        choice = choices[index]
+        if path is not None:
+            path.append((state.turn, index))
+        if checkpoints is not None:
+            key = choice.id if by_choice else state.turn
+            if key not in checkpoints:
+                checkpoints[key] = state.copy()
+        step(state, choice, rules)
+    return state
+
+def _outcome(state: GameState, rules: Rules) -> Tuple[int, int]:
+    return int(state.status.startswith('WON_')), final_score(state, rules)
+
+def _perturbed_choice(choice: Choice, raw: Dict, metric: str, delta: int) -> Choice:
+    effects = dict(raw['effects'])
+    effects[metric] = effects.get(metric, 0) + delta
+    return Choice(choice.turn, dict(raw, effects=effects))
+
+def effect_steps(data: List[Dict], fraction: float) -> Dict[str, int]:
+    """지표별 step = 일반 턴 선택지의 0 이 아닌 |효과| 중앙값 × fraction (정수, 최소 1)
+
+    표준편차는 수십억 원짜리 투자 선택지 몇 개에 끌려가므로 중앙값을 씁니다.
+    """
+    steps = {}
+    for metric in METRICS:
+        values = [abs(c['effects'].get(metric, 0)) for t in data if not is_special_turn(t['turn'])
+                  for c in t['choices'] if c['effects'].get(metric, 0)]
+        typical = statistics.median(values) if values else 0
+        steps[metric] = max(1, int(round(typical * fraction)))
+    return steps
+
+# ---------------------------------------------------------------------------
+# 기준선 + 변경 실행
+# ---------------------------------------------------------------------------
+
+class Experiment:
+    """기준선 실행 결과와 재시작 지점 (워커 프로세스는 fork 로 상속하거나 같은 시드로 다시 만듦)"""
+
+    def __init__(self, data: List[Dict], difficulty: str, policy: str, games: int, seed: int,
+                 sharpness: float = 3.0):
+        self.rules = Rules(difficulty)
+        self.policy = policy
+        self.sharpness = sharpness
+        self.by_choice = policy == RANDOM_POLICY
+        self.games = games
+        self.turns = compile_turns(data)
+        self.raw = {str(c['id']): c for t in data for c in t['choices']}
+        self.cumulative = {turn: _cumulative(choices, policy, sharpness)
+                           for turn, choices in self.turns.items() if choices}
+
+        rng = random.Random(seed)
+        max_steps = 4 * len(data)
+        self.draws = [[rng.random() for _ in range(max_steps)] for _ in range(games)]
+
+        # 기준선: 게임별 결과 + 재시작 지점 → (키 → [(게임, 상태)])
+        self.wins: List[int] = []
+        self.scores: List[int] = []
+        self.resume: Dict[object, List[Tuple[int, GameState]]] = {}
+        self.paths: List[List[Tuple[int, int]]] = []
+        for g in range(games):
+            checkpoints = {}
+            path = None if self.by_choice else []
+            final = _play_from(new_game(self.rules), self.turns, self.cumulative, self.rules,
+                               self.draws[g], checkpoints, self.by_choice, path)
+            self.paths.append(path)
+            win, score = _outcome(final, self.rules)
+            self.wins.append(win)
+            self.scores.append(score)
+            for key, state in checkpoints.items():
+                self.resume.setdefault(key, []).append((g, state))
+
+    def _diverges(self, g: int, choice: Choice, cumulative: List[float]) -> bool:
+        """가중 정책: 게임 g 가 그 턴에서 바뀐 선택지를 고르거나 고르는 순번이 바뀌는지"""
+        draws = self.draws[g]
+        choices = self.turns[choice.turn]
+        for k, (turn, index) in enumerate(self.paths[g]):
+            if turn != choice.turn:
+                continue
+            if choices[index] is choice or min(bisect_right(cumulative, draws[k]), len(choices) - 1) != index:
+                return True
+        return False
+
+    def perturb(self, choice: Choice, metric: str, delta: int) -> Dict:
+        """선택지 하나의 지표를 delta 만큼 바꿨을 때 (승률, 점수) 평균 변화와 표준오차 (짝지은 차이)"""
+        perturbed = _perturbed_choice(choice, self.raw[str(choice.id)], metric, delta)
+        turns = dict(self.turns)
+        turns[choice.turn] = [perturbed if c is choice else c for c in self.turns[choice.turn]]
+        cumulative = self.cumulative
+        if not self.by_choice:
+            cumulative = dict(cumulative)
+            cumulative[choice.turn] = _cumulative(turns[choice.turn], self.policy, self.sharpness)
+
+        key = choice.id if self.by_choice else choice.turn
+        sums = [0.0, 0.0, 0.0, 0.0]   # Σ승 차이, Σ승 차이², Σ점수 차이, Σ점수 차이²
+        affected = 0
+        for g, checkpoint in self.resume.get(key, ()):
+            if not self.by_choice and not self._diverges(g, choice, cumulative[choice.turn]):
+                continue  # 이 게임은 바뀐 선택지를 만나지 않음 → 차이 0
+            final = _play_from(checkpoint.copy(), turns, cumulative, self.rules, self.draws[g])
+            win, score = _outcome(final, self.rules)
+            dw, ds = win - self.wins[g], score - self.scores[g]
+            if dw or ds:
+                affected += 1
+                sums[0] += dw
+                sums[1] += dw * dw
+                sums[2] += ds
+                sums[3] += ds * ds
+        n = self.games
+        return {
+            'win_rate': sums[0] / n,
+            'win_rate_se': _standard_error(sums[0], sums[1], n),
+            'score': sums[2] / n,
+            'score_se': _standard_error(sums[2], sums[3], n),
+            'affected': affected,
+        }
+
+def _standard_error(total: float, total_sq: float, n: int) -> float:
+    if n < 2:
+        return 0.0
+    mean = total / n
+    variance = max(0.0, (total_sq - n * mean * mean) / (n - 1))
+    return math.sqrt(variance / n)
+
+# 워커 프로세스 전역 상태 (balance_sweep 과 같은 방식: fork 면 부모의 기준선을 그대로 상속)
+_EXPERIMENT: Optional[Experiment] = None
+
+def _init_worker(args: Tuple):
+    global _EXPERIMENT
+    if _EXPERIMENT is None:
+        _EXPERIMENT = Experiment(*args)
+
+def _run_choice(job: Tuple[int, str, Dict[str, int]]) -> Tuple[int, str, Dict]:
+    turn, choice_id, steps = job
+    experiment = _EXPERIMENT
+    choice = next(c for c in experiment.turns[turn] if str(c.id) == choice_id)
+    result = {}
+    for metric in METRICS:
+        with PROFILER.stage('perturb'):
+            plus = experiment.perturb(choice, metric, steps[metric])
+            minus = experiment.perturb(choice, metric, -steps[metric])
+        result[metric] = {
+            'step': steps[metric],
+            'plus': plus,
+            'minus': minus,
+            # 중앙 차분: step 하나당 변화량
+            'win_rate_slope': (plus['win_rate'] - minus['win_rate']) / 2,
+            'score_slope': (plus['score'] - minus['score']) / 2,
+        }
+    return turn, choice_id, result
+
+def analyze_sensitivity(data: List[Dict], difficulty: str = 'NORMAL', policy: str = RANDOM_POLICY,
+                        games: int = 1000, seed: int = 0, step_fraction: float = 0.5,
+                        workers: int = 1, sharpness: float = 3.0) -> Dict:
+    """모든 선택지 × 지표 × (+step, -step) 민감도"""
+    global _EXPERIMENT
+    settings = (data, difficulty, policy, games, seed, sharpness)
+    with PROFILER.stage('baseline'):
+        _EXPERIMENT = experiment = Experiment(*settings)
+    steps = effect_steps(data, step_fraction)
+    jobs = [(turn, str(choice.id), steps) for turn, choices in sorted(experiment.turns.items())
+            for choice in choices]
+
+    workers = workers or os.cpu_count() or 1
+    if workers == 1:
+        results = list(map(_run_choice, jobs))
+    else:
+        chunksize = max(1, len(jobs) // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(settings,)) as pool:
+            results = list(pool.map(_run_choice, jobs, chunksize=chunksize))
+
+    # 공통 난수의 효과: 독립 표본이라면 차이의 분산은 2 × Var(기준선)
+    base_win_var = statistics.pvariance(experiment.wins) if games > 1 else 0.0
+    base_score_var = statistics.pvariance(experiment.scores) if games > 1 else 0.0
+    reductions = []
+    choices = []
+    for turn, choice_id, by_metric in results:
+        raw = experiment.raw[choice_id]
+        for entry in by_metric.values():
+            for side in ('plus', 'minus'):
+                se = entry[side]['score_se']
+                if se > 0 and base_score_var > 0:
+                    reductions.append(2 * base_score_var / (se * se * games))
+        choices.append({
+            'turn': turn,
+            'id': raw['id'],
+            'title': raw.get('text', '').split('\n', 1)[0][:60],
+            'effects': {metric: raw['effects'].get(metric, 0) for metric in METRICS},
+            'influence': sum(abs(entry['win_rate_slope']) for entry in by_metric.values()),
+            'score_influence': sum(abs(entry['score_slope']) for entry in by_metric.values()),
+            'metrics': by_metric,
+        })
+    choices.sort(key=lambda c: (-c['influence'], -c['score_influence']))
+
+    return {
+        'difficulty': difficulty,
+        'policy': policy,
+        'games': games,
+        'seed': seed,
+        'steps': steps,
+        'baseline': {
+            'win_rate': sum(experiment.wins) / games,
+            'score': sum(experiment.scores) / games,
+            'win_rate_stdev': math.sqrt(base_win_var),
+            'score_stdev': math.sqrt(base_score_var),
+        },
+        # 같은 정밀도를 독립 표본으로 얻으려면 몇 배의 게임이 필요한지 (점수 기준 중앙값)
+        'crn_variance_reduction': statistics.median(reductions) if reductions else None,
+        'choices': choices,
+    }
+
+def parse_args():
+    parser = argparse.ArgumentParser(description='선택지별 민감도 분석 (공통 난수)')
+    parser.add_argument('--data', default='../game_choices_db.json', help='게임 데이터 JSON 경로')
+    parser.add_argument('--output', default='../choice_sensitivity.json', help='리포트 저장 경로')
+    parser.add_argument('--difficulty', default='NORMAL', choices=DIFFICULTIES)
+    parser.add_argument('--policy', default=RANDOM_POLICY, choices=[RANDOM_POLICY] + STRATEGIES,
+                        help="선택 정책: 'random' 또는 전략 이름 (전략 점수의 softmax)")
+    parser.add_argument('--games', type=int, default=1000, help='기준선 게임 수')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--step', type=float, default=0.5, help='효과 변경 크기 (지표별 대표 |효과| 의 배수)')
+    parser.add_argument('--workers', type=int, default=1, help='워커 프로세스 수 (0이면 CPU 코어 수)')
+    parser.add_argument('--top', type=int, default=15, help='출력할 상위 선택지 수')
+    add_profile_arguments(parser)
+    return parser.parse_args()
+
+def main():
+    args = parse_args()
+    enable_from_args(args)
+
+    print("🎮 AWS CTO Game - Choice Sensitivity")
+    print("=" * 60)
+
+    data = load_game_data(args.data)
+    started = time.perf_counter()
+    report = analyze_sensitivity(data, args.difficulty, args.policy, args.games, args.seed,
+                                 args.step, args.workers)
+    elapsed = time.perf_counter() - started
+
+    base = report['baseline']
+    steps = report['steps']
+    print(f"\n📊 기준선 ({args.difficulty}, 정책 {args.policy}, {args.games:,}게임): "
+          f"승률 {base['win_rate']:.1%}, 평균 점수 {base['score']:,.0f}")
+    print(f"   step: 유저 ±{steps['users']:,} / 현금 ±{steps['cash']:,} / 신뢰도 ±{steps['trust']}")
+    if report['crn_variance_reduction']:
+        print(f"   공통 난수 분산 감소: 독립 표본 대비 약 {report['crn_variance_reduction']:,.0f}배 적은 게임으로 같은 정밀도")
+
+    print(f"\n🎯 승률에 가장 민감한 선택지 (상위 {args.top}개, step 하나당 승률 변화):")
+    print("   턴\tid\t유저\t\t현금\t\t신뢰도\t\t점수 합\t\t선택지")
+    for entry in report['choices'][:args.top]:
+        slopes = '\t\t'.join(f"{entry['metrics'][m]['win_rate_slope']:+.2%}" for m in METRICS)
+        print(f"   {entry['turn']}\t{entry['id']}\t{slopes}\t\t{entry['score_influence']:,.0f}\t\t{entry['title']}")
+
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+
+    print(f"\n✅ 완료 ({elapsed:.1f}초, 선택지 {len(report['choices'])}개 × 지표 {len(METRICS)}개 × ±step)! "
+          f"결과가 {args.output}에 저장되었습니다.")
+    finish_from_args(args)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,323 @@
+#!/usr/bin/env python3
+"""
+AWS CTO Game - Columnar Choice Table
+game_choices_db.json → 열(column) 단위 선택지 표 + 메모리 매핑 가능한 바이너리 캐시
+
+선택지 i 의 효과는 dict 조회 대신 정수 배열 인덱싱으로 읽습니다:
+    table.users[i], table.cash[i], table.trust[i], table.next_turn[i], table.infra[i] (비트마스크)
+턴 t 의 선택지는 table.turn_range(t) (CSR 오프셋 인덱스) 입니다.
+
+바이너리 캐시는 원본 JSON 의 내용 해시로 키가 붙어 scripts/.cache/choice_table/ 에 저장되며,
+mmap + memoryview.cast 로 복사 없이 열을 노출하므로 JSON 파싱 없이 바로 로드됩니다.
+문자열(선택지 텍스트, 카테고리, 인프라 이름, 숫자가 아닌 선택지 id)은 파일 끝의 JSON 메타 블록에 있고
+처음 접근할 때만 읽습니다. 선택지 id 는 game_engine.choice_id 로 통일하며, 숫자가 아닌 id 는 id 열에
+음수 코드(-1 - 메타 'string_ids' 인덱스)로 넣습니다.
+
+캐시 파일 이름과 헤더에는 형식 버전(FORMAT_VERSION)과 엔진 해시(CONSTANTS_HASH)가 함께 들어가므로,
+형식이나 선택지 해석 규칙(채용 플래그, 인프라 비트)이 바뀌면 이전 캐시를 쓰지 않고 다시 컴파일합니다.
+
+사용 예:
+    python3 choice_table.py --data ../game_choices_db.json        # 컴파일 (캐시에 있으면 재사용)
+"""
+
+import argparse
+import array
+import bisect
+import hashlib
+import json
+import mmap
+import os
+import struct
+import time
+from typing import Dict, List, Optional
+
+from game_engine import CONSTANTS_HASH, Choice, infra_mask
+
+MAGIC = b'CTOCHT'
+FORMAT_VERSION = 2
+# magic(6) + 형식 버전(2), 원본 해시(16자), 엔진 해시(16자), 선택지 수, 턴 수, 메타 블록 길이
+_HEADER = struct.Struct('<6sH16s16sIIQ')
+_ALIGN = 8
+
+# 선택지별 정수 열 (모두 int64, infra 만 uint64 비트마스크)
+INT_COLUMNS = ('turn', 'id', 'users', 'cash', 'trust', 'next_turn', 'flags')
+MASK_COLUMNS = ('infra',)
+
+# flags 비트 — Choice 의 채용 여부
+FLAG_HIRES_DEVELOPER = 1
+FLAG_HIRES_DESIGNER = 2
+FLAG_HIRES_PLANNER = 4
+
+DEFAULT_CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.cache', 'choice_table')
+
+def _source_hash(raw: bytes) -> str:
+    return hashlib.sha256(raw).hexdigest()[:16]
+
+class ChoiceTable:
+    """열 단위 선택지 표
+
+    열은 array.array(메모리에서 컴파일) 또는 mmap 위의 memoryview(캐시에서 로드) 이며
+    둘 다 같은 인덱싱/len/반복 인터페이스를 가집니다. numpy 가 있다면
+    numpy.frombuffer(table.users, dtype=numpy.int64) 로 복사 없이 배열로 쓸 수 있습니다.
+    """
+
+    def __init__(self, columns: Dict, turn_numbers, offsets, source_hash: str,
+                 meta: Optional[Dict] = None, meta_loader=None, handle=None):
+        for name in INT_COLUMNS + MASK_COLUMNS:
+            setattr(self, name, columns[name])
+        self.turn_numbers = turn_numbers
+        self.offsets = offsets
+        self.source_hash = source_hash
+        self._meta = meta
+        self._meta_loader = meta_loader
+        self._handle = handle
+
+    def __len__(self) -> int:
+        return len(self.id)
+
+    # -- 인덱스 --------------------------------------------------------------
+
+    def turn_range(self, turn: int) -> range:
+        """턴의 선택지 인덱스 범위 (없는 턴이면 빈 범위)"""
+        k = bisect.bisect_left(self.turn_numbers, turn)
+        if k == len(self.turn_numbers) or self.turn_numbers[k] != turn:
+            return range(0)
+        return range(self.offsets[k], self.offsets[k + 1])
+
+    def has_choices(self, turn: int) -> bool:
+        return len(self.turn_range(turn)) > 0
+
+    # -- 문자열 메타 ---------------------------------------------------------
+
+    @property
+    def meta(self) -> Dict:
+        if self._meta is None:
+            self._meta = self._meta_loader()
+        return self._meta
+
+    @property
+    def infra_names(self) -> List[str]:
+        return self.meta['infra_names']
+
+    def infra_bit(self, name: str) -> int:
+        """인프라 이름의 비트 (표에 없는 인프라면 0)"""
+        try:
+            return 1 << self.infra_names.index(name)
+        except ValueError:
+            return 0
+
+    def infra_mask(self, names) -> int:
+        mask = 0
+        for name in names:
+            mask |= self.infra_bit(name)
+        return mask
+
+    def infra_set(self, mask: int) -> frozenset:
+        return frozenset(name for i, name in enumerate(self.infra_names) if mask >> i & 1)
+
+    def choice_id(self, i: int):
+        """선택지 i 의 id (compile_turns 의 Choice.id 와 같은 값/타입)"""
+        code = self.id[i]
+        return code if code >= 0 else self.meta['string_ids'][-1 - code]
+
+    # -- 엔진 연동 -----------------------------------------------------------
+
+    def turns(self) -> Dict[int, List[Choice]]:
+        """game_engine.compile_turns 와 같은 {턴: [Choice, ...]} (JSON 파싱 없이 생성)"""
+        meta = self.meta
+        result = {}
+        for k, turn in enumerate(self.turn_numbers):
+            choices = []
+            for i in range(self.offsets[k], self.offsets[k + 1]):
+                choice = Choice.__new__(Choice)
+                choice.id = self.choice_id(i)
+                choice.turn = turn
+                choice.users = self.users[i]
+                choice.cash = self.cash[i]
+                choice.trust = self.trust[i]
+                choice.infra = infra_mask(self.infra_set(self.infra[i]))
+                choice.next_turn = self.next_turn[i]
+                choice.tags = frozenset(meta['tags'][i])
+                flags = self.flags[i]
+                choice.hires_developer = bool(flags & FLAG_HIRES_DEVELOPER)
+                choice.hires_designer = bool(flags & FLAG_HIRES_DESIGNER)
+                choice.hires_planner = bool(flags & FLAG_HIRES_PLANNER)
+                choice.text = meta['texts'][i]
+                choices.append(choice)
+            result[turn] = choices
+        return result
+
+    # -- 직렬화 --------------------------------------------------------------
+
+    def save(self, path: str):
+        """바이너리 캐시로 저장 (임시 파일 → rename 으로 원자적 교체)"""
+        meta = json.dumps(self.meta, ensure_ascii=False).encode('utf-8')
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        tmp = path + '.tmp'
+        with open(tmp, 'wb') as f:
+            f.write(_HEADER.pack(MAGIC, FORMAT_VERSION, self.source_hash.encode('ascii'),
+                                 CONSTANTS_HASH.encode('ascii'), len(self), len(self.turn_numbers), len(meta)))
+            _pad(f)
+            for name in INT_COLUMNS:
+                f.write(array.array('q', getattr(self, name)).tobytes())
+            for name in MASK_COLUMNS:
+                f.write(array.array('Q', getattr(self, name)).tobytes())
+            f.write(array.array('q', self.turn_numbers).tobytes())
+            f.write(array.array('q', self.offsets).tobytes())
+            f.write(meta)
+        os.replace(tmp, path)
+
+    @staticmethod
+    def open(path: str) -> 'ChoiceTable':
+        """바이너리 캐시를 mmap 으로 열기 (열은 복사 없는 memoryview)"""
+        with open(path, 'rb') as f:
+            handle = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if len(handle) < _HEADER.size:
+            handle.close()
+            raise ValueError(f'{path}: 선택지 표 캐시 형식이 아닙니다')
+        magic, version, source_hash, engine_hash, n_choices, n_turns, meta_len = _HEADER.unpack_from(handle, 0)
+        if magic != MAGIC:
+            handle.close()
+            raise ValueError(f'{path}: 선택지 표 캐시 형식이 아닙니다')
+        if version != FORMAT_VERSION or engine_hash.decode('ascii') != CONSTANTS_HASH:
+            handle.close()
+            raise ValueError(f'{path}: 다른 형식 버전(v{version}) 또는 엔진({engine_hash.decode("ascii")})의 '
+                             f'캐시입니다 — 다시 컴파일하세요')
+
+        view = memoryview(handle)
+        offset = _aligned(_HEADER.size)
+        columns = {}
+        for name in INT_COLUMNS + MASK_COLUMNS:
+            fmt = 'Q' if name in MASK_COLUMNS else 'q'
+            columns[name] = view[offset:offset + 8 * n_choices].cast(fmt)
+            offset += 8 * n_choices
+        turn_numbers = view[offset:offset + 8 * n_turns].cast('q')
+        offset += 8 * n_turns
+        offsets = view[offset:offset + 8 * (n_turns + 1)].cast('q')
+        offset += 8 * (n_turns + 1)
+        meta_start = offset
+
+        def load_meta() -> Dict:
+            return json.loads(bytes(view[meta_start:meta_start + meta_len]).decode('utf-8'))
+
+        return ChoiceTable(columns, turn_numbers, offsets, source_hash.decode('ascii'),
+                           meta_loader=load_meta, handle=handle)
+
+def _aligned(offset: int) -> int:
+    return (offset + _ALIGN - 1) // _ALIGN * _ALIGN
+
+def _pad(f):
+    f.write(b'\0' * (_aligned(f.tell()) - f.tell()))
+
+def compile_choice_table(data: List[Dict], source_hash: str = '') -> ChoiceTable:
+    """게임 데이터(JSON) → ChoiceTable (턴 번호 순으로 정렬)"""
+    infra_names = sorted({name for t in data for c in t['choices']
+                          for name in c['effects'].get('infra', ())})
+    if len(infra_names) > 64:
+        raise ValueError(f'인프라 종류가 64개를 넘어 비트마스크로 표현할 수 없습니다 ({len(infra_names)}개)')
+    infra_bits = {name: 1 << i for i, name in enumerate(infra_names)}
+
+    columns = {name: array.array('q') for name in INT_COLUMNS}
+    columns.update((name, array.array('Q')) for name in MASK_COLUMNS)
+    turn_numbers = array.array('q')
+    offsets = array.array('q', [0])
+    meta = {'infra_names': infra_names, 'texts': [], 'categories': [], 'tags': [], 'string_ids': []}
+    string_codes: Dict[str, int] = {}
+
+    for turn_data in sorted(data, key=lambda t: t['turn']):
+        turn = turn_data['turn']
+        for raw in turn_data['choices']:
+            choice = Choice(turn, raw)
+            flags = ((FLAG_HIRES_DEVELOPER if choice.hires_developer else 0)
+                     | (FLAG_HIRES_DESIGNER if choice.hires_designer else 0)
+                     | (FLAG_HIRES_PLANNER if choice.hires_planner else 0))
+            # 숫자가 아닌 id('invest_6_conservative')는 string_ids 표의 음수 코드로
+            if isinstance(choice.id, int):
+                code = choice.id
+            else:
+                code = string_codes.get(choice.id)
+                if code is None:
+                    code = string_codes[choice.id] = -1 - len(meta['string_ids'])
+                    meta['string_ids'].append(choice.id)
+            for name, value in (('turn', turn), ('id', code), ('users', choice.users),
+                                ('cash', choice.cash), ('trust', choice.trust),
+                                ('next_turn', choice.next_turn), ('flags', flags)):
+                columns[name].append(value)
+            columns['infra'].append(sum(infra_bits[name] for name in frozenset(raw['effects'].get('infra', ()))))
+            meta['texts'].append(choice.text)
+            meta['categories'].append(raw.get('category'))
+            meta['tags'].append(sorted(choice.tags))
+        turn_numbers.append(turn)
+        offsets.append(len(columns['id']))
+
+    return ChoiceTable(columns, turn_numbers, offsets, source_hash, meta=meta)
+
+# 같은 파일을 다시 해시하지 않도록 (경로, 크기, mtime) → 원본 해시 를 기억하는 작은 색인
+_INDEX_FILE = 'index.json'
+
+def _read_index(cache_dir: str) -> Dict:
+    try:
+        with open(os.path.join(cache_dir, _INDEX_FILE), 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def _write_index(cache_dir: str, index: Dict):
+    os.makedirs(cache_dir, exist_ok=True)
+    path = os.path.join(cache_dir, _INDEX_FILE)
+    with open(path + '.tmp', 'w', encoding='utf-8') as f:
+        json.dump(index, f)
+    os.replace(path + '.tmp', path)
+
+def cache_path(cache_dir: str, source_hash: str) -> str:
+    """원본 해시 × 형식 버전 × 엔진 해시 로 키가 붙은 캐시 파일 경로"""
+    return os.path.join(cache_dir, f'{source_hash}-v{FORMAT_VERSION}-{CONSTANTS_HASH}.bin')
+
+def load_choice_table(data_path: str, cache_dir: Optional[str] = DEFAULT_CACHE_DIR) -> ChoiceTable:
+    """데이터 파일의 선택지 표 (캐시가 있으면 mmap 으로 바로 열고, 없으면 컴파일 후 저장)
+
+    cache_dir=None 이면 캐시 없이 매번 컴파일합니다.
+    """
+    if cache_dir is None:
+        with open(data_path, 'rb') as f:
+            raw = f.read()
+        return compile_choice_table(json.loads(raw), _source_hash(raw))
+
+    stat = os.stat(data_path)
+    key = os.path.abspath(data_path)
+    signature = [stat.st_size, stat.st_mtime_ns]
+    index = _read_index(cache_dir)
+    entry = index.get(key)
+    if entry and entry['signature'] == signature:
+        path = cache_path(cache_dir, entry['hash'])
+        if os.path.exists(path):
+            return ChoiceTable.open(path)
+
+    with open(data_path, 'rb') as f:
+        raw = f.read()
+    source_hash = _source_hash(raw)
+    path = cache_path(cache_dir, source_hash)
+    if not os.path.exists(path):
+        compile_choice_table(json.loads(raw), source_hash).save(path)
+    index[key] = {'signature': signature, 'hash': source_hash}
+    _write_index(cache_dir, index)
+    return ChoiceTable.open(path)
+
+def parse_args():
+    parser = argparse.ArgumentParser(description='선택지 표 컴파일 (바이너리 캐시 생성)')
+    parser.add_argument('--data', nargs='+', default=['../game_choices_db.json'], help='게임 데이터 JSON 경로')
+    parser.add_argument('--cache-dir', default=DEFAULT_CACHE_DIR, help='바이너리 캐시 디렉터리')
+    return parser.parse_args()
+
+def main():
+    args = parse_args()
+    for path in args.data:
+        started = time.perf_counter()
+        table = load_choice_table(path, args.cache_dir)
+        elapsed = time.perf_counter() - started
+        print(f"✅ {path}: 선택지 {len(table)}개, 턴 {len(table.turn_numbers)}개, "
+              f"인프라 {len(table.infra_names)}종 → {os.path.basename(cache_path(args.cache_dir, table.source_hash))} "
+              f"({elapsed * 1e6:,.0f}µs)")
+
+if __name__ == '__main__':
+    main()
@@ -146,6 +146,7 @@ const choiceTextUpdates: { [key: number]: string } = {
 """
 
 # 모든 선택지에 대한 텍스트 추가
+json_updates = {}
 for choice in choices:
     choice_id = choice.get('choiceId')
     if choice_id in choice_texts:
@@ -176,6 +177,8 @@ for choice in choices:
         else:
             text = original  # 이미 커스텀 텍스트가 있는 경우
 
+    json_updates[choice_id] = text
+
     # 이스케이프 처리
     text = text.replace("'", "\\'").replace('\n', '\\n')
     typescript_code += f"  {choice_id}: '{text}',\n"
@@ -229,5 +232,10 @@ updateChoiceTexts()
 with open('complete-choice-updates.ts', 'w', encoding='utf-8') as f:
     f.write(typescript_code)
 
+# apply_choice_updates.py 입력용 JSON (한 트랜잭션 일괄 반영, 변경 없는 행은 건너뜀)
+with open('complete-choice-updates.json', 'w', encoding='utf-8') as f:
+    json.dump(json_updates, f, ensure_ascii=False, indent=2)
+
 print(f"✅ Generated complete update script for {len(choices)} choices")
-print("📝 Saved to complete-choice-updates.ts")
\ No newline at end of file
+print("📝 Saved to complete-choice-updates.ts")
+print("📝 Saved to complete-choice-updates.json (python3 apply_choice_updates.py --input ...)")
\ No newline at end of file
@@ -0,0 +1,525 @@
+#!/usr/bin/env python3
+"""
+AWS CTO Game - Random Event Matcher (Python port)
+EventService 정적 랜덤 이벤트 발동 규칙의 Python 이식본
+
+EventService.selectStaticEvent / evaluateTriggerCondition / applyEventEffect 를 시뮬레이션에서
+쓸 수 있게 옮긴 모듈입니다. 이벤트 정의는 DynamicEvent 엔티티와 같은 JSON 형식이며,
+기본 파일(random_events.json)은 src/game/event-examples.ts 의 EXAMPLE_EVENTS 를
+event.constants.ts 값으로 풀어 쓴 것입니다.
+
+매 턴 모든 이벤트를 선형으로 검사하지 않도록 OptimizedEventMatcherService/EventCacheService 처럼
+색인을 미리 만듭니다.
+- 턴 색인: (난이도, 턴, 용량 초과 여부) → 그 조건에서 발동 가능한 후보 (우선순위 내림차순)
+  턴 범위/난이도/capacityExceeded 조건은 색인을 만들 때 한 번만 평가됩니다.
+- 조건 색인: 필수/제외 인프라는 game_engine 인프라 비트마스크 AND 한 번으로 검사
+- 선택: 주사위 한 번(roll)으로 우선순위 순서에서 roll < 확률 인 첫 적격 이벤트를 고르므로
+  (selectStaticEvent 와 같은 규칙) 확률을 먼저 비교하고 나머지 조건은 그 후보에만 평가합니다.
+
+TypeScript 와 같은 점:
+- 0 인 임계값은 조건 없음으로 취급 (`condition.minUsers && ...`)
+- probability 가 없거나 0 이면 15%
+- investmentFailed 조건은 EventService 가 평가하지 않으므로 여기서도 무시
+
+사용 예:
+    python3 event_matcher.py                                  # 이벤트 포함/미포함 Monte Carlo 비교
+    python3 event_matcher.py --games 5000 --difficulty HARD --events my_events.json
+    python3 event_matcher.py --verify --synthetic 5000        # 색인 결과 = 단순 선형 검사 결과 확인 + 속도 비교
+"""
+
+import argparse
+import json
+import math
+import os
+import random
+import time
+from collections import Counter
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from game_engine import (
+    DIFFICULTIES, STRATEGIES, GameState, GameStatus, Rules, compile_turns, final_score,
+    greedy_policy, infra_bit, infra_count, infra_mask, load_game_data, play, random_policy,
+)
+
+EVENTS_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'random_events.json')
+
+DEFAULT_PROBABILITY = 15
+# 색인을 미리 만들어 둘 턴 (그 밖의 턴은 처음 물어볼 때 만들어 기억)
+INDEXED_TURNS = range(1, 26)
+
+# applyAutoDefense: 피해 감소율 (multi-region 은 완전 면역, 합계 최대 90%)
+AUTO_DEFENSE = tuple((infra_bit(name), rate) for name, rate in
+                     (('CloudFront', 0.5), ('Aurora Global DB', 0.7), ('DR', 0.3)))
+AUTO_DEFENSE_IMMUNE = infra_bit('multi-region')
+AUTO_DEFENSE_CAP = 0.9
+
+INF = float('inf')
+
+def load_events(filepath: str = EVENTS_FILE) -> List[Dict]:
+    """이벤트 정의 로드 (DynamicEvent JSON 배열)"""
+    with open(filepath, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+# ---------------------------------------------------------------------------
+# 기준 구현 (evaluateTriggerCondition 그대로)
+# ---------------------------------------------------------------------------
+
+class EventHistory:
+    """게임 하나의 이벤트 상태 (EventState 테이블의 lastTriggeredTurn / isCompleted)"""
+
+    __slots__ = ('last_triggered', 'completed')
+
+    def __init__(self):
+        self.last_triggered: Dict[str, int] = {}
+        self.completed = set()
+
+    def record(self, event: Dict, turn: int):
+        self.last_triggered[event['eventId']] = turn
+        if event.get('isOneTime'):
+            self.completed.add(event['eventId'])
+
+def evaluate_trigger(event: Dict, state: GameState, difficulty: str, history: EventHistory) -> bool:
+    """이벤트 하나의 발동 조건 (색인 없는 선형 검사용 기준 구현)"""
+    condition = event.get('triggerCondition')
+    if not condition:
+        return True
+    get = condition.get
+    if get('minTurn') and state.turn < condition['minTurn']:
+        return False
+    if get('maxTurn') and state.turn > condition['maxTurn']:
+        return False
+    if get('minUsers') and state.users < condition['minUsers']:
+        return False
+    if get('maxUsers') and state.users > condition['maxUsers']:
+        return False
+    if get('minCash') and state.cash < condition['minCash']:
+        return False
+    if get('maxCash') and state.cash > condition['maxCash']:
+        return False
+    if get('minTrust') and state.trust < condition['minTrust']:
+        return False
+    if get('maxTrust') and state.trust > condition['maxTrust']:
+        return False
+    if get('requiredInfra') and not all(state.infra & infra_bit(name) for name in condition['requiredInfra']):
+        return False
+    if get('excludedInfra') and any(state.infra & infra_bit(name) for name in condition['excludedInfra']):
+        return False
+    if get('minInfraCount') and infra_count(state.infra) < condition['minInfraCount']:
+        return False
+    if get('maxInfraCount') and infra_count(state.infra) > condition['maxInfraCount']:
+        return False
+    if get('requiredStaff') and not all(name in state.hired_staff for name in condition['requiredStaff']):
+        return False
+    if get('minStaffCount') and len(state.hired_staff) < condition['minStaffCount']:
+        return False
+    if get('capacityExceeded') is not None and (state.users > state.max_capacity) != condition['capacityExceeded']:
+        return False
+    if get('multiChoiceEnabled') is not None and state.multi_choice != condition['multiChoiceEnabled']:
+        return False
+    if get('difficulties') and difficulty not in condition['difficulties']:
+        return False
+    cooldown = get('cooldownTurns')
+    if cooldown and cooldown > 0:
+        last = history.last_triggered.get(event['eventId'])
+        if last and state.turn - last < cooldown:
+            return False
+    if event.get('isOneTime') and event['eventId'] in history.completed:
+        return False
+    return True
+
+def select_linear(events: Sequence[Dict], state: GameState, difficulty: str, history: EventHistory,
+                  roll: float) -> Optional[Dict]:
+    """selectStaticEvent: 적격 이벤트를 우선순위 순으로 정렬하고 roll < 확률 인 첫 이벤트"""
+    eligible = [e for e in events if evaluate_trigger(e, state, difficulty, history)]
+    eligible.sort(key=lambda e: -(e.get('priority') or 0))
+    for event in eligible:
+        probability = (event.get('triggerCondition') or {}).get('probability') or DEFAULT_PROBABILITY
+        if roll < probability / 100:
+            return event
+    return None
+
+# ---------------------------------------------------------------------------
+# 색인 매처
+# ---------------------------------------------------------------------------
+
+class _Candidate:
+    """턴 색인에 들어가는 컴파일된 조건 (턴/난이도/용량 초과 조건은 이미 색인에서 처리됨)"""
+
+    __slots__ = ('event', 'event_id', 'threshold', 'min_users', 'max_users', 'min_cash', 'max_cash',
+                 'min_trust', 'max_trust', 'required_infra', 'excluded_infra', 'min_infra', 'max_infra',
+                 'required_staff', 'min_staff', 'multi_choice', 'cooldown', 'one_time',
+                 'min_turn', 'max_turn', 'difficulties', 'capacity_exceeded')
+
+    def __init__(self, event: Dict):
+        condition = event.get('triggerCondition') or {}
+        get = condition.get
+        self.event = event
+        self.event_id = event['eventId']
+        self.threshold = (get('probability') or DEFAULT_PROBABILITY) / 100
+        self.min_turn = get('minTurn') or -INF
+        self.max_turn = get('maxTurn') or INF
+        self.min_users = get('minUsers') or -INF
+        self.max_users = get('maxUsers') or INF
+        self.min_cash = get('minCash') or -INF
+        self.max_cash = get('maxCash') or INF
+        self.min_trust = get('minTrust') or -INF
+        self.max_trust = get('maxTrust') or INF
+        self.required_infra = infra_mask(get('requiredInfra') or ())
+        self.excluded_infra = infra_mask(get('excludedInfra') or ())
+        self.min_infra = get('minInfraCount') or 0
+        self.max_infra = get('maxInfraCount') or INF
+        self.required_staff = tuple(get('requiredStaff') or ())
+        self.min_staff = get('minStaffCount') or 0
+        self.multi_choice = get('multiChoiceEnabled')
+        self.difficulties = frozenset(get('difficulties') or ())
+        self.capacity_exceeded = get('capacityExceeded')
+        cooldown = get('cooldownTurns')
+        self.cooldown = cooldown if cooldown and cooldown > 0 else 0
+        self.one_time = bool(event.get('isOneTime'))
+
+    def matches(self, state: GameState, history: EventHistory) -> bool:
+        if not (self.min_users <= state.users <= self.max_users
+                and self.min_cash <= state.cash <= self.max_cash
+                and self.min_trust <= state.trust <= self.max_trust):
+            return False
+        infra = state.infra
+        if infra & self.required_infra != self.required_infra or infra & self.excluded_infra:
+            return False
+        if not self.min_infra <= infra_count(infra) <= self.max_infra:
+            return False
+        if self.required_staff and not all(name in state.hired_staff for name in self.required_staff):
+            return False
+        if len(state.hired_staff) < self.min_staff:
+            return False
+        if self.multi_choice is not None and state.multi_choice != self.multi_choice:
+            return False
+        if self.cooldown:
+            last = history.last_triggered.get(self.event_id)
+            if last and state.turn - last < self.cooldown:
+                return False
+        if self.one_time and self.event_id in history.completed:
+            return False
+        return True
+
+class EventMatcher:
+    """(난이도, 턴, 용량 초과) 색인 + 인프라 비트마스크로 selectStaticEvent 를 재현"""
+
+    def __init__(self, events: Sequence[Dict]):
+        self.events = list(events)
+        # priority 내림차순, 같은 priority 는 파일 순서 (Array.prototype.sort 는 안정 정렬)
+        ordered = sorted(self.events, key=lambda e: -(e.get('priority') or 0))
+        self._candidates = [_Candidate(event) for event in ordered]
+        self._index: Dict[Tuple[str, int, bool], Tuple[_Candidate, ...]] = {}
+        for difficulty in DIFFICULTIES:
+            for turn in INDEXED_TURNS:
+                for exceeded in (False, True):
+                    self._build(difficulty, turn, exceeded)
+
+    def _build(self, difficulty: str, turn: int, exceeded: bool) -> Tuple[_Candidate, ...]:
+        bucket = tuple(c for c in self._candidates
+                       if c.min_turn <= turn <= c.max_turn
+                       and (not c.difficulties or difficulty in c.difficulties)
+                       and (c.capacity_exceeded is None or c.capacity_exceeded == exceeded))
+        self._index[(difficulty, turn, exceeded)] = bucket
+        return bucket
+
+    def candidates(self, difficulty: str, turn: int, exceeded: bool) -> Tuple[_Candidate, ...]:
+        bucket = self._index.get((difficulty, turn, exceeded))
+        return bucket if bucket is not None else self._build(difficulty, turn, exceeded)
+
+    def eligible(self, state: GameState, difficulty: str, history: EventHistory) -> List[Dict]:
+        """filterEligibleEvents 와 같은 결과 (우선순위 순)"""
+        bucket = self.candidates(difficulty, state.turn, state.users > state.max_capacity)
+        return [c.event for c in bucket if c.matches(state, history)]
+
+    def select(self, state: GameState, difficulty: str, history: EventHistory, roll: float) -> Optional[Dict]:
+        """selectStaticEvent 와 같은 결과 — 확률을 먼저 비교해 roll 을 넘는 후보만 조건 평가"""
+        bucket = self.candidates(difficulty, state.turn, state.users > state.max_capacity)
+        for candidate in bucket:
+            if roll >= candidate.threshold:
+                continue
+            if candidate.matches(state, history):
+                return candidate.event
+        return None
+
+# ---------------------------------------------------------------------------
+# 효과 적용 (executeEventResponse / applyEventEffect)
+# ---------------------------------------------------------------------------
+
+def _auto_defense(state: GameState, damage: float) -> float:
+    if damage >= 0:
+        return damage
+    if state.infra & AUTO_DEFENSE_IMMUNE:
+        return 0
+    reduction = min(AUTO_DEFENSE_CAP, sum(rate for bit, rate in AUTO_DEFENSE if state.infra & bit))
+    return math.floor(damage * (1 - reduction))
+
+def apply_effect(state: GameState, effect: Optional[Dict]):
+    """이벤트 효과를 state 에 제자리 적용 (음수 효과는 인프라 자동 방어로 감소)"""
+    if not effect:
+        return
+    if effect.get('usersDelta'):
+        state.users = max(0, state.users + _auto_defense(state, effect['usersDelta']))
+    if effect.get('usersMultiplier'):
+        state.users = math.floor(state.users * effect['usersMultiplier'])
+    if effect.get('cashDelta'):
+        state.cash += _auto_defense(state, effect['cashDelta'])
+    if effect.get('cashMultiplier'):
+        state.cash = math.floor(state.cash * effect['cashMultiplier'])
+    if effect.get('trustDelta'):
+        state.trust = max(0, min(100, state.trust + _auto_defense(state, effect['trustDelta'])))
+    if effect.get('trustMultiplier'):
+        state.trust = max(0, min(100, math.floor(state.trust * effect['trustMultiplier'])))
+    if effect.get('addInfrastructure'):
+        state.infra |= infra_mask(effect['addInfrastructure'])
+    if effect.get('removeInfrastructure'):
+        state.infra &= ~infra_mask(effect['removeInfrastructure'])
+    if effect.get('maxCapacityDelta'):
+        state.max_capacity = max(0, state.max_capacity + effect['maxCapacityDelta'])
+    if effect.get('maxCapacityMultiplier'):
+        state.max_capacity = math.floor(state.max_capacity * effect['maxCapacityMultiplier'])
+    if effect.get('userAcquisitionMultiplierDelta'):
+        state.user_multiplier += effect['userAcquisitionMultiplierDelta']
+    if effect.get('trustMultiplierDelta'):
+        state.trust_multiplier += effect['trustMultiplierDelta']
+    if effect.get('endGame') and effect.get('setStatus'):
+        state.status = effect['setStatus']
+
+def available_choices(event: Dict, state: GameState) -> List[Dict]:
+    """요구 조건(requiredCash/Trust/Infra/Staff)을 만족하는 선택지"""
+    return [c for c in event.get('choices') or []
+            if state.cash >= (c.get('requiredCash') or 0)
+            and state.trust >= (c.get('requiredTrust') or 0)
+            and not infra_mask(c.get('requiredInfra') or ()) & ~state.infra
+            and all(name in state.hired_staff for name in c.get('requiredStaff') or ())]
+
+def _choice_value(choice: Dict, strategy: str) -> float:
+    """game_engine.choice_preference 와 같은 기준으로 이벤트 선택지 평가 (비용 포함)"""
+    effect = choice.get('effect') or {}
+    users = effect.get('usersDelta') or 0
+    cash = (effect.get('cashDelta') or 0) - (choice.get('cashCost') or 0)
+    trust = (effect.get('trustDelta') or 0) - (choice.get('trustCost') or 0)
+    if strategy == 'balanced':
+        return users / 20000 + cash / 1000000 + trust / 10
+    direction, _, metric = strategy.partition('_')
+    value = {'users': users, 'cash': cash, 'trust': trust}[metric]
+    return -value if direction == 'worst' else value
+
+def respond(event: Dict, state: GameState, rng: random.Random, strategy: Optional[str] = None) -> Optional[Dict]:
+    """이벤트에 응답 — 선택지가 없으면 autoEffect, 있으면 전략(없으면 무작위)으로 하나 선택"""
+    if not event.get('choices'):
+        apply_effect(state, event.get('autoEffect'))
+        return None
+    choices = available_choices(event, state)
+    if not choices:
+        return None
+    if strategy in STRATEGIES:
+        choice = max(choices, key=lambda c: _choice_value(c, strategy))
+    else:
+        choice = choices[rng.randrange(len(choices))]
+    apply_effect(state, choice.get('effect'))
+    if choice.get('cashCost'):
+        state.cash -= choice['cashCost']
+    if choice.get('trustCost'):
+        state.trust -= choice['trustCost']
+    return choice
+
+class EventRunner:
+    """game_engine.play 의 on_step 훅 — 턴이 끝날 때마다 랜덤 이벤트 검사/발동
+
+    trigger_rate 를 주면 LLM 경로처럼 먼저 그 확률로 이벤트 검사 여부를 정합니다
+    (LLMConfig.features.triggerRate, 생성 실패 시 정적 이벤트로 대체되는 경우를 근사).
+    """
+
+    def __init__(self, matcher: EventMatcher, difficulty: str, rng: random.Random,
+                 strategy: Optional[str] = None, trigger_rate: Optional[float] = None):
+        self.matcher = matcher
+        self.difficulty = difficulty
+        self.rng = rng
+        self.strategy = strategy
+        self.trigger_rate = trigger_rate
+        self.history = EventHistory()
+        self.fired: Counter = Counter()
+        self.checks = 0
+
+    def reset(self):
+        """새 게임 시작 (발동 횟수 통계는 유지)"""
+        self.history = EventHistory()
+
+    def __call__(self, state: GameState, choice=None):
+        if state.status != GameStatus.PLAYING:
+            return
+        if self.trigger_rate is not None and self.rng.random() >= self.trigger_rate:
+            return
+        self.checks += 1
+        event = self.matcher.select(state, self.difficulty, self.history, self.rng.random())
+        if event is None:
+            return
+        respond(event, state, self.rng, self.strategy)
+        self.history.record(event, state.turn)
+        self.fired[event['eventId']] += 1
+
+def chain_hooks(*hooks: Optional[Callable]) -> Optional[Callable]:
+    """on_step 훅 여러 개를 순서대로 호출 (None 은 건너뜀)"""
+    active = [hook for hook in hooks if hook is not None]
+    if not active:
+        return None
+    if len(active) == 1:
+        return active[0]
+    def on_step(state, choice):
+        for hook in active:
+            hook(state, choice)
+    return on_step
+
+# ---------------------------------------------------------------------------
+# CLI: Monte Carlo 비교 / 검증
+# ---------------------------------------------------------------------------
+
+def synthetic_events(count: int, seed: int = 0, template: Optional[Sequence[Dict]] = None) -> List[Dict]:
+    """기본 이벤트를 흔들어 만든 대량 이벤트 (색인 검증/속도 측정용)"""
+    template = template or load_events()
+    rng = random.Random(seed)
+    infra = ['EC2', 'RDS', 'Aurora', 'ALB', 'EKS', 'Redis', 'CloudFront', 'WAF', 'Aurora Global DB']
+    events = []
+    for i in range(count):
+        source = template[i % len(template)]
+        condition = dict(source.get('triggerCondition') or {})
+        low = rng.randint(1, 20)
+        condition['minTurn'], condition['maxTurn'] = low, min(25, low + rng.randint(0, 8))
+        for key in ('minUsers', 'maxUsers', 'minCash', 'minTrust', 'maxTrust'):
+            if key in condition or rng.random() < 0.2:
+                base = {'minUsers': 5000, 'maxUsers': 50000, 'minCash': 30_000_000,
+                        'minTrust': 40, 'maxTrust': 80}[key]
+                condition[key] = int(base * rng.uniform(0.5, 1.5))
+        if rng.random() < 0.3:
+            condition['requiredInfra'] = rng.sample(infra, rng.randint(1, 2))
+        if rng.random() < 0.2:
+            condition['excludedInfra'] = rng.sample(infra, 1)
+        condition['probability'] = rng.choice([0, 5, 10, 15, 25, 50, 100])
+        events.append(dict(source, eventId=f"{source['eventId']}_{i}", triggerCondition=condition,
+                           priority=rng.choice([10, 25, 50, 75, 100])))
+    return events
+
+def verify(turns, rules: Rules, events: List[Dict], games: int, seed: int) -> Dict:
+    """랜덤 플레이 중 모든 검사 시점에서 색인 매처 == 선형 기준 구현인지 확인하고 시간 비교"""
+    matcher = EventMatcher(events)
+    rng = random.Random(seed)
+    policy = random_policy(rng)
+    checks = mismatches = 0
+    indexed_time = linear_time = 0.0
+    for _ in range(games):
+        history = EventHistory()
+
+        def on_step(state, choice):
+            nonlocal checks, mismatches, indexed_time, linear_time
+            if state.status != GameStatus.PLAYING:
+                return
+            roll = rng.random()
+            start = time.perf_counter()
+            fast = matcher.select(state, rules.mode, history, roll)
+            eligible = matcher.eligible(state, rules.mode, history)
+            middle = time.perf_counter()
+            slow = select_linear(events, state, rules.mode, history, roll)
+            slow_eligible = [e for e in events if evaluate_trigger(e, state, rules.mode, history)]
+            linear_time += time.perf_counter() - middle
+            indexed_time += middle - start
+            checks += 1
+            slow_eligible.sort(key=lambda e: -(e.get('priority') or 0))
+            if fast is not slow or [e['eventId'] for e in eligible] != [e['eventId'] for e in slow_eligible]:
+                mismatches += 1
+            if fast is not None:
+                respond(fast, state, rng)
+                history.record(fast, state.turn)
+
+        play(turns, rules, policy, on_step=on_step)
+    return {'checks': checks, 'mismatches': mismatches,
+            'indexed_us': indexed_time / max(1, checks) * 1e6, 'linear_us': linear_time / max(1, checks) * 1e6}
+
+def monte_carlo(turns, rules: Rules, matcher: Optional[EventMatcher], games: int, seed: int,
+                strategy: Optional[str] = None, trigger_rate: Optional[float] = None) -> Dict:
+    """같은 시드로 게임을 돌려 승률/점수/발동 빈도 집계 (matcher 가 None 이면 이벤트 없음)"""
+    rng = random.Random(seed)
+    policy = greedy_policy(strategy) if strategy in STRATEGIES else random_policy(rng)
+    runner = EventRunner(matcher, rules.mode, rng, strategy, trigger_rate) if matcher else None
+    wins, score, status = 0, 0, Counter()
+    started = time.perf_counter()
+    for _ in range(games):
+        if runner is not None:
+            runner.reset()
+        final = play(turns, rules, policy, on_step=runner)
+        status[final.status] += 1
+        wins += final.status.startswith('WON_')
+        score += final_score(final, rules)
+    elapsed = time.perf_counter() - started
+    return {
+        'games': games,
+        'win_rate': wins / games,
+        'avg_score': score / games,
+        'status': {s: c / games for s, c in status.most_common()},
+        'events_per_game': sum(runner.fired.values()) / games if runner else 0.0,
+        'fired': {event_id: count / games for event_id, count in runner.fired.most_common()} if runner else {},
+        'checks': runner.checks if runner else 0,
+        'seconds': elapsed,
+    }
+
+def parse_args():
+    parser = argparse.ArgumentParser(description='랜덤 이벤트 발동 시뮬레이션 (EventService 이식)')
+    parser.add_argument('--data', default='../game_choices_db.json', help='게임 데이터 JSON 경로')
+    parser.add_argument('--events', default=EVENTS_FILE, help='이벤트 정의 JSON (DynamicEvent 배열)')
+    parser.add_argument('--difficulty', default='NORMAL', choices=DIFFICULTIES)
+    parser.add_argument('--strategy', default='random', choices=['random'] + STRATEGIES,
+                        help='본 선택지/이벤트 선택지 정책')
+    parser.add_argument('--games', type=int, default=2000)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--trigger-rate', type=float, help='LLM 경로의 이벤트 검사 확률 (예: 0.1, 기본: 매 턴 검사)')
+    parser.add_argument('--verify', action='store_true', help='색인 매처와 선형 기준 구현 결과 비교')
+    parser.add_argument('--synthetic', type=int, default=0, help='--verify 에 쓸 합성 이벤트 수 (0이면 --events)')
+    parser.add_argument('--output', help='결과 JSON 저장 경로')
+    return parser.parse_args()
+
+def main():
+    args = parse_args()
+
+    print("🎮 AWS CTO Game - Random Event Matcher")
+    print("=" * 60)
+
+    turns = compile_turns(load_game_data(args.data))
+    rules = Rules(args.difficulty)
+    events = synthetic_events(args.synthetic, args.seed) if args.synthetic else load_events(args.events)
+    print(f"📋 이벤트 {len(events)}개, 난이도 {args.difficulty}, 정책 {args.strategy}")
+
+    if args.verify:
+        result = verify(turns, rules, events, args.games, args.seed)
+        ok = result['mismatches'] == 0
+        print(f"\n{'✅' if ok else '❌'} 검사 {result['checks']:,}회 중 불일치 {result['mismatches']:,}회")
+        print(f"   색인 {result['indexed_us']:.1f}µs / 선형 {result['linear_us']:.1f}µs (검사당, 선택 + 적격 목록)")
+        report = {'verify': result}
+    else:
+        matcher = EventMatcher(events)
+        base = monte_carlo(turns, rules, None, args.games, args.seed, args.strategy)
+        with_events = monte_carlo(turns, rules, matcher, args.games, args.seed, args.strategy, args.trigger_rate)
+        print(f"\n📊 {args.games:,}게임:")
+        print(f"   이벤트 없음: 승률 {base['win_rate']:.1%}, 평균 점수 {base['avg_score']:,.0f} ({base['seconds']:.2f}초)")
+        print(f"   이벤트 포함: 승률 {with_events['win_rate']:.1%}, 평균 점수 {with_events['avg_score']:,.0f} "
+              f"({with_events['seconds']:.2f}초, 게임당 {with_events['events_per_game']:.2f}회 발동)")
+        if with_events['checks']:
+            overhead = (with_events['seconds'] - base['seconds']) / with_events['checks'] * 1e6
+            print(f"   검사 {with_events['checks']:,}회, 검사당 추가 비용 약 {max(0.0, overhead):.1f}µs")
+        print("\n🎲 이벤트별 게임당 발동 횟수:")
+        for event_id, rate in with_events['fired'].items():
+            print(f"   - {event_id}: {rate:.3f}")
+        never = [e['eventId'] for e in events if e['eventId'] not in with_events['fired']]
+        if never:
+            print(f"   ⚠️  한 번도 발동하지 않음: {', '.join(never)}")
+        report = {'without_events': base, 'with_events': with_events}
+        ok = True
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f"\n📝 {args.output}")
+    if not ok:
+        raise SystemExit(1)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,898 @@
+#!/usr/bin/env python3
+"""
+AWS CTO Game - LLM Event Pool Generator
+LLM 동적 이벤트 풀 오프라인 일괄 생성 + 품질 채점
+
+게임 중 backend/src/llm/services/vllm-client.service.ts 는 이벤트를 하나씩(재시도 포함) 요청합니다.
+이 도구는 릴리스 전에 EventCacheService 의 버킷(턴 구간 × 자금/유저/신뢰도 등급)마다
+이벤트를 미리 만들어 두어, 실제 요청 대부분이 미리 만든 풀에서 처리되게 합니다.
+생성된 풀(JSONL)은 EventCacheService 가 시작할 때 LLM_EVENT_POOL_PATH 에서 읽어 캐시 미스 시 사용합니다.
+
+- 프롬프트: prompt-builder.service.ts 와 같은 형식 (시스템 프롬프트 + few-shot + 게임 상황)
+- 동시 요청: asyncio + Semaphore(--concurrency), HTTP 호출은 전용 스레드 풀의 urllib
+  (표준 라이브러리만 사용)
+- 재시도: 연결 오류/타임아웃/429/5xx 에 지수 백오프 + 지터, Retry-After 헤더 우선
+- 캐시: 요청 본문(모델, 프롬프트, 샘플링 파라미터, seed)의 sha256 으로 원문 응답을 저장
+  (.cache/llm_events/ab/abcd….json) — 같은 프롬프트는 다시 요청하지 않고, 채점 규칙이 바뀌면
+  풀 파일만 지우고 다시 실행해 네트워크 없이 재채점합니다.
+- 이어하기: 풀(JSONL)은 한 줄씩 추가되고 캐시는 원자적으로 기록되므로, 중단 후 다시 실행하면
+  이미 채택된 이벤트는 건너뛰고 받은 응답은 캐시에서 읽습니다.
+- 검증/채점: llm-response-validator.service.ts (구조/밸런스/콘텐츠, 범위 초과 자동 보정) 와
+  event-quality-scorer.service.ts (일관성/밸런스/재미/교육성) 의 Python 포팅
+- --stub: 로컬 스텁 vLLM 서버(http.server)를 띄워 네트워크/GPU 없이 전체 흐름을 시험
+
+사용 예:
+    python3 event_pool_generator.py --stub --variants 2                     # 스텁 서버로 시험
+    python3 event_pool_generator.py --stub --stub-failure-rate 0.3 --stub-latency 0.05
+    VLLM_ENDPOINT=http://gpu-box:8000 python3 event_pool_generator.py --variants 4 --concurrency 32
+"""
+
+import argparse
+import asyncio
+import hashlib
+import json
+import math
+import os
+import random
+import re
+import tempfile
+import threading
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from profiler import PROFILER, add_arguments as add_profile_arguments, enable_from_args, finish_from_args
+
+CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.cache', 'llm_events')
+
+# backend/src/config/llm.config.ts 와 같은 환경 변수 (오프라인 생성이라 타임아웃/재시도는 더 넉넉하게)
+DEFAULT_ENDPOINT = os.environ.get('VLLM_ENDPOINT', 'http://localhost:8000')
+DEFAULT_MODEL = os.environ.get('VLLM_MODEL_NAME', 'openai/gpt-oss-20b')
+
+SAMPLING = {'max_tokens': 1000, 'temperature': 0.7, 'top_p': 0.9, 'stop': ['---', '\n\n\n']}
+RETRY_STATUS = {408, 429, 500, 502, 503, 504}
+MAX_BACKOFF = 30.0
+MAX_TURN = 25
+
+# ---------------------------------------------------------------------------
+# 프롬프트 (backend/src/llm/templates/*.ts 포팅)
+# ---------------------------------------------------------------------------
+
+SYSTEM_PROMPT = """당신은 AWS 스타트업 타이쿤 게임의 이벤트 생성 AI입니다.
+
+게임 규칙:
+- 자금(cash): ±50M~200M 범위의 변화
+- 유저수(users): ±1000~5000 범위의 변화 (초기), ±5000~20000 (성장기)
+- 신뢰도(trust): ±3~10 범위의 변화
+- 인프라: EC2, Aurora, ALB, EKS, Redis, Aurora Global DB 중 추가/제거 가능
+
+이벤트는 반드시:
+1. 현재 게임 상황에 맞는 현실적인 시나리오
+2. 2-3개의 선택지 제공 (trade-off 명확)
+3. 각 선택지는 명확한 결과와 교훈 제공
+4. JSON 형식으로 응답 (다른 텍스트 없이 순수 JSON만)
+
+응답 형식:
+{
+  "eventType": "MARKET_OPPORTUNITY|COMPETITOR_ACTION|INFRASTRUCTURE_CRISIS|TEAM_EVENT|FUNDING_OPPORTUNITY",
+  "title": "이벤트 제목 (20자 이내)",
+  "description": "이벤트 상황 설명 (100-200자)",
+  "choices": [
+    {
+      "text": "선택지 설명 (50-100자)",
+      "effects": {
+        "usersDelta": 숫자,
+        "cashDelta": 숫자,
+        "trustDelta": 숫자,
+        "addInfrastructure": ["Aurora"] // optional
+      },
+      "resultText": "선택 결과 설명 (50-100자)"
+    }
+  ]
+}"""
+
+FEW_SHOT_EXAMPLES = [
+    {
+        'context': '턴: 3, 자금: 10M, 유저: 100, 신뢰도: 50, 인프라: EC2',
+        'event': {
+            'eventType': 'MARKET_OPPORTUNITY',
+            'title': '유명 인플루언서 협업 제안',
+            'description': '팔로워 50만 명의 테크 인플루언서가 무료로 서비스를 홍보하겠다고 제안했습니다. '
+                           '단, 프리미엄 기능을 1개월간 무료로 제공해야 합니다.',
+            'choices': [
+                {
+                    'text': '협업 진행 - 단기 매출 감소하지만 유저 폭증 기대',
+                    'effects': {'usersDelta': 3000, 'cashDelta': -20000000, 'trustDelta': 5},
+                    'resultText': '인플루언서 효과로 3000명의 신규 유저 유입! 프리미엄 무료 제공으로 2000만원 손실',
+                },
+                {
+                    'text': '정중히 거절 - 안정적 성장 유지',
+                    'effects': {'usersDelta': 200, 'cashDelta': 5000000, 'trustDelta': -2},
+                    'resultText': '기회를 놓쳤다는 아쉬움이 남지만, 안정적인 매출 유지',
+                },
+            ],
+        },
+    },
+    {
+        'context': '턴: 8, 자금: 150M, 유저: 5000, 신뢰도: 60, 인프라: EC2, Aurora',
+        'event': {
+            'eventType': 'INFRASTRUCTURE_CRISIS',
+            'title': '갑작스런 트래픽 폭증',
+            'description': '유명 커뮤니티에 서비스가 소개되며 트래픽이 10배 증가했습니다. '
+                           '현재 EC2 인스턴스가 CPU 90%를 기록 중입니다.',
+            'choices': [
+                {
+                    'text': '긴급 ALB + AutoScaling 구축 - 비용 많이 들지만 안정적',
+                    'effects': {'usersDelta': 8000, 'cashDelta': -80000000, 'trustDelta': 8,
+                                'addInfrastructure': ['ALB', 'AutoScaling']},
+                    'resultText': 'AutoScaling으로 안정적으로 트래픽 처리! 8000명 신규 유저 확보',
+                },
+                {
+                    'text': 'EC2 인스턴스 타입만 업그레이드 - 저렴하지만 위험',
+                    'effects': {'usersDelta': 4000, 'cashDelta': -30000000, 'trustDelta': -5},
+                    'resultText': '일부 유저는 느린 응답 속도에 이탈했지만, 비용 절감 성공',
+                },
+                {
+                    'text': '아무것도 안 함 - 비용 0원이지만 서비스 불안정',
+                    'effects': {'usersDelta': -1000, 'cashDelta': 0, 'trustDelta': -10},
+                    'resultText': '서버 다운으로 1000명 이탈! 신뢰도 큰 폭 하락',
+                },
+            ],
+        },
+    },
+    {
+        'context': '턴: 15, 자금: 500M, 유저: 100000, 신뢰도: 75, 인프라: EC2, Aurora, ALB, EKS',
+        'event': {
+            'eventType': 'FUNDING_OPPORTUNITY',
+            'title': '글로벌 VC 투자 제안',
+            'description': '실리콘밸리의 유명 VC가 200억 원 투자를 제안했습니다. '
+                           '대신 글로벌 진출과 EKS 기반 MSA 전환을 요구합니다.',
+            'choices': [
+                {
+                    'text': '투자 받고 글로벌 진출 - Aurora Global DB 구축',
+                    'effects': {'usersDelta': 50000, 'cashDelta': 20000000000, 'trustDelta': 15,
+                                'addInfrastructure': ['Aurora Global DB']},
+                    'resultText': '200억 투자 유치! Aurora Global DB로 아시아 전역 서비스 시작',
+                },
+                {
+                    'text': '투자 거절하고 국내 시장 집중',
+                    'effects': {'usersDelta': 10000, 'cashDelta': 50000000, 'trustDelta': -5},
+                    'resultText': '안정적이지만 성장 속도가 느려짐. 경쟁사에 뒤처질 위험',
+                },
+            ],
+        },
+    },
+]
+
+def _few_shot_prompt() -> str:
+    examples = '\n---\n'.join(
+        f"\n예시 {idx + 1}:\n{example['context']}\n\n생성된 이벤트:\n"
+        f"{json.dumps(example['event'], ensure_ascii=False, indent=2)}\n"
+        for idx, example in enumerate(FEW_SHOT_EXAMPLES))
+    return f"\n좋은 이벤트 예시:\n\n{examples}\n\n이제 주어진 게임 상황에 맞는 새로운 이벤트를 생성하세요.\n"
+
+FEW_SHOT_PROMPT = _few_shot_prompt()
+
+def _game_stage(turn: int) -> str:
+    if turn < 5:
+        return '초기 스타트업'
+    if turn < 10:
+        return '성장기'
+    if turn < 15:
+        return '확장기'
+    if turn < 20:
+        return '스케일업'
+    return 'IPO 준비'
+
+def _format_cash(cash: int) -> str:
+    if cash >= 1_000_000_000:
+        return f"{cash / 1_000_000_000:.1f}B원"
+    if cash >= 1_000_000:
+        return f"{cash / 1_000_000:.0f}M원"
+    return f"{cash / 1000:.0f}K원"
+
+def _format_users(users: int) -> str:
+    if users >= 1_000_000:
+        return f"{users / 1_000_000:.1f}M명"
+    if users >= 1000:
+        return f"{users / 1000:.0f}K명"
+    return f"{users}명"
+
+def build_prompt(state: Dict) -> str:
+    """PromptBuilderService.buildEventPrompt 와 같은 프롬프트"""
+    context = (f"\n현재 게임 상황:\n"
+               f"- 턴: {state['currentTurn']}/{MAX_TURN}\n"
+               f"- 자금: {_format_cash(state['cash'])}\n"
+               f"- 유저 수: {_format_users(state['users'])}\n"
+               f"- 신뢰도: {state['trust']}/100\n"
+               f"- 인프라: {', '.join(state['infrastructure'])}\n"
+               f"- 단계: {_game_stage(state['currentTurn'])}\n\n"
+               f"위 상황에 맞는 이벤트를 생성하세요.")
+    return f"{SYSTEM_PROMPT}\n\n{FEW_SHOT_PROMPT}\n\n{context}\n\n응답 (JSON만):"
+
+def extract_json(raw: str) -> str:
+    """PromptBuilderService.extractJsonFromResponse — 코드 블록을 벗기고 첫 '{' ~ 마지막 '}'"""
+    cleaned = raw.strip()
+    cleaned = re.sub(r'^```json\s*', '', cleaned, flags=re.IGNORECASE)
+    cleaned = re.sub(r'^```\s*', '', cleaned)
+    cleaned = re.sub(r'\s*```$', '', cleaned)
+    start, end = cleaned.find('{'), cleaned.rfind('}')
+    if start == -1 or end == -1:
+        raise ValueError('No JSON object found in response')
+    return cleaned[start:end + 1]
+
+# ---------------------------------------------------------------------------
+# 게임 상황 격자 (EventCacheService.getCacheKey 버킷)
+# ---------------------------------------------------------------------------
+
+# 등급 이름 → 대표값 (event-cache.service.ts 의 경계 사이 값)
+CASH_TIERS = {'negative': -20_000_000, 'low': 20_000_000, 'medium': 120_000_000,
+              'high': 500_000_000, 'very-high': 2_000_000_000}
+USER_TIERS = {'startup': 500, 'growth': 5_000, 'scale': 50_000, 'large': 300_000, 'massive': 2_000_000}
+TRUST_TIERS = {'critical': 25, 'low': 40, 'medium': 60, 'high': 80, 'excellent': 95}
+# 턴 구간별 대표 인프라 (구간이 올라갈수록 누적)
+STAGE_INFRA = ['EC2', 'Aurora', 'ALB', 'EKS', 'Redis', 'Aurora Global DB']
+
+def _cash_tier(cash: int) -> str:
+    if cash < 0:
+        return 'negative'
+    if cash < 50_000_000:
+        return 'low'
+    if cash < 200_000_000:
+        return 'medium'
+    if cash < 1_000_000_000:
+        return 'high'
+    return 'very-high'
+
+def _user_tier(users: int) -> str:
+    if users < 1000:
+        return 'startup'
+    if users < 10_000:
+        return 'growth'
+    if users < 100_000:
+        return 'scale'
+    if users < 1_000_000:
+        return 'large'
+    return 'massive'
+
+def _trust_tier(trust: int) -> str:
+    if trust < 30:
+        return 'critical'
+    if trust < 50:
+        return 'low'
+    if trust < 70:
+        return 'medium'
+    if trust < 90:
+        return 'high'
+    return 'excellent'
+
+def bucket_key(state: Dict) -> str:
+    """EventCacheService.getCacheKey 와 같은 키 (event:턴구간:자금:유저:신뢰도)"""
+    return (f"event:{state['currentTurn'] // 5}:{_cash_tier(state['cash'])}:"
+            f"{_user_tier(state['users'])}:{_trust_tier(state['trust'])}")
+
+def state_grid(turn_buckets: Optional[Iterable[int]] = None) -> List[Dict]:
+    """버킷마다 대표 게임 상황 하나 (기본: 턴 1~25 의 모든 구간 × 등급 조합)"""
+    buckets = sorted(set(turn_buckets)) if turn_buckets is not None else list(range(MAX_TURN // 5 + 1))
+    states = []
+    for bucket in buckets:
+        turn = min(MAX_TURN, max(1, bucket * 5 + 2))
+        infra = STAGE_INFRA[:min(len(STAGE_INFRA), bucket + 1)]
+        for cash in CASH_TIERS.values():
+            for users in USER_TIERS.values():
+                for trust in TRUST_TIERS.values():
+                    states.append({'currentTurn': turn, 'cash': cash, 'users': users,
+                                   'trust': trust, 'infrastructure': list(infra)})
+    return states
+
+# ---------------------------------------------------------------------------
+# 검증 + 채점 (validators/*.ts, services/event-quality-scorer.service.ts 포팅)
+# ---------------------------------------------------------------------------
+
+LIMITS = {'users': (-100_000, 100_000), 'cash': (-100_000_000, 100_000_000), 'trust': (-50, 50),
+          'min_choices': 2, 'max_choices': 4, 'event_text': (20, 500)}
+FORBIDDEN_WORDS = ['씨발', '개새끼', '병신', '좆', '엿먹어', '지랄', '닥쳐', '꺼져']
+DELTA_FIELDS = (('usersDelta', 'users'), ('cashDelta', 'cash'), ('trustDelta', 'trust'))
+
+def _is_number(value) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+def _delta(choice: Dict, field: str) -> float:
+    return choice['effects'].get(field) or 0
+
+def _js_round(value: float) -> int:
+    return math.floor(value + 0.5)
+
+def _structure_errors(event) -> List[str]:
+    if not isinstance(event, dict):
+        return ['이벤트가 JSON 객체가 아님']
+    errors = []
+    if not event.get('eventType') or not isinstance(event['eventType'], str):
+        errors.append('eventType 누락')
+    if not event.get('title') or not isinstance(event['title'], str):
+        errors.append('title 누락 또는 잘못된 타입')
+    if not event.get('description') or not isinstance(event['description'], str):
+        errors.append('description 텍스트 누락 또는 잘못된 타입')
+    choices = event.get('choices')
+    if not isinstance(choices, list):
+        return errors + ['choices 배열 누락']
+    if len(choices) < LIMITS['min_choices']:
+        errors.append(f"선택지 부족: {len(choices)}개 (최소 {LIMITS['min_choices']}개)")
+    if len(choices) > LIMITS['max_choices']:
+        errors.append(f"선택지 과다: {len(choices)}개 (최대 {LIMITS['max_choices']}개)")
+    for idx, choice in enumerate(choices, 1):
+        if not isinstance(choice, dict):
+            errors.append(f'선택지 {idx}: 객체가 아님')
+            continue
+        if not choice.get('text') or not isinstance(choice['text'], str):
+            errors.append(f'선택지 {idx}: text 누락')
+        effects = choice.get('effects')
+        if not isinstance(effects, dict):
+            errors.append(f'선택지 {idx}: effects 누락')
+            continue
+        for field, _ in DELTA_FIELDS:
+            if effects.get(field) is not None and not _is_number(effects[field]):
+                errors.append(f'선택지 {idx}: effects.{field}가 숫자가 아님')
+        for field in ('addInfrastructure', 'removeInfrastructure'):
+            if effects.get(field) and not isinstance(effects[field], list):
+                errors.append(f'선택지 {idx}: effects.{field}가 배열이 아님')
+        if choice.get('resultText') is not None and not isinstance(choice['resultText'], str):
+            errors.append(f'선택지 {idx}: resultText가 문자열이 아님')
+    return errors
+
+def validate_event(event: Dict, state: Dict) -> Tuple[List[str], List[str]]:
+    """→ (오류, 경고) — LLMResponseValidatorService 의 구조/밸런스/콘텐츠 단계"""
+    errors = _structure_errors(event)
+    if errors:
+        return errors, []
+    warnings = []
+    low, high = LIMITS['event_text']
+    if not low <= len(event['description']) <= high:
+        warnings.append(f"이벤트 텍스트 길이 범위 밖: {len(event['description'])}자")
+
+    choices = event['choices']
+    for idx, choice in enumerate(choices, 1):
+        for field, limit in DELTA_FIELDS:
+            value = _delta(choice, field)
+            lo, hi = LIMITS[limit]
+            if not lo <= value <= hi:
+                errors.append(f'선택지 {idx}: {limit} 변화 범위 초과 ({value}, 허용: {lo}~{hi})')
+    if state.get('cash') and all(state['cash'] + _delta(c, 'cashDelta') < 0 for c in choices):
+        errors.append('모든 선택지가 파산으로 이어짐 (탈출 불가능)')
+    if state.get('trust') and any(state['trust'] + _delta(c, 'trustDelta') < 20 for c in choices):
+        warnings.append('신뢰도 게임오버 위험 선택지 있음')
+
+    text = ' '.join([event['description'], event['title']] + [c['text'] for c in choices]
+                    + [c['resultText'] for c in choices if c.get('resultText')])
+    errors.extend(f'금지 단어 발견: "{word}"' for word in FORBIDDEN_WORDS if word in text)
+    if not re.search(r'AWS|클라우드|EC2|S3|Lambda|RDS|Aurora|EKS|CloudFront|서버|인프라|데이터베이스|스케일링',
+                     text, re.IGNORECASE):
+        warnings.append('AWS/클라우드 관련 컨텍스트 부족 (게임 세계관 이탈 가능)')
+    korean = len(re.findall(r'[가-힣]', text))
+    total = len(re.sub(r'\s', '', text))
+    if total and korean / total < 0.5:
+        warnings.append(f'한글 비율 낮음: {korean / total:.1%}')
+    texts = [c['text'] for c in choices]
+    if len(set(texts)) != len(texts):
+        errors.append('선택지 텍스트 중복 발견')
+    return errors, warnings
+
+def auto_fix(event: Dict) -> Dict:
+    """범위 초과 효과를 한도로 자르고 금지 단어를 가림 (attemptAutoFix)"""
+    fixed = json.loads(json.dumps(event))
+    for choice in fixed['choices']:
+        for field, limit in DELTA_FIELDS:
+            lo, hi = LIMITS[limit]
+            choice['effects'][field] = max(lo, min(hi, _delta(choice, field)))
+        for key in ('text', 'resultText'):
+            if choice.get(key):
+                choice[key] = _mask(choice[key])
+    fixed['title'] = _mask(fixed['title'])
+    fixed['description'] = _mask(fixed['description'])
+    return fixed
+
+def _mask(text: str) -> str:
+    for word in FORBIDDEN_WORDS:
+        text = text.replace(word, '***')
+    return text
+
+def _score_coherence(event: Dict) -> int:
+    score = 100
+    choices = event['choices']
+    if 'CRISIS' in event['eventType']:
+        if not re.search(r'장애|사고|위기|긴급|문제|버그|해킹|공격', event['description']):
+            score -= 25
+        if not any(_delta(c, 'cashDelta') < 0 or _delta(c, 'trustDelta') < 0 for c in choices):
+            score -= 15
+    if 'OPPORTUNITY' in event['eventType']:
+        if not re.search(r'기회|투자|제안|제휴|성장|확장|수익|파트너', event['description']):
+            score -= 25
+        if not any(_delta(c, 'cashDelta') > 0 or _delta(c, 'usersDelta') > 0 for c in choices):
+            score -= 15
+    text = f"{event['title']} {event['description']} {' '.join(c['text'] for c in choices)}"
+    if not re.search(r'스타트업|서비스|유저|고객|투자|매출|수익|팀|개발|배포', text):
+        score -= 20
+    for choice in choices:
+        choice_text = choice['text'].lower()
+        cash, users = _delta(choice, 'cashDelta'), _delta(choice, 'usersDelta')
+        if re.search(r'투자|구매|확보|채용|광고', choice_text) and cash >= 0:
+            score -= 10
+        if re.search(r'절감|축소|감소|최소화', choice_text) and abs(cash) > 50_000_000:
+            score -= 10
+        if re.search(r'공격적|대규모|전면|대대적', choice_text) and abs(cash) < 20_000_000 and abs(users) < 1000:
+            score -= 10
+    return max(0, score)
+
+def _score_balance(event: Dict, state: Optional[Dict]) -> int:
+    score = 100
+    choices = event['choices']
+    avg_cash = sum(abs(_delta(c, 'cashDelta')) for c in choices) / len(choices)
+    avg_users = sum(abs(_delta(c, 'usersDelta')) for c in choices) / len(choices)
+    avg_trust = sum(abs(_delta(c, 'trustDelta')) for c in choices) / len(choices)
+    if avg_cash > 80_000_000:
+        score -= 25
+    elif avg_cash < 5_000_000:
+        score -= 15
+    if avg_users > 3000:
+        score -= 20
+    elif 0 < avg_users < 500:
+        score -= 10
+    if avg_trust > 8:
+        score -= 15
+    cash_effects = [_delta(c, 'cashDelta') for c in choices]
+    cash_gap = max(cash_effects) - min(cash_effects)
+    if cash_gap > 150_000_000:
+        score -= 20
+    if state:
+        if state.get('cash') and all(state['cash'] + _delta(c, 'cashDelta') < 0 for c in choices):
+            score -= 30
+        if state.get('trust') and all(state['trust'] + _delta(c, 'trustDelta') < 20 for c in choices):
+            score -= 30
+    first_users = choices[0]['effects'].get('usersDelta')
+    if cash_gap == 0 and all(c['effects'].get('usersDelta') == first_users for c in choices):
+        score -= 25
+    return max(0, score)
+
+def _has_tradeoff(event: Dict) -> bool:
+    choices = event['choices']
+    if len(choices) < 2:
+        return True
+    scores = [_delta(c, 'cashDelta') / 10_000_000 + _delta(c, 'usersDelta') / 100 + _delta(c, 'trustDelta') * 2
+              for c in choices]
+    return max(scores) - min(scores) <= 10 and max(scores) != min(scores)
+
+def _score_entertainment(event: Dict) -> int:
+    score = 100
+    description, title, choices = len(event['description']), len(event['title']), event['choices']
+    if description < 30:
+        score -= 35
+    elif description < 50:
+        score -= 15
+    elif description > 400:
+        score -= 10
+    if title < 5:
+        score -= 10
+    elif title > 50:
+        score -= 5
+    if len(choices) >= 3:
+        score += 10
+    for choice in choices:
+        if len(choice['text']) < 10:
+            score -= 25
+        elif len(choice['text']) > 150:
+            score -= 10
+        if re.fullmatch(r'예|아니오|네|아뇨|예스|노|확인|취소', choice['text']):
+            score -= 20
+    if not _has_tradeoff(event):
+        score -= 20
+    if all(c.get('resultText') and len(c['resultText']) > 10 for c in choices):
+        score += 10
+    return max(0, score)
+
+def _score_educational(event: Dict) -> int:
+    score = 60
+    text = f"{event['title']} {event['description']} {' '.join(c['text'] for c in event['choices'])}"
+    services = set(re.findall(r'EC2|S3|Lambda|RDS|Aurora|EKS|CloudFront|Route53|VPC|DynamoDB|'
+                              r'ElastiCache|ALB|CloudWatch|IAM|KMS', text))
+    score += min(40, len(services) * 8)
+    if any(c['effects'].get('addInfrastructure') for c in event['choices']):
+        score += 15
+    if len(re.findall(r'스케일링|확장성|가용성|내구성|성능|최적화|보안|백업|복구|장애조치|다중화|로드밸런싱|캐싱|모니터링',
+                      text)) >= 2:
+        score += 10
+    if re.search(r'비용|요금|가격|절감|최적화|예산', text):
+        score += 5
+    return max(0, min(100, score))
+
+def score_event(event: Dict, state: Optional[Dict] = None) -> Dict:
+    """EventQualityScorerService.calculateQualityScore (0~100, 구조 검증을 통과한 이벤트만)"""
+    parts = {
+        'coherence': _score_coherence(event),
+        'balance': _score_balance(event, state),
+        'entertainment': _score_entertainment(event),
+        'educational': _score_educational(event),
+    }
+    overall = _js_round(sum(parts.values()) / 4)
+    quality = {name: max(0, min(100, value)) for name, value in parts.items()}
+    quality['overall'] = max(0, min(100, overall))
+    return quality
+
+def evaluate(raw: str, state: Dict) -> Dict:
+    """원문 응답 → {'event', 'quality', 'errors', 'warnings', 'autoFixed'} (게임 서버 검증 흐름과 같은 순서)"""
+    try:
+        event = json.loads(extract_json(raw))
+    except ValueError as e:
+        return {'event': None, 'quality': None, 'errors': [f'JSON 파싱 실패: {e}'], 'warnings': [], 'autoFixed': False}
+    errors, warnings = validate_event(event, state)
+    fixed = False
+    if errors and all('범위 초과' in e for e in errors):
+        event, fixed = auto_fix(event), True
+        errors, warnings = validate_event(event, state)
+    quality = score_event(event, state) if not _structure_errors(event) else None
+    return {'event': event, 'quality': quality, 'errors': errors, 'warnings': warnings, 'autoFixed': fixed}
+
+# ---------------------------------------------------------------------------
+# 응답 캐시 (내용 주소) + 풀 파일
+# ---------------------------------------------------------------------------
+
+def request_key(body: Dict) -> str:
+    return hashlib.sha256(json.dumps(body, ensure_ascii=False, sort_keys=True).encode('utf-8')).hexdigest()
+
+class ResponseCache:
+    """요청 본문 sha256 → 원문 응답 (파일 하나에 하나, 임시 파일 + os.replace 로 원자적 기록)"""
+
+    def __init__(self, root: str = CACHE_DIR):
+        self.root = root
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.root, key[:2], f'{key}.json')
+
+    def get(self, key: str) -> Optional[str]:
+        try:
+            with open(self._path(key), 'r', encoding='utf-8') as f:
+                return json.load(f)['text']
+        except FileNotFoundError:
+            return None
+        except (ValueError, KeyError):   # 손상된 항목은 없는 것으로 취급하고 다시 요청
+            return None
+
+    def put(self, key: str, body: Dict, text: str):
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump({'request': body, 'text': text, 'created': time.strftime('%Y-%m-%dT%H:%M:%S')},
+                      f, ensure_ascii=False)
+        os.replace(tmp, path)
+
+def load_pool(path: str) -> Set[str]:
+    """기존 풀의 요청 키 (중단으로 잘린 마지막 줄은 잘라 냄)"""
+    if not os.path.exists(path):
+        return set()
+    with open(path, 'rb') as f:
+        content = f.read()
+    end = content.rfind(b'\n') + 1
+    if end != len(content):
+        with open(path, 'r+b') as f:
+            f.truncate(end)
+    keys = set()
+    for line in content[:end].splitlines():
+        if line.strip():
+            keys.add(json.loads(line)['key'])
+    return keys
+
+# ---------------------------------------------------------------------------
+# 비동기 클라이언트
+# ---------------------------------------------------------------------------
+
+class LLMRequestError(Exception):
+    pass
+
+class CompletionClient:
+    """/v1/completions 비동기 호출 — 재시도 가능한 오류는 지수 백오프(+지터)로 다시 시도"""
+
+    def __init__(self, endpoint: str, concurrency: int, timeout: float, retries: int,
+                 backoff: float, seed: int = 0):
+        self.url = endpoint.rstrip('/') + '/v1/completions'
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff = backoff
+        self.executor = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix='llm')
+        self.rng = random.Random(seed)
+        self.attempts = 0
+        self.retried = 0
+
+    def close(self):
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+    def _post(self, body: Dict) -> str:
+        request = urllib.request.Request(self.url, data=json.dumps(body).encode('utf-8'),
+                                         headers={'Content-Type': 'application/json'})
+        with urllib.request.urlopen(request, timeout=self.timeout) as response:
+            payload = json.loads(response.read().decode('utf-8'))
+        return payload['choices'][0]['text']
+
+    def _delay(self, attempt: int, retry_after: Optional[str]) -> float:
+        if retry_after:
+            try:
+                return min(MAX_BACKOFF, float(retry_after))
+            except ValueError:
+                pass
+        return min(MAX_BACKOFF, self.backoff * 2 ** attempt) * self.rng.uniform(0.5, 1.5)
+
+    async def complete(self, body: Dict) -> str:
+        loop = asyncio.get_running_loop()
+        last_error = None
+        for attempt in range(self.retries + 1):
+            self.attempts += 1
+            retry_after = None
+            try:
+                return await loop.run_in_executor(self.executor, self._post, body)
+            except urllib.error.HTTPError as e:
+                if e.code not in RETRY_STATUS:
+                    raise LLMRequestError(f'HTTP {e.code}: {e.reason}') from e
+                last_error, retry_after = f'HTTP {e.code}', e.headers.get('Retry-After')
+            except (urllib.error.URLError, TimeoutError, ConnectionError) as e:
+                last_error = f'{type(e).__name__}: {getattr(e, "reason", e)}'
+            except (ValueError, KeyError, IndexError) as e:
+                raise LLMRequestError(f'잘못된 응답 형식: {e}') from e
+            if attempt < self.retries:
+                self.retried += 1
+                await asyncio.sleep(self._delay(attempt, retry_after))
+        raise LLMRequestError(f'{self.retries + 1}회 시도 후 실패: {last_error}')
+
+# ---------------------------------------------------------------------------
+# 풀 생성
+# ---------------------------------------------------------------------------
+
+def build_jobs(states: List[Dict], variants: int, model: str) -> List[Dict]:
+    """(상황 × 변형) 요청 목록 — 변형은 seed 로 구분 (같은 프롬프트, 다른 표본)"""
+    jobs = []
+    for state in states:
+        prompt = build_prompt(state)
+        for variant in range(variants):
+            body = dict(SAMPLING, model=model, prompt=prompt, seed=variant)
+            jobs.append({'key': request_key(body), 'body': body, 'state': state, 'variant': variant})
+    return jobs
+
+def _reason(error: str) -> str:
+    """집계용 오류 종류 ('선택지 2: cash 변화 범위 초과 (…)' → 'cash 변화 범위 초과')"""
+    return re.sub(r'^선택지 \d+: ', '', error).split(' (')[0].split(':')[0]
+
+async def generate_pool(jobs: List[Dict], client: Optional[CompletionClient], cache: ResponseCache,
+                        output: str, concurrency: int, min_quality: int) -> Dict:
+    """요청 → 캐시 → 검증/채점 → 채택된 이벤트를 풀 JSONL 에 한 줄씩 추가"""
+    done = load_pool(output)
+    pending = [job for job in jobs if job['key'] not in done]
+    stats = {'jobs': len(jobs), 'resumed': len(jobs) - len(pending), 'cache_hits': 0, 'requests': 0,
+             'failed': 0, 'accepted': 0, 'rejected': 0, 'auto_fixed': 0, 'errors': {}, 'quality': []}
+    semaphore = asyncio.Semaphore(concurrency)
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+
+    with open(output, 'a', encoding='utf-8') as pool:
+        async def run(job: Dict):
+            text = cache.get(job['key'])
+            PROFILER.cache('llm_events', text is not None)
+            if text is not None:
+                stats['cache_hits'] += 1
+            elif client is None:
+                stats['failed'] += 1
+                return
+            else:
+                async with semaphore:
+                    try:
+                        stats['requests'] += 1
+                        text = await client.complete(job['body'])
+                    except LLMRequestError as e:
+                        stats['failed'] += 1
+                        stats['errors'][str(e)] = stats['errors'].get(str(e), 0) + 1
+                        return
+                cache.put(job['key'], job['body'], text)
+
+            result = evaluate(text, job['state'])
+            quality = result['quality']
+            if result['errors'] or quality is None or quality['overall'] < min_quality:
+                stats['rejected'] += 1
+                reason = _reason(result['errors'][0]) if result['errors'] else '품질 점수 미달'
+                stats['errors'][reason] = stats['errors'].get(reason, 0) + 1
+                return
+            stats['accepted'] += 1
+            stats['auto_fixed'] += result['autoFixed']
+            stats['quality'].append(quality['overall'])
+            pool.write(json.dumps({
+                'key': job['key'],
+                'bucket': bucket_key(job['state']),
+                'variant': job['variant'],
+                'model': job['body']['model'],
+                'gameState': job['state'],
+                'event': result['event'],
+                'quality': quality,
+                'warnings': result['warnings'],
+                'autoFixed': result['autoFixed'],
+            }, ensure_ascii=False) + '\n')
+            pool.flush()
+
+        await asyncio.gather(*(run(job) for job in pending))
+    return stats
+
+def pool_coverage(path: str) -> Dict[str, int]:
+    """버킷 → 풀의 이벤트 수"""
+    coverage: Dict[str, int] = {}
+    if os.path.exists(path):
+        with open(path, 'r', encoding='utf-8') as f:
+            for line in f:
+                if line.strip():
+                    bucket = json.loads(line)['bucket']
+                    coverage[bucket] = coverage.get(bucket, 0) + 1
+    return coverage
+
+# ---------------------------------------------------------------------------
+# 스텁 vLLM 서버 (시험용)
+# ---------------------------------------------------------------------------
+
+class _StubHandler(BaseHTTPRequestHandler):
+    """/health 와 /v1/completions — few-shot 예시를 프롬프트/seed 별로 흔든 이벤트를 돌려줌"""
+
+    def log_message(self, *args):
+        pass
+
+    def _reply(self, status: int, payload: Dict, headers: Optional[Dict] = None):
+        body = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        if self.path == '/health':
+            self._reply(200, {'status': 'ok'})
+        else:
+            self._reply(404, {'error': 'not found'})
+
+    def do_POST(self):
+        if self.path != '/v1/completions':
+            self._reply(404, {'error': 'not found'})
+            return
+        body = json.loads(self.rfile.read(int(self.headers.get('Content-Length', 0))))
+        server = self.server
+        with server.lock:
+            server.requests += 1
+            roll = server.rng.random()
+        if server.latency:
+            time.sleep(server.latency)
+        if roll < server.failure_rate:
+            if roll < server.failure_rate / 2:
+                self._reply(429, {'error': 'rate limited'}, {'Retry-After': '0'})
+            else:
+                self._reply(503, {'error': 'overloaded'})
+            return
+        text = stub_completion(body['prompt'], body.get('seed', 0), server.garbage_rate)
+        self._reply(200, {
+            'id': 'cmpl-stub', 'object': 'text_completion', 'created': int(time.time()), 'model': body['model'],
+            'choices': [{'text': text, 'index': 0, 'logprobs': None, 'finish_reason': 'stop'}],
+            'usage': {'prompt_tokens': len(body['prompt']), 'completion_tokens': len(text),
+                      'total_tokens': len(body['prompt']) + len(text)},
+        })
+
+def stub_completion(prompt: str, seed: int, garbage_rate: float = 0.0) -> str:
+    """결정적 가짜 응답 — 같은 (프롬프트, seed) 는 항상 같은 텍스트"""
+    rng = random.Random(hashlib.sha256(f'{seed}:{prompt}'.encode('utf-8')).digest())
+    if rng.random() < garbage_rate:
+        return '죄송합니다. 지금은 이벤트를 생성할 수 없습니다.'
+    event = json.loads(json.dumps(rng.choice(FEW_SHOT_EXAMPLES)['event']))
+    turn = re.search(rf'- 턴: (\d+)/{MAX_TURN}', prompt)
+    event['title'] = f"{event['title']} #{seed + 1}"
+    if turn:
+        event['description'] += f" (턴 {turn.group(1)} 상황)"
+    scale = rng.uniform(0.5, 1.5)
+    for choice in event['choices']:
+        for field, _ in DELTA_FIELDS:
+            choice['effects'][field] = int(round(choice['effects'][field] * scale))
+    text = json.dumps(event, ensure_ascii=False, indent=2)
+    return f'```json\n{text}\n```' if rng.random() < 0.3 else text
+
+def start_stub_server(failure_rate: float = 0.0, latency: float = 0.0, garbage_rate: float = 0.0,
+                      seed: int = 0, port: int = 0) -> Tuple[ThreadingHTTPServer, str]:
+    """백그라운드 스레드에서 스텁 서버 시작 → (서버, 엔드포인트 URL)"""
+    server = ThreadingHTTPServer(('127.0.0.1', port), _StubHandler)
+    server.daemon_threads = True
+    server.failure_rate, server.latency, server.garbage_rate = failure_rate, latency, garbage_rate
+    server.rng, server.lock, server.requests = random.Random(seed), threading.Lock(), 0
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f'http://127.0.0.1:{server.server_address[1]}'
+
+# ---------------------------------------------------------------------------
+# CLI
+# ---------------------------------------------------------------------------
+
+def parse_args():
+    parser = argparse.ArgumentParser(description='LLM 동적 이벤트 풀 오프라인 생성')
+    parser.add_argument('--endpoint', default=DEFAULT_ENDPOINT, help='vLLM 엔드포인트 (VLLM_ENDPOINT)')
+    parser.add_argument('--model', default=DEFAULT_MODEL, help='모델 이름 (VLLM_MODEL_NAME)')
+    parser.add_argument('--output', default='../llm_event_pool.jsonl', help='이벤트 풀 JSONL 경로')
+    parser.add_argument('--cache-dir', default=CACHE_DIR, help='응답 캐시 디렉터리')
+    parser.add_argument('--variants', type=int, default=4, help='버킷당 요청 수 (seed 0..N-1)')
+    parser.add_argument('--turn-buckets', help='쉼표로 구분한 턴 구간 (턴 // 5, 기본: 전체)')
+    parser.add_argument('--limit', type=int, help='요청 수 상한 (시험용)')
+    parser.add_argument('--concurrency', type=int, default=16, help='동시 요청 수')
+    parser.add_argument('--timeout', type=float, default=60.0, help='요청 타임아웃 (초)')
+    parser.add_argument('--retries', type=int, default=4, help='재시도 횟수')
+    parser.add_argument('--backoff', type=float, default=0.5, help='첫 재시도 대기 (초, 매번 2배)')
+    parser.add_argument('--min-quality', type=int, default=60, help='채택할 최소 품질 점수 (0~100)')
+    parser.add_argument('--offline', action='store_true', help='요청하지 않고 캐시에 있는 응답만 사용')
+    parser.add_argument('--seed', type=int, default=0, help='백오프 지터/스텁 서버 시드')
+    parser.add_argument('--stub', action='store_true', help='로컬 스텁 vLLM 서버로 실행 (--endpoint 무시)')
+    parser.add_argument('--stub-failure-rate', type=float, default=0.0, help='스텁 서버 429/503 비율')
+    parser.add_argument('--stub-latency', type=float, default=0.0, help='스텁 서버 응답 지연 (초)')
+    parser.add_argument('--stub-garbage-rate', type=float, default=0.0, help='스텁 서버가 JSON 이 아닌 응답을 줄 비율')
+    add_profile_arguments(parser)
+    return parser.parse_args()
+
+def main():
+    args = parse_args()
+    enable_from_args(args)
+
+    print("🎮 AWS CTO Game - LLM Event Pool Generator")
+    print("=" * 60)
+
+    server = None
+    endpoint = args.endpoint
+    if args.stub:
+        server, endpoint = start_stub_server(args.stub_failure_rate, args.stub_latency,
+                                             args.stub_garbage_rate, args.seed)
+        print(f"🧪 스텁 서버: {endpoint}")
+
+    turn_buckets = [int(b) for b in args.turn_buckets.split(',')] if args.turn_buckets else None
+    with PROFILER.stage('prompts'):
+        jobs = build_jobs(state_grid(turn_buckets), args.variants, args.model)
+    if args.limit is not None:
+        jobs = jobs[:args.limit]
+    print(f"📋 요청 {len(jobs):,}개 (버킷 {len(jobs) // max(1, args.variants):,}개 × 변형 {args.variants}개) "
+          f"→ {'캐시만' if args.offline else endpoint}")
+
+    client = None if args.offline else CompletionClient(endpoint, args.concurrency, args.timeout,
+                                                          args.retries, args.backoff, args.seed)
+    started = time.perf_counter()
+    try:
+        with PROFILER.stage('generate'):
+            stats = asyncio.run(generate_pool(jobs, client, ResponseCache(args.cache_dir), args.output,
+                                              args.concurrency, args.min_quality))
+    finally:
+        if client is not None:
+            client.close()
+        if server is not None:
+            server.shutdown()
+    elapsed = time.perf_counter() - started
+
+    processed = stats['jobs'] - stats['resumed']
+    print(f"\n📊 결과 ({elapsed:.1f}초):")
+    print(f"   - 이어하기로 건너뜀: {stats['resumed']:,}개")
+    print(f"   - 캐시 적중: {stats['cache_hits']:,}개 / 네트워크 요청: {stats['requests']:,}개"
+          + (f" (시도 {client.attempts:,}회, 재시도 {client.retried:,}회)" if client else ''))
+    if stats['requests'] and elapsed > 0:
+        print(f"   - 처리량: {stats['requests'] / elapsed:,.1f} 요청/초")
+    print(f"   - 채택 {stats['accepted']:,}개 (자동 보정 {stats['auto_fixed']:,}개) / "
+          f"거절 {stats['rejected']:,}개 / 실패 {stats['failed']:,}개 (이번 실행 {processed:,}개 중)")
+    if stats['quality']:
+        quality = sorted(stats['quality'])
+        print(f"   - 품질 점수: 평균 {sum(quality) / len(quality):.1f}, 최저 {quality[0]}, "
+              f"80점 이상 {sum(q >= 80 for q in quality) / len(quality):.0%}")
+    for reason, count in sorted(stats['errors'].items(), key=lambda item: -item[1])[:5]:
+        print(f"   ⚠️  {reason}: {count:,}건")
+
+    coverage = pool_coverage(args.output)
+    buckets = {bucket_key(job['state']) for job in jobs}
+    covered = sum(1 for bucket in buckets if coverage.get(bucket))
+    print(f"\n✅ 풀 {sum(coverage.values()):,}개 이벤트, 버킷 {covered:,}/{len(buckets):,}개 확보 → {args.output}")
+    if stats['failed']:
+        print("ℹ️  실패한 요청은 다시 실행하면 이어서 처리합니다")
+    finish_from_args(args)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,27 @@
+/**
+ * game-constants.ts → scripts/game_constants.json 내보내기
+ *
+ * Python 분석 도구(game_engine.py)는 이 JSON 하나만 읽어서
+ * 백엔드와 동일한 밸런스 상수를 사용합니다.
+ * game-constants.ts 를 수정했다면 반드시 다시 실행하세요:
+ *
+ *   npm run constants:export
+ */
+import * as fs from 'fs';
+import * as path from 'path';
+import {
+  GAME_CONSTANTS,
+  DIFFICULTY_CONFIGS,
+  VICTORY_PATH_CONDITIONS,
+} from '../src/game/game-constants';
+
+const outputFile = path.join(__dirname, 'game_constants.json');
+
+const table = {
+  GAME_CONSTANTS,
+  DIFFICULTY_CONFIGS,
+  VICTORY_PATH_CONDITIONS,
+};
+
+fs.writeFileSync(outputFile, JSON.stringify(table, null, 2) + '\n', 'utf-8');
+console.log(`✅ Exported game constants to ${outputFile}`);
@@ -0,0 +1,651 @@
+#!/usr/bin/env python3
+"""
+AWS CTO Game - Turn Engine (Python port)
+GameService.executeChoice 턴 진행 규칙의 Python 이식본
+
+밸런스 상수는 game_constants.json (npm run constants:export 로 생성) 하나에서
+읽으므로 game-constants.ts 와 항상 같은 값을 사용합니다.
+분석/시뮬레이션 스크립트는 모두 이 모듈 위에서 동작합니다.
+"""
+
+import hashlib
+import json
+import math
+import os
+from bisect import bisect_right
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+CONSTANTS_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'game_constants.json')
+
+with open(CONSTANTS_FILE, 'rb') as _f:
+    _RAW_TABLE = _f.read()
+_TABLE = json.loads(_RAW_TABLE)
+
+# 턴 규칙(step) 이 바뀌면 올림 — 상수 해시에 함께 섞어서 이전 엔진의 캐시 결과를 무효화
+ENGINE_REVISION = 3
+
+# 캐시 키에 섞어서 상수가 바뀌면 이전 분석 결과를 재사용하지 않도록 함
+CONSTANTS_HASH = hashlib.sha256(_RAW_TABLE + b':%d' % ENGINE_REVISION).hexdigest()[:16]
+
+GAME_CONSTANTS: Dict = _TABLE['GAME_CONSTANTS']
+DIFFICULTY_CONFIGS: Dict = _TABLE['DIFFICULTY_CONFIGS']
+VICTORY_PATH_CONDITIONS: Dict = _TABLE['VICTORY_PATH_CONDITIONS']
+
+DIFFICULTIES = ('EASY', 'NORMAL', 'HARD')
+
+# 우선순위: IPO > TECH_LEADER > ACQUISITION > PROFITABILITY (findBestVictoryPath)
+VICTORY_PATHS = ('IPO', 'TECH_LEADER', 'ACQUISITION', 'PROFITABILITY')
+
+class GameStatus:
+    """game.entity.ts 의 GameStatus 와 동일한 값"""
+    PLAYING = 'PLAYING'
+    WON_IPO = 'WON_IPO'
+    WON_ACQUISITION = 'WON_ACQUISITION'
+    WON_PROFITABILITY = 'WON_PROFITABILITY'
+    WON_TECH_LEADER = 'WON_TECH_LEADER'
+    LOST_BANKRUPT = 'LOST_BANKRUPT'
+    LOST_OUTAGE = 'LOST_OUTAGE'
+    LOST_FAILED_IPO = 'LOST_FAILED_IPO'
+    LOST_EQUITY = 'LOST_EQUITY'
+    LOST_FIRED_CTO = 'LOST_FIRED_CTO'
+
+VICTORY_STATUS = {path: f'WON_{path}' for path in VICTORY_PATHS}
+STATUS_VICTORY = {status: path for path, status in VICTORY_STATUS.items()}
+
+_C = GAME_CONSTANTS
+_RECOVERY = _C['TRUST_RECOVERY']
+_RESILIENCE = _C['RESILIENCE']
+_STABLE = _C['STABLE_OPERATIONS']
+_DIMINISHING = _C['TRUST_DIMINISHING_RETURNS']
+_INFRA_CAPACITY = _C['INFRASTRUCTURE_CAPACITY']
+_PENALTY_TIERS = tuple((t['excessRatio'], t['penalty']) for t in _C['CAPACITY_PENALTY_TIERS'])
+_GRADES = tuple((grade, t['minUsers'], t['minCash'], t['minTrust'])
+                for grade, t in _C['GRADE_THRESHOLDS'].items())
+
+# ---------------------------------------------------------------------------
+# 인프라 비트마스크
+# ---------------------------------------------------------------------------
+# 인프라 집합은 int 비트마스크입니다: mergeInfrastructure 는 OR, 포함 검사는 AND.
+# INFRASTRUCTURE_CAPACITY 의 이름이 낮은 비트를 차지하므로 기본 용량은 (mask & _CAPACITY_BITS)
+# 를 인덱스로 미리 계산해 둔 표에서 바로 읽습니다. 그 밖의 이름은 처음 볼 때 다음 비트를 받습니다.
+# 비트 번호는 프로세스마다 다를 수 있으므로 저장/전달할 때는 to_dict() 의 이름 목록을 씁니다.
+
+_INFRA_BITS: Dict[str, int] = {}
+_INFRA_NAMES: List[str] = []
+_NAME_SETS: Dict[int, frozenset] = {}
+
+def infra_bit(name: str) -> int:
+    """인프라 이름의 비트 (처음 보는 이름이면 새 비트 할당)"""
+    bit = _INFRA_BITS.get(name)
+    if bit is None:
+        bit = _INFRA_BITS[name] = 1 << len(_INFRA_NAMES)
+        _INFRA_NAMES.append(name)
+    return bit
+
+def infra_mask(names: Iterable[str]) -> int:
+    mask = 0
+    for name in names:
+        mask |= infra_bit(name)
+    return mask
+
+def infra_names(mask: int) -> frozenset:
+    """비트마스크 → 인프라 이름 집합 (마스크별로 기억)"""
+    names = _NAME_SETS.get(mask)
+    if names is None:
+        names = _NAME_SETS[mask] = frozenset(name for i, name in enumerate(_INFRA_NAMES) if mask >> i & 1)
+    return names
+
+def infra_bit_names() -> List[str]:
+    """비트 순서의 인프라 이름 목록 (i 번째 이름 = 1 << i, 이 프로세스 기준)"""
+    return list(_INFRA_NAMES)
+
+def infra_count(mask: int) -> int:
+    return bin(mask).count('1')
+
+def _capacity_table(values: Tuple[int, ...]) -> List[int]:
+    """부분집합 마스크 → BASE_CAPACITY + 용량 합 (가장 낮은 비트 하나를 뺀 부분집합에서 한 칸씩 채움)"""
+    table = [_C['BASE_CAPACITY']] * (1 << len(values))
+    for mask in range(1, len(table)):
+        low = mask & -mask
+        table[mask] = table[mask ^ low] + values[low.bit_length() - 1]
+    return table
+
+_CAPACITY_BITS = infra_mask(_INFRA_CAPACITY)
+_CAPACITY_TABLE = _capacity_table(tuple(_INFRA_CAPACITY.values()))
+_IPO_REQUIRED_INFRA = infra_mask(_C['IPO_REQUIRED_INFRA'])
+_DR_BIT = infra_bit('dr-configured')
+
+# 용량별 페널티 단계 경계: tier 의 excessRatio 이상이 되는 최소 유저 수 (용량 값마다 기억)
+_TIER_PENALTIES = (_PENALTY_TIERS[0][1],) + tuple(penalty for _, penalty in _PENALTY_TIERS)
+_PENALTY_THRESHOLDS: Dict[int, Tuple[int, ...]] = {}
+
+def log_bucket(value: int, ratio: float) -> int:
+    """로그 스케일 버킷 (상대 오차 ratio 이내의 값을 같은 칸으로 묶음)"""
+    if value == 0:
+        return 0
+    index = int(math.log(abs(value)) / math.log1p(ratio)) + 1
+    return index if value > 0 else -index
+
+def is_emergency_turn(turn: int) -> bool:
+    return _C['EMERGENCY_TURN_START'] <= turn <= _C['EMERGENCY_TURN_END']
+
+def is_special_turn(turn: int) -> bool:
+    return is_emergency_turn(turn) or turn == _C['IPO_SELECTION_TURN']
+
+class Rules:
+    """난이도별 규칙 (DIFFICULTY_CONFIGS + VICTORY_PATH_CONDITIONS 를 평탄화)"""
+
+    __slots__ = ('mode', 'max_turns', 'initial_cash', 'initial_trust', 'initial_max_capacity',
+                 'early_pitch_trust_threshold', 'series_min_trust', 'trust_outage_threshold',
+                 'bankruptcy_threshold', 'ipo_min_users', 'ipo_min_cash', 'ipo_min_trust',
+                 'positive_multiplier', 'negative_multiplier', 'score_multiplier', 'victory_paths',
+                 'path_score_multiplier')
+
+    def __init__(self, mode: str = 'NORMAL'):
+        config = DIFFICULTY_CONFIGS[mode]
+        self.mode = mode
+        self.max_turns = config['maxTurns']
+        self.initial_cash = config['initialCash']
+        self.initial_trust = config['initialTrust']
+        self.initial_max_capacity = config['initialMaxCapacity']
+        self.early_pitch_trust_threshold = config['earlyPitchTrustThreshold']
+        # 투자 턴 → (최소 현금 효과, 목표 신뢰도)
+        self.series_min_trust = {
+            _C['SERIES_A_TURN']: (_C['SERIES_A_MIN_CASH_EFFECT'], config['seriesAMinTrust']),
+            _C['SERIES_B_TURN']: (_C['SERIES_B_MIN_CASH_EFFECT'], config['seriesBMinTrust']),
+            _C['SERIES_C_TURN']: (_C['SERIES_C_MIN_CASH_EFFECT'], config['seriesCMinTrust']),
+        }
+        self.trust_outage_threshold = config['trustOutageThreshold']
+        self.bankruptcy_threshold = config['bankruptcyThreshold']
+        self.ipo_min_users = config['ipoMinUsers']
+        self.ipo_min_cash = config['ipoMinCash']
+        self.ipo_min_trust = config['ipoMinTrust']
+        self.positive_multiplier = config['positiveEffectMultiplier']
+        self.negative_multiplier = config['negativeEffectMultiplier']
+        self.score_multiplier = config['scoreMultiplier']
+        # (경로, minUsers, minCash, minTrust, minInfraCount, requiredInfra 비트마스크) — 우선순위 순
+        self.victory_paths = tuple(
+            (path, c['minUsers'], c['minCash'], c['minTrust'],
+             c.get('minInfraCount', 0), infra_mask(c.get('requiredInfra', ())))
+            for path, c in ((p, VICTORY_PATH_CONDITIONS[mode][p]) for p in VICTORY_PATHS)
+        )
+        self.path_score_multiplier = {path: c['scoreMultiplier']
+                                      for path, c in VICTORY_PATH_CONDITIONS[mode].items()}
+
+def choice_id(value):
+    """JSON 선택지 id → 숫자 id 는 int (DB choiceId 와 같음), 'invest_6_conservative' 같은 id 는 문자열 그대로
+
+    일부 데이터 파일은 숫자 id 를 문자열('1123')로 저장하므로 어느 경로로 읽어도 같은 id 가 되도록 통일합니다.
+    """
+    if isinstance(value, str) and value.isdigit():
+        return int(value)
+    return value
+
+class Choice:
+    """선택지 (효과를 미리 풀어 둔 읽기 전용 레코드)"""
+
+    __slots__ = ('id', 'turn', 'users', 'cash', 'trust', 'infra', 'next_turn',
+                 'tags', 'hires_developer', 'hires_designer', 'hires_planner', 'text')
+
+    def __init__(self, turn: int, choice: Dict):
+        effects = choice['effects']
+        text = choice.get('text', '')
+        hiring = '채용' in text
+        self.id = choice_id(choice['id'])
+        self.turn = turn
+        self.users = effects.get('users', 0)
+        self.cash = effects.get('cash', 0)
+        self.trust = effects.get('trust', 0)
+        self.infra = infra_mask(effects.get('infra', ()))
+        self.next_turn = choice['next_turn']
+        self.tags = frozenset(choice.get('tags', ()))
+        self.hires_developer = hiring and '개발자' in text
+        self.hires_designer = hiring and '디자이너' in text
+        self.hires_planner = hiring and '기획자' in text
+        self.text = text
+
+def load_game_data(filepath: str) -> List[Dict]:
+    """게임 데이터(game_choices_db.json 형식) 로드"""
+    with open(filepath, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+def compile_turns(data: List[Dict]) -> Dict[int, List[Choice]]:
+    """게임 데이터(JSON) → {턴 번호: [Choice, ...]}"""
+    return {t['turn']: [Choice(t['turn'], c) for c in t['choices']] for t in data}
+
+class GameState:
+    """Game 엔티티 중 턴 진행에 필요한 필드만 담은 상태"""
+
+    __slots__ = ('turn', 'users', 'cash', 'trust', 'infra', 'status', 'max_capacity',
+                 'has_dr', 'has_consulting', 'user_multiplier', 'trust_multiplier',
+                 'hired_staff', 'multi_choice', 'equity', 'resilience_stacks',
+                 'negative_cash_turns', 'capacity_warning', 'capacity_exceeded_streak',
+                 'capacity_exceeded_count', 'stable_turns', 'ipo_condition_met',
+                 'ipo_achieved_turn', 'grade', 'steps')
+
+    def copy(self) -> 'GameState':
+        clone = GameState.__new__(GameState)
+        for name in GameState.__slots__:
+            setattr(clone, name, getattr(self, name))
+        clone.hired_staff = list(self.hired_staff)
+        return clone
+
+    def key(self) -> Tuple:
+        """정확한 상태 키 — 이후 진행에 영향을 주는 모든 필드 (steps 제외: 같은 키면 남은 게임이 같음)"""
+        return (self.turn, self.users, self.cash, self.trust, self.infra, self.status, self.max_capacity,
+                self.has_dr, self.has_consulting, self.user_multiplier, self.trust_multiplier,
+                tuple(self.hired_staff), self.multi_choice, self.equity, self.resilience_stacks,
+                self.negative_cash_turns, self.capacity_warning, self.capacity_exceeded_streak,
+                self.capacity_exceeded_count, self.stable_turns, self.ipo_condition_met,
+                self.ipo_achieved_turn, self.grade)
+
+    def to_dict(self) -> Dict:
+        result = {name: getattr(self, name) for name in GameState.__slots__}
+        result['infra'] = sorted(infra_names(self.infra))
+        result['hired_staff'] = list(self.hired_staff)
+        return result
+
+    @staticmethod
+    def from_dict(values: Dict) -> 'GameState':
+        state = GameState.__new__(GameState)
+        for name in GameState.__slots__:
+            setattr(state, name, values[name])
+        state.infra = infra_mask(values['infra'])
+        state.hired_staff = list(values['hired_staff'])
+        return state
+
+def new_game(rules: Rules) -> GameState:
+    """startGame 과 동일한 초기 상태"""
+    state = GameState()
+    state.turn = 1
+    state.users = _C['INITIAL_USERS']
+    state.cash = rules.initial_cash
+    state.trust = rules.initial_trust
+    state.infra = infra_mask(_C['INITIAL_INFRASTRUCTURE'])
+    state.status = GameStatus.PLAYING
+    state.max_capacity = rules.initial_max_capacity
+    state.has_dr = False
+    state.has_consulting = False
+    state.user_multiplier = _C['INITIAL_USER_ACQUISITION_MULTIPLIER']
+    state.trust_multiplier = _C['INITIAL_TRUST_MULTIPLIER']
+    state.hired_staff = []
+    state.multi_choice = False
+    state.equity = _C['INITIAL_EQUITY_PERCENTAGE']
+    state.resilience_stacks = 0
+    state.negative_cash_turns = 0
+    state.capacity_warning = False
+    state.capacity_exceeded_streak = 0
+    state.capacity_exceeded_count = 0
+    state.stable_turns = 0
+    state.ipo_condition_met = False
+    state.ipo_achieved_turn = None
+    state.grade = None
+    state.steps = 0
+    return state
+
+# ---------------------------------------------------------------------------
+# Balance mechanics (game.service.ts private helpers)
+# ---------------------------------------------------------------------------
+
+def calculate_max_capacity(infra: int, has_consulting: bool) -> int:
+    total = _CAPACITY_TABLE[infra & _CAPACITY_BITS]
+    if has_consulting:
+        total *= _C['CONSULTING_CAPACITY_MULTIPLIER']
+    return total
+
+def apply_resilience_to_capacity(base_capacity: int, stacks: int) -> int:
+    return math.floor(base_capacity * (1 + stacks * _RESILIENCE['CAPACITY_BONUS_PER_STACK']))
+
+def _penalty_thresholds(max_capacity: int) -> Tuple[int, ...]:
+    # (users - max_capacity) / max_capacity >= ratio 를 원래 식 그대로 확인해서 부동소수 경계까지 맞춤
+    thresholds = []
+    for ratio, _ in _PENALTY_TIERS:
+        users = math.floor(max_capacity * (1 + ratio)) - 2
+        while (users - max_capacity) / max_capacity < ratio:
+            users += 1
+        thresholds.append(users)
+    return tuple(thresholds)
+
+def calculate_capacity_penalty(users: int, max_capacity: int) -> int:
+    if max_capacity <= 0:
+        return _C['CAPACITY_EXCEEDED_TRUST_PENALTY']
+    thresholds = _PENALTY_THRESHOLDS.get(max_capacity)
+    if thresholds is None:
+        thresholds = _PENALTY_THRESHOLDS[max_capacity] = _penalty_thresholds(max_capacity)
+    return _TIER_PENALTIES[bisect_right(thresholds, users)]
+
+def calculate_investment_scale(trust: int, target_trust: int) -> float:
+    if target_trust <= 0:
+        return 1.0
+    return min(_C['INVESTMENT_MAX_SCALE'], max(_C['INVESTMENT_MIN_SCALE'], trust / target_trust))
+
+def apply_diminishing_returns(trust_gain: int, trust: int) -> int:
+    if not _DIMINISHING['ENABLED'] or trust_gain <= 0:
+        return trust_gain
+    tiers = _DIMINISHING['TIERS']
+    multiplier = tiers[-1]['multiplier']
+    for tier in tiers:
+        if tier['minTrust'] <= trust < tier['maxTrust']:
+            multiplier = tier['multiplier']
+            break
+    return math.floor(trust_gain * multiplier)
+
+def comeback_multiplier(state: GameState, rules: Rules) -> float:
+    ratio = _C['COMEBACK']['DANGER_ZONE_RATIO']
+    in_danger = (state.users / rules.ipo_min_users < ratio
+                 or state.cash / rules.ipo_min_cash < ratio
+                 or state.trust / rules.ipo_min_trust < ratio)
+    return _C['COMEBACK']['COMEBACK_MULTIPLIER'] if in_danger else 1.0
+
+def apply_turn_start_recovery(state: GameState) -> None:
+    """자연 신뢰도 회복 + 부채 이자"""
+    if state.trust < _RECOVERY['THRESHOLD'] and state.trust < _RECOVERY['MAX_NATURAL']:
+        if state.trust < _RECOVERY['DANGER_THRESHOLD']:
+            amount = _RECOVERY['DANGER_RECOVERY_AMOUNT']
+        else:
+            amount = _RECOVERY['RECOVERY_AMOUNT']
+        amount += state.resilience_stacks * _RESILIENCE['TRUST_RECOVERY_PER_STACK']
+        state.trust = max(state.trust, min(_RECOVERY['MAX_NATURAL'], state.trust + amount))
+
+    if state.cash < 0:
+        state.cash -= math.floor(abs(state.cash) * _C['BANKRUPTCY_GRACE']['DEBT_INTEREST_RATE'])
+        state.negative_cash_turns += 1
+    else:
+        state.negative_cash_turns = 0
+
+def apply_staff_hiring(state: GameState, choice: Choice) -> None:
+    staff = _C['STAFF_MULTIPLIERS']
+    bonus = _C['STAFF_HIRE_BONUS']
+    if choice.hires_developer:
+        state.multi_choice = True
+        if '개발자' not in state.hired_staff:
+            state.hired_staff.append('개발자')
+    if choice.hires_designer:
+        state.user_multiplier = min(
+            2.5, state.user_multiplier + staff['DESIGNER_USERS'] - 1.0 + bonus * len(state.hired_staff))
+        if '디자이너' not in state.hired_staff:
+            state.hired_staff.append('디자이너')
+    if choice.hires_planner:
+        state.trust_multiplier = min(
+            2.5, state.trust_multiplier + staff['PLANNER_TRUST'] - 1.0 + bonus * len(state.hired_staff))
+        if '기획자' not in state.hired_staff:
+            state.hired_staff.append('기획자')
+
+def check_full_ipo_conditions(state: GameState, rules: Rules) -> bool:
+    return (state.users >= rules.ipo_min_users
+            and state.cash >= rules.ipo_min_cash
+            and state.trust >= rules.ipo_min_trust
+            and state.infra & _IPO_REQUIRED_INFRA == _IPO_REQUIRED_INFRA)
+
+def find_best_victory_path(state: GameState, rules: Rules) -> Optional[str]:
+    for path, min_users, min_cash, min_trust, min_infra, required in rules.victory_paths:
+        if (state.users >= min_users and state.cash >= min_cash and state.trust >= min_trust
+                and infra_count(state.infra) >= min_infra and state.infra & required == required):
+            return path
+    return None
+
+def calculate_grade(state: GameState) -> str:
+    for grade, min_users, min_cash, min_trust in _GRADES:
+        if state.users >= min_users and state.cash >= min_cash and state.trust >= min_trust:
+            return grade
+    return 'F'
+
+def final_score(state: GameState, rules: Rules, quiz_bonus: int = 0) -> int:
+    """LeaderboardService.calculateScore 와 동일한 리더보드 점수"""
+    base = state.users + math.floor(state.cash / 10000) + state.trust * 1000 + quiz_bonus * 1000
+    score = math.floor(base * rules.score_multiplier)
+    path = STATUS_VICTORY.get(state.status)
+    if path is not None:
+        score = math.floor(score * rules.path_score_multiplier[path])
+    return score
+
+def check_game_status(state: GameState, rules: Rules) -> str:
+    if state.cash < rules.bankruptcy_threshold:
+        return GameStatus.LOST_BANKRUPT
+    if state.cash < 0 and state.negative_cash_turns >= _C['BANKRUPTCY_GRACE']['GRACE_TURNS']:
+        return GameStatus.LOST_BANKRUPT
+    if state.users > 0 and state.trust < rules.trust_outage_threshold:
+        return GameStatus.LOST_OUTAGE
+    if state.equity < _C['EQUITY_MIN_THRESHOLD']:
+        return GameStatus.LOST_EQUITY
+    if state.turn >= rules.max_turns and not is_emergency_turn(state.turn):
+        if find_best_victory_path(state, rules) is None:
+            return GameStatus.LOST_FIRED_CTO
+    if state.turn != _C['IPO_SELECTION_TURN'] and check_full_ipo_conditions(state, rules):
+        if state.turn == _C['IPO_FINAL_SUCCESS_TURN']:
+            return GameStatus.WON_IPO
+    return GameStatus.PLAYING
+
+# ---------------------------------------------------------------------------
+# Turn step (GameService.executeChoice)
+# ---------------------------------------------------------------------------
+
+def step(state: GameState, choice: Choice, rules: Rules) -> GameState:
+    """선택지 하나를 적용하고 다음 턴으로 진행 (state 를 제자리 수정)"""
+    previous_turn = state.turn
+    apply_turn_start_recovery(state)
+
+    early_pitch_failed = (previous_turn == _C['EARLY_PITCH_TURN']
+                          and choice.id == _C['EARLY_PITCH_CHOICE_ID']
+                          and state.trust < rules.early_pitch_trust_threshold)
+    scale = 1.0
+    series = rules.series_min_trust.get(previous_turn)
+    if series is not None and choice.cash > series[0]:
+        scale = calculate_investment_scale(state.trust, series[1])
+
+    if choice.infra:
+        state.infra |= choice.infra
+        if choice.infra & _DR_BIT:
+            state.has_dr = True
+    state.max_capacity = apply_resilience_to_capacity(
+        calculate_max_capacity(state.infra, state.has_consulting), state.resilience_stacks)
+
+    comeback = comeback_multiplier(state, rules)
+
+    if early_pitch_failed:
+        state.trust = max(0, state.trust - max(5, math.floor(state.trust * 0.5)))
+    else:
+        users = math.floor(choice.users * state.user_multiplier)
+        if users >= 0:
+            users = math.floor(users * rules.positive_multiplier)
+        else:
+            users = math.floor(users * rules.negative_multiplier)
+        if users > 0 and comeback > 1.0:
+            users = math.floor(users * comeback)
+        state.users += users
+
+        cash = choice.cash
+        if scale != 1.0 and cash > 0:
+            cash = math.floor(cash * scale)
+        if cash > 0 and comeback > 1.0:
+            cash = math.floor(cash * comeback)
+        state.cash += cash
+
+        trust = choice.trust
+        if trust > 0:
+            # 유저/현금이 반영된 뒤 위험 구간 여부를 다시 판정 (getComebackMultiplier 재호출과 동일)
+            multiplier = min(state.trust_multiplier * rules.positive_multiplier
+                             * comeback_multiplier(state, rules), _C['TRUST_MULTIPLIER_CAP'])
+        elif trust < 0:
+            multiplier = rules.negative_multiplier
+        else:
+            multiplier = state.trust_multiplier
+        gain = math.floor(trust * multiplier)
+        if 'transparency' in choice.tags and state.capacity_warning and gain > 0:
+            gain = min(math.floor(gain * _C['TRANSPARENCY']['EFFECT_MULTIPLIER']),
+                       math.floor(trust * _C['TRUST_MULTIPLIER_CAP']))
+        if gain > 0:
+            gain = apply_diminishing_returns(gain, state.trust)
+        state.trust += gain
+
+    apply_staff_hiring(state, choice)
+
+    if choice.id == _C['CONSULTING_CHOICE_ID'] and not state.has_consulting:
+        state.has_consulting = True
+        state.max_capacity *= _C['CONSULTING_CAPACITY_MULTIPLIER']
+
+    # --- 턴 진행 ---
+    max_turns = rules.max_turns
+    next_turn = choice.next_turn
+    if next_turn > max_turns and not is_special_turn(next_turn):
+        next_turn = max_turns
+
+    if choice.id == _C['IPO_CONTINUE_CHOICE_ID']:
+        return_turn = state.ipo_achieved_turn or previous_turn + 1
+        if return_turn > max_turns:
+            state.status = GameStatus.WON_IPO
+            next_turn = max_turns
+        else:
+            next_turn = return_turn
+            state.ipo_condition_met = False
+
+    if (next_turn == _C['EMERGENCY_TRIGGER_NEXT_TURN'] and not state.has_dr
+            and not is_emergency_turn(previous_turn)):
+        next_turn = _C['EMERGENCY_REDIRECT_TURN']
+
+    if (previous_turn != _C['IPO_SELECTION_TURN'] and not state.ipo_condition_met
+            and check_full_ipo_conditions(state, rules)):
+        state.ipo_condition_met = True
+        state.ipo_achieved_turn = next_turn
+        next_turn = _C['IPO_SELECTION_TURN']
+
+    if next_turn > max_turns and not is_special_turn(next_turn):
+        next_turn = max_turns
+    state.turn = next_turn
+    if next_turn == max_turns:
+        state.multi_choice = False
+
+    # --- 용량 체크 (EPIC-09 3단계 페널티) ---
+    if state.users > state.max_capacity:
+        full_penalty = calculate_capacity_penalty(state.users, state.max_capacity)
+        if state.capacity_exceeded_streak == 0:
+            penalty = math.floor(full_penalty * 0.33)
+        elif state.capacity_exceeded_streak == 1:
+            penalty = math.floor(full_penalty * 0.67)
+        else:
+            penalty = full_penalty
+        state.trust = max(0, state.trust - penalty)
+        state.capacity_exceeded_count += 1
+        state.users = max(0, state.users - math.floor(state.users * 0.20))
+
+        if state.resilience_stacks < _RESILIENCE['MAX_STACKS']:
+            state.resilience_stacks += 1
+        if state.resilience_stacks > 0:
+            state.trust = min(100, state.trust + _RECOVERY['CRISIS_RECOVERY_BONUS'])
+
+        state.capacity_warning = True
+        state.capacity_exceeded_streak += 1
+        state.stable_turns = 0
+    else:
+        state.capacity_exceeded_streak = 0
+        state.capacity_warning = False
+        ratio = state.users / state.max_capacity if state.max_capacity > 0 else 0
+        if ratio <= _STABLE['CAPACITY_THRESHOLD']:
+            state.stable_turns += 1
+            if state.stable_turns >= _STABLE['REQUIRED_TURNS']:
+                state.trust = min(100, state.trust + _STABLE['TRUST_BONUS'])
+                state.stable_turns = 0
+        else:
+            state.stable_turns = 0
+
+    # --- 승패 판정 ---
+    if state.turn != _C['IPO_SELECTION_TURN']:
+        state.status = check_game_status(state, rules)
+    if previous_turn == max_turns and state.status == GameStatus.PLAYING:
+        path = find_best_victory_path(state, rules)
+        state.status = VICTORY_STATUS[path] if path else GameStatus.LOST_FIRED_CTO
+    if state.status != GameStatus.PLAYING:
+        state.grade = calculate_grade(state)
+
+    state.steps += 1
+    return state
+
+Policy = Callable[[GameState, List[Choice]], Choice]
+
+STRATEGIES = ['best_users', 'worst_users', 'best_cash', 'worst_cash', 'best_trust', 'balanced']
+
+def choice_preference(choice: Choice, strategy: str) -> float:
+    """전략별 선택지 선호 점수 (클수록 해당 전략이 선호)"""
+    if strategy == 'balanced':
+        # 균형잡힌 선택: 각 지표를 정규화해서 합산
+        return choice.users / 20000 + choice.cash / 1000000 + choice.trust / 10
+    direction, _, metric = strategy.partition('_')
+    value = getattr(choice, metric)
+    return -value if direction == 'worst' else value
+
+def greedy_policy(strategy: str) -> Policy:
+    """매 턴 전략 점수가 가장 높은 선택지 (알 수 없는 전략이면 첫 번째 선택지)"""
+    if strategy not in STRATEGIES:
+        return lambda state, choices: choices[0]
+    return lambda state, choices: max(choices, key=lambda c: choice_preference(c, strategy))
+
+def random_policy(rng) -> Policy:
+    """균등 무작위 선택 (rng: random.Random)"""
+    return lambda state, choices: choices[rng.randrange(len(choices))]
+
+def weighted_policy(rng, weights: Dict[int, float]) -> Policy:
+    """선택지 id 별 가중치에 비례한 무작위 선택 (실제 플레이어 선택 비율 재현 등)
+
+    턴의 모든 선택지 가중치가 0 이면 균등 선택으로 대체합니다.
+    """
+    def policy(state: GameState, choices: List[Choice]) -> Choice:
+        w = [weights.get(c.id, 0) for c in choices]
+        if not any(w):
+            return choices[rng.randrange(len(choices))]
+        return rng.choices(choices, weights=w)[0]
+    return policy
+
+def play(turns: Dict[int, List[Choice]], rules: Rules, policy: Policy,
+         max_steps: int = 200, on_step: Optional[Callable[[GameState, Choice], None]] = None) -> GameState:
+    """게임 한 판을 끝까지 진행
+
+    현재 턴에 선택지가 없으면 (데이터에 없는 특수 턴 등) 그 자리에서 종료합니다.
+    """
+    state = new_game(rules)
+    while state.status == GameStatus.PLAYING and state.steps < max_steps:
+        choices = turns.get(state.turn)
+        if not choices:
+            break
+        choice = policy(state, choices)
+        step(state, choice, rules)
+        if on_step is not None:
+            on_step(state, choice)
+    return state
+
+# ---------------------------------------------------------------------------
+# 상태 병합 (analyze_balance 경로 탐색, markov_outcomes 연쇄 공용)
+# ---------------------------------------------------------------------------
+
+class Lumping:
+    """병합 키 — 유저/현금은 로그 버킷, 신뢰도는 고정 폭 버킷, 규칙 기준선은 넘었는지 여부로 보존"""
+
+    def __init__(self, rules: Rules, resolution: float, trust_resolution: int):
+        self.resolution = resolution
+        self.trust_resolution = trust_resolution
+        self.rule_infra = _IPO_REQUIRED_INFRA | _DR_BIT
+        for _, _, _, _, _, required in rules.victory_paths:
+            self.rule_infra |= required
+        paths = rules.victory_paths
+        self.user_thresholds = sorted({p[1] for p in paths} | {rules.ipo_min_users})
+        self.cash_thresholds = sorted({p[2] for p in paths} | {rules.ipo_min_cash, rules.bankruptcy_threshold, 0})
+        self.trust_thresholds = sorted({p[3] for p in paths} | {rules.ipo_min_trust, rules.trust_outage_threshold})
+        self.infra_thresholds = sorted({p[4] for p in paths})
+        self.grace_turns = _C['BANKRUPTCY_GRACE']['GRACE_TURNS']
+
+    def key(self, state: GameState) -> Tuple:
+        return (
+            state.turn,
+            log_bucket(state.users, self.resolution),
+            log_bucket(state.cash, self.resolution),
+            state.trust // self.trust_resolution,
+            state.infra & self.rule_infra,
+            state.has_dr,
+            min(state.negative_cash_turns, self.grace_turns),
+            state.ipo_condition_met,
+            state.ipo_achieved_turn,
+            # 기준선 몇 개를 넘었는지 (bisect_right = '>= 기준선' 을 만족하는 개수)
+            bisect_right(self.user_thresholds, state.users),
+            bisect_right(self.cash_thresholds, state.cash),
+            bisect_right(self.trust_thresholds, state.trust),
+            bisect_right(self.infra_thresholds, infra_count(state.infra)),
+        )
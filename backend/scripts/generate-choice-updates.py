@@ -2,6 +2,8 @@
 import json
 import re
 
+from keyword_matcher import CATEGORY_EMOJI, DEFAULT_EMOJI, classify_choice
+
 # 백업 파일 읽기
 with open('backup/choices_backup_2025-10-02T07-09-42-427Z.json', 'r', encoding='utf-8') as f:
     choices = json.load(f)
@@ -27,80 +29,38 @@ def extract_title(text):
         return title
     return "선택"
 
-def get_emoji_for_category(category, title):
+def get_emoji_for_category(category, title, matched=None):
     """카테고리와 제목에 맞는 이모지 선택"""
-    emoji_map = {
-        "marketing": "📢",
-        "infra": "🏗️",
-        "feature": "✨",
-        "investment": "💰",
-        "hr": "👥",
-        "revenue": "💎",
-        "global": "🌍",
-        "crisis": "🚨",
-        "보안": "🛡️",
-        "AI": "🤖",
-        "데이터": "📊",
-        "파트너": "🤝",
-        "IPO": "🔔",
-        "개발": "💻",
-        "디자인": "🎨",
-        "기획": "📋",
-        "클라우드": "☁️",
-        "자동화": "⚙️",
-        "프리미엄": "💎",
-        "글로벌": "🌐",
-        "혁신": "💡"
-    }
+    matched = matched if matched is not None else classify_choice(title)
 
-    # 제목에서 키워드 찾기
-    for keyword, emoji in emoji_map.items():
-        if keyword in title:
-            return emoji
+    # 제목에서 키워드 찾기 (CATEGORY_EMOJI 순서상 첫 키워드)
+    if 'emoji' in matched:
+        return matched['emoji']
 
     # 카테고리별 기본 이모지
-    if category in emoji_map:
-        return emoji_map[category]
+    return CATEGORY_EMOJI.get(category, DEFAULT_EMOJI)
 
-    return "🎯"
+HIRING_ROLES = {
+    "developer": "개발 역량을 크게 강화합니다.\\n더 빠른 기능 개발이 가능해집니다.",
+    "designer": "사용자 경험을 혁신적으로 개선합니다.\\n아름답고 직관적인 인터페이스를 만듭니다.",
+    "planner": "체계적인 서비스 기획이 가능해집니다.\\n사용자 요구를 정확히 파악합니다.",
+    "marketer": "전문적인 마케팅 전략을 수립합니다.\\n효과적인 고객 획득이 가능해집니다.",
+}
 
 def generate_storytelling(choice):
     """선택지를 스토리텔링으로 변환"""
     original_text = choice.get('text', '')
     category = choice.get('category', 'general')
-    choice_id = choice.get('choiceId')
 
-    # 제목 추출
+    # 제목 추출 후 키워드 분류는 한 번만 스캔 (keyword_matcher.py)
     title = extract_title(original_text)
-    emoji = get_emoji_for_category(category, title)
+    matched = classify_choice(title)
+    emoji = get_emoji_for_category(category, title, matched)
 
     # 키워드 기반 카테고리 자동 매칭
     if not category or category == '':
-        # 제목에서 카테고리 추론
-        if "마케팅" in title or "캠페인" in title or "광고" in title or "홍보" in title or "프로모션" in title or "SNS" in title or "유저" in title:
-            category = "marketing"
-        elif "인프라" in title or "EC2" in title or "Aurora" in title or "CloudFront" in title or "CDN" in title or "Redis" in title or "RDS" in title or "S3" in title or "EKS" in title or "Lambda" in title or "서버" in title or "스케일" in title or "t4g" in title or "AWS" in title or "클라우드" in title or "DB" in title or "데이터베이스" in title or "네트워크" in title or "로드" in title or "백업" in title or "WAF" in title or "보안" in title:
-            category = "infra"
-        elif "기능" in title or "개발" in title or "리팩토링" in title or "API" in title or "UI" in title or "UX" in title or "모바일" in title or "앱" in title or "버전" in title or "업데이트" in title or "출시" in title or "런칭" in title or "프로필" in title or "알림" in title or "결제" in title or "로그인" in title or "소셜" in title or "실시간" in title:
-            category = "feature"
-        elif "투자" in title or "시리즈" in title or "VC" in title or "펀딩" in title or "자금" in title or "엔젤" in title or "억" in title:
-            category = "investment"
-        elif "채용" in title or "팀" in title or "인력" in title or "영입" in title or "조직" in title or "HR" in title or "인사" in title or "CTO" in title or "CFO" in title or "CMO" in title:
-            category = "hr"
-        elif "수익" in title or "매출" in title or "흑자" in title or "비즈니스" in title or "플랜" in title or "가격" in title or "구독" in title or "프리미엄" in title or "유료" in title or "결제" in title or "B2B" in title or "B2C" in title or "SI" in title or "컨설팅" in title:
-            category = "revenue"
-        elif "글로벌" in title or "해외" in title or "진출" in title or "현지" in title or "도쿄" in title or "싱가포르" in title or "미국" in title or "일본" in title or "중국" in title:
-            category = "global"
-        elif "위기" in title or "긴급" in title or "장애" in title or "복구" in title or "사고" in title or "해킹" in title or "DDoS" in title:
-            category = "crisis"
-        elif "계속" in title or "유지" in title or "현재" in title:
-            category = "maintain"
-        else:
-            # 금액이나 숫자가 포함된 경우 revenue로 분류
-            if "만원" in title or "천만" in title or "억원" in title:
-                category = "revenue"
-            else:
-                category = "general"
+        # 제목에서 카테고리 추론, 없으면 금액 표현(만원/천만/억원)이 있을 때 revenue
+        category = matched.get('category') or matched.get('category_fallback') or "general"
 
     # 카테고리별 설명 선택
     descriptions = category_descriptions.get(category, [
@@ -110,26 +70,17 @@ def generate_storytelling(choice):
     ])
 
     # 특수 케이스 처리
-    if "IPO" in title:
+    special = matched.get('special')
+    if special == 'ipo':
         return f"{emoji} {title}\\n\\n드디어 상장의 꿈을 실현합니다.\\n주식시장에 회사를 공개합니다.\\n새로운 성장 단계로 진입합니다."
-    elif "긴급" in title or "비상" in title:
+    elif special == 'emergency':
         return f"{emoji} {title}\\n\\n위기 상황에 즉각 대응합니다.\\n모든 역량을 집중하여 문제를 해결합니다.\\n신속하고 정확한 판단이 필요합니다."
-    elif "계속하기" in title:
+    elif special == 'continue':
         return f"{emoji} {title}\\n\\n아직 준비가 더 필요합니다.\\n더 성장한 후 재도전합니다.\\n현재 전략을 유지합니다."
-    elif "DR" in title or "재해복구" in title:
+    elif special == 'dr':
         return f"{emoji} {title}\\n\\n어떤 상황에도 서비스가 중단되지 않습니다.\\n완벽한 백업과 복구 체계를 갖춥니다.\\n고객의 절대적 신뢰를 얻습니다."
-    elif "채용" in title or "영입" in title:
-        role = ""
-        if "개발" in title:
-            role = "개발 역량을 크게 강화합니다.\\n더 빠른 기능 개발이 가능해집니다."
-        elif "디자인" in title:
-            role = "사용자 경험을 혁신적으로 개선합니다.\\n아름답고 직관적인 인터페이스를 만듭니다."
-        elif "기획" in title:
-            role = "체계적인 서비스 기획이 가능해집니다.\\n사용자 요구를 정확히 파악합니다."
-        elif "마케" in title:
-            role = "전문적인 마케팅 전략을 수립합니다.\\n효과적인 고객 획득이 가능해집니다."
-        else:
-            role = "최고의 인재들을 영입합니다.\\n조직 역량을 크게 강화합니다."
+    elif special == 'hiring':
+        role = HIRING_ROLES.get(matched.get('role'), "최고의 인재들을 영입합니다.\\n조직 역량을 크게 강화합니다.")
         return f"{emoji} {title}\\n\\n{role}\\n다음 단계 성장을 위한 팀을 구성합니다."
 
     # 일반적인 스토리텔링 생성
@@ -218,5 +169,11 @@ updateChoiceTexts()
 with open('scripts/update-all-choice-texts.ts', 'w', encoding='utf-8') as f:
     f.write(typescript_code)
 
+# apply_choice_updates.py 입력용 JSON (한 트랜잭션 일괄 반영, 변경 없는 행은 건너뜀)
+with open('scripts/choice-text-updates.json', 'w', encoding='utf-8') as f:
+    json.dump({choice_id: text.replace('\\n', '\n') for choice_id, text in sorted(updates.items())},
+              f, ensure_ascii=False, indent=2)
+
 print(f"✅ Generated update script for {len(updates)} choices")
-print("📝 Saved to scripts/update-all-choice-texts.ts")
\ No newline at end of file
+print("📝 Saved to scripts/update-all-choice-texts.ts")
+print("📝 Saved to scripts/choice-text-updates.json (python3 scripts/apply_choice_updates.py --input ...)")
\ No newline at end of file
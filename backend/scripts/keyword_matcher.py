@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""
+AWS CTO Game - Keyword Matcher
+선택지 텍스트 분류용 다중 키워드 매처 (Aho–Corasick)
+
+키워드 → (종류, 값) 표 하나(CHOICE_KEYWORDS)에서 오토마톤을 한 번만 만들고,
+텍스트를 한 번 선형 스캔해서 종류별(카테고리, 이모지, 특수 케이스, 역할, 기술 여부)로
+가장 우선순위가 높은 값을 돌려줍니다. 우선순위는 표에 나열된 순서이므로
+기존의 `if "X" in title or ... elif ...` 사슬과 같은 결과를 냅니다.
+
+사용하는 스크립트:
+- generate-choice-updates.py: 제목 카테고리 추론, 이모지, 스토리텔링 특수 케이스
+- rebalance_game.py (boost_tech_choices 스테이지), boost_tech_choices.py: 기술 선택지 판별
+"""
+
+from collections import deque
+from functools import lru_cache
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple
+
+class KeywordMatcher:
+    """Aho–Corasick 오토마톤
+
+    entries: (키워드, 값) 목록. 같은 키워드가 여러 번 나와도 되고, 매치 결과는
+    entries 의 인덱스로 돌려주므로 값/우선순위 해석은 호출하는 쪽이 정합니다.
+    대소문자를 구분하는 부분 문자열 매칭으로 `keyword in text` 와 같습니다.
+    """
+
+    def __init__(self, entries: Iterable[Tuple[str, Any]]):
+        self.entries: List[Tuple[str, Any]] = list(entries)
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[List[int]] = [[]]
+
+        for index, (keyword, _) in enumerate(self.entries):
+            if not keyword:
+                raise ValueError('빈 키워드는 등록할 수 없습니다')
+            node = 0
+            for ch in keyword:
+                nxt = self._goto[node].get(ch)
+                if nxt is None:
+                    nxt = len(self._goto)
+                    self._goto[node][ch] = nxt
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._out.append([])
+                node = nxt
+            self._out[node].append(index)
+
+        # BFS 로 실패 링크 계산, 출력 목록은 실패 링크를 따라 합침
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for ch, nxt in self._goto[node].items():
+                queue.append(nxt)
+                fail = self._fail[node]
+                while fail and ch not in self._goto[fail]:
+                    fail = self._fail[fail]
+                target = self._goto[fail].get(ch, 0)
+                self._fail[nxt] = target if target != nxt else 0
+                self._out[nxt] = self._out[nxt] + self._out[self._fail[nxt]]
+
+    def iter_matches(self, text: str) -> Iterator[Tuple[int, int]]:
+        """(끝 위치, entry 인덱스) — 텍스트 길이에 선형"""
+        goto, fail, out = self._goto, self._fail, self._out
+        node = 0
+        for position, ch in enumerate(text):
+            while node and ch not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(ch, 0)
+            for index in out[node]:
+                yield position, index
+
+    def matched(self, text: str) -> Set[int]:
+        """텍스트에 들어 있는 entry 인덱스 집합"""
+        return {index for _, index in self.iter_matches(text)}
+
+    def contains_any(self, text: str) -> bool:
+        for _ in self.iter_matches(text):
+            return True
+        return False
+
+# ---------------------------------------------------------------------------
+# 선택지 분류 표 — 종류별로 위에 있을수록 우선
+# ---------------------------------------------------------------------------
+
+# 제목에서 카테고리 추론 (generate-choice-updates.py 의 elif 사슬 순서)
+CATEGORY_KEYWORDS = [
+    ('marketing', ['마케팅', '캠페인', '광고', '홍보', '프로모션', 'SNS', '유저']),
+    ('infra', ['인프라', 'EC2', 'Aurora', 'CloudFront', 'CDN', 'Redis', 'RDS', 'S3', 'EKS', 'Lambda',
+               '서버', '스케일', 't4g', 'AWS', '클라우드', 'DB', '데이터베이스', '네트워크', '로드',
+               '백업', 'WAF', '보안']),
+    ('feature', ['기능', '개발', '리팩토링', 'API', 'UI', 'UX', '모바일', '앱', '버전', '업데이트',
+                 '출시', '런칭', '프로필', '알림', '결제', '로그인', '소셜', '실시간']),
+    ('investment', ['투자', '시리즈', 'VC', '펀딩', '자금', '엔젤', '억']),
+    ('hr', ['채용', '팀', '인력', '영입', '조직', 'HR', '인사', 'CTO', 'CFO', 'CMO']),
+    ('revenue', ['수익', '매출', '흑자', '비즈니스', '플랜', '가격', '구독', '프리미엄', '유료', '결제',
+                 'B2B', 'B2C', 'SI', '컨설팅']),
+    ('global', ['글로벌', '해외', '진출', '현지', '도쿄', '싱가포르', '미국', '일본', '중국']),
+    ('crisis', ['위기', '긴급', '장애', '복구', '사고', '해킹', 'DDoS']),
+    ('maintain', ['계속', '유지', '현재']),
+]
+# 위 카테고리에 모두 해당하지 않을 때 금액 표현이 있으면 revenue
+CATEGORY_FALLBACK_KEYWORDS = [('revenue', ['만원', '천만', '억원'])]
+
+# 제목 키워드 → 이모지 (순서대로 첫 매치), 카테고리 이름은 기본 이모지로도 쓰임
+EMOJI_KEYWORDS = [
+    ('marketing', '📢'), ('infra', '🏗️'), ('feature', '✨'), ('investment', '💰'), ('hr', '👥'),
+    ('revenue', '💎'), ('global', '🌍'), ('crisis', '🚨'), ('보안', '🛡️'), ('AI', '🤖'),
+    ('데이터', '📊'), ('파트너', '🤝'), ('IPO', '🔔'), ('개발', '💻'), ('디자인', '🎨'),
+    ('기획', '📋'), ('클라우드', '☁️'), ('자동화', '⚙️'), ('프리미엄', '💎'), ('글로벌', '🌐'),
+    ('혁신', '💡'),
+]
+DEFAULT_EMOJI = '🎯'
+
+# 스토리텔링 특수 케이스 (IPO > 긴급 > 계속하기 > DR > 채용)
+SPECIAL_KEYWORDS = [
+    ('ipo', ['IPO']),
+    ('emergency', ['긴급', '비상']),
+    ('continue', ['계속하기']),
+    ('dr', ['DR', '재해복구']),
+    ('hiring', ['채용', '영입']),
+]
+# 채용 선택지의 역할
+ROLE_KEYWORDS = [
+    ('developer', ['개발']),
+    ('designer', ['디자인']),
+    ('planner', ['기획']),
+    ('marketer', ['마케']),
+]
+
+# 기술 선택지 판별 (boost_tech_choices.py)
+TECH_KEYWORDS = [
+    'RDS', 'Aurora', 'ECS', 'EKS', 'CloudFront', 'Lambda', 'WAF',
+    'Auto Scaling', 'Redis', 'CloudWatch', 'CodePipeline', 'S3',
+    'CDN', 'Bedrock', 'X-Ray', 'Shield', 'DevOps', 'CI/CD',
+    '컨테이너', '모니터링', '인프라', '보안', '암호화', '데이터베이스'
+]
+
+def _rows(kind: str, groups: Sequence[Tuple[str, Sequence[str]]]) -> List[Tuple[str, str, str]]:
+    return [(keyword, kind, value) for value, keywords in groups for keyword in keywords]
+
+# 단일 키워드 표: (키워드, 종류, 값) — 종류 안에서는 표 순서가 우선순위
+CHOICE_KEYWORDS: List[Tuple[str, str, str]] = (
+    _rows('category', CATEGORY_KEYWORDS)
+    + _rows('category_fallback', CATEGORY_FALLBACK_KEYWORDS)
+    + [(keyword, 'emoji', emoji) for keyword, emoji in EMOJI_KEYWORDS]
+    + _rows('special', SPECIAL_KEYWORDS)
+    + _rows('role', ROLE_KEYWORDS)
+    + [(keyword, 'tech', 'tech') for keyword in TECH_KEYWORDS]
+)
+
+class ChoiceClassifier:
+    """키워드 표 → 종류별 최우선 값 (텍스트 한 번 스캔)"""
+
+    def __init__(self, table: Sequence[Tuple[str, str, str]] = CHOICE_KEYWORDS):
+        self.matcher = KeywordMatcher((keyword, (kind, value)) for keyword, kind, value in table)
+
+    def classify(self, text: str) -> Dict[str, Optional[str]]:
+        """{종류: 값} — 표 순서상 가장 앞선 매치만 (매치가 없는 종류는 빠짐)"""
+        result: Dict[str, Tuple[int, str]] = {}
+        for index in self.matcher.matched(text):
+            kind, value = self.matcher.entries[index][1]
+            best = result.get(kind)
+            if best is None or index < best[0]:
+                result[kind] = (index, value)
+        return {kind: value for kind, (_, value) in result.items()}
+
+CHOICE_CLASSIFIER = ChoiceClassifier()
+CATEGORY_EMOJI = dict(EMOJI_KEYWORDS)
+
+def classify_choice(text: str) -> Dict[str, Optional[str]]:
+    """공유 분류기로 텍스트 분류 (category, category_fallback, emoji, special, role, tech)"""
+    return CHOICE_CLASSIFIER.classify(text)
+
+@lru_cache(maxsize=32)
+def keyword_matcher(keywords: Tuple[str, ...]) -> KeywordMatcher:
+    """임의 키워드 목록용 매처 (같은 목록은 한 번만 빌드)"""
+    return KeywordMatcher((keyword, keyword) for keyword in keywords)
+
+def is_tech_choice(choice: Dict, category: str = '인프라', keywords: Sequence[str] = TECH_KEYWORDS) -> bool:
+    """인프라 카테고리이거나 텍스트에 기술 키워드가 들어 있는 선택지"""
+    if choice.get('category') == category:
+        return True
+    return keyword_matcher(tuple(keywords)).contains_any(choice.get('text', ''))
@@ -0,0 +1,473 @@
+#!/usr/bin/env python3
+"""
+AWS CTO Game - Leaderboard Score Index
+시뮬레이션 최종 상태의 리더보드 점수 일괄 계산 + 백분위 색인
+
+- score_batch: LeaderboardService.calculateScore 의 NumPy 벡터화 이식
+  (난이도 scoreMultiplier → 승리 경로 scoreMultiplier 순서로 각각 floor, game_engine.final_score 와 동일)
+- ScoreIndex: 정렬된 점수 배열 — getPlayerRank 의 COUNT(score > x) 를 이진 탐색 O(log n) 으로 대체
+- QuantileTable: 색인을 고정 크기(기본 1,001개 분위점) 표로 줄인 것 — JSON 으로 저장해 두고
+  "리더보드에 N 명이 있을 때 점수 X 는 몇 등쯤인가" 를 예측
+- 라이브 리더보드 백업(leaderboard_backup_*.json)을 같은 규칙으로 재계산해서 저장된 점수와 다른 기록,
+  시뮬레이션 범위를 벗어난 기록(예: 신뢰도 100 초과), int 컬럼 한도에 가까운 기록을 표시
+
+시뮬레이션은 game_engine.play (random 정책, --events 시 랜덤 이벤트 포함)로 난이도별 --games 판을
+진행하고, 진행 중(PLAYING)으로 끝난 판은 제출할 수 없으므로 제외합니다. 퀴즈 보너스는 정답 수를
+Binomial(5, --quiz-accuracy) 로 뽑아 QuizService.calculateQuizBonus 표(0/0/5/15/30/50)로 붙이며,
+--samples 를 주면 최종 상태를 복원 추출해 그만큼(수백만 개) 점수를 만듭니다.
+
+사용 예:
+    python3 leaderboard_index.py                                   # 난이도별 20,000판
+    python3 leaderboard_index.py --games 100000 --samples 5000000 --rank 1200000 8000000
+    python3 leaderboard_index.py --backup ../leaderboard_backup_20251010_120131.json --wins-only
+"""
+
+import argparse
+import glob
+import json
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from game_engine import (
+    DIFFICULTIES, DIFFICULTY_CONFIGS, STATUS_VICTORY, VICTORY_PATH_CONDITIONS, VICTORY_PATHS,
+    GameStatus, Rules, compile_turns, final_score, load_game_data, play, random_policy,
+)
+from event_matcher import EVENTS_FILE, EventMatcher, EventRunner, load_events
+from profiler import PROFILER, add_arguments as add_profile_arguments, enable, enable_from_args, finish_from_args
+
+# 경로 번호 0 은 "승리 경로 없음" (배율 1.0 — 정수에 곱해도 floor 결과가 같음)
+PATH_CODES = {None: 0, **{path: i + 1 for i, path in enumerate(VICTORY_PATHS)}}
+DIFFICULTY_CODES = {mode: i for i, mode in enumerate(DIFFICULTIES)}
+
+# QuizService.calculateQuizBonus: 정답 수(0-5) → 보너스
+QUIZ_BONUS_BY_CORRECT = np.array([0, 0, 5, 15, 30, 50], dtype=np.int64)
+
+# leaderboard.entity.ts 의 score 는 int 컬럼 (PostgreSQL int4)
+INT32_MAX = 2 ** 31 - 1
+
+# 분위 예측 표 / 리포트에 쓰는 값
+TABLE_POINTS = 1001
+REPORT_PERCENTILES = (50, 75, 90, 95, 99, 99.9)
+OUTLIER_PERCENTILE = 99.9
+TRUST_CAP = 100   # 위기 회복/안정 운영 보너스가 쓰는 상한
+
+_DIFFICULTY_MULTIPLIER = np.array([DIFFICULTY_CONFIGS[mode]['scoreMultiplier'] for mode in DIFFICULTIES])
+_PATH_MULTIPLIER = np.array([
+    [1.0] + [VICTORY_PATH_CONDITIONS[mode][path]['scoreMultiplier'] for path in VICTORY_PATHS]
+    for mode in DIFFICULTIES
+])
+
+# ---------------------------------------------------------------------------
+# 점수 계산
+# ---------------------------------------------------------------------------
+
+def path_code(value: Optional[str]) -> int:
+    """'IPO' / 'WON_IPO' / None → 경로 번호 (알 수 없는 값이면 0: calculateScore 도 배율을 적용하지 않음)"""
+    if not value:
+        return 0
+    return PATH_CODES.get(STATUS_VICTORY.get(value, value), 0)
+
+def score_batch(users, cash, trust, difficulty, path, quiz_bonus=None) -> np.ndarray:
+    """calculateScore 벡터화 — 인자는 같은 길이의 배열(또는 스칼라)
+
+    difficulty 는 DIFFICULTY_CODES, path 는 PATH_CODES 번호입니다.
+    TS 와 같이 현금 점수는 Math.floor(cash / 10000) (부동소수 나눗셈 후 floor) 로 계산합니다.
+    """
+    users = np.asarray(users, dtype=np.int64)
+    cash = np.asarray(cash, dtype=np.int64)
+    trust = np.asarray(trust, dtype=np.int64)
+    difficulty = np.asarray(difficulty, dtype=np.intp)
+    path = np.asarray(path, dtype=np.intp)
+    base = users + np.floor(cash / 10000).astype(np.int64) + trust * 1000
+    if quiz_bonus is not None:
+        base = base + np.asarray(quiz_bonus, dtype=np.int64) * 1000
+    score = np.floor(base * _DIFFICULTY_MULTIPLIER[difficulty])
+    score = np.floor(score * _PATH_MULTIPLIER[difficulty, path])
+    return score.astype(np.int64)
+
+def quiz_bonus_sample(rng: np.random.Generator, size: int, accuracy: float) -> np.ndarray:
+    """퀴즈 5문제 정답 수를 Binomial(5, accuracy) 로 뽑아 보너스로 변환"""
+    return QUIZ_BONUS_BY_CORRECT[rng.binomial(5, accuracy, size)]
+
+# ---------------------------------------------------------------------------
+# 백분위 색인
+# ---------------------------------------------------------------------------
+
+class ScoreIndex:
+    """정렬된 점수 배열 — 순위/백분위 조회는 모두 searchsorted (O(log n), 배열 입력이면 일괄 처리)"""
+
+    __slots__ = ('scores',)
+
+    def __init__(self, scores: Iterable[int], presorted: bool = False):
+        scores = np.asarray(scores, dtype=np.int64)
+        self.scores = scores if presorted else np.sort(scores, kind='stable')
+
+    def __len__(self) -> int:
+        return len(self.scores)
+
+    def rank(self, score):
+        """getPlayerRank 와 같은 순위: (score 보다 높은 기록 수) + 1"""
+        return len(self.scores) - np.searchsorted(self.scores, score, side='right') + 1
+
+    def percentile(self, score):
+        """score 이하 기록의 비율 (0~1)"""
+        return np.searchsorted(self.scores, score, side='right') / len(self.scores)
+
+    def score_at_rank(self, rank):
+        """rank 등의 점수 (1 = 최고점)"""
+        rank = np.clip(np.asarray(rank), 1, len(self.scores))
+        return self.scores[len(self.scores) - rank]
+
+    def quantile(self, q):
+        return np.quantile(self.scores, q)
+
+    def merge(self, other: 'ScoreIndex') -> 'ScoreIndex':
+        """두 정렬 배열 병합 (워커별 색인 합치기)"""
+        merged = np.concatenate((self.scores, other.scores))
+        merged.sort(kind='stable')  # 정렬된 두 구간 — timsort 가 선형에 가깝게 병합
+        return ScoreIndex(merged, presorted=True)
+
+    def table(self, points: int = TABLE_POINTS) -> 'QuantileTable':
+        return QuantileTable(np.quantile(self.scores, np.linspace(0, 1, points)), len(self.scores))
+
+class QuantileTable:
+    """분위점 표 — 점수 X 의 누적 비율을 선형 보간으로 추정 (크기 고정, JSON 저장용)"""
+
+    __slots__ = ('values', 'count')
+
+    def __init__(self, values: Sequence[float], count: int):
+        self.values = np.asarray(values, dtype=np.float64)
+        self.count = count
+
+    def cdf(self, score):
+        """score 이하 비율 추정 (같은 값이 여러 분위점에 걸치면 가장 오른쪽 기준)"""
+        probabilities = np.linspace(0, 1, len(self.values))
+        right = np.searchsorted(self.values, score, side='right')
+        lower = np.clip(right - 1, 0, len(self.values) - 1)
+        upper = np.clip(right, 0, len(self.values) - 1)
+        span = self.values[upper] - self.values[lower]
+        fraction = np.where(span > 0, (np.asarray(score) - self.values[lower]) / np.where(span > 0, span, 1), 0)
+        estimate = probabilities[lower] + fraction * (probabilities[upper] - probabilities[lower])
+        return np.where(right == 0, 0.0, np.where(right >= len(self.values), 1.0, estimate))
+
+    def predict_rank(self, score, population: int):
+        """리더보드에 population 개 기록이 이 분포로 쌓였을 때 score 의 예상 순위"""
+        return np.floor((1 - self.cdf(score)) * population).astype(np.int64) + 1
+
+    def to_dict(self) -> Dict:
+        return {'count': self.count, 'values': self.values.tolist()}
+
+    @staticmethod
+    def from_dict(values: Dict) -> 'QuantileTable':
+        return QuantileTable(values['values'], values['count'])
+
+# ---------------------------------------------------------------------------
+# 시뮬레이션 (balance_sweep.py 와 같은 워커 전역 상태 패턴)
+# ---------------------------------------------------------------------------
+
+_TURNS: Dict = {}
+_EVENTS: Optional[EventMatcher] = None
+_IN_WORKER = False
+
+def _load_tables(data_path: str, events_path: Optional[str] = None):
+    global _TURNS, _EVENTS
+    if not _TURNS:
+        _TURNS = compile_turns(load_game_data(data_path))
+    if events_path and _EVENTS is None:
+        _EVENTS = EventMatcher(load_events(events_path))
+
+def _init_worker(data_path: str, profile: bool = False, events_path: Optional[str] = None):
+    global _IN_WORKER
+    _IN_WORKER = True
+    if profile:
+        enable()
+    _load_tables(data_path, events_path)
+
+def _simulate_job(job: Tuple[str, int, int]) -> Tuple[str, Dict]:
+    """(난이도, 시드, 판 수) → 제출 가능한(PLAYING 이 아닌) 최종 상태 배열"""
+    difficulty, seed, games = job
+    started = time.perf_counter()
+    rules = Rules(difficulty)
+    policy = random_policy(random.Random(seed))
+    runner = None
+    if _EVENTS is not None:
+        runner = EventRunner(_EVENTS, difficulty, random.Random(f'events:{seed}'))
+    users = np.empty(games, dtype=np.int64)
+    cash = np.empty(games, dtype=np.int64)
+    trust = np.empty(games, dtype=np.int64)
+    path = np.empty(games, dtype=np.int8)
+    n = 0
+    with PROFILER.stage('simulate'), PROFILER.stage(difficulty):
+        for _ in range(games):
+            if runner is not None:
+                runner.reset()
+            final = play(_TURNS, rules, policy, on_step=runner)
+            if final.status == GameStatus.PLAYING:
+                continue
+            users[n], cash[n], trust[n] = final.users, final.cash, final.trust
+            path[n] = PATH_CODES[STATUS_VICTORY.get(final.status)]
+            n += 1
+    PROFILER.count(f'unfinished:{difficulty}', games - n)
+    result = {'users': users[:n], 'cash': cash[:n], 'trust': trust[:n], 'path': path[:n]}
+    if PROFILER.enabled:
+        PROFILER.worker_task(os.getpid(), time.perf_counter() - started)
+        if _IN_WORKER:
+            result['profile'] = PROFILER.drain()
+    return difficulty, result
+
+def simulate_outcomes(data_path: str, difficulties: Sequence[str], games: int, seed: int = 0,
+                      workers: int = 1, chunk: int = 5000,
+                      events_path: Optional[str] = None) -> Dict[str, Dict[str, np.ndarray]]:
+    """난이도별 최종 상태 배열 {난이도: {'users', 'cash', 'trust', 'path'}}"""
+    jobs = [(difficulty, seed * 100003 + start, min(chunk, games - start))
+            for difficulty in difficulties for start in range(0, games, chunk)]
+    _load_tables(data_path, events_path)  # fork 시 워커가 그대로 상속
+    PROFILER.pool_start('simulate')
+    started = time.perf_counter()
+    parts: Dict[str, List[Dict]] = {difficulty: [] for difficulty in difficulties}
+
+    if workers == 1:
+        results = map(_simulate_job, jobs)
+    else:
+        pool = ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                   initargs=(data_path, PROFILER.enabled, events_path))
+        results = pool.map(_simulate_job, jobs)
+    try:
+        for difficulty, result in results:
+            profile = result.pop('profile', None)
+            if profile is not None:
+                PROFILER.merge(profile)
+            parts[difficulty].append(result)
+    finally:
+        if workers != 1:
+            pool.shutdown()
+    PROFILER.pool('simulate', workers, time.perf_counter() - started)
+
+    return {difficulty: {key: np.concatenate([part[key] for part in chunks]) for key in chunks[0]}
+            for difficulty, chunks in parts.items()}
+
+def score_outcomes(outcomes: Dict[str, Dict[str, np.ndarray]], samples: int = 0,
+                   quiz_accuracy: float = 0.0, wins_only: bool = False,
+                   seed: int = 0) -> Dict[str, np.ndarray]:
+    """난이도별 점수 배열
+
+    samples 가 0 이면 최종 상태마다 한 번씩, 아니면 난이도마다 samples 개를 복원 추출합니다.
+    퀴즈 보너스는 정답률이 0 보다 클 때만 붙입니다.
+    """
+    rng = np.random.default_rng(seed)
+    scores = {}
+    for difficulty, outcome in outcomes.items():
+        keep = outcome['path'] > 0 if wins_only else slice(None)
+        users, cash = outcome['users'][keep], outcome['cash'][keep]
+        trust, path = outcome['trust'][keep], outcome['path'][keep]
+        if not len(users):
+            scores[difficulty] = np.empty(0, dtype=np.int64)
+            continue
+        if samples:
+            picks = rng.integers(0, len(users), samples)
+            users, cash, trust, path = users[picks], cash[picks], trust[picks], path[picks]
+        bonus = quiz_bonus_sample(rng, len(users), quiz_accuracy) if quiz_accuracy > 0 else None
+        with PROFILER.stage('score_batch'):
+            scores[difficulty] = score_batch(users, cash, trust, DIFFICULTY_CODES[difficulty], path, bonus)
+    return scores
+
+def verify_scores(outcomes: Dict[str, Dict[str, np.ndarray]], limit: int = 20000) -> int:
+    """score_batch 가 game_engine.final_score 와 같은지 확인 (불일치 수)"""
+    from game_engine import GameState  # 검증에서만 사용
+    mismatches = 0
+    rng = random.Random(0)
+    for difficulty, outcome in outcomes.items():
+        rules = Rules(difficulty)
+        statuses = {code: (f'WON_{path}' if path else GameStatus.LOST_BANKRUPT) for path, code in PATH_CODES.items()}
+        count = min(limit, len(outcome['users']))
+        bonus = np.array([rng.choice((0, 5, 15, 30, 50)) for _ in range(count)], dtype=np.int64)
+        batch = score_batch(outcome['users'][:count], outcome['cash'][:count], outcome['trust'][:count],
+                            DIFFICULTY_CODES[difficulty], outcome['path'][:count], bonus)
+        state = GameState.__new__(GameState)
+        for i in range(count):
+            state.users = int(outcome['users'][i])
+            state.cash = int(outcome['cash'][i])
+            state.trust = int(outcome['trust'][i])
+            state.status = statuses[int(outcome['path'][i])]
+            if final_score(state, rules, int(bonus[i])) != batch[i]:
+                mismatches += 1
+    return mismatches
+
+# ---------------------------------------------------------------------------
+# 라이브 리더보드 비교
+# ---------------------------------------------------------------------------
+
+def load_leaderboard(paths: Sequence[str]) -> List[Dict]:
+    """leaderboard 테이블 백업(JSON 배열) 로드"""
+    records = []
+    for path in paths:
+        with open(path, 'r', encoding='utf-8') as f:
+            records.extend(json.load(f))
+    return records
+
+def rescore_records(records: List[Dict]) -> np.ndarray:
+    """백업 기록을 calculateScore 로 다시 계산 (victoryPath 가 없는 예전 스키마는 배율 없음)"""
+    if not records:
+        return np.empty(0, dtype=np.int64)
+    return score_batch(
+        [r['finalUsers'] for r in records],
+        [int(r['finalCash']) for r in records],   # bigint 컬럼은 문자열로 내보내짐
+        [r['finalTrust'] for r in records],
+        [DIFFICULTY_CODES.get(r.get('difficulty') or 'NORMAL', DIFFICULTY_CODES['NORMAL']) for r in records],
+        [path_code(r.get('victoryPath')) for r in records],
+        [r.get('quizBonus') or 0 for r in records],
+    )
+
+def find_outliers(records: List[Dict], indexes: Dict[str, ScoreIndex]) -> List[Dict]:
+    """저장 점수 불일치 / 시뮬레이션 범위 밖 / 신뢰도 상한 초과 / int 한도 근접 기록"""
+    rescored = rescore_records(records)
+    outliers = []
+    for record, expected in zip(records, rescored):
+        difficulty = record.get('difficulty') or 'NORMAL'
+        index = indexes.get(difficulty)
+        reasons = []
+        if record['score'] != expected:
+            reasons.append(f"저장 점수 {record['score']:,} ≠ 재계산 {int(expected):,}")
+        if record['finalTrust'] > TRUST_CAP:
+            reasons.append(f"신뢰도 {record['finalTrust']} > {TRUST_CAP}")
+        if index is not None and len(index):
+            top = int(index.scores[-1])
+            percentile = float(index.percentile(record['score']))
+            if record['score'] > top:
+                reasons.append(f"시뮬레이션 최고점 {top:,} 초과 ({record['score'] / max(top, 1):.1f}배)")
+            elif percentile * 100 >= OUTLIER_PERCENTILE:
+                reasons.append(f"시뮬레이션 상위 {(1 - percentile) * 100:.2f}%")
+        if record['score'] > INT32_MAX // 2:
+            reasons.append(f"int 컬럼 한도({INT32_MAX:,})의 {record['score'] / INT32_MAX:.0%}")
+        if reasons:
+            outliers.append({'id': record.get('id'), 'playerName': record.get('playerName'),
+                             'difficulty': difficulty, 'score': record['score'],
+                             'rescored': int(expected), 'trust': record['finalTrust'],
+                             'reasons': reasons})
+    return outliers
+
+# ---------------------------------------------------------------------------
+# 리포트
+# ---------------------------------------------------------------------------
+
+def summarize(index: ScoreIndex, points: int = TABLE_POINTS) -> Dict:
+    if not len(index):
+        return {'count': 0}
+    values = index.quantile([p / 100 for p in REPORT_PERCENTILES])
+    return {
+        'count': len(index),
+        'min': int(index.scores[0]),
+        'max': int(index.scores[-1]),
+        'avg': float(index.scores.mean()),
+        **{f'p{p:g}': float(v) for p, v in zip(REPORT_PERCENTILES, values)},
+        'quantile_table': index.table(points).to_dict(),
+    }
+
+def parse_args():
+    parser = argparse.ArgumentParser(description='AWS CTO Game 리더보드 점수 분포 / 백분위 색인')
+    parser.add_argument('--data', default='../game_choices_db.json', help='게임 데이터 JSON 경로')
+    parser.add_argument('--difficulties', nargs='+', default=list(DIFFICULTIES), choices=DIFFICULTIES)
+    parser.add_argument('--games', type=int, default=20000, help='난이도별 시뮬레이션 게임 수')
+    parser.add_argument('--samples', type=int, default=0,
+                        help='난이도별 점수 표본 수 (최종 상태 복원 추출, 0 이면 게임당 1개)')
+    parser.add_argument('--quiz-accuracy', type=float, default=0.6, help='퀴즈 문제당 정답률 (0 이면 보너스 없음)')
+    parser.add_argument('--wins-only', action='store_true', help='승리한 게임만 리더보드에 제출한다고 가정')
+    parser.add_argument('--events', nargs='?', const=EVENTS_FILE,
+                        help='랜덤 이벤트 발동 포함 (이벤트 정의 JSON, 값 생략 시 random_events.json)')
+    parser.add_argument('--backup', nargs='*', default=['../leaderboard_backup_*.json'],
+                        help='비교할 리더보드 백업 JSON (glob 패턴 가능, 빈 값이면 비교 안 함)')
+    parser.add_argument('--rank', nargs='*', type=int, default=[], help='순위를 조회할 점수')
+    parser.add_argument('--population', type=int, default=0,
+                        help='예상 순위를 계산할 리더보드 기록 수 (0 이면 표본 수 기준)')
+    parser.add_argument('--points', type=int, default=TABLE_POINTS, help='저장할 분위점 수')
+    parser.add_argument('--workers', type=int, default=1, help='시뮬레이션 워커 프로세스 수 (0이면 CPU 코어 수)')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--verify', action='store_true', help='score_batch 와 final_score 결과 비교')
+    parser.add_argument('--output', default='../leaderboard_index.json', help='리포트 저장 경로')
+    add_profile_arguments(parser)
+    return parser.parse_args()
+
+def main():
+    args = parse_args()
+    enable_from_args(args)
+
+    print("🎮 AWS CTO Game - Leaderboard Score Index")
+    print("=" * 60)
+
+    workers = args.workers or os.cpu_count() or 1
+    print(f"\n🎲 난이도별 {args.games:,}판 시뮬레이션 (워커 {workers}개"
+          + (", 랜덤 이벤트 포함" if args.events else "") + ")")
+    started = time.perf_counter()
+    outcomes = simulate_outcomes(args.data, args.difficulties, args.games, seed=args.seed,
+                                 workers=workers, events_path=args.events)
+    print(f"   {time.perf_counter() - started:.1f}초, 제출 가능한 최종 상태 "
+          + ', '.join(f"{d} {len(o['users']):,}" for d, o in outcomes.items()))
+
+    if args.verify:
+        mismatches = verify_scores(outcomes)
+        print(f"\n🔍 score_batch vs final_score: 불일치 {mismatches}건")
+
+    started = time.perf_counter()
+    scores = score_outcomes(outcomes, samples=args.samples, quiz_accuracy=args.quiz_accuracy,
+                            wins_only=args.wins_only, seed=args.seed)
+    with PROFILER.stage('index'):
+        indexes = {difficulty: ScoreIndex(values) for difficulty, values in scores.items()}
+    total = sum(len(index) for index in indexes.values())
+    elapsed = time.perf_counter() - started
+    print(f"\n📊 점수 {total:,}개 계산 + 정렬 색인 {elapsed:.2f}초 ({total / max(elapsed, 1e-9) / 1e6:.1f}M/초)")
+
+    report = {
+        'settings': {'data': args.data, 'games': args.games, 'samples': args.samples,
+                     'quiz_accuracy': args.quiz_accuracy, 'wins_only': args.wins_only,
+                     'events': args.events, 'seed': args.seed},
+        'distribution': {},
+        'ranks': {},
+    }
+    for difficulty, index in indexes.items():
+        summary = report['distribution'][difficulty] = summarize(index, args.points)
+        if not summary['count']:
+            print(f"  {difficulty}: 기록 없음")
+            continue
+        print(f"  {difficulty}: 중앙값 {summary['p50']:,.0f}, p90 {summary['p90']:,.0f}, "
+              f"p99 {summary['p99']:,.0f}, 최고 {summary['max']:,}")
+
+    if args.rank:
+        print("\n🏅 점수별 예상 순위:")
+        for difficulty, index in indexes.items():
+            if not len(index):
+                continue
+            population = args.population or len(index)
+            table = index.table(args.points)
+            exact = index.rank(args.rank) if population == len(index) else table.predict_rank(args.rank, population)
+            report['ranks'][difficulty] = {
+                str(score): {'rank': int(rank), 'population': population,
+                             'top_percent': float(100 * (1 - index.percentile(score)))}
+                for score, rank in zip(args.rank, exact)
+            }
+            row = ', '.join(f"{score:,} → {int(rank):,}위" for score, rank in zip(args.rank, exact))
+            print(f"  {difficulty} ({population:,}명 중): {row}")
+
+    backups = sorted({path for pattern in args.backup for path in glob.glob(pattern)})
+    if backups:
+        records = load_leaderboard(backups)
+        outliers = find_outliers(records, indexes)
+        report['live'] = {'files': [os.path.basename(path) for path in backups],
+                          'records': len(records), 'outliers': outliers}
+        print(f"\n🚨 라이브 리더보드 {len(records)}건 중 이상 기록 {len(outliers)}건:")
+        for outlier in outliers:
+            print(f"  - {outlier['playerName']} ({outlier['difficulty']}, {outlier['score']:,}점): "
+                  + '; '.join(outlier['reasons']))
+
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+
+    print(f"\n✅ 완료! 결과가 {args.output}에 저장되었습니다.")
+    finish_from_args(args)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,393 @@
+#!/usr/bin/env python3
+"""
+AWS CTO Game - Markov Outcome Analysis
+턴 그래프 위의 흡수 마르코프 연쇄로 결과 확률 계산 (표본 추출 없음)
+
+정책(균등 무작위 또는 실제 기록의 선택 비율)이 주어졌을 때 IPO, 승리 경로별 승리, 파산,
+서비스 장애, 긴급 분기(888) 도달, IPO 선택 턴(950) 도달 확률을 game_engine.step 규칙 그대로 계산합니다.
+
+상태 병합 (이산화):
+- 게임 상태 전체는 경우의 수가 너무 많아서, 같은 step 깊이에서 아래 키가 같은 상태는 하나로 합칩니다.
+  (턴, 유저/현금 로그 버킷, 신뢰도 버킷, 규칙에 쓰이는 인프라, DR, 연속 적자 턴, IPO 조건 상태,
+  그리고 game_constants.json 의 승리/IPO/파산/장애 기준선 각각을 넘었는지 여부)
+- 합쳐진 상태의 유저/현금/신뢰도는 들어온 상태들의 평균이고 나머지 필드는 처음 들어온 상태를 따릅니다.
+  대표 상태가 정책과 무관하므로 연쇄는 (데이터, 난이도, 해상도)마다 한 번만 만들고
+  scripts/.cache/markov/ 에 저장해 두었다가 정책만 바꿔서 바로 다시 풉니다.
+- 매 전이마다 step 이 1 증가하므로 연쇄는 층(layer) 구조의 DAG 입니다. 흡수 확률 e0·(I-Q)^-1·R 의
+  급수 Σ Q^k 는 층 수만큼에서 정확히 끝나므로, 층마다 희소 전이(COO 배열) 한 번씩 곱해서 계산합니다.
+
+결과는 병합된 연쇄에 대해 정확하고(잡음 없음) 같은 해상도끼리는 작은 데이터/정책 변화도 그대로 차이로
+드러납니다. 병합 자체의 편향은 --verify 로 Monte Carlo(play)와 비교해서 확인하세요.
+
+사용 예:
+    python3 markov_outcomes.py                                       # NORMAL, 균등 무작위 정책
+    python3 markov_outcomes.py --pick-rates ../playlog_report.json   # 실제 선택 비율 정책도 함께
+    python3 markov_outcomes.py --compare ../game_choices_db_rebalanced.json --verify 100000
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import random
+import time
+from collections import Counter
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from game_engine import (
+    CONSTANTS_HASH, DIFFICULTIES, GAME_CONSTANTS, VICTORY_STATUS, Choice, GameStatus,
+    Lumping, Rules, compile_turns, is_emergency_turn, load_game_data, new_game, play,
+    random_policy, step, weighted_policy,
+)
+from profiler import PROFILER, add_arguments as add_profile_arguments, enable_from_args, finish_from_args
+
+CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.cache', 'markov')
+CHAIN_VERSION = 1   # 병합 키/구성 규칙이 바뀌면 올려서 이전 캐시를 무효화
+
+# 흡수 상태: 승리(우선순위 순) → 패배 → 미종료 (선택지가 없는 턴 또는 max_steps 도달, play 와 동일)
+OUTCOMES = tuple(VICTORY_STATUS.values()) + (
+    GameStatus.LOST_BANKRUPT, GameStatus.LOST_OUTAGE, GameStatus.LOST_FAILED_IPO,
+    GameStatus.LOST_EQUITY, GameStatus.LOST_FIRED_CTO, GameStatus.PLAYING,
+)
+_OUTCOME_CODE = {status: i for i, status in enumerate(OUTCOMES)}
+
+# 도달(hitting) 확률을 계산하는 턴 집합
+HIT_TARGETS = {
+    'emergency': is_emergency_turn,
+    'ipo_selection': lambda turn: turn == GAME_CONSTANTS['IPO_SELECTION_TURN'],
+}
+
+# ---------------------------------------------------------------------------
+# 연쇄
+# ---------------------------------------------------------------------------
+
+class OutcomeChain:
+    """층 구조 흡수 연쇄 (전이는 COO 배열: src → dst, dst < 0 이면 흡수 상태 -(코드+1))
+
+    상태 번호는 층 순서로 매겨지고 layer_states[k]:layer_states[k+1] 이 k 번째 층,
+    전이도 출발 상태 순서라 layer_edges[k]:layer_edges[k+1] 이 k 번째 층에서 나가는 전이입니다.
+    choice 는 전이를 만든 선택지 번호(choice_ids 의 인덱스), -1 이면 확률 1 의 미종료 흡수입니다.
+    """
+
+    __slots__ = ('state_turn', 'layer_states', 'layer_edges', 'src', 'dst', 'choice',
+                 'choice_ids', 'choice_group')
+
+    def __init__(self, state_turn, layer_states, layer_edges, src, dst, choice, choice_ids, choice_group):
+        self.state_turn = np.asarray(state_turn, dtype=np.int32)
+        self.layer_states = np.asarray(layer_states, dtype=np.int64)
+        self.layer_edges = np.asarray(layer_edges, dtype=np.int64)
+        self.src = np.asarray(src, dtype=np.int64)
+        self.dst = np.asarray(dst, dtype=np.int64)
+        self.choice = np.asarray(choice, dtype=np.int32)
+        self.choice_ids = np.asarray(choice_ids, dtype=np.int64)
+        self.choice_group = np.asarray(choice_group, dtype=np.int32)
+
+    @property
+    def states(self) -> int:
+        return len(self.state_turn)
+
+    @property
+    def edges(self) -> int:
+        return len(self.src)
+
+    def save(self, path: str):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = path + '.tmp.npz'
+        np.savez_compressed(tmp, **{name: getattr(self, name) for name in OutcomeChain.__slots__})
+        os.replace(tmp, path)
+
+    @staticmethod
+    def load(path: str) -> 'OutcomeChain':
+        with np.load(path) as arrays:
+            return OutcomeChain(*(arrays[name] for name in OutcomeChain.__slots__))
+
+    def edge_probabilities(self, weights: Optional[Dict[int, float]] = None) -> np.ndarray:
+        """정책 → 전이 확률 (weights: 선택지 id 별 가중치, 없으면 균등 — weighted_policy 와 같은 규칙)
+
+        턴의 모든 선택지 가중치가 0 이면 그 턴은 균등 선택으로 대체합니다.
+        """
+        if weights is None:
+            w = np.ones(len(self.choice_ids))
+        else:
+            w = np.array([weights.get(int(choice_id), 0) for choice_id in self.choice_ids], dtype=np.float64)
+        totals = np.bincount(self.choice_group, weights=w)[self.choice_group]
+        counts = np.bincount(self.choice_group)[self.choice_group]
+        per_choice = np.where(totals > 0, w / np.where(totals > 0, totals, 1), 1.0 / counts)
+        return np.where(self.choice >= 0, per_choice[np.maximum(self.choice, 0)], 1.0)
+
+    def absorb(self, probabilities: np.ndarray) -> Dict:
+        """초기 상태에서의 흡수 확률, 기대 step 수, 목표 턴 도달 확률"""
+        x = np.zeros(self.states)
+        x[0] = 1.0
+        # 목표별로 '아직 도달하지 않은' 확률 질량을 따로 굴림 (처음 도달할 때 빼서 더함)
+        targets = {name: np.fromiter((hit(int(t)) for t in self.state_turn), bool, self.states)
+                   for name, hit in HIT_TARGETS.items()}
+        pending = {name: x.copy() for name in targets}
+        hits = dict.fromkeys(targets, 0.0)
+        absorbed = np.zeros(len(OUTCOMES))
+        expected_steps = 0.0
+        stepping = self.choice >= 0
+
+        for k in range(len(self.layer_states) - 1):
+            a, b = self.layer_states[k], self.layer_states[k + 1]
+            c = self.layer_states[k + 2] if k + 2 < len(self.layer_states) else b
+            ea, eb = self.layer_edges[k], self.layer_edges[k + 1]
+            src, dst = self.src[ea:eb], self.dst[ea:eb]
+            p = probabilities[ea:eb]
+            terminal = dst < 0
+            moving = ~terminal
+
+            for name, mask in targets.items():
+                layer = pending[name][a:b]
+                hit = mask[a:b]
+                hits[name] += layer[hit].sum()
+                layer[hit] = 0.0
+                flow = layer[src - a] * p
+                pending[name][b:c] = np.bincount(dst[moving] - b, weights=flow[moving], minlength=c - b)
+
+            flow = x[src] * p
+            absorbed += np.bincount(-dst[terminal] - 1, weights=flow[terminal], minlength=len(OUTCOMES))
+            expected_steps += flow[stepping[ea:eb]].sum()
+            x[b:c] = np.bincount(dst[moving] - b, weights=flow[moving], minlength=c - b)
+
+        return {
+            'outcomes': {status: float(value) for status, value in zip(OUTCOMES, absorbed)},
+            'expected_steps': float(expected_steps),
+            'hits': {name: float(value) for name, value in hits.items()},
+        }
+
+def build_chain(turns: Dict[int, List[Choice]], rules: Rules, resolution: float = 0.2,
+                trust_resolution: int = 5, max_steps: int = 200) -> OutcomeChain:
+    """새 게임부터 step 깊이별로 모든 선택지를 펼치며 병합 연쇄 구성"""
+    lumping = Lumping(rules, resolution, trust_resolution)
+    choice_index, choice_ids, choice_group = {}, [], []
+    for group, turn in enumerate(sorted(turns)):
+        choice_index[turn] = len(choice_ids)
+        for choice in turns[turn]:
+            choice_ids.append(choice.id)
+            choice_group.append(group)
+
+    initial = new_game(rules)
+    # 키 → [처음 들어온 상태, 들어온 수, 유저 합, 현금 합, 신뢰도 합]
+    layer = {lumping.key(initial): [initial, 1, initial.users, initial.cash, initial.trust]}
+    state_turn, layer_states, layer_edges = [], [0], [0]
+    src, dst, edge_choice = [], [], []
+    unfinished = -(_OUTCOME_CODE[GameStatus.PLAYING] + 1)
+
+    for depth in range(max_steps + 1):
+        if not layer:
+            break
+        base = len(state_turn)
+        next_base = base + len(layer)
+        following: Dict[Tuple, List] = {}
+        with PROFILER.stage('expand'):
+            for offset, (state, count, users, cash, trust) in enumerate(layer.values()):
+                if count > 1:
+                    state = state.copy()
+                    state.users = round(users / count)
+                    state.cash = round(cash / count)
+                    state.trust = round(trust / count)
+                index = base + offset
+                state_turn.append(state.turn)
+                choices = turns.get(state.turn)
+                if not choices or depth == max_steps:
+                    src.append(index)
+                    dst.append(unfinished)
+                    edge_choice.append(-1)
+                    continue
+                first = choice_index[state.turn]
+                for i, choice in enumerate(choices):
+                    successor = state.copy()
+                    step(successor, choice, rules)
+                    src.append(index)
+                    edge_choice.append(first + i)
+                    if successor.status != GameStatus.PLAYING:
+                        dst.append(-(_OUTCOME_CODE[successor.status] + 1))
+                        continue
+                    key = lumping.key(successor)
+                    entry = following.get(key)
+                    if entry is None:
+                        dst.append(next_base + len(following))
+                        following[key] = [successor, 1, successor.users, successor.cash, successor.trust, len(following)]
+                    else:
+                        dst.append(next_base + entry[5])
+                        entry[1] += 1
+                        entry[2] += successor.users
+                        entry[3] += successor.cash
+                        entry[4] += successor.trust
+        PROFILER.count('markov:states', len(layer))
+        layer = {key: entry[:5] for key, entry in following.items()}
+        layer_states.append(len(state_turn))
+        layer_edges.append(len(src))
+
+    return OutcomeChain(state_turn, layer_states, layer_edges, src, dst, edge_choice, choice_ids, choice_group)
+
+def load_chain(data_path: str, difficulty: str, resolution: float, trust_resolution: int,
+               max_steps: int = 200, cache_dir: Optional[str] = CACHE_DIR) -> Tuple[OutcomeChain, bool]:
+    """(연쇄, 캐시 적중 여부) — 캐시 키는 데이터 파일 내용 + 상수 해시 + 난이도/해상도"""
+    with open(data_path, 'rb') as f:
+        raw = f.read()
+    digest = hashlib.sha256(raw)
+    digest.update(f'{CONSTANTS_HASH}:{CHAIN_VERSION}:{difficulty}:{resolution}:{trust_resolution}:{max_steps}'.encode())
+    path = os.path.join(cache_dir, f'{difficulty}_{digest.hexdigest()[:16]}.npz') if cache_dir else None
+    if path and os.path.exists(path):
+        PROFILER.cache('markov', True)
+        return OutcomeChain.load(path), True
+    PROFILER.cache('markov', False)
+    with PROFILER.stage('build'):
+        chain = build_chain(compile_turns(json.loads(raw)), Rules(difficulty), resolution,
+                            trust_resolution, max_steps)
+    if path:
+        chain.save(path)
+    return chain, False
+
+# ---------------------------------------------------------------------------
+# 요약 / 검증
+# ---------------------------------------------------------------------------
+
+def summarize(result: Dict) -> Dict:
+    """리포트용 주요 확률 (IPO, 승리, 파산, 장애, 긴급 분기, IPO 선택 턴)"""
+    outcomes = result['outcomes']
+    return {
+        'ipo': outcomes[GameStatus.WON_IPO],
+        'win': sum(p for status, p in outcomes.items() if status.startswith('WON_')),
+        'bankrupt': outcomes[GameStatus.LOST_BANKRUPT],
+        'outage': outcomes[GameStatus.LOST_OUTAGE],
+        'unfinished': outcomes[GameStatus.PLAYING],
+        'emergency': result['hits']['emergency'],
+        'ipo_selection': result['hits']['ipo_selection'],
+        'expected_steps': result['expected_steps'],
+    }
+
+def monte_carlo(turns: Dict[int, List[Choice]], rules: Rules, games: int, seed: int = 0,
+                weights: Optional[Dict[int, float]] = None, max_steps: int = 200) -> Dict:
+    """같은 정책의 play 표본 — summarize 와 같은 항목 + 표준오차"""
+    rng = random.Random(seed)
+    policy = weighted_policy(rng, weights) if weights else random_policy(rng)
+    status = Counter()
+    hits = Counter()
+    steps = 0
+    for _ in range(games):
+        reached = set()
+
+        def on_step(state, choice):
+            for name, hit in HIT_TARGETS.items():
+                if hit(state.turn):
+                    reached.add(name)
+
+        final = play(turns, rules, policy, max_steps=max_steps, on_step=on_step)
+        status[final.status] += 1
+        hits.update(reached)
+        steps += final.steps
+    result = {
+        'outcomes': {s: status[s] / games for s in OUTCOMES},
+        'hits': {name: hits[name] / games for name in HIT_TARGETS},
+        'expected_steps': steps / games,
+    }
+    summary = summarize(result)
+    return {name: {'value': value,
+                   'stderr': None if name == 'expected_steps' else (value * (1 - value) / games) ** 0.5}
+            for name, value in summary.items()}
+
+def load_pick_rates(path: str) -> Dict[int, float]:
+    """analyze_playlogs.py 리포트의 pick_rates ({턴: {선택지 id: 비율}}) → 선택지 id 별 가중치"""
+    with open(path, 'r', encoding='utf-8') as f:
+        report = json.load(f)
+    return {int(choice_id): rate for rates in report['pick_rates'].values() for choice_id, rate in rates.items()}
+
+LABELS = {
+    'ipo': 'IPO 성공', 'win': '승리 (전체)', 'bankrupt': '파산', 'outage': '서비스 장애',
+    'unfinished': '미종료', 'emergency': '긴급 분기 도달', 'ipo_selection': 'IPO 선택 턴 도달',
+}
+
+def parse_args():
+    parser = argparse.ArgumentParser(description='AWS CTO Game 흡수 마르코프 연쇄 결과 확률')
+    parser.add_argument('--data', default='../game_choices_db.json', help='게임 데이터 JSON 경로')
+    parser.add_argument('--difficulty', default='NORMAL', choices=DIFFICULTIES)
+    parser.add_argument('--resolution', type=float, default=0.2, help='유저/현금 로그 버킷의 상대 크기 (0.2 = 20%%)')
+    parser.add_argument('--trust-resolution', type=int, default=5, help='신뢰도 버킷 크기')
+    parser.add_argument('--max-steps', type=int, default=200, help='play 와 같은 최대 step 수')
+    parser.add_argument('--pick-rates', help='analyze_playlogs.py 리포트 (실제 선택 비율 정책도 계산)')
+    parser.add_argument('--compare', help='같은 조건으로 비교할 다른 게임 데이터 JSON')
+    parser.add_argument('--verify', type=int, default=0, metavar='GAMES',
+                        help='Monte Carlo(play) GAMES 판과 비교해서 병합 편향 확인')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--cache-dir', default=CACHE_DIR, help='연쇄 캐시 디렉터리')
+    parser.add_argument('--no-cache', action='store_true', help='캐시를 읽거나 쓰지 않음')
+    parser.add_argument('--output', default='../markov_outcomes.json', help='리포트 저장 경로')
+    add_profile_arguments(parser)
+    return parser.parse_args()
+
+def main():
+    args = parse_args()
+    enable_from_args(args)
+
+    print("🎮 AWS CTO Game - Markov Outcome Analysis")
+    print("=" * 60)
+
+    cache_dir = None if args.no_cache else args.cache_dir
+    policies = {'uniform': None}
+    if args.pick_rates:
+        policies['observed'] = load_pick_rates(args.pick_rates)
+
+    datasets = [args.data] + ([args.compare] if args.compare else [])
+    report = {
+        'difficulty': args.difficulty,
+        'resolution': args.resolution,
+        'trust_resolution': args.trust_resolution,
+        'datasets': {},
+    }
+    for data_path in datasets:
+        started = time.perf_counter()
+        chain, cached = load_chain(data_path, args.difficulty, args.resolution, args.trust_resolution,
+                                   args.max_steps, cache_dir)
+        built = time.perf_counter() - started
+        print(f"\n📂 {data_path} ({args.difficulty}): 상태 {chain.states:,}개, 전이 {chain.edges:,}개, "
+              f"층 {len(chain.layer_states) - 1}개 — {'캐시' if cached else '구성'} {built:.1f}초")
+
+        entry = report['datasets'][data_path] = {'states': chain.states, 'edges': chain.edges, 'policies': {}}
+        for name, weights in policies.items():
+            started = time.perf_counter()
+            with PROFILER.stage('absorb'):
+                result = chain.absorb(chain.edge_probabilities(weights))
+            summary = summarize(result)
+            entry['policies'][name] = dict(summary, outcomes=result['outcomes'])
+            print(f"\n  🎯 {name} 정책 (풀이 {(time.perf_counter() - started) * 1000:.0f}ms):")
+            for key, label in LABELS.items():
+                print(f"     {label}: {summary[key]:.4%}")
+            print(f"     기대 step 수: {summary['expected_steps']:.2f}")
+
+    if args.compare:
+        base, other = (report['datasets'][path]['policies'] for path in datasets)
+        report['difference'] = {name: {key: other[name][key] - base[name][key] for key in LABELS}
+                                for name in policies}
+        print(f"\n⚖️  차이 ({args.compare} - {args.data}):")
+        for name, delta in report['difference'].items():
+            print(f"  {name}: " + ', '.join(f"{LABELS[key]} {value:+.4%}" for key, value in delta.items()))
+
+    if args.verify:
+        turns = compile_turns(load_game_data(args.data))
+        rules = Rules(args.difficulty)
+        report['verify'] = {}
+        print(f"\n🔍 Monte Carlo {args.verify:,}판과 비교 (±1.96 표준오차):")
+        for name, weights in policies.items():
+            with PROFILER.stage('verify'):
+                sampled = monte_carlo(turns, rules, args.verify, args.seed, weights, args.max_steps)
+            exact = report['datasets'][args.data]['policies'][name]
+            report['verify'][name] = sampled
+            print(f"  {name}:")
+            for key, label in LABELS.items():
+                value, stderr = sampled[key]['value'], sampled[key]['stderr']
+                mark = '✅' if abs(exact[key] - value) <= 1.96 * stderr + 1e-12 else '⚠️'
+                print(f"     {mark} {label}: 연쇄 {exact[key]:.4%} / 표본 {value:.4%} ± {1.96 * stderr:.4%}")
+
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+
+    print(f"\n✅ 완료! 결과가 {args.output}에 저장되었습니다.")
+    finish_from_args(args)
+
+if __name__ == '__main__':
+    main()
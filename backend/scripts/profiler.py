@@ -0,0 +1,318 @@
+#!/usr/bin/env python3
+"""
+AWS CTO Game - Simulator Instrumentation
+분석/시뮬레이션 스크립트용 선택적(opt-in) 계측
+
+backend/src/game/performance-monitor.service.ts 가 NestJS 쪽에 주는 것과 같은 정보를
+Python 도구에서 얻기 위한 모듈입니다. 기본은 꺼져 있고(PROFILER.enabled == False),
+꺼져 있을 때 stage() 는 공유 no-op 컨텍스트를, count()/cache() 는 즉시 반환하므로
+핫 루프에 남겨 두어도 비용이 거의 없습니다.
+
+- stage(name): 중첩 가능한 단계별 wall/CPU 시간 (호출 수, 평균/최소/최대, p50/p95/p99 ms)
+- count(name, n): 카운터 (예: 턴별 step 수)
+- cache(name, hit): 캐시 적중률
+- worker_task(worker, seconds) / pool_start(name) / pool(name, workers, wall): 프로세스 풀 워커 사용률
+- 최대 메모리: ru_maxrss (항상 — 부모 프로세스, 워커별, 종료된 자식), tracemalloc 최대치 (enable(trace_memory=True) 일 때)
+- 내보내기: JSON (write_json) / flamegraph.pl·speedscope 용 collapsed stacks (write_collapsed)
+
+사용:
+    from profiler import PROFILER, enable
+    enable()
+    with PROFILER.stage('simulate'):
+        ...
+    PROFILER.write_json('profile.json'); PROFILER.write_collapsed('profile.folded')
+"""
+
+import json
+import os
+import time
+import tracemalloc
+from contextlib import contextmanager, nullcontext
+from typing import Dict, Optional, Tuple
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+from stream_stats import RunningStats
+
+STAGE_PERCENTILES = (50, 95, 99)
+_NOOP = nullcontext()
+
+def _peak_rss_kb(children: bool = False) -> Optional[int]:
+    """이 프로세스(또는 종료되어 회수된 자식 중 가장 큰 것)의 최대 RSS"""
+    if resource is None:
+        return None
+    who = resource.RUSAGE_CHILDREN if children else resource.RUSAGE_SELF
+    return resource.getrusage(who).ru_maxrss  # Linux: KB
+
+class _StageStats:
+    __slots__ = ('wall', 'cpu', 'child_wall', 'durations')
+
+    def __init__(self):
+        self.wall = 0.0
+        self.cpu = 0.0
+        self.child_wall = 0.0
+        self.durations = RunningStats()   # ms
+
+    def to_dict(self) -> Dict:
+        return {'wall': self.wall, 'cpu': self.cpu, 'child_wall': self.child_wall,
+                'durations': self.durations.to_dict()}
+
+    @staticmethod
+    def from_dict(values: Dict) -> '_StageStats':
+        stats = _StageStats()
+        stats.wall = values['wall']
+        stats.cpu = values['cpu']
+        stats.child_wall = values['child_wall']
+        stats.durations = RunningStats.from_dict(values['durations'])
+        return stats
+
+    def merge(self, other: '_StageStats'):
+        self.wall += other.wall
+        self.cpu += other.cpu
+        self.child_wall += other.child_wall
+        self.durations.merge(other.durations)
+
+class Profiler:
+    """단계 타이머 + 카운터 + 캐시 적중률 + 워커 사용률 (프로세스 간 병합 가능)"""
+
+    def __init__(self):
+        self.enabled = False
+        self.trace_memory = False
+        self.reset()
+
+    def reset(self):
+        self.stages: Dict[Tuple[str, ...], _StageStats] = {}
+        self.counters: Dict[str, int] = {}
+        self.caches: Dict[str, list] = {}          # 이름 → [hits, misses]
+        self.worker_tasks: Dict[str, list] = {}    # 워커 → [작업 수, busy 초]
+        self.worker_rss: Dict[str, int] = {}       # 워커 → drain 시점까지의 최대 RSS (KB)
+        self.pools: Dict[str, Dict] = {}
+        self._pool_marks: Dict[str, float] = {}   # 풀 이름 → 시작 시점의 워커 busy 합
+        self._pool_busy_seen = 0.0                 # 이미 끝난 풀들이 가져간 busy 합
+        self._stack: Tuple[str, ...] = ()
+        self._started = time.perf_counter()
+        self._cpu_started = time.process_time()
+
+    # -- 기록 -----------------------------------------------------------------
+
+    def stage(self, name: str):
+        """단계 타이머 (with 문) — 꺼져 있으면 공유 no-op"""
+        if not self.enabled:
+            return _NOOP
+        return self._stage(name)
+
+    @contextmanager
+    def _stage(self, name: str):
+        parent = self._stack
+        path = parent + (name,)
+        self._stack = path
+        wall_start = time.perf_counter()
+        cpu_start = time.process_time()
+        try:
+            yield
+        finally:
+            wall = time.perf_counter() - wall_start
+            cpu = time.process_time() - cpu_start
+            self._stack = parent
+            stats = self.stages.get(path)
+            if stats is None:
+                stats = self.stages[path] = _StageStats()
+            stats.wall += wall
+            stats.cpu += cpu
+            stats.durations.push(wall * 1000)
+            if parent:
+                parent_stats = self.stages.get(parent)
+                if parent_stats is None:
+                    parent_stats = self.stages[parent] = _StageStats()
+                parent_stats.child_wall += wall
+
+    def count(self, name: str, n: int = 1):
+        if self.enabled:
+            self.counters[name] = self.counters.get(name, 0) + n
+
+    def cache(self, name: str, hit: bool, n: int = 1):
+        if self.enabled:
+            entry = self.caches.setdefault(name, [0, 0])
+            entry[0 if hit else 1] += n
+
+    def worker_task(self, worker, seconds: float):
+        if self.enabled:
+            entry = self.worker_tasks.setdefault(str(worker), [0, 0.0])
+            entry[0] += 1
+            entry[1] += seconds
+
+    def _busy(self) -> float:
+        return sum(seconds for _, seconds in self.worker_tasks.values())
+
+    def pool_start(self, name: str):
+        """풀 시작 시점 기록 — pool() 은 이 시점 이후의 워커 busy 만 셈"""
+        if self.enabled:
+            self._pool_marks[name] = self._busy()
+
+    def pool(self, name: str, workers: int, wall: float):
+        """프로세스 풀 한 번의 실행 — 사용률 = 이 풀 동안의 워커 busy 합 / (워커 수 × wall)
+
+        worker_tasks 는 스크립트 전체에 걸쳐 누적되므로, pool_start(name) 시점(없으면 직전 풀이
+        끝난 시점)의 busy 합을 빼서 앞선 풀의 작업이 뒤 풀의 사용률에 섞이지 않게 합니다.
+        """
+        if self.enabled:
+            total = self._busy()
+            busy = total - self._pool_marks.pop(name, self._pool_busy_seen)
+            self._pool_busy_seen = total
+            self.pools[name] = {'workers': workers, 'wall': wall, 'busy': busy,
+                                'utilization': busy / (workers * wall) if wall > 0 else 0.0}
+
+    # -- 병합 (워커 → 부모) -----------------------------------------------------
+
+    def drain(self) -> Dict:
+        """원시 기록을 꺼내고 비움 (워커 프로세스가 작업 결과와 함께 돌려줌)"""
+        raw = {
+            'stages': [[list(path), stats.to_dict()] for path, stats in self.stages.items()],
+            'counters': self.counters,
+            'caches': self.caches,
+            'worker_tasks': self.worker_tasks,
+            'rss': {str(os.getpid()): _peak_rss_kb()},
+        }
+        self.reset()
+        return raw
+
+    def merge(self, raw: Dict):
+        for path, values in raw['stages']:
+            incoming = _StageStats.from_dict(values)
+            existing = self.stages.get(tuple(path))
+            if existing is None:
+                self.stages[tuple(path)] = incoming
+            else:
+                existing.merge(incoming)
+        for name, n in raw['counters'].items():
+            self.counters[name] = self.counters.get(name, 0) + n
+        for name, (hits, misses) in raw['caches'].items():
+            entry = self.caches.setdefault(name, [0, 0])
+            entry[0] += hits
+            entry[1] += misses
+        for worker, (tasks, seconds) in raw['worker_tasks'].items():
+            entry = self.worker_tasks.setdefault(worker, [0, 0.0])
+            entry[0] += tasks
+            entry[1] += seconds
+        for worker, kb in raw.get('rss', {}).items():
+            if kb is not None:
+                self.worker_rss[worker] = max(kb, self.worker_rss.get(worker, 0))
+
+    # -- 내보내기 ---------------------------------------------------------------
+
+    def report(self) -> Dict:
+        stages = {}
+        for path, stats in sorted(self.stages.items()):
+            durations = stats.durations
+            entry = {
+                'count': durations.count,
+                'totalMs': stats.wall * 1000,
+                'cpuMs': stats.cpu * 1000,
+                'selfMs': max(0.0, stats.wall - stats.child_wall) * 1000,
+            }
+            if durations.count:
+                entry.update({'avgMs': durations.mean, 'minMs': durations.min, 'maxMs': durations.max})
+                for p in STAGE_PERCENTILES:
+                    entry[f'p{p}Ms'] = durations.quantile(p / 100)
+            stages['/'.join(path)] = entry
+
+        # ru_maxrss 는 프로세스별 값이므로 --workers N 실행에서는 워커 몫을 따로 더해야 함
+        peak_rss = _peak_rss_kb()
+        children_rss = _peak_rss_kb(children=True)
+        workers_rss = sum(self.worker_rss.values())
+        report = {
+            'wallSeconds': time.perf_counter() - self._started,
+            'cpuSeconds': time.process_time() - self._cpu_started,
+            'peakRssKB': peak_rss,
+            'stages': stages,
+            'counters': dict(sorted(self.counters.items())),
+            'caches': {name: {'hits': hits, 'misses': misses,
+                              'hitRate': hits / (hits + misses) if hits + misses else 0.0}
+                       for name, (hits, misses) in sorted(self.caches.items())},
+        }
+        if self.trace_memory and tracemalloc.is_tracing():
+            report['tracemallocPeakKB'] = tracemalloc.get_traced_memory()[1] // 1024
+        if peak_rss is not None and (self.worker_rss or children_rss):
+            # 워커별 최대치의 합(동시에 최대였다고 가정한 상한) — drain 으로 못 받은 자식은 RUSAGE_CHILDREN 최대치
+            report['childrenPeakRssKB'] = max([children_rss] + list(self.worker_rss.values()))
+            report['totalPeakRssKB'] = peak_rss + (workers_rss or children_rss)
+        if self.worker_tasks or self.pools:
+            report['workers'] = {
+                'tasks': {worker: {'tasks': tasks, 'busySeconds': seconds,
+                                   'peakRssKB': self.worker_rss.get(worker)}
+                          for worker, (tasks, seconds) in sorted(self.worker_tasks.items())},
+                'pools': self.pools,
+            }
+        return report
+
+    def collapsed_stacks(self):
+        """'a;b;c <self 마이크로초>' 줄 (flamegraph.pl / speedscope 입력 형식)"""
+        for path, stats in sorted(self.stages.items()):
+            self_us = int(max(0.0, stats.wall - stats.child_wall) * 1_000_000)
+            if self_us > 0:
+                yield f"{';'.join(name.replace(';', ':').replace(' ', '_') for name in path)} {self_us}"
+
+    def write_json(self, path: str):
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.report(), f, ensure_ascii=False, indent=2)
+
+    def write_collapsed(self, path: str):
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            for line in self.collapsed_stacks():
+                f.write(line + '\n')
+
+    def print_summary(self, limit: int = 12):
+        report = self.report()
+        print(f"\n⏱️  프로파일 (wall {report['wallSeconds']:.2f}초, CPU {report['cpuSeconds']:.2f}초"
+              + (f", 최대 RSS {report['peakRssKB'] / 1024:.0f}MB" if report['peakRssKB'] else '')
+              + (f" (워커 포함 {report['totalPeakRssKB'] / 1024:.0f}MB)" if 'totalPeakRssKB' in report else '')
+              + "):")
+        top = sorted(report['stages'].items(), key=lambda item: -item[1]['totalMs'])[:limit]
+        for name, entry in top:
+            print(f"  - {name}: {entry['totalMs']:,.1f}ms (self {entry['selfMs']:,.1f}ms, "
+                  f"CPU {entry['cpuMs']:,.1f}ms, {entry['count']}회)")
+        for name, entry in report['caches'].items():
+            print(f"  - 캐시 {name}: {entry['hitRate']:.1%} 적중 ({entry['hits']}/{entry['hits'] + entry['misses']})")
+        for name, entry in report.get('workers', {}).get('pools', {}).items():
+            print(f"  - 워커 풀 {name}: 사용률 {entry['utilization']:.0%} "
+                  f"(워커 {entry['workers']}개, busy {entry['busy']:.2f}초 / wall {entry['wall']:.2f}초)")
+
+PROFILER = Profiler()
+
+def enable(trace_memory: bool = False) -> Profiler:
+    """전역 프로파일러 켜기 (기록 초기화)"""
+    PROFILER.reset()
+    PROFILER.enabled = True
+    PROFILER.trace_memory = trace_memory
+    if trace_memory and not tracemalloc.is_tracing():
+        tracemalloc.start()
+    return PROFILER
+
+def add_arguments(parser):
+    """--profile / --profile-stacks / --profile-memory 옵션 추가"""
+    parser.add_argument('--profile', metavar='JSON', help='계측 결과(단계 시간, 카운터, 캐시, 메모리) 저장 경로')
+    parser.add_argument('--profile-stacks', metavar='FOLDED', help='flamegraph 용 collapsed stacks 저장 경로')
+    parser.add_argument('--profile-memory', action='store_true', help='tracemalloc 으로 최대 메모리 추적 (느려짐)')
+
+def enable_from_args(args) -> bool:
+    if args.profile or args.profile_stacks or args.profile_memory:
+        enable(trace_memory=args.profile_memory)
+        return True
+    return False
+
+def finish_from_args(args):
+    """계측이 켜져 있으면 요약 출력 + 파일 저장"""
+    if not PROFILER.enabled:
+        return
+    PROFILER.print_summary()
+    if args.profile:
+        PROFILER.write_json(args.profile)
+        print(f"  📝 {args.profile}")
+    if args.profile_stacks:
+        PROFILER.write_collapsed(args.profile_stacks)
+        print(f"  📝 {args.profile_stacks}")
@@ -2,270 +2,488 @@
 """
 AWS CTO Game - Rebalancing Script
 게임 밸런싱 자동 조정 스크립트
+
+조정 작업은 스테이지로 등록되고 설정 파일(JSON)의 순서대로 파이프라인을 이룹니다.
+- 턴 스테이지: 턴 단위 구조 변경 (예: 투자 라운드 선택지 추가)
+- 선택지 스테이지: 선택지 효과 변경 (비용, 유저, 신뢰도 …) — 연속된 선택지 스테이지는
+  한 번의 순회로 합쳐서(fused) 실행됩니다.
+원본은 수정하지 않고, 바뀐 선택지/턴만 새 dict 로 복사(copy-on-write)하므로
+파라미터 조합 하나를 평가하는 비용이 전체 deepcopy 보다 훨씬 작습니다.
+
+사용 예:
+    python3 rebalance_game.py                                   # 기본 파이프라인
+    python3 rebalance_game.py --config rebalance.json --dry-run # 변경 내역만 출력
+    python3 rebalance_game.py --set adjust_trust_growth.factor=0.5 --dry-run
 """
 
+import argparse
 import json
-import copy
-from typing import Dict, List
+from typing import Callable, Dict, List, Optional, Tuple
 
-def load_game_data(filepath: str) -> List[Dict]:
-    """게임 데이터 로드"""
-    with open(filepath, 'r', encoding='utf-8') as f:
-        return json.load(f)
+from game_engine import load_game_data
+from keyword_matcher import TECH_KEYWORDS, is_tech_choice
+from snapshot_store import SnapshotStore
+from validate_choices import print_report, validate
 
 def save_game_data(filepath: str, data: List[Dict]):
     """게임 데이터 저장"""
     with open(filepath, 'w', encoding='utf-8') as f:
         json.dump(data, f, ensure_ascii=False, indent=2)
 
-def add_investment_rounds(data: List[Dict]) -> List[Dict]:
-    """투자 라운드 추가
+# ---------------------------------------------------------------------------
+# 스테이지 등록
+# ---------------------------------------------------------------------------
 
-    턴 6: 시리즈 A (5억 ~ 20억)
-    턴 12: 시리즈 B (20억 ~ 100억)
-    턴 18: 시리즈 C (100억 ~ 500억)
+class Stage:
+    """등록된 조정 작업
+
+    kind='choice': fn(turn, choice, effects, **params) -> 바뀐 효과 dict 또는 None
+        effects 는 앞선 스테이지까지 반영된 (읽기 전용으로 다룰) 효과입니다.
+    kind='turn': fn(turn_data, **params) -> 새 턴 dict 또는 None (바꾸지 않음)
+        turn_data 를 직접 수정하지 말고, 바꿀 때는 얕은 복사본을 반환합니다.
     """
 
-    investment_rounds = {
-        6: {
-            "turn": 6,
-            "event": "💼 턴 6 — 시리즈 A 투자 라운드\n\n현재 상황:\n- 자금: (선택에 따라 변동)\n- 유저: 500-7,000명\n- 인프라: EC2 AutoScaling, Aurora, EKS (선택에 따라)\n- 팀: CTO + 개발자 1-4명\n\n투자자들이 테이블에 앉았습니다. 실사(Due Diligence)가 시작되었고,\n기술 스택, 보안, 확장성에 대한 질문이 쏟아집니다.\n\n\"귀사의 인프라는 10만 유저를 감당할 수 있습니까?\"\n\"데이터 보안 인증은 어떻게 되어 있습니까?\"\n\"DevOps 파이프라인은 구축되어 있습니까?\"\n\n투자 성공을 위해 어떤 부분을 강화하시겠습니까?",
-            "choices_to_add": [
-                {
-                    "id": "invest_6_conservative",
-                    "text": "🏦 보수적 투자 유치 — 시리즈 A 최소 규모 (지분 15% 양도)\n\n📈 투자 유치: ₩500,000,000 (5억 원)\n💼 밸류에이션: ₩3,300,000,000 (33억 원)\n👥 투자자: 국내 초기 단계 VC\n\n안정적이지만 성장 속도는 제한적입니다.",
-                    "effects": {
-                        "users": 5000,
-                        "cash": 500000000,
-                        "trust": 10,
-                        "infra": []
-                    },
-                    "next_turn": 7
+    def __init__(self, name: str, kind: str, fn: Callable, defaults: Dict, description: str):
+        self.name = name
+        self.kind = kind
+        self.fn = fn
+        self.defaults = defaults
+        self.description = description
+
+STAGES: Dict[str, Stage] = {}
+
+def stage(kind: str, description: str, **defaults):
+    """스테이지 등록 데코레이터 (defaults 는 설정 파일에서 덮어쓸 수 있는 파라미터)"""
+    def register(fn: Callable) -> Callable:
+        STAGES[fn.__name__] = Stage(fn.__name__, kind, fn, defaults, description)
+        return fn
+    return register
+
+INVESTMENT_ROUNDS = {
+    6: {
+        "turn": 6,
+        "event": "💼 턴 6 — 시리즈 A 투자 라운드\n\n현재 상황:\n- 자금: (선택에 따라 변동)\n- 유저: 500-7,000명\n- 인프라: EC2 AutoScaling, Aurora, EKS (선택에 따라)\n- 팀: CTO + 개발자 1-4명\n\n투자자들이 테이블에 앉았습니다. 실사(Due Diligence)가 시작되었고,\n기술 스택, 보안, 확장성에 대한 질문이 쏟아집니다.\n\n\"귀사의 인프라는 10만 유저를 감당할 수 있습니까?\"\n\"데이터 보안 인증은 어떻게 되어 있습니까?\"\n\"DevOps 파이프라인은 구축되어 있습니까?\"\n\n투자 성공을 위해 어떤 부분을 강화하시겠습니까?",
+        "choices_to_add": [
+            {
+                "id": "invest_6_conservative",
+                "text": "🏦 보수적 투자 유치 — 시리즈 A 최소 규모 (지분 15% 양도)\n\n📈 투자 유치: ₩500,000,000 (5억 원)\n💼 밸류에이션: ₩3,300,000,000 (33억 원)\n👥 투자자: 국내 초기 단계 VC\n\n안정적이지만 성장 속도는 제한적입니다.",
+                "effects": {
+                    "users": 5000,
+                    "cash": 500000000,
+                    "trust": 10,
+                    "infra": []
+                },
+                "next_turn": 7
+            },
+            {
+                "id": "invest_6_moderate",
+                "text": "💰 적정 규모 투자 유치 — 시리즈 A 평균 규모 (지분 20% 양도)\n\n📈 투자 유치: ₩1,000,000,000 (10억 원)\n💼 밸류에이션: ₩5,000,000,000 (50억 원)\n👥 투자자: 글로벌 VC 참여\n\n균형잡힌 선택으로 성장 가능성을 확보합니다.",
+                "effects": {
+                    "users": 10000,
+                    "cash": 1000000000,
+                    "trust": 20,
+                    "infra": []
+                },
+                "next_turn": 7
+            },
+            {
+                "id": "invest_6_aggressive",
+                "text": "🚀 공격적 투자 유치 — 시리즈 A 대규모 (지분 25% 양도)\n\n📈 투자 유치: ₩2,000,000,000 (20억 원)\n💼 밸류에이션: ₩8,000,000,000 (80억 원)\n👥 투자자: 유명 VC 리드 투자\n\n빠른 성장을 위한 자금을 확보하지만 지분을 많이 양도합니다.",
+                "effects": {
+                    "users": 20000,
+                    "cash": 2000000000,
+                    "trust": 30,
+                    "infra": []
+                },
+                "next_turn": 7
+            }
+        ]
+    },
+    12: {
+        "turn": 12,
+        "event": "🏢 턴 12 — 시리즈 B 투자 라운드\n\n현재 성과:\n- 유저: 10만+ 명 달성\n- 매출: 연 10-50억 원 규모\n- 인프라: 엔터프라이즈급 구성\n- 팀: 20-50명 규모\n\n시리즈 B 투자자들이 실적을 분석합니다.\nMAU, 리텐션, CAC, LTV 등 핵심 지표를 요구합니다.\n\n\"월간 활성 사용자 증가율은?\"\n\"고객 획득 비용 대비 생애 가치는?\"\n\"확장성 있는 비즈니스 모델입니까?\"\n\n본격적인 스케일업을 위한 투자 규모를 결정하세요.",
+        "choices_to_add": [
+            {
+                "id": "invest_12_conservative",
+                "text": "🏦 안정적 성장 전략 — 시리즈 B 최소 규모 (지분 12% 양도)\n\n📈 투자 유치: ₩2,000,000,000 (20억 원)\n💼 밸류에이션: ₩16,700,000,000 (167억 원)\n👥 투자자: 기존 투자자 팔로우온\n\n안정적 성장을 우선시합니다.",
+                "effects": {
+                    "users": 30000,
+                    "cash": 2000000000,
+                    "trust": 15,
+                    "infra": []
                 },
-                {
-                    "id": "invest_6_moderate",
-                    "text": "💰 적정 규모 투자 유치 — 시리즈 A 평균 규모 (지분 20% 양도)\n\n📈 투자 유치: ₩1,000,000,000 (10억 원)\n💼 밸류에이션: ₩5,000,000,000 (50억 원)\n👥 투자자: 글로벌 VC 참여\n\n균형잡힌 선택으로 성장 가능성을 확보합니다.",
-                    "effects": {
-                        "users": 10000,
-                        "cash": 1000000000,
-                        "trust": 20,
-                        "infra": []
-                    },
-                    "next_turn": 7
+                "next_turn": 13
+            },
+            {
+                "id": "invest_12_moderate",
+                "text": "💰 균형 성장 전략 — 시리즈 B 표준 규모 (지분 15% 양도)\n\n📈 투자 유치: ₩5,000,000,000 (50억 원)\n💼 밸류에이션: ₩33,300,000,000 (333억 원)\n👥 투자자: 유명 VC 신디케이트\n\n시장 확대와 조직 강화를 동시에 추진합니다.",
+                "effects": {
+                    "users": 50000,
+                    "cash": 5000000000,
+                    "trust": 25,
+                    "infra": []
                 },
-                {
-                    "id": "invest_6_aggressive",
-                    "text": "🚀 공격적 투자 유치 — 시리즈 A 대규모 (지분 25% 양도)\n\n📈 투자 유치: ₩2,000,000,000 (20억 원)\n💼 밸류에이션: ₩8,000,000,000 (80억 원)\n👥 투자자: 유명 VC 리드 투자\n\n빠른 성장을 위한 자금을 확보하지만 지분을 많이 양도합니다.",
-                    "effects": {
-                        "users": 20000,
-                        "cash": 2000000000,
-                        "trust": 30,
-                        "infra": []
-                    },
-                    "next_turn": 7
-                }
-            ]
-        },
-        12: {
-            "turn": 12,
-            "event": "🏢 턴 12 — 시리즈 B 투자 라운드\n\n현재 성과:\n- 유저: 10만+ 명 달성\n- 매출: 연 10-50억 원 규모\n- 인프라: 엔터프라이즈급 구성\n- 팀: 20-50명 규모\n\n시리즈 B 투자자들이 실적을 분석합니다.\nMAU, 리텐션, CAC, LTV 등 핵심 지표를 요구합니다.\n\n\"월간 활성 사용자 증가율은?\"\n\"고객 획득 비용 대비 생애 가치는?\"\n\"확장성 있는 비즈니스 모델입니까?\"\n\n본격적인 스케일업을 위한 투자 규모를 결정하세요.",
-            "choices_to_add": [
-                {
-                    "id": "invest_12_conservative",
-                    "text": "🏦 안정적 성장 전략 — 시리즈 B 최소 규모 (지분 12% 양도)\n\n📈 투자 유치: ₩2,000,000,000 (20억 원)\n💼 밸류에이션: ₩16,700,000,000 (167억 원)\n👥 투자자: 기존 투자자 팔로우온\n\n안정적 성장을 우선시합니다.",
-                    "effects": {
-                        "users": 30000,
-                        "cash": 2000000000,
-                        "trust": 15,
-                        "infra": []
-                    },
-                    "next_turn": 13
+                "next_turn": 13
+            },
+            {
+                "id": "invest_12_aggressive",
+                "text": "🚀 시장 지배 전략 — 시리즈 B 대규모 (지분 20% 양도)\n\n📈 투자 유치: ₩10,000,000,000 (100억 원)\n💼 밸류에이션: ₩50,000,000,000 (500억 원)\n👥 투자자: 글로벌 메가 VC\n\n시장 1위를 위한 공격적 확장을 추진합니다.",
+                "effects": {
+                    "users": 100000,
+                    "cash": 10000000000,
+                    "trust": 35,
+                    "infra": []
                 },
-                {
-                    "id": "invest_12_moderate",
-                    "text": "💰 균형 성장 전략 — 시리즈 B 표준 규모 (지분 15% 양도)\n\n📈 투자 유치: ₩5,000,000,000 (50억 원)\n💼 밸류에이션: ₩33,300,000,000 (333억 원)\n👥 투자자: 유명 VC 신디케이트\n\n시장 확대와 조직 강화를 동시에 추진합니다.",
-                    "effects": {
-                        "users": 50000,
-                        "cash": 5000000000,
-                        "trust": 25,
-                        "infra": []
-                    },
-                    "next_turn": 13
+                "next_turn": 13
+            }
+        ]
+    },
+    18: {
+        "turn": 18,
+        "event": "🌟 턴 18 — 시리즈 C/Pre-IPO 투자 라운드\n\n현재 위치:\n- 유저: 50만+ 명 달성\n- 매출: 연 100-500억 원 규모\n- 시장 지위: 업계 Top 3\n- 팀: 100-300명 규모\n\nIPO를 준비하는 마지막 대형 투자 라운드입니다.\n기관 투자자와 전략적 투자자들이 관심을 보입니다.\n\n\"IPO 시 예상 밸류에이션은?\"\n\"글로벌 확장 계획은?\"\n\"유니콘 가능성은?\"\n\nIPO 성공을 위한 마지막 선택을 하세요.",
+        "choices_to_add": [
+            {
+                "id": "invest_18_conservative",
+                "text": "🏦 안정적 IPO 준비 — 시리즈 C 최소 규모 (지분 8% 양도)\n\n📈 투자 유치: ₩10,000,000,000 (100억 원)\n💼 밸류에이션: ₩125,000,000,000 (1,250억 원)\n👥 투자자: 안정적 기관 투자자\n\n확실한 수익성을 증명하며 IPO를 준비합니다.",
+                "effects": {
+                    "users": 50000,
+                    "cash": 10000000000,
+                    "trust": 20,
+                    "infra": []
                 },
-                {
-                    "id": "invest_12_aggressive",
-                    "text": "🚀 시장 지배 전략 — 시리즈 B 대규모 (지분 20% 양도)\n\n📈 투자 유치: ₩10,000,000,000 (100억 원)\n💼 밸류에이션: ₩50,000,000,000 (500억 원)\n👥 투자자: 글로벌 메가 VC\n\n시장 1위를 위한 공격적 확장을 추진합니다.",
-                    "effects": {
-                        "users": 100000,
-                        "cash": 10000000000,
-                        "trust": 35,
-                        "infra": []
-                    },
-                    "next_turn": 13
-                }
-            ]
-        },
-        18: {
-            "turn": 18,
-            "event": "🌟 턴 18 — 시리즈 C/Pre-IPO 투자 라운드\n\n현재 위치:\n- 유저: 50만+ 명 달성\n- 매출: 연 100-500억 원 규모\n- 시장 지위: 업계 Top 3\n- 팀: 100-300명 규모\n\nIPO를 준비하는 마지막 대형 투자 라운드입니다.\n기관 투자자와 전략적 투자자들이 관심을 보입니다.\n\n\"IPO 시 예상 밸류에이션은?\"\n\"글로벌 확장 계획은?\"\n\"유니콘 가능성은?\"\n\nIPO 성공을 위한 마지막 선택을 하세요.",
-            "choices_to_add": [
-                {
-                    "id": "invest_18_conservative",
-                    "text": "🏦 안정적 IPO 준비 — 시리즈 C 최소 규모 (지분 8% 양도)\n\n📈 투자 유치: ₩10,000,000,000 (100억 원)\n💼 밸류에이션: ₩125,000,000,000 (1,250억 원)\n👥 투자자: 안정적 기관 투자자\n\n확실한 수익성을 증명하며 IPO를 준비합니다.",
-                    "effects": {
-                        "users": 50000,
-                        "cash": 10000000000,
-                        "trust": 20,
-                        "infra": []
-                    },
-                    "next_turn": 19
+                "next_turn": 19
+            },
+            {
+                "id": "invest_18_moderate",
+                "text": "💰 표준 IPO 트랙 — 시리즈 C 표준 규모 (지분 10% 양도)\n\n📈 투자 유치: ₩30,000,000,000 (300억 원)\n💼 밸류에이션: ₩300,000,000,000 (3,000억 원)\n👥 투자자: 대형 PE 및 전략적 투자자\n\n글로벌 확장과 IPO를 동시에 준비합니다.",
+                "effects": {
+                    "users": 100000,
+                    "cash": 30000000000,
+                    "trust": 30,
+                    "infra": []
                 },
-                {
-                    "id": "invest_18_moderate",
-                    "text": "💰 표준 IPO 트랙 — 시리즈 C 표준 규모 (지분 10% 양도)\n\n📈 투자 유치: ₩30,000,000,000 (300억 원)\n💼 밸류에이션: ₩300,000,000,000 (3,000억 원)\n👥 투자자: 대형 PE 및 전략적 투자자\n\n글로벌 확장과 IPO를 동시에 준비합니다.",
-                    "effects": {
-                        "users": 100000,
-                        "cash": 30000000000,
-                        "trust": 30,
-                        "infra": []
-                    },
-                    "next_turn": 19
+                "next_turn": 19
+            },
+            {
+                "id": "invest_18_aggressive",
+                "text": "🚀 유니콘 도전 — Pre-IPO 대규모 (지분 12% 양도)\n\n📈 투자 유치: ₩50,000,000,000 (500억 원)\n💼 밸류에이션: ₩416,700,000,000 (4,167억 원)\n👥 투자자: 글로벌 메가 펀드\n\n유니콘 기업으로 상장을 목표로 합니다.",
+                "effects": {
+                    "users": 200000,
+                    "cash": 50000000000,
+                    "trust": 40,
+                    "infra": []
                 },
-                {
-                    "id": "invest_18_aggressive",
-                    "text": "🚀 유니콘 도전 — Pre-IPO 대규모 (지분 12% 양도)\n\n📈 투자 유치: ₩50,000,000,000 (500억 원)\n💼 밸류에이션: ₩416,700,000,000 (4,167억 원)\n👥 투자자: 글로벌 메가 펀드\n\n유니콘 기업으로 상장을 목표로 합니다.",
-                    "effects": {
-                        "users": 200000,
-                        "cash": 50000000000,
-                        "trust": 40,
-                        "infra": []
-                    },
-                    "next_turn": 19
-                }
-            ]
-        }
+                "next_turn": 19
+            }
+        ]
     }
+}
 
-    new_data = copy.deepcopy(data)
-
-    # 투자 라운드 턴 찾기 및 선택지 추가
-    for turn_data in new_data:
-        turn_num = turn_data['turn']
-        if turn_num in investment_rounds:
-            investment = investment_rounds[turn_num]
-
-            # 기존 이벤트 텍스트 교체 (투자 라운드 스토리로)
-            turn_data['event'] = investment['event']
-
-            # 투자 선택지 추가 (기존 선택지 유지하면서)
-            for inv_choice in investment['choices_to_add']:
-                # ID 충돌 방지를 위해 높은 숫자 할당
-                max_id = max([c['id'] for c in turn_data['choices']] + [0])
-                inv_choice_copy = copy.deepcopy(inv_choice)
-                inv_choice_copy['id'] = max_id + 1000  # 1000번대로 시작
-                turn_data['choices'].append(inv_choice_copy)
-
-    return new_data
+@stage('turn', '투자 라운드 추가 (턴 6/12/18 시리즈 A/B/C)', turns=[6, 12, 18])
+def add_investment_rounds(turn_data: Dict, turns: List[int]) -> Optional[Dict]:
+    """투자 라운드 추가
 
-def adjust_costs(data: List[Dict], reduction_factor: float = 0.5) -> List[Dict]:
+    턴 6: 시리즈 A (5억 ~ 20억)
+    턴 12: 시리즈 B (20억 ~ 100억)
+    턴 18: 시리즈 C (100억 ~ 500억)
+    """
+    investment = INVESTMENT_ROUNDS.get(turn_data['turn'])
+    if investment is None or turn_data['turn'] not in turns:
+        return None
+
+    # 기존 이벤트 텍스트 교체 (투자 라운드 스토리로), 기존 선택지는 유지
+    choices = list(turn_data['choices'])
+    for inv_choice in investment['choices_to_add']:
+        # ID 충돌 방지를 위해 높은 숫자 할당 (일부 데이터는 id 가 문자열)
+        max_id = max([int(c['id']) for c in choices] + [0])
+        choices.append(dict(inv_choice, id=max_id + 1000))  # 1000번대로 시작
+    return dict(turn_data, event=investment['event'], choices=choices)
+
+@stage('choice', '비용 조정 (턴 11-20 은 더 큰 폭으로 감소)',
+       reduction_factor=0.5, mid_game_factor=0.3, mid_game_turns=[11, 20])
+def adjust_costs(turn: int, choice: Dict, effects: Dict, reduction_factor: float,
+                 mid_game_factor: float, mid_game_turns: List[int]) -> Optional[Dict]:
     """비용 조정 (50% 감소)"""
-    new_data = copy.deepcopy(data)
-
-    for turn_data in new_data:
-        turn_num = turn_data['turn']
-
-        for choice in turn_data['choices']:
-            effects = choice['effects']
-
-            # 현금 효과 조정
-            if effects.get('cash', 0) < 0:  # 비용인 경우만
-                # 턴 11-20은 더 큰 폭으로 감소
-                if 11 <= turn_num <= 20:
-                    effects['cash'] = int(effects['cash'] * 0.3)  # 70% 감소
-                else:
-                    effects['cash'] = int(effects['cash'] * reduction_factor)
-
-    return new_data
-
-def normalize_user_effects(data: List[Dict]) -> List[Dict]:
+    cash = effects.get('cash', 0)
+    if cash >= 0:  # 비용인 경우만
+        return None
+    start, end = mid_game_turns
+    factor = mid_game_factor if start <= turn <= end else reduction_factor
+    return {'cash': int(cash * factor)}
+
+@stage('choice', '유저 증가 효과 표준화 (상한/하한)', max_users=150000, min_users=0)
+def normalize_user_effects(turn: int, choice: Dict, effects: Dict,
+                           max_users: int, min_users: int) -> Optional[Dict]:
     """유저 증가 효과 표준화"""
-    new_data = copy.deepcopy(data)
-
-    for turn_data in new_data:
-        for choice in turn_data['choices']:
-            effects = choice['effects']
-            users = effects.get('users', 0)
-
-            # 최대 제한
-            if users > 150000:
-                effects['users'] = 150000
-
-            # 최소 제한 (마이너스 제거)
-            if users < 0:
-                effects['users'] = 0
-
-    return new_data
-
-def adjust_trust_growth(data: List[Dict]) -> List[Dict]:
-    """신뢰도 증가 조정"""
-    new_data = copy.deepcopy(data)
-
-    for turn_data in new_data:
-        for choice in turn_data['choices']:
-            effects = choice['effects']
-            trust = effects.get('trust', 0)
-
-            # 신뢰도 증가를 40%로 감소
-            if trust > 0:
-                effects['trust'] = max(1, int(trust * 0.4))
-
-    return new_data
+    users = effects.get('users', 0)
+    if users > max_users:
+        return {'users': max_users}
+    if users < min_users:
+        return {'users': min_users}
+    return None
+
+@stage('choice', '신뢰도 증가 축소', factor=0.4, min_gain=1)
+def adjust_trust_growth(turn: int, choice: Dict, effects: Dict,
+                        factor: float, min_gain: int) -> Optional[Dict]:
+    """신뢰도 증가 조정 (기본: 40%로 감소)"""
+    trust = effects.get('trust', 0)
+    if trust > 0:
+        return {'trust': max(min_gain, int(trust * factor))}
+    return None
+
+@stage('choice', '신뢰도 효과 구간 축소 (adjust_trust_effects.py)',
+       tiers=[[20, 3], [15, 2], [10, 1], [5, 1]])
+def scale_trust_tiers(turn: int, choice: Dict, effects: Dict, tiers: List[List[int]]) -> Optional[Dict]:
+    """|신뢰도 효과| 가 구간 하한 이상이면 구간 값으로 (부호 유지), 가장 작은 구간 미만은 그대로"""
+    trust = effects.get('trust', 0)
+    magnitude = abs(trust)
+    for threshold, value in tiers:
+        if magnitude >= threshold:
+            scaled = value if trust > 0 else -value
+            return {'trust': scaled} if scaled != trust else None
+    return None
+
+@stage('choice', '기술 선택지 신뢰도 보너스 (boost_tech_choices.py)',
+       bonus=2, category='인프라', keywords=TECH_KEYWORDS)
+def boost_tech_choices(turn: int, choice: Dict, effects: Dict, bonus: int,
+                       category: str, keywords: List[str]) -> Optional[Dict]:
+    """인프라 카테고리이거나 기술 키워드가 들어간 선택지에 신뢰도 보너스"""
+    if is_tech_choice(choice, category, keywords):
+        return {'trust': effects.get('trust', 0) + bonus}
+    return None
+
+# 기존 rebalance_game.py 와 같은 순서/값
+DEFAULT_PIPELINE = [
+    {'stage': 'add_investment_rounds'},
+    {'stage': 'adjust_costs', 'reduction_factor': 0.5},
+    {'stage': 'normalize_user_effects'},
+    {'stage': 'adjust_trust_growth'},
+]
+
+# ---------------------------------------------------------------------------
+# 파이프라인 실행
+# ---------------------------------------------------------------------------
+
+def compile_pipeline(config: List[Dict]) -> List[Tuple[str, List[Tuple[Stage, Dict]]]]:
+    """설정 → 실행 블록 목록
+
+    연속된 선택지 스테이지는 하나의 'choice' 블록으로 합쳐져 선택지를 한 번만 순회합니다.
+    알 수 없는 스테이지/파라미터는 ValueError.
+    """
+    blocks: List[Tuple[str, List[Tuple[Stage, Dict]]]] = []
+    for entry in config:
+        name = entry.get('stage')
+        if name not in STAGES:
+            raise ValueError(f"알 수 없는 스테이지: {name} (사용 가능: {', '.join(STAGES)})")
+        registered = STAGES[name]
+        overrides = {k: v for k, v in entry.items() if k != 'stage'}
+        unknown = set(overrides) - set(registered.defaults)
+        if unknown:
+            raise ValueError(f"{name}: 알 수 없는 파라미터 {', '.join(sorted(unknown))}")
+        params = dict(registered.defaults, **overrides)
+        if registered.kind == 'choice' and blocks and blocks[-1][0] == 'choice':
+            blocks[-1][1].append((registered, params))
+        else:
+            blocks.append((registered.kind, [(registered, params)]))
+    return blocks
+
+def _apply_choice_block(turn_data: Dict, stages: List[Tuple[Stage, Dict]]) -> Dict:
+    """선택지 스테이지 묶음을 한 번의 순회로 적용 (바뀐 선택지만 복사)"""
+    turn = turn_data['turn']
+    choices = turn_data['choices']
+    new_choices = None
+    for index, choice in enumerate(choices):
+        original = choice['effects']
+        effects = original
+        for registered, params in stages:
+            changes = registered.fn(turn, choice, effects, **params)
+            if changes:
+                if effects is original:
+                    effects = dict(original)
+                effects.update(changes)
+        if effects is not original and effects != original:
+            if new_choices is None:
+                new_choices = list(choices)
+            new_choices[index] = dict(choice, effects=effects)
+    if new_choices is None:
+        return turn_data
+    return dict(turn_data, choices=new_choices)
+
+def run_pipeline(data: List[Dict], config: List[Dict]) -> List[Dict]:
+    """파이프라인 실행 — 입력은 수정하지 않고, 바뀌지 않은 턴/선택지 객체는 그대로 공유"""
+    blocks = compile_pipeline(config)
+    result = []
+    for turn_data in data:
+        current = turn_data
+        for kind, stages in blocks:
+            if kind == 'choice':
+                current = _apply_choice_block(current, stages)
+            else:
+                for registered, params in stages:
+                    current = registered.fn(current, **params) or current
+        result.append(current)
+    return result
+
+def diff_data(before: List[Dict], after: List[Dict]) -> List[Dict]:
+    """변경 내역 (copy-on-write 이므로 객체가 달라진 턴/선택지만 비교)"""
+    changes = []
+    for old_turn, new_turn in zip(before, after):
+        if old_turn is new_turn:
+            continue
+        turn = new_turn['turn']
+        if old_turn.get('event') != new_turn.get('event'):
+            changes.append({'turn': turn, 'field': 'event'})
+        old_choices = {str(c['id']): c for c in old_turn['choices']}
+        for choice in new_turn['choices']:
+            old = old_choices.get(str(choice['id']))
+            if old is None:
+                changes.append({'turn': turn, 'choice_id': choice['id'], 'field': 'added',
+                                'new': choice['effects']})
+                continue
+            if old is choice:
+                continue
+            for field in sorted(set(old['effects']) | set(choice['effects'])):
+                a, b = old['effects'].get(field), choice['effects'].get(field)
+                if a != b:
+                    changes.append({'turn': turn, 'choice_id': choice['id'], 'field': field,
+                                    'old': a, 'new': b})
+    return changes
+
+def load_config(path: Optional[str]) -> Dict:
+    """설정 파일 로드 (없으면 기본 파이프라인)
+
+    형식: {"input": ..., "output": ..., "stages": [{"stage": 이름, 파라미터...}, ...]}
+    원본/결과는 스냅샷 저장소(snapshot_store.py)에 저장되며, 전체 복사본이 필요하면 "backup": 경로
+    입력과 결과는 validate_choices.py 로 검증하고 오류가 있으면 중단 ("validate": false 로 끔)
+    """
+    config = {'input': '../game_choices_db.json',
+              'output': '../game_choices_db_rebalanced.json',
+              'snapshot': True,
+              'validate': True,
+              'stages': [dict(entry) for entry in DEFAULT_PIPELINE]}
+    if path:
+        with open(path, 'r', encoding='utf-8') as f:
+            config.update(json.load(f))
+    return config
+
+def apply_overrides(stages: List[Dict], overrides: List[str]):
+    """'stage.param=value' 형식의 덮어쓰기 (value 는 JSON, 실패하면 문자열)"""
+    for override in overrides:
+        key, _, raw = override.partition('=')
+        name, _, param = key.partition('.')
+        try:
+            value = json.loads(raw)
+        except ValueError:
+            value = raw
+        targets = [entry for entry in stages if entry['stage'] == name]
+        if not targets:
+            raise ValueError(f'파이프라인에 없는 스테이지: {name}')
+        for entry in targets:
+            entry[param] = value
+
+def parse_args():
+    parser = argparse.ArgumentParser(description='AWS CTO Game 밸런스 재조정 파이프라인')
+    parser.add_argument('--config', help='파이프라인 설정 JSON (없으면 기본 파이프라인)')
+    parser.add_argument('--input', help='입력 데이터 (설정보다 우선)')
+    parser.add_argument('--output', help='출력 경로 (설정보다 우선)')
+    parser.add_argument('--set', action='append', default=[], metavar='STAGE.PARAM=VALUE',
+                        help='스테이지 파라미터 덮어쓰기 (여러 번 가능)')
+    parser.add_argument('--dry-run', action='store_true', help='저장하지 않고 변경 내역만 출력')
+    parser.add_argument('--diff-output', help='변경 내역 JSON 저장 경로')
+    parser.add_argument('--list-stages', action='store_true', help='등록된 스테이지 목록')
+    return parser.parse_args()
 
 def main():
+    args = parse_args()
+
     print("🎮 AWS CTO Game - Rebalancing Script")
     print("=" * 60)
 
+    if args.list_stages:
+        for registered in STAGES.values():
+            params = ', '.join(f'{k}={v!r}' for k, v in registered.defaults.items()
+                               if not isinstance(v, list) or len(v) <= 4)
+            print(f"  - {registered.name} [{registered.kind}] {registered.description}")
+            if params:
+                print(f"      {params}")
+        return
+
+    config = load_config(args.config)
+    apply_overrides(config['stages'], args.set)
+    input_path = args.input or config['input']
+    output_path = args.output or config['output']
+
     # 1. 원본 데이터 로드
-    print("\n📂 Loading original game data...")
-    data = load_game_data('../game_choices_db.json')
+    print(f"\n📂 Loading {input_path}...")
+    data = load_game_data(input_path)
     print(f"   Loaded {len(data)} turns with {sum(len(t['choices']) for t in data)} choices")
 
-    # 2. 백업 생성
-    print("\n💾 Creating backup...")
-    save_game_data('../game_choices_db_backup.json', data)
-    print("   Backup saved to: game_choices_db_backup.json")
-
-    # 3. 투자 라운드 추가
-    print("\n💼 Adding investment rounds...")
-    data = add_investment_rounds(data)
-    print(f"   Added investment rounds at turns 6, 12, 18")
-    print(f"   Total choices now: {sum(len(t['choices']) for t in data)}")
-
-    # 4. 비용 조정
-    print("\n💰 Adjusting costs...")
-    data = adjust_costs(data, reduction_factor=0.5)
-    print("   Reduced costs by 50% (70% for turns 11-20)")
-
-    # 5. 유저 효과 표준화
-    print("\n👥 Normalizing user effects...")
-    data = normalize_user_effects(data)
-    print("   Capped max users at 150,000, removed negative values")
-
-    # 6. 신뢰도 조정
-    print("\n📊 Adjusting trust growth...")
-    data = adjust_trust_growth(data)
-    print("   Reduced trust growth by 60%")
-
-    # 7. 저장
+    # 2. 무결성 검증 (첫 단계 — 깨진 데이터는 파이프라인과 시딩까지 가지 않음)
+    if config.get('validate'):
+        print("\n🔍 Validating input...")
+        report = validate(data)
+        print_report(report, label=input_path)
+        if report['errors']:
+            raise SystemExit(f"❌ 입력 데이터 검증 실패 ({len(report['errors'])}건) — 파이프라인을 실행하지 않습니다")
+
+    # 3. 파이프라인 실행
+    blocks = compile_pipeline(config['stages'])
+    print("\n🔧 Pipeline:")
+    for kind, stages in blocks:
+        names = ' + '.join(registered.name for registered, _ in stages)
+        print(f"   [{kind}] {names}")
+    result = run_pipeline(data, config['stages'])
+    changes = diff_data(data, result)
+    touched = len({(c['turn'], c.get('choice_id')) for c in changes if 'choice_id' in c})
+    print(f"   {len(changes)} changes across {touched} choices")
+    print(f"   Total choices now: {sum(len(t['choices']) for t in result)}")
+    result_report = validate(result) if config.get('validate') else None
+    if result_report is not None:
+        print_report(result_report, label='rebalanced')
+
+    if args.diff_output:
+        with open(args.diff_output, 'w', encoding='utf-8') as f:
+            json.dump(changes, f, ensure_ascii=False, indent=2)
+        print(f"   Diff saved to: {args.diff_output}")
+
+    if args.dry_run:
+        print("\n📝 Dry run — changes:")
+        for change in changes:
+            if change['field'] == 'event':
+                print(f"   턴 {change['turn']}: event text replaced")
+            elif change['field'] == 'added':
+                print(f"   턴 {change['turn']} #{change['choice_id']}: added {change['new']}")
+            else:
+                print(f"   턴 {change['turn']} #{change['choice_id']} {change['field']}: "
+                      f"{change['old']} → {change['new']}")
+        return
+
+    if result_report is not None and result_report['errors']:
+        raise SystemExit(f"❌ 재조정 결과 검증 실패 ({len(result_report['errors'])}건) — 저장하지 않습니다")
+
+    # 4. 백업 생성 (스냅샷 저장소는 바뀐 선택지만 새로 저장)
+    if config.get('snapshot'):
+        store = SnapshotStore()
+        before, _ = store.save(data, label='rebalance:input', source=input_path)
+        after, written = store.save(result, label='rebalance:output', source=output_path)
+        print("\n💾 Snapshot saved:")
+        print(f"   {before['id']} (input) → {after['id']} (output), +{written} bytes")
+        print(f"   Diff: python3 snapshot_store.py diff {before['id']} {after['id']}")
+    if config.get('backup'):
+        print("\n💾 Creating backup...")
+        save_game_data(config['backup'], data)
+        print(f"   Backup saved to: {config['backup']}")
+
+    # 5. 저장
     print("\n💾 Saving rebalanced data...")
-    save_game_data('../game_choices_db_rebalanced.json', data)
-    print("   Saved to: game_choices_db_rebalanced.json")
+    save_game_data(output_path, result)
+    print(f"   Saved to: {output_path}")
 
     print("\n✅ Rebalancing complete!")
     print("\nNext steps:")
-    print("1. Review the changes in game_choices_db_rebalanced.json")
+    print(f"1. Review the changes in {output_path}")
     print("2. Run balance analysis: python3 scripts/analyze_balance.py")
-    print("3. If satisfied, replace: mv game_choices_db_rebalanced.json game_choices_db.json")
+    print(f"3. If satisfied, replace: mv {output_path} {input_path}")
     print("4. Re-seed database: npm run seed")
 
 if __name__ == '__main__':
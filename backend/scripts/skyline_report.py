@@ -0,0 +1,423 @@
+#!/usr/bin/env python3
+"""
+AWS CTO Game - Pareto Skyline Report
+선택지/전체 경로의 Pareto 지배 관계 — "항상 X 를 고르면 된다" 문제 찾기
+
+- 선택지: 같은 턴에서 다른 선택지보다 모든 축(유저, 현금, 신뢰도, 얻는 인프라 용량)이 같거나 나쁘고
+  하나 이상 나쁜 선택지를 찾습니다. 난이도 배율과 스태프 배율은 모두 단조 증가 함수라 원래 효과로
+  판단한 지배 관계는 난이도와 무관합니다 (floor 반올림으로 동점이 되는 경우 제외).
+  지배하는 선택지와 next_turn 이 다르거나 지배당하는 쪽만 채용 효과가 있으면 caveats 로 표시합니다.
+  턴의 스카이라인(지배당하지 않는 선택지)이 하나뿐이면 그 턴은 "항상 X" 턴입니다.
+- 경로: 시뮬레이션한 판(random 정책 + 탐욕 전략 6개, 또는 trajectory_store 기록)의 최종
+  (유저, 현금, 신뢰도)로 스카이라인을 구하고, 지배당하는 탐욕 전략과
+  스카이라인 경로에서 유독 자주 고르는 선택지(그 턴에 도달한 판 중 선택 비율 비교)를 보고합니다.
+
+스카이라인은 SFS/LESS(Sort-Filter-Skyline) 방식으로 계산합니다. 축별 순위 합 내림차순으로 정렬하면
+앞의 점만 뒤의 점을 지배할 수 있으므로, 각 블록을 지금까지의 스카이라인과만 (NumPy 로 한꺼번에) 비교합니다.
+비교 횟수는 O(n × 스카이라인 크기) 라서 쌍별 O(n²) 비교 없이 수백만 점도 처리합니다.
+
+사용 예:
+    python3 skyline_report.py
+    python3 skyline_report.py --data /tmp/synthetic_large.json --games 100000 --verify
+    python3 skyline_report.py --trajectories .cache/trajectories       # trajectory_store 기록 사용
+"""
+
+import argparse
+import array
+import json
+import random
+import time
+from collections import Counter
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from game_engine import (
+    DIFFICULTIES, GAME_CONSTANTS, STRATEGIES, GameStatus, Rules,
+    calculate_max_capacity, compile_turns, greedy_policy, load_game_data, play, random_policy,
+)
+from profiler import PROFILER, add_arguments as add_profile_arguments, enable_from_args, finish_from_args
+from trajectory_store import DEFAULT_STORE as TRAJECTORY_STORE, OUTCOMES, TrajectoryStore
+
+CHOICE_AXES = ('users', 'cash', 'trust', 'capacity')
+PATH_AXES = ('users', 'cash', 'trust')
+
+# 스카이라인 경로에서 "유독 자주 고르는" 선택지 기준
+FAVORED_SHARE = 0.8   # 그 턴에 도달한 스카이라인 경로 중 이 비율 이상이 고름
+FAVORED_LIFT = 1.5    # 전체 경로의 선택 비율보다 이 배수 이상
+FAVORED_MIN_PATHS = 10   # 그 턴에 도달한 스카이라인 경로가 이보다 적으면 판단하지 않음
+
+# ---------------------------------------------------------------------------
+# 스카이라인
+# ---------------------------------------------------------------------------
+
+def _first_dominator(points: np.ndarray, candidates: np.ndarray, width: int = 2048) -> np.ndarray:
+    """각 점을 지배하는 첫 후보 번호 (없으면 -1)
+
+    모든 축이 >= 이면 "한 축 이상 >" 은 "축 합이 더 큼" 과 같으므로 축별 >= 비교와 합 비교 한 번으로 판정합니다.
+    """
+    result = np.full(len(points), -1, dtype=np.int64)
+    point_sums = points.sum(axis=1)
+    candidate_sums = candidates.sum(axis=1)
+    for start in range(0, len(candidates), width):
+        open_rows = np.flatnonzero(result < 0)
+        if not len(open_rows):
+            break
+        block = candidates[start:start + width]
+        rows = points[open_rows]
+        dominated = candidate_sums[None, start:start + width] > point_sums[open_rows, None]
+        for axis in range(points.shape[1]):
+            dominated &= block[None, :, axis] >= rows[:, axis, None]
+        found = dominated.any(axis=1)
+        result[open_rows[found]] = start + dominated[found].argmax(axis=1)
+    return result
+
+def _rank_sum(points: np.ndarray) -> np.ndarray:
+    """축별 순위(같은 값은 같은 순위)의 합 — 지배하는 점은 항상 합이 더 큼"""
+    total = np.zeros(len(points), dtype=np.int64)
+    for axis in range(points.shape[1]):
+        total += np.unique(points[:, axis], return_inverse=True)[1].reshape(-1)
+    return total
+
+def skyline(points, block: int = 512, window: int = 256, rows: int = 32768) -> np.ndarray:
+    """SFS 스카이라인 — 점마다 그 점을 지배하는 스카이라인 점 번호 (스카이라인이면 -1)
+
+    points 는 (n, 축 수) 정수 배열이며 모든 축은 클수록 좋습니다.
+    LESS 처럼 먼저 순위 합이 큰 window 개 점의 스카이라인으로 전체를 한 번 걸러
+    (독립/양의 상관 데이터에서는 대부분 여기서 제거됨) 남은 점만 블록 단위로 비교합니다.
+    """
+    points = np.asarray(points, dtype=np.int64)
+    dominator = np.full(len(points), -1, dtype=np.int64)
+    if not len(points):
+        return dominator
+    # 순위 합 내림차순 — 지배하는 점은 항상 앞에 오므로 스카이라인은 추가만 됨
+    order = np.argsort(-_rank_sum(points), kind='stable')
+    sky = np.empty((0, points.shape[1]), dtype=np.int64)
+    sky_ids = np.empty(0, dtype=np.int64)
+    position = 0
+    while position < len(order):
+        size = window if position == 0 else block
+        ids = order[position:position + size]
+        position += size
+        batch = points[ids]
+        if len(sky):
+            hit = _first_dominator(batch, sky)
+            dominated = hit >= 0
+            dominator[ids[dominated]] = sky_ids[hit[dominated]]
+            ids, batch = ids[~dominated], batch[~dominated]
+            if not len(ids):
+                continue
+        # 블록 안: 블록의 다른 점에 지배당하지 않으면 스카이라인 (지배 관계는 추이적이라
+        # 지배당한 점에는 항상 지배당하지 않는 지배자가 있음)
+        keep = _first_dominator(batch, batch) < 0
+        if not keep.all():
+            dominator[ids[~keep]] = ids[keep][_first_dominator(batch[~keep], batch[keep])]
+        sky = np.concatenate((sky, batch[keep]))
+        sky_ids = np.concatenate((sky_ids, ids[keep]))
+        if size == window:
+            # 첫 창의 스카이라인으로 나머지 전체를 한꺼번에 거름
+            rest = order[position:]
+            survivors = []
+            for start in range(0, len(rest), rows):
+                part = rest[start:start + rows]
+                hit = _first_dominator(points[part], sky)
+                dominated = hit >= 0
+                dominator[part[dominated]] = sky_ids[hit[dominated]]
+                survivors.append(part[~dominated])
+            order = np.concatenate([order[:position]] + survivors)
+    return dominator
+
+def skyline_bruteforce(points) -> np.ndarray:
+    """쌍별 비교 기준 구현 (--verify 용) — 지배당하면 True"""
+    points = np.asarray(points, dtype=np.int64)
+    ge = (points[None, :, :] >= points[:, None, :]).all(axis=2)
+    gt = (points[None, :, :] > points[:, None, :]).any(axis=2)
+    return (ge & gt).any(axis=1)
+
+def _check(points: np.ndarray, dominator: np.ndarray) -> int:
+    """skyline 결과와 쌍별 비교 결과가 다른 점 수 (지배자가 실제로 지배하는지도 확인)"""
+    expected = skyline_bruteforce(points)
+    mismatches = int(((dominator >= 0) != expected).sum())
+    rows = np.flatnonzero(dominator >= 0)
+    if len(rows):
+        a, b = points[dominator[rows]], points[rows]
+        mismatches += int((~((a >= b).all(axis=1) & (a > b).any(axis=1))).sum())
+    return mismatches
+
+# ---------------------------------------------------------------------------
+# 선택지
+# ---------------------------------------------------------------------------
+
+def choice_vector(choice) -> List[int]:
+    """(유저, 현금, 신뢰도, 얻는 인프라 용량) — 용량은 이미 가진 인프라와 무관한 이 선택지 인프라의 합"""
+    capacity = calculate_max_capacity(choice.infra, False) - GAME_CONSTANTS['BASE_CAPACITY']
+    return [choice.users, choice.cash, choice.trust, capacity]
+
+def _hires(choice) -> bool:
+    return choice.hires_developer or choice.hires_designer or choice.hires_planner
+
+def analyze_choices(turns: Dict, verify: bool = False) -> Dict:
+    """턴별 선택지 스카이라인 → 지배당하는 선택지 목록과 "항상 X" 턴"""
+    dominated, always, mismatches = [], [], 0
+    total = 0
+    for turn in sorted(turns):
+        choices = turns[turn]
+        total += len(choices)
+        if len(choices) < 2:
+            continue
+        points = np.array([choice_vector(c) for c in choices], dtype=np.int64)
+        with PROFILER.stage('skyline:choices'):
+            dominator = skyline(points)
+        if verify:
+            mismatches += _check(points, dominator)
+        for i in np.flatnonzero(dominator >= 0):
+            loser, winner = choices[i], choices[dominator[i]]
+            caveats = []
+            if loser.next_turn != winner.next_turn:
+                caveats.append('next_turn')
+            if _hires(loser) and not _hires(winner):
+                caveats.append('hires_staff')
+            dominated.append({
+                'turn': turn, 'choice': int(loser.id), 'dominated_by': int(winner.id),
+                'effects': dict(zip(CHOICE_AXES, points[i].tolist())),
+                'dominator_effects': dict(zip(CHOICE_AXES, points[dominator[i]].tolist())),
+                'caveats': caveats,
+            })
+        front = np.flatnonzero(dominator < 0)
+        if len(front) == 1:
+            always.append({'turn': turn, 'choice': int(choices[front[0]].id), 'choices': len(choices)})
+    result = {'choices': total, 'turns': len(turns), 'dominated': dominated, 'always_pick': always}
+    if verify:
+        result['verify_mismatches'] = mismatches
+    return result
+
+# ---------------------------------------------------------------------------
+# 경로
+# ---------------------------------------------------------------------------
+
+class PathSet:
+    """판 묶음 — 최종 값 열 + 판별 (턴, 선택지) 스텝 (CSR)"""
+
+    def __init__(self, finals: Dict[str, np.ndarray], outcome: Sequence[str], steps: np.ndarray,
+                 turn: np.ndarray, choice: np.ndarray, labels: Optional[List[Optional[str]]] = None):
+        self.finals = finals
+        self.outcome = list(outcome)
+        self.steps = np.asarray(steps, dtype=np.int64)
+        self.turn = np.asarray(turn, dtype=np.int64)
+        self.choice = np.asarray(choice, dtype=np.int64)
+        self.labels = labels or [None] * len(self.outcome)
+
+    def __len__(self) -> int:
+        return len(self.outcome)
+
+    def points(self) -> np.ndarray:
+        return np.stack([self.finals[axis] for axis in PATH_AXES], axis=1).astype(np.int64)
+
+    def owners(self) -> np.ndarray:
+        """스텝별 판 번호"""
+        return np.repeat(np.arange(len(self)), self.steps)
+
+def simulate_paths(turns: Dict, difficulty: str, games: int, seed: int = 0, max_steps: int = 200) -> PathSet:
+    """탐욕 전략 6개 + random 정책 games 판"""
+    rules = Rules(difficulty)
+    rng = random.Random(seed)
+    policies = [(strategy, greedy_policy(strategy)) for strategy in STRATEGIES]
+    policies += [(None, random_policy(rng))] * games
+    finals = {axis: np.empty(len(policies), dtype=np.int64) for axis in PATH_AXES}
+    outcome, labels = [], []
+    steps = np.empty(len(policies), dtype=np.int64)
+    turn, choice = array.array('q'), array.array('q')
+
+    def record(state, picked):
+        turn.append(picked.turn)
+        choice.append(int(picked.id))
+
+    with PROFILER.stage('simulate'), PROFILER.stage(difficulty):
+        for g, (label, policy) in enumerate(policies):
+            before = len(turn)
+            final = play(turns, rules, policy, max_steps=max_steps, on_step=record)
+            finals['users'][g], finals['cash'][g], finals['trust'][g] = final.users, final.cash, final.trust
+            steps[g] = len(turn) - before
+            outcome.append(final.status)
+            labels.append(label)
+    return PathSet(finals, outcome, steps, np.frombuffer(turn, dtype=np.int64),
+                   np.frombuffer(choice, dtype=np.int64), labels)
+
+def stored_paths(store_path: str) -> Dict[str, PathSet]:
+    """trajectory_store 기록을 난이도별 PathSet 으로"""
+    store = TrajectoryStore(store_path)
+    parts: Dict[str, List] = {}
+    for index in range(len(store.chunks)):
+        chunk = store.chunk(index)
+        difficulty = chunk.game('difficulty')
+        owners = np.repeat(np.arange(chunk.games), chunk.game('steps'))
+        for code in np.unique(difficulty):
+            games = difficulty == code
+            rows = games[owners]
+            parts.setdefault(DIFFICULTIES[code], []).append((
+                {axis: chunk.game(axis)[games].astype(np.int64) for axis in PATH_AXES},
+                [OUTCOMES[o] for o in chunk.game('outcome')[games]],
+                chunk.game('steps')[games], chunk.step('turn')[rows], chunk.step('choice')[rows],
+            ))
+    return {difficulty: PathSet({axis: np.concatenate([p[0][axis] for p in chunks]) for axis in PATH_AXES},
+                                [o for p in chunks for o in p[1]],
+                                np.concatenate([p[2] for p in chunks]),
+                                np.concatenate([p[3] for p in chunks]),
+                                np.concatenate([p[4] for p in chunks]))
+            for difficulty, chunks in parts.items()}
+
+def _pick_shares(paths: PathSet, selected: np.ndarray, choice_turn: Dict[int, int]) -> Dict[int, Tuple[float, int]]:
+    """선택지별 (고른 판 수 / 그 턴에 도달한 판 수, 도달한 판 수) — selected 판만"""
+    owners = paths.owners()
+    rows = selected[owners]
+    # 같은 판에서 같은 턴/선택지를 여러 번 지나도 한 번만 셈
+    picked = np.unique(np.stack((owners[rows], paths.choice[rows]), axis=1), axis=0)
+    reached = np.unique(np.stack((owners[rows], paths.turn[rows]), axis=1), axis=0)
+    picks = Counter(picked[:, 1].tolist())
+    reach = Counter(reached[:, 1].tolist())
+    return {choice: (n / reach[choice_turn[choice]], reach[choice_turn[choice]]) for choice, n in picks.items()
+            if choice in choice_turn and reach[choice_turn[choice]]}
+
+def analyze_paths(paths: PathSet, choice_turn: Dict[int, int], verify: bool = False) -> Dict:
+    """최종 (유저, 현금, 신뢰도) 스카이라인 → 지배당하는 전략과 스카이라인이 선호하는 선택지
+
+    진행 중(PLAYING)으로 끝난 판은 리더보드에 제출할 수 없으므로 스카이라인에서 제외합니다.
+    """
+    points = paths.points()
+    finished = np.array([outcome != GameStatus.PLAYING for outcome in paths.outcome], dtype=bool)
+    candidates = np.flatnonzero(finished)
+    started = time.perf_counter()
+    with PROFILER.stage('skyline:paths'):
+        found = skyline(points[candidates])
+    elapsed = time.perf_counter() - started
+    dominator = np.full(len(paths), -1, dtype=np.int64)
+    dominator[candidates] = np.where(found >= 0, candidates[np.maximum(found, 0)], -1)
+    front = finished & (dominator < 0)
+    result = {
+        'paths': len(candidates),
+        'unfinished': len(paths) - len(candidates),
+        'skyline': int(front.sum()),
+        'dominated_share': float(1 - front.sum() / len(candidates)) if len(candidates) else 0.0,
+        'skyline_seconds': elapsed,
+        'skyline_outcomes': dict(Counter(o for o, keep in zip(paths.outcome, front) if keep).most_common()),
+        'strategies': {},
+        'favored_choices': [],
+    }
+    for g, label in enumerate(paths.labels):
+        if label is None:
+            continue
+        entry = {'final': dict(zip(PATH_AXES, points[g].tolist())), 'outcome': paths.outcome[g],
+                 'dominated': bool(dominator[g] >= 0) if finished[g] else None}
+        if dominator[g] >= 0:
+            winner = dominator[g]
+            entry['dominated_by'] = {'path': int(winner), 'label': paths.labels[winner],
+                                     'final': dict(zip(PATH_AXES, points[winner].tolist())),
+                                     'outcome': paths.outcome[winner]}
+        result['strategies'][label] = entry
+
+    if front.any() and len(paths.choice):
+        with PROFILER.stage('favored'):
+            on_front = _pick_shares(paths, front, choice_turn)
+            overall = _pick_shares(paths, finished, choice_turn)
+        for choice, (share, reach) in on_front.items():
+            base = overall[choice][0]
+            if reach >= FAVORED_MIN_PATHS and share >= FAVORED_SHARE and share / base >= FAVORED_LIFT:
+                result['favored_choices'].append({'turn': choice_turn[choice], 'choice': choice,
+                                                  'skyline_share': share, 'skyline_reached': reach,
+                                                  'overall_share': base, 'lift': share / base})
+        result['favored_choices'].sort(key=lambda e: (e['turn'], -e['lift']))
+
+    if verify:
+        sample = np.random.default_rng(0).choice(candidates, min(len(candidates), 3000), replace=False)
+        result['verify_mismatches'] = _check(points[sample], skyline(points[sample]))
+    return result
+
+# ---------------------------------------------------------------------------
+# CLI
+# ---------------------------------------------------------------------------
+
+def parse_args():
+    parser = argparse.ArgumentParser(description='AWS CTO Game 선택지/경로 Pareto 스카이라인 리포트')
+    parser.add_argument('--data', default='../game_choices_db.json', help='게임 데이터 JSON 경로')
+    parser.add_argument('--difficulties', nargs='+', default=list(DIFFICULTIES), choices=DIFFICULTIES)
+    parser.add_argument('--games', type=int, default=20000, help='난이도별 random 정책 시뮬레이션 게임 수')
+    parser.add_argument('--trajectories', nargs='?', const=TRAJECTORY_STORE,
+                        help='시뮬레이션 대신 trajectory_store 기록 사용 (저장소 경로, 값 생략 시 기본 위치)')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--limit', type=int, default=20, help='출력할 항목 수')
+    parser.add_argument('--verify', action='store_true', help='스카이라인 결과를 쌍별 비교와 대조')
+    parser.add_argument('--output', default='../skyline_report.json', help='리포트 저장 경로')
+    add_profile_arguments(parser)
+    return parser.parse_args()
+
+def _format_effects(effects: Dict) -> str:
+    return (f"유저 {effects['users']:+,} 현금 {effects['cash']:+,} "
+            f"신뢰도 {effects['trust']:+} 용량 {effects['capacity']:+,}")
+
+def main():
+    args = parse_args()
+    enable_from_args(args)
+
+    print("🎮 AWS CTO Game - Pareto Skyline Report")
+    print("=" * 60)
+
+    turns = compile_turns(load_game_data(args.data))
+    choice_turn = {int(c.id): turn for turn, choices in turns.items() for c in choices}
+    report = {'settings': {'data': args.data, 'games': args.games, 'trajectories': args.trajectories,
+                           'seed': args.seed},
+              'choices': None, 'paths': {}}
+
+    started = time.perf_counter()
+    choices = report['choices'] = analyze_choices(turns, verify=args.verify)
+    print(f"\n📋 선택지 {choices['choices']:,}개 / 턴 {choices['turns']:,}개 "
+          f"({time.perf_counter() - started:.2f}초): 지배당하는 선택지 {len(choices['dominated']):,}개, "
+          f"\"항상 X\" 턴 {len(choices['always_pick']):,}개")
+    for entry in choices['dominated'][:args.limit]:
+        note = f" ⚠️ {', '.join(entry['caveats'])} 다름" if entry['caveats'] else ""
+        print(f"   턴 {entry['turn']:>3}: {entry['choice']} ({_format_effects(entry['effects'])})"
+              f" ⊂ {entry['dominated_by']} ({_format_effects(entry['dominator_effects'])}){note}")
+    for entry in choices['always_pick'][:args.limit]:
+        print(f"   🎯 턴 {entry['turn']:>3}: 선택지 {entry['choice']} 가 나머지 {entry['choices'] - 1}개를 모두 지배")
+    if args.verify:
+        print(f"   🔍 쌍별 비교와 불일치 {choices['verify_mismatches']}건")
+
+    if args.trajectories:
+        print(f"\n📦 경로: {args.trajectories} 기록 사용")
+        path_sets = stored_paths(args.trajectories)
+    else:
+        print(f"\n🎲 경로: 난이도별 random {args.games:,}판 + 탐욕 전략 {len(STRATEGIES)}개 시뮬레이션")
+        path_sets = {difficulty: simulate_paths(turns, difficulty, args.games, seed=args.seed)
+                     for difficulty in args.difficulties}
+
+    for difficulty in args.difficulties:
+        paths = path_sets.get(difficulty)
+        if paths is None or not len(paths):
+            continue
+        result = report['paths'][difficulty] = analyze_paths(paths, choice_turn, verify=args.verify)
+        print(f"\n📊 {difficulty}: 끝난 경로 {result['paths']:,}개 중 스카이라인 {result['skyline']:,}개 "
+              f"(지배당함 {result['dominated_share'] * 100:.1f}%, {result['skyline_seconds'] * 1000:.0f}ms)")
+        print("   스카이라인 결과: " + ', '.join(f"{o} {n}" for o, n in result['skyline_outcomes'].items()))
+        for label, entry in result['strategies'].items():
+            if entry['dominated'] is None:
+                print(f"   ⏸️  {label}: 진행 중으로 끝남 (제외)")
+            elif entry['dominated']:
+                winner = entry['dominated_by']
+                name = f" ({winner['label']})" if winner['label'] else ''
+                print(f"   ❌ {label}: {entry['outcome']} {entry['final']} ⊂ "
+                      f"경로 #{winner['path']}{name} {winner['outcome']} {winner['final']}")
+            else:
+                print(f"   ✅ {label}: 스카이라인 ({entry['outcome']})")
+        for entry in result['favored_choices'][:args.limit]:
+            print(f"   🎯 턴 {entry['turn']:>3} 선택지 {entry['choice']}: 스카이라인 경로 "
+                  f"{entry['skyline_share'] * 100:.0f}% vs 전체 {entry['overall_share'] * 100:.0f}% "
+                  f"(×{entry['lift']:.1f})")
+        if args.verify:
+            print(f"   🔍 쌍별 비교와 불일치 {result['verify_mismatches']}건 (표본 최대 3,000개)")
+
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    print(f"\n✅ 완료! 결과가 {args.output}에 저장되었습니다.")
+    finish_from_args(args)
+
+if __name__ == '__main__':
+    main()
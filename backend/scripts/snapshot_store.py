@@ -0,0 +1,549 @@
+#!/usr/bin/env python3
+"""
+AWS CTO Game - Choice Snapshot Store
+선택지 DB 버전을 내용 주소(content-addressed) 방식으로 보관하고 구조적으로 비교
+
+backend/ 에 쌓인 game_choices_db*.json, backup/choices_backup_*.json, final_backup_*.json 같은
+거의 같은 전체 복사본 대신
+- 선택지(와 턴 헤더) 레코드 하나하나를 내용 해시로 팩 파일(objects.pack)에 한 번만 저장하고
+- 버전은 (턴 → 선택지 id → 해시) 목록인 작은 매니페스트로 저장합니다.
+같은 내용을 다시 저장하면 같은 버전 id 가 나오고 새로 쓰이는 객체가 없으므로
+실행할 때마다 디스크가 늘어나지 않습니다.
+
+diff 는 매니페스트의 해시만 비교해 바뀐 턴/선택지의 객체만 읽으므로 변경량에 비례하고,
+선택지 id 기준으로 effects / text / next_turn(재연결) / 턴 이동 / 추가 / 삭제를 보고합니다.
+두 가지 레이아웃을 모두 지원합니다.
+- turns: [{"turn": 1, "event": ..., "choices": [{"id": 1, "next_turn": 2, ...}]}]  (game_choices_db.json)
+- flat:  [{"choiceId": 1, "turnNumber": 1, "nextTurn": 2, ...}]                   (backup/choices_backup_*.json)
+
+사용 예:
+    python3 snapshot_store.py save ../game_choices_db*.json ../backup/*.json
+    python3 snapshot_store.py list
+    python3 snapshot_store.py diff game_choices_db_original.json game_choices_db.json
+    python3 snapshot_store.py diff 3f2a9c ../game_choices_db.json      # 버전 id 접두사 / 레이블 / 파일
+    python3 snapshot_store.py restore 3f2a9c --output ../game_choices_db.json
+"""
+
+import argparse
+import glob
+import hashlib
+import json
+import os
+import time
+from collections import Counter
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from game_engine import load_game_data
+
+DEFAULT_STORE = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '.snapshots')
+
+# flat(DB 행) 레이아웃 필드 → turns 레이아웃 필드 (비교는 turns 이름 기준)
+FLAT_FIELDS = {'choiceId': 'id', 'turnNumber': 'turn', 'nextTurn': 'next_turn'}
+
+def save_game_data(filepath: str, data):
+    """게임 데이터 저장"""
+    with open(filepath, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+
+def _encode(record) -> bytes:
+    # 키 순서를 보존해야 복원 결과가 원본과 같으므로 정렬하지 않음
+    return json.dumps(record, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+def _digest(payload: bytes) -> str:
+    return hashlib.sha256(payload).hexdigest()
+
+def _choice_key(value) -> str:
+    """선택지 id 정규화 — 일부 데이터는 id 가 문자열('1123')"""
+    try:
+        return str(int(value))
+    except (TypeError, ValueError):
+        return str(value)
+
+def detect_layout(data) -> str:
+    if not isinstance(data, list) or not data:
+        raise ValueError('선택지 DB 는 비어 있지 않은 JSON 배열이어야 합니다')
+    if 'choices' in data[0]:
+        return 'turns'
+    if 'choiceId' in data[0]:
+        return 'flat'
+    raise ValueError('알 수 없는 레이아웃 (turn/choices 또는 choiceId/turnNumber 형식만 지원)')
+
+def choice_view(record: Dict, layout: str, turn=None) -> Dict:
+    """비교용 선택지 보기 (레이아웃과 무관하게 turns 필드 이름 사용)"""
+    if layout == 'flat':
+        view = {FLAT_FIELDS.get(key, key): value for key, value in record.items()}
+    else:
+        view = dict(record)
+        view['turn'] = turn
+    view['id'] = _choice_key(view.get('id'))
+    return view
+
+class SnapshotStore:
+    """objects.pack (추가 전용) + objects.idx + manifests/<버전 id>.json + refs.json
+
+    객체(선택지/턴 헤더 레코드)는 파일 하나씩이 아니라 한 팩 파일에 이어 붙입니다
+    (수백 개의 작은 파일은 파일 시스템 블록 단위 때문에 실제 내용보다 훨씬 큰 공간을 차지).
+    objects.idx 는 '해시 오프셋 길이' 줄을 추가만 하므로 저장은 새 객체 수에 비례합니다.
+    """
+
+    def __init__(self, root: str = DEFAULT_STORE):
+        self.root = root
+        self.pack_path = os.path.join(root, 'objects.pack')
+        self.index_path = os.path.join(root, 'objects.idx')
+        self.manifests_dir = os.path.join(root, 'manifests')
+        self.refs_path = os.path.join(root, 'refs.json')
+        self._memory: Dict[str, bytes] = {}   # 저장하지 않은 스냅샷(파일 직접 비교)의 객체
+        self._loaded: Dict[str, object] = {}
+        self._pending: Dict[str, bytes] = {}   # 팩에 아직 쓰지 않은 새 객체
+        self.index: Dict[str, Tuple[int, int]] = {}
+        if os.path.exists(self.index_path):
+            with open(self.index_path, 'r', encoding='ascii') as f:
+                for line in f:
+                    digest, offset, length = line.split()
+                    self.index[digest] = (int(offset), int(length))
+        self.refs = {'labels': {}, 'log': []}
+        if os.path.exists(self.refs_path):
+            with open(self.refs_path, 'r', encoding='utf-8') as f:
+                self.refs = json.load(f)
+
+    # -- 객체 ---------------------------------------------------------------
+
+    def _put(self, record, persist: bool) -> Tuple[str, int]:
+        """레코드 등록 → (해시, 새로 쓸 바이트 수)"""
+        payload = _encode(record)
+        digest = _digest(payload)
+        if not persist:
+            self._memory[digest] = payload
+            return digest, 0
+        if digest in self.index or digest in self._pending:
+            return digest, 0
+        self._pending[digest] = payload
+        return digest, len(payload)
+
+    def _flush(self):
+        """대기 중인 새 객체를 팩에 이어 쓰고 색인 줄 추가 (팩을 먼저 써서 색인이 항상 유효)"""
+        if not self._pending:
+            return
+        os.makedirs(self.root, exist_ok=True)
+        lines = []
+        with open(self.pack_path, 'ab') as pack:
+            offset = pack.tell()
+            for digest, payload in self._pending.items():
+                pack.write(payload)
+                self.index[digest] = (offset, len(payload))
+                lines.append(f'{digest} {offset} {len(payload)}\n')
+                offset += len(payload)
+            pack.flush()
+            os.fsync(pack.fileno())
+        with open(self.index_path, 'a', encoding='ascii') as f:
+            f.writelines(lines)
+        self._pending = {}
+
+    def get(self, digest: str):
+        if digest in self._loaded:
+            return self._loaded[digest]
+        payload = self._memory.get(digest) or self._pending.get(digest)
+        if payload is None:
+            offset, length = self.index[digest]
+            with open(self.pack_path, 'rb') as f:
+                f.seek(offset)
+                payload = f.read(length)
+        record = json.loads(payload)
+        self._loaded[digest] = record
+        return record
+
+    # -- 스냅샷 ---------------------------------------------------------------
+
+    def snapshot(self, data, persist: bool = True) -> Tuple[Dict, int]:
+        """데이터 → (매니페스트, 새로 쓴 객체 바이트)"""
+        layout = detect_layout(data)
+        written = 0
+        if layout == 'flat':
+            choices = []
+            for record in data:
+                digest, size = self._put(record, persist)
+                written += size
+                choices.append([_choice_key(record.get('choiceId')), digest])
+            manifest = {'layout': 'flat', 'choices': choices}
+        else:
+            turns = []
+            for turn_data in data:
+                # 턴 헤더는 choices 자리를 None 으로 두어 키 순서를 보존
+                header = {key: (None if key == 'choices' else value) for key, value in turn_data.items()}
+                header_digest, size = self._put(header, persist)
+                written += size
+                choices = []
+                for choice in turn_data['choices']:
+                    digest, size = self._put(choice, persist)
+                    written += size
+                    choices.append([_choice_key(choice.get('id')), digest])
+                entry = {'turn': turn_data.get('turn'), 'header': header_digest, 'choices': choices}
+                # 턴 전체 해시: diff 에서 바뀌지 않은 턴은 선택지 목록을 보지 않고 건너뜀
+                entry['digest'] = _digest(_encode([header_digest, choices]))
+                turns.append(entry)
+            manifest = {'layout': 'turns', 'turns': turns}
+        manifest['id'] = _digest(_encode(manifest))[:16]
+        return manifest, written
+
+    def save(self, data, label: Optional[str] = None, source: Optional[str] = None,
+             source_bytes: int = 0) -> Tuple[Dict, int]:
+        """스냅샷 저장 (같은 내용이면 같은 버전 id, 새 객체 없음)"""
+        manifest, written = self.snapshot(data, persist=True)
+        self._flush()
+        path = os.path.join(self.manifests_dir, manifest['id'] + '.json')
+        if not os.path.exists(path):
+            os.makedirs(self.manifests_dir, exist_ok=True)
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump(manifest, f, ensure_ascii=False, separators=(',', ':'))
+            written += os.path.getsize(path)
+
+        log = self.refs['log']
+        if not any(entry['id'] == manifest['id'] and entry.get('source') == source
+                   and entry.get('label') == label for entry in log):
+            log.append({'id': manifest['id'], 'label': label, 'source': source,
+                        'layout': manifest['layout'], 'choices': _count_choices(manifest),
+                        'source_bytes': source_bytes, 'created': time.strftime('%Y-%m-%dT%H:%M:%S')})
+        if label:
+            self.refs['labels'][label] = manifest['id']
+        self._write_refs()
+        return manifest, written
+
+    def _write_refs(self):
+        os.makedirs(self.root, exist_ok=True)
+        tmp_path = self.refs_path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.refs, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, self.refs_path)
+
+    def manifest(self, version_id: str) -> Dict:
+        with open(os.path.join(self.manifests_dir, version_id + '.json'), 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    def resolve(self, ref: str) -> Dict:
+        """레이블 / 버전 id(접두사) / 파일 경로 → 매니페스트 (파일은 저장하지 않고 메모리에서만)"""
+        if ref in self.refs['labels']:
+            return self.manifest(self.refs['labels'][ref])
+        if os.path.isdir(self.manifests_dir):
+            matches = [name[:-5] for name in os.listdir(self.manifests_dir)
+                       if name.endswith('.json') and name.startswith(ref)]
+            if len(matches) == 1:
+                return self.manifest(matches[0])
+            if len(matches) > 1:
+                raise ValueError(f'버전 id 접두사가 여러 버전과 일치합니다: {ref}')
+        if os.path.exists(ref):
+            return self.snapshot(load_game_data(ref), persist=False)[0]
+        raise ValueError(f'버전/레이블/파일을 찾을 수 없습니다: {ref}')
+
+    def restore(self, manifest: Dict):
+        """매니페스트 → 원래 레이아웃의 데이터
+
+        레코드 키 순서까지 원본과 JSON 으로 같지만 원본 파일의 서식(들여쓰기, 한 줄 배열 등)은
+        보관하지 않으므로, 저장하면 save_game_data(indent=2) 서식이 됩니다.
+        """
+        if manifest['layout'] == 'flat':
+            return [self.get(digest) for _, digest in manifest['choices']]
+        data = []
+        for entry in manifest['turns']:
+            turn_data = dict(self.get(entry['header']))
+            turn_data['choices'] = [self.get(digest) for _, digest in entry['choices']]
+            data.append(turn_data)
+        return data
+
+    # -- 정리 -----------------------------------------------------------------
+
+    def forget(self, ref: str) -> str:
+        """버전을 로그/레이블에서 제거하고 매니페스트 삭제 (객체는 gc 로 정리)"""
+        version_id = self.resolve(ref)['id']
+        self.refs['log'] = [entry for entry in self.refs['log'] if entry['id'] != version_id]
+        self.refs['labels'] = {label: vid for label, vid in self.refs['labels'].items() if vid != version_id}
+        path = os.path.join(self.manifests_dir, version_id + '.json')
+        if os.path.exists(path):
+            os.remove(path)
+        self._write_refs()
+        return version_id
+
+    def gc(self) -> Tuple[int, int]:
+        """어떤 매니페스트도 참조하지 않는 객체를 빼고 팩을 다시 씀 → (삭제 수, 바이트)"""
+        referenced = set()
+        if os.path.isdir(self.manifests_dir):
+            for name in os.listdir(self.manifests_dir):
+                referenced.update(_iter_digests(self.manifest(name[:-5])))
+        garbage = [digest for digest in self.index if digest not in referenced]
+        if not garbage:
+            return 0, 0
+        freed = sum(self.index[digest][1] for digest in garbage)
+        self._pending = {digest: _encode(self.get(digest)) for digest in self.index if digest in referenced}
+        for path in (self.pack_path, self.index_path):
+            os.replace(path, path + '.old')
+        self.index = {}
+        self._flush()
+        for path in (self.pack_path, self.index_path):
+            os.remove(path + '.old')
+        return len(garbage), freed
+
+    def disk_usage(self) -> Tuple[int, int]:
+        """(객체 수, 저장소 전체 바이트)"""
+        total = 0
+        for directory, _, files in os.walk(self.root):
+            for name in files:
+                total += os.path.getsize(os.path.join(directory, name))
+        return len(self.index), total
+
+def _count_choices(manifest: Dict) -> int:
+    if manifest['layout'] == 'flat':
+        return len(manifest['choices'])
+    return sum(len(entry['choices']) for entry in manifest['turns'])
+
+def _iter_digests(manifest: Dict) -> Iterator[str]:
+    if manifest['layout'] == 'flat':
+        for _, digest in manifest['choices']:
+            yield digest
+        return
+    for entry in manifest['turns']:
+        yield entry['header']
+        for _, digest in entry['choices']:
+            yield digest
+
+def _unique_keys(manifest: Dict) -> Dict:
+    """한 버전 안에서 겹치는 선택지 id 를 등장 순서대로 '9003', '9003#2', ... 로 구분한 매니페스트 사본
+
+    일부 데이터(game_choices_db_fixed*.json)는 같은 id 의 선택지가 두 번 들어 있어,
+    그대로 id 로 색인하면 앞의 항목이 조용히 사라집니다.
+    """
+    seen = Counter()
+
+    def relabel(choices):
+        result = []
+        for key, digest in choices:
+            seen[key] += 1
+            result.append([key if seen[key] == 1 else f'{key}#{seen[key]}', digest])
+        return result
+
+    if manifest['layout'] == 'flat':
+        return dict(manifest, choices=relabel(manifest['choices']))
+    return dict(manifest, turns=[dict(entry, choices=relabel(entry['choices'])) for entry in manifest['turns']])
+
+def _choice_index(manifest: Dict) -> Dict[str, Tuple[str, object]]:
+    """선택지 id → (해시, 턴) — 매니페스트만 보고 만듦 (id 가 겹치면 _unique_keys 를 먼저 적용)"""
+    if manifest['layout'] == 'flat':
+        return {key: (digest, None) for key, digest in manifest['choices']}
+    return {key: (digest, entry['turn']) for entry in manifest['turns'] for key, digest in entry['choices']}
+
+# ---------------------------------------------------------------------------
+# 구조적 diff
+# ---------------------------------------------------------------------------
+
+def _compare_choice(old: Dict, new: Dict) -> Dict:
+    """선택지 하나의 필드별 변경"""
+    change = {}
+    old_effects, new_effects = old.get('effects') or {}, new.get('effects') or {}
+    effects = {key: [old_effects.get(key), new_effects.get(key)]
+               for key in sorted(set(old_effects) | set(new_effects))
+               if old_effects.get(key) != new_effects.get(key)}
+    if effects:
+        change['effects'] = effects
+    for field in sorted((set(old) | set(new)) - {'effects', 'id'}):
+        if old.get(field) != new.get(field):
+            change[field] = [old.get(field), new.get(field)]
+    return change
+
+def diff_manifests(store: SnapshotStore, old: Dict, new: Dict) -> Dict:
+    """두 버전의 구조적 diff (선택지 id 기준)
+
+    같은 레이아웃이면 해시가 같은 턴/선택지는 객체를 읽지 않습니다.
+    같은 버전 안에서 겹치는 id 는 '#2', '#3' 을 붙여 각각 비교합니다.
+    """
+    old, new = _unique_keys(old), _unique_keys(new)
+    result = {'added': [], 'removed': [], 'changed': {}, 'turns': {}}
+    same_layout = old['layout'] == new['layout']
+
+    if old['layout'] == 'turns' and same_layout:
+        old_turns = {entry['turn']: entry for entry in old['turns']}
+        new_turns = {entry['turn']: entry for entry in new['turns']}
+        old_index, new_index = {}, {}
+        for turn in sorted(set(old_turns) | set(new_turns), key=lambda t: (len(str(t)), str(t))):
+            a, b = old_turns.get(turn), new_turns.get(turn)
+            if a is None or b is None:
+                result['turns'][str(turn)] = 'added' if a is None else 'removed'
+            elif a['digest'] == b['digest']:
+                continue
+            elif a['header'] != b['header']:
+                header_a = {k: v for k, v in store.get(a['header']).items() if k != 'choices'}
+                header_b = {k: v for k, v in store.get(b['header']).items() if k != 'choices'}
+                fields = sorted(k for k in set(header_a) | set(header_b) if header_a.get(k) != header_b.get(k))
+                result['turns'][str(turn)] = fields
+            # 바뀐 턴의 선택지만 색인 (선택지가 다른 턴으로 옮겨간 경우도 아래에서 id 로 맞춤)
+            for key, digest in (a or {}).get('choices', []):
+                old_index[key] = (digest, turn)
+            for key, digest in (b or {}).get('choices', []):
+                new_index[key] = (digest, turn)
+        # 바뀐 턴에서만 사라진/생긴 id 는 바뀌지 않은 턴과 짝지어 확인
+        full_old = full_new = None
+        for key in set(old_index) ^ set(new_index):
+            if key not in old_index:
+                full_old = full_old or _choice_index(old)
+                if key in full_old:
+                    old_index[key] = full_old[key]
+            else:
+                full_new = full_new or _choice_index(new)
+                if key in full_new:
+                    new_index[key] = full_new[key]
+    else:
+        old_index, new_index = _choice_index(old), _choice_index(new)
+
+    for key in sorted(set(old_index) | set(new_index), key=lambda k: (len(k), k)):
+        a, b = old_index.get(key), new_index.get(key)
+        if a is None:
+            result['added'].append(key)
+            continue
+        if b is None:
+            result['removed'].append(key)
+            continue
+        if same_layout and a == b:
+            continue
+        view_a = choice_view(store.get(a[0]), old['layout'], a[1])
+        view_b = choice_view(store.get(b[0]), new['layout'], b[1])
+        change = _compare_choice(view_a, view_b)
+        if change:
+            result['changed'][key] = change
+    return result
+
+def print_diff(diff: Dict, limit: int = 50):
+    changed = diff['changed']
+    rewired = [key for key, change in changed.items() if 'next_turn' in change]
+    moved = [key for key, change in changed.items() if 'turn' in change]
+    text = [key for key, change in changed.items() if 'text' in change]
+    effects = [key for key, change in changed.items() if 'effects' in change]
+
+    print(f"➕ 추가 {len(diff['added'])}개, ➖ 삭제 {len(diff['removed'])}개, ✏️  변경 {len(changed)}개")
+    print(f"   effects {len(effects)}개, text {len(text)}개, next_turn 재연결 {len(rewired)}개, 턴 이동 {len(moved)}개")
+    for turn, change in diff['turns'].items():
+        detail = change if isinstance(change, str) else ', '.join(change)
+        print(f"   턴 {turn}: {detail}")
+    if diff['added']:
+        print(f"   추가된 선택지: {', '.join(diff['added'][:limit])}")
+    if diff['removed']:
+        print(f"   삭제된 선택지: {', '.join(diff['removed'][:limit])}")
+
+    for key in list(changed)[:limit]:
+        change = changed[key]
+        parts = []
+        for field, (a, b) in change.get('effects', {}).items():
+            parts.append(f'{field} {a} → {b}')
+        if 'next_turn' in change:
+            parts.append(f"next_turn {change['next_turn'][0]} → {change['next_turn'][1]}")
+        if 'turn' in change:
+            parts.append(f"턴 {change['turn'][0]} → {change['turn'][1]}")
+        others = [field for field in change if field not in ('effects', 'next_turn', 'turn')]
+        if others:
+            parts.append(', '.join(others) + ' 변경')
+        print(f"   #{key}: {'; '.join(parts)}")
+    if len(changed) > limit:
+        print(f"   … 외 {len(changed) - limit}개")
+
+# ---------------------------------------------------------------------------
+# CLI
+# ---------------------------------------------------------------------------
+
+def _format_bytes(size: int) -> str:
+    for unit in ('B', 'KB', 'MB'):
+        if size < 1024:
+            return f'{size:.0f}{unit}' if unit == 'B' else f'{size:.1f}{unit}'
+        size /= 1024
+    return f'{size:.1f}GB'
+
+def cmd_save(store: SnapshotStore, args):
+    paths = sorted({path for pattern in args.paths for path in glob.glob(pattern)})
+    if not paths:
+        raise SystemExit('❌ 저장할 파일이 없습니다')
+    total_source = total_written = 0
+    for path in paths:
+        size = os.path.getsize(path)
+        try:
+            data = load_game_data(path)
+            label = args.label if len(paths) == 1 and args.label else None
+            manifest, written = store.save(data, label=label, source=os.path.relpath(path), source_bytes=size)
+        except ValueError as e:
+            print(f"   ⏭️  {path}: {e}")
+            continue
+        total_source += size
+        total_written += written
+        print(f"   💾 {manifest['id']} [{manifest['layout']}] {_count_choices(manifest)}개 선택지 "
+              f"← {path} (+{_format_bytes(written)})")
+    objects, usage = store.disk_usage()
+    print(f"\n📦 원본 {_format_bytes(total_source)} → 새로 쓴 {_format_bytes(total_written)} "
+          f"(저장소 전체 {_format_bytes(usage)}, 객체 {objects}개)")
+
+def cmd_list(store: SnapshotStore, args):
+    labels: Dict[str, List[str]] = {}
+    for label, version_id in store.refs['labels'].items():
+        labels.setdefault(version_id, []).append(label)
+    for entry in store.refs['log']:
+        tags = ', '.join(labels.get(entry['id'], []))
+        print(f"   {entry['id']}  {entry['created']}  [{entry['layout']}] {entry['choices']}개  "
+              f"{entry.get('source') or ''}{f'  ({tags})' if tags else ''}")
+    versions = len({entry['id'] for entry in store.refs['log']})
+    source = sum(entry.get('source_bytes', 0) for entry in store.refs['log'])
+    objects, usage = store.disk_usage()
+    print(f"\n📦 버전 {versions}개 / 기록 {len(store.refs['log'])}건, 원본 합계 {_format_bytes(source)} "
+          f"→ 저장소 {_format_bytes(usage)} (객체 {objects}개)")
+
+def cmd_diff(store: SnapshotStore, args):
+    old, new = store.resolve(args.old), store.resolve(args.new)
+    start = time.perf_counter()
+    diff = diff_manifests(store, old, new)
+    elapsed = time.perf_counter() - start
+    print(f"🔍 {old['id']} [{old['layout']}] → {new['id']} [{new['layout']}] ({elapsed * 1000:.1f}ms)")
+    print_diff(diff, args.limit)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(diff, f, ensure_ascii=False, indent=2)
+        print(f"\n💾 diff 저장: {args.output}")
+
+def cmd_restore(store: SnapshotStore, args):
+    manifest = store.resolve(args.version)
+    save_game_data(args.output, store.restore(manifest))
+    print(f"✅ {manifest['id']} [{manifest['layout']}] → {args.output}")
+
+def cmd_forget(store: SnapshotStore, args):
+    print(f"🗑️  {store.forget(args.version)} 제거 (객체 정리는 gc)")
+
+def cmd_gc(store: SnapshotStore, args):
+    removed, freed = store.gc()
+    print(f"🧹 참조되지 않는 객체 {removed}개 삭제 ({_format_bytes(freed)})")
+
+def main():
+    parser = argparse.ArgumentParser(description='선택지 DB 스냅샷 저장소 (내용 주소 기반 중복 제거 + 구조적 diff)')
+    parser.add_argument('--store', default=DEFAULT_STORE, help='저장소 디렉터리')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    save = commands.add_parser('save', help='파일(글롭 가능)을 스냅샷으로 저장')
+    save.add_argument('paths', nargs='+')
+    save.add_argument('--label', help='레이블 (파일 하나일 때)')
+    save.set_defaults(handler=cmd_save)
+
+    commands.add_parser('list', help='저장된 버전 목록').set_defaults(handler=cmd_list)
+
+    diff = commands.add_parser('diff', help='두 버전 비교 (버전 id 접두사 / 레이블 / 파일)')
+    diff.add_argument('old')
+    diff.add_argument('new')
+    diff.add_argument('--limit', type=int, default=50, help='출력할 변경 수')
+    diff.add_argument('--output', help='diff JSON 저장 경로')
+    diff.set_defaults(handler=cmd_diff)
+
+    restore = commands.add_parser('restore', help='버전을 원래 레이아웃의 JSON 으로 복원')
+    restore.add_argument('version')
+    restore.add_argument('--output', required=True)
+    restore.set_defaults(handler=cmd_restore)
+
+    forget = commands.add_parser('forget', help='버전 제거')
+    forget.add_argument('version')
+    forget.set_defaults(handler=cmd_forget)
+
+    commands.add_parser('gc', help='참조되지 않는 객체 정리').set_defaults(handler=cmd_gc)
+
+    args = parser.parse_args()
+    args.handler(SnapshotStore(args.store), args)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,271 @@
+#!/usr/bin/env python3
+"""
+AWS CTO Game - Victory Path Solver
+승리 경로(IPO/ACQUISITION/PROFITABILITY/TECH_LEADER) × 난이도별 최적 선택 순서 계산
+
+game_engine 의 턴 규칙은 결정적이므로 "승리 확률 최대화"는 곧 도달 가능성 문제입니다.
+(턴, 유저, 현금, 신뢰도, 인프라, 보조 상태) 를 이산화한 상태 공간에서 메모이제이션
+후진 귀납(backward induction)으로 (목표 경로 달성 여부, 리더보드 점수) 를 사전식으로
+최대화하고, 찾은 선택 순서를 정확한 엔진으로 다시 재생해 결과를 검증합니다.
+재생이 목표 경로에 실제로 도달한 경우만 'found' 이고, 이산화 예측만 도달 가능한 경우는 'not found' 입니다.
+결과는 데이터/상수 파일 해시별로 디스크에 캐시되어 데이터가 바뀌지 않으면 즉시 반환됩니다.
+"""
+
+import argparse
+import hashlib
+import json
+import math
+import os
+import sys
+import time
+from typing import Dict, List, Optional, Tuple
+
+from game_engine import (
+    CONSTANTS_FILE, DIFFICULTIES, VICTORY_PATH_CONDITIONS, VICTORY_PATHS, VICTORY_STATUS,
+    GameStatus, Rules,
+    compile_turns, final_score, infra_count, infra_mask, load_game_data, log_bucket, new_game, step,
+)
+
+SOLVER_VERSION = 3   # 탐색 규칙이 바뀌면 올려서 이전 캐시 결과를 무효화
+
+# 승리/진행 조건이 이름으로 확인하는 인프라
+_REQUIRED_INFRA = infra_mask(
+    ['dr-configured'] + [name for paths in VICTORY_PATH_CONDITIONS.values()
+                         for c in paths.values() for name in c.get('requiredInfra', ())])
+DEFAULT_CACHE = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.cache', 'victory_solver.json')
+DEFAULT_OUTPUT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.cache', 'victory_paths.json')
+
+# 기본 이산화 — 유저/현금/용량 로그 버킷 비율 0.5, 신뢰도 5 단위 (NORMAL 약 90만 상태, 난이도당 30~40초)
+DEFAULT_RESOLUTION = 0.5
+DEFAULT_TRUST_RESOLUTION = 5
+
+def content_hash(*paths: str) -> str:
+    digest = hashlib.sha256()
+    for path in paths:
+        with open(path, 'rb') as f:
+            digest.update(f.read())
+    return digest.hexdigest()[:16]
+
+def _state_key(state, resolution: float, trust_resolution: int) -> Tuple:
+    """이산화 상태 키
+
+    턴/상태/IPO 진행 여부는 정확히, 유저/현금은 로그 버킷, 신뢰도는 trust_resolution
+    단위 버킷으로 묶습니다. 스태프 배율·연속 카운터 같은 보조 상태는 키에서 빠지므로
+    같은 칸의 상태는 처음 만난 대표 상태의 값을 공유합니다 (근사 — 재생으로 검증).
+    resolution=0 이면 모든 필드를 그대로 쓰는 정확한 키가 됩니다.
+    """
+    if resolution <= 0:
+        return (state.turn, state.status, state.users, state.cash, state.trust, state.infra,
+                state.has_dr, state.has_consulting, state.user_multiplier, state.trust_multiplier,
+                tuple(state.hired_staff), state.resilience_stacks, state.negative_cash_turns,
+                state.capacity_warning, state.capacity_exceeded_streak, state.stable_turns,
+                state.ipo_condition_met, state.ipo_achieved_turn)
+    # 인프라는 집합 대신 규칙이 보는 요약값(용량, 개수, 필수 인프라 보유)으로 묶음
+    return (state.turn, state.status, log_bucket(state.users, resolution),
+            log_bucket(state.cash, resolution), state.trust // trust_resolution,
+            log_bucket(state.max_capacity, resolution), infra_count(state.infra), _REQUIRED_INFRA & state.infra,
+            state.ipo_condition_met, state.ipo_achieved_turn)
+
+class VictoryPathSolver:
+    """메모이제이션 후진 귀납 — 한 번의 탐색으로 모든 목표 승리 경로의 값을 함께 계산"""
+
+    def __init__(self, turns: Dict, rules: Rules, paths: Tuple[str, ...] = VICTORY_PATHS,
+                 resolution: float = DEFAULT_RESOLUTION, trust_resolution: int = DEFAULT_TRUST_RESOLUTION,
+                 max_steps: int = 60):
+        self.turns = turns
+        self.rules = rules
+        self.paths = tuple(paths)
+        self.targets = tuple(VICTORY_STATUS[path] for path in self.paths)
+        self.resolution = resolution
+        self.trust_resolution = trust_resolution
+        self.max_steps = max_steps
+        # 키 → (경로별 (달성 여부, 점수), 경로별 최선 선택지 인덱스)
+        self.memo: Dict[Tuple, Tuple[Tuple, Tuple]] = {}
+        # 탐색 중인 키 → 재귀 깊이 (순환 감지)
+        self._in_progress: Dict[Tuple, int] = {}
+
+    def _key(self, state) -> Tuple:
+        return _state_key(state, self.resolution, self.trust_resolution)
+
+    def _terminal_values(self, state, ended: bool = True) -> Tuple:
+        score = final_score(state, self.rules)
+        return tuple((1 if ended and state.status == target else 0, score) for target in self.targets)
+
+    def values(self, state) -> Tuple:
+        return self._search(state, 0)[0]
+
+    def _search(self, state, depth: int) -> Tuple[Tuple, float]:
+        """(경로별 값, 잘라낸 순환이 가리키는 가장 얕은 조상 깊이 — 없으면 inf)
+
+        같은 상태로 되돌아오는 순환은 끝나지 않는 게임이므로 패배로 잘라냅니다.
+        잘라낸 값은 어느 조상에서 순환이 닫혔는지(방문 순서)에 따라 달라지므로,
+        자기보다 얕은 조상을 가리키는 순환이 섞인 결과는 메모하지 않고 매번 다시 계산합니다.
+        자기 자신에서 닫히는 순환은 어디서 들어와도 같으므로 메모합니다.
+        """
+        choices = self.turns.get(state.turn)
+        if state.status != GameStatus.PLAYING or not choices or state.steps >= self.max_steps:
+            return self._terminal_values(state), math.inf
+
+        key = self._key(state)
+        cached = self.memo.get(key)
+        if cached is not None:
+            return cached[0], math.inf
+        if key in self._in_progress:
+            return self._terminal_values(state, ended=False), self._in_progress[key]
+
+        self._in_progress[key] = depth
+        best = [None] * len(self.paths)
+        best_index = [0] * len(self.paths)
+        low = math.inf
+        for index, choice in enumerate(choices):
+            results, cut = self._search(step(state.copy(), choice, self.rules), depth + 1)
+            low = min(low, cut)
+            for i, result in enumerate(results):
+                if best[i] is None or result > best[i]:
+                    best[i], best_index[i] = result, index
+        del self._in_progress[key]
+
+        entry = (tuple(best), tuple(best_index))
+        if low >= depth:
+            self.memo[key] = entry
+            low = math.inf
+        return entry[0], low
+
+    def _replay(self, i: int) -> Dict:
+        """경로 i 의 메모 정책을 정확한 엔진으로 재생 (이산화 오차 검증)"""
+        state = new_game(self.rules)
+        sequence = []
+        while state.status == GameStatus.PLAYING and state.steps < self.max_steps:
+            choices = self.turns.get(state.turn)
+            if not choices:
+                break
+            entry = self.memo.get(self._key(state))
+            if entry is None:
+                self.values(state)
+                entry = self.memo[self._key(state)]
+            choice = choices[entry[1][i]]
+            sequence.append({'turn': state.turn, 'choice_id': choice.id})
+            step(state, choice, self.rules)
+        return {'state': state, 'sequence': sequence}
+
+    def _not_found_reason(self, state, predicted: bool) -> str:
+        if predicted:
+            return '이산화 예측은 도달 가능하지만 정확한 재생이 목표에 도달하지 못함 (resolution 을 낮추세요)'
+        if state.status != GameStatus.PLAYING:
+            return f'최선의 재생이 {state.status} 로 끝남'
+        if not self.turns.get(state.turn):
+            return f'턴 {state.turn} 에 선택지가 없어 게임이 끝나지 않음'
+        return f'턴 {state.turn} 에서 {self.max_steps}회 선택 후에도 게임이 끝나지 않음'
+
+    def solve(self) -> Dict:
+        """경로별 결과 — 'verified'/'reachable' 은 정확한 엔진 재생이 목표 상태에 도달했을 때만 True"""
+        predicted = self.values(new_game(self.rules))
+        report = {}
+        for i, path in enumerate(self.paths):
+            replay = self._replay(i)
+            state = replay['state']
+            achieved = state.status == self.targets[i]
+            report[path] = {
+                'result': 'found' if achieved else 'not found',
+                'reachable': achieved,
+                'verified': achieved,
+                'predicted_reachable': bool(predicted[i][0]),
+                'reason': None if achieved else self._not_found_reason(state, bool(predicted[i][0])),
+                'predicted_score': predicted[i][1],
+                'final': {'status': state.status, 'turn': state.turn, 'users': state.users,
+                          'cash': state.cash, 'trust': state.trust, 'grade': state.grade,
+                          'score': final_score(state, self.rules)},
+                'sequence': replay['sequence'],
+                'states': len(self.memo),
+            }
+        return report
+
+def _load_cache(path: str) -> Dict:
+    if not os.path.exists(path):
+        return {}
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+def _save_cache(path: str, cache: Dict):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp = path + '.tmp'
+    with open(tmp, 'w', encoding='utf-8') as f:
+        json.dump(cache, f, ensure_ascii=False)
+    os.replace(tmp, path)
+
+def solve_all(data_path: str, difficulties: List[str], paths: List[str],
+              resolution: float = DEFAULT_RESOLUTION, trust_resolution: int = DEFAULT_TRUST_RESOLUTION,
+              max_steps: int = 60, cache_path: Optional[str] = DEFAULT_CACHE) -> Dict:
+    """난이도 × 승리 경로별 해 (캐시에 있으면 재사용)"""
+    data_hash = content_hash(data_path, CONSTANTS_FILE)
+    cache = _load_cache(cache_path) if cache_path else {}
+    turns = None
+    report = {}
+    dirty = False
+
+    for difficulty in difficulties:
+        key = f'v{SOLVER_VERSION}:{data_hash}:{difficulty}:{resolution}:{trust_resolution}:{max_steps}'
+        results = cache.get(key, {})
+        missing = [path for path in paths if path not in results]
+        if missing:
+            if turns is None:
+                turns = compile_turns(load_game_data(data_path))
+            started = time.perf_counter()
+            solved = VictoryPathSolver(turns, Rules(difficulty), tuple(missing), resolution=resolution,
+                                       trust_resolution=trust_resolution, max_steps=max_steps).solve()
+            elapsed = round(time.perf_counter() - started, 3)
+            for result in solved.values():
+                result['seconds'] = elapsed
+            results.update(solved)
+            cache[key] = results
+            dirty = True
+        report[difficulty] = {path: results[path] for path in paths}
+
+    if cache_path and dirty:
+        _save_cache(cache_path, cache)
+    return report
+
+def parse_args():
+    parser = argparse.ArgumentParser(description='AWS CTO Game 승리 경로 최적해 탐색')
+    parser.add_argument('--data', default='../game_choices_db.json', help='게임 데이터 JSON 경로')
+    parser.add_argument('--difficulties', nargs='+', default=list(DIFFICULTIES), choices=DIFFICULTIES)
+    parser.add_argument('--paths', nargs='+', default=list(VICTORY_PATHS), choices=VICTORY_PATHS)
+    parser.add_argument('--resolution', type=float, default=DEFAULT_RESOLUTION,
+                        help='유저/현금/용량 로그 버킷의 상대 크기 (0이면 정확한 상태로 탐색)')
+    parser.add_argument('--trust-resolution', type=int, default=DEFAULT_TRUST_RESOLUTION, help='신뢰도 버킷 크기')
+    parser.add_argument('--max-steps', type=int, default=60, help='한 게임의 최대 선택 횟수')
+    parser.add_argument('--cache', default=DEFAULT_CACHE, help='결과 캐시 파일')
+    parser.add_argument('--no-cache', action='store_true', help='캐시를 읽지도 쓰지도 않음')
+    parser.add_argument('--output', default=DEFAULT_OUTPUT, help='결과 저장 경로')
+    return parser.parse_args()
+
+def main():
+    args = parse_args()
+    sys.setrecursionlimit(max(sys.getrecursionlimit(), 10 * args.max_steps + 1000))
+
+    print("🎮 AWS CTO Game - Victory Path Solver")
+    print("=" * 60)
+
+    report = solve_all(args.data, args.difficulties, args.paths, resolution=args.resolution,
+                       trust_resolution=args.trust_resolution, max_steps=args.max_steps, cache_path=None if args.no_cache else args.cache)
+
+    for difficulty, by_path in report.items():
+        print(f"\n🏁 {difficulty}:")
+        for path, result in by_path.items():
+            final = result['final']
+            if result['verified']:
+                print(f"  ✅ {path}: {final['status']} 턴 {final['turn']}, 점수 {final['score']:,}, "
+                      f"상태 {result['states']:,}개, {result.get('seconds', 0):.2f}초")
+                print(f"     선택 순서: {' → '.join(str(s['choice_id']) for s in result['sequence'])}")
+            else:
+                print(f"  ❌ {path}: not found — {result['reason']} "
+                      f"(상태 {result['states']:,}개, {result.get('seconds', 0):.2f}초)")
+
+    os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+
+    print(f"\n\n✅ 분석 완료! 결과가 {args.output}에 저장되었습니다.")
+
+if __name__ == '__main__':
+    main()
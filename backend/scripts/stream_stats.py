@@ -0,0 +1,308 @@
+#!/usr/bin/env python3
+"""
+AWS CTO Game - Streaming Statistics
+한 번의 순회로 계산하는 병합 가능한 통계 누산기
+
+- RunningStats: Welford 분산 + 최소/최대/합계, 근사 분위수 스케치 (O(k log n) 메모리)
+- StatsTable: (그룹, 지표) 별 RunningStats 묶음 — 턴/카테고리/전략 단위 리포트의 공통 통계 계층
+
+모든 누산기는 merge() 로 합칠 수 있어 턴 단위 캐시나 워커 프로세스 결과를
+다시 순회하지 않고 합산할 수 있고, to_dict()/from_dict() 로 JSON 캐시에 저장됩니다.
+
+사용 예 (메모리에 올리지 않고 JSONL 레코드 스트림 요약):
+    python3 stream_stats.py --input playlog.jsonl --group-by difficulty --metrics users cash trust
+"""
+
+import argparse
+import json
+import math
+import sys
+from typing import Callable, Dict, Iterable, List, Optional, Sequence
+
+DEFAULT_SKETCH_SIZE = 256
+
+class QuantileSketch:
+    """MRL/KLL 계열의 결정적 분위수 스케치
+
+    레벨 h 의 버퍼 항목은 가중치 2^h 를 가집니다. 버퍼가 k 개를 넘으면 정렬해서
+    하나 걸러 하나씩(오프셋 교대) 다음 레벨로 올립니다. 한 번도 압축되지 않았다면
+    (n <= k) 모든 값을 그대로 들고 있으므로 분위수는 정확합니다.
+    """
+
+    __slots__ = ('k', 'levels', 'count', '_offset')
+
+    def __init__(self, k: int = DEFAULT_SKETCH_SIZE):
+        self.k = k
+        self.levels: List[List[float]] = [[]]
+        self.count = 0
+        self._offset = 0
+
+    @property
+    def exact(self) -> bool:
+        return len(self.levels) == 1
+
+    def push(self, value: float):
+        self.levels[0].append(value)
+        self.count += 1
+        if len(self.levels[0]) > self.k:
+            self._compress()
+
+    def _compress(self):
+        for h, buffer in enumerate(self.levels):
+            if len(buffer) <= self.k:
+                continue
+            buffer.sort()
+            # 홀수 개면 마지막 하나는 이 레벨에 남김
+            carry = buffer.pop() if len(buffer) % 2 else None
+            promoted = buffer[self._offset::2]
+            self._offset ^= 1
+            self.levels[h] = [carry] if carry is not None else []
+            if h + 1 == len(self.levels):
+                self.levels.append([])
+            self.levels[h + 1].extend(promoted)
+
+    def merge(self, other: 'QuantileSketch') -> 'QuantileSketch':
+        while len(self.levels) < len(other.levels):
+            self.levels.append([])
+        for h, buffer in enumerate(other.levels):
+            self.levels[h].extend(buffer)
+        self.count += other.count
+        self._compress()
+        return self
+
+    def quantile(self, q: float) -> Optional[float]:
+        """q 분위수 (정확한 모드에서는 numpy 'linear' 보간과 동일, median 은 statistics.median 과 동일)"""
+        if not self.count:
+            return None
+        if self.exact:
+            values = sorted(self.levels[0])
+            position = q * (len(values) - 1)
+            lower = math.floor(position)
+            upper = min(lower + 1, len(values) - 1)
+            fraction = position - lower
+            if not fraction:
+                return values[lower]
+            return values[lower] + (values[upper] - values[lower]) * fraction
+
+        weighted = sorted((value, 1 << h) for h, buffer in enumerate(self.levels) for value in buffer)
+        total = sum(weight for _, weight in weighted)
+        target = q * total
+        cumulative = 0
+        for value, weight in weighted:
+            cumulative += weight
+            if cumulative >= target:
+                return value
+        return weighted[-1][0]
+
+    def to_dict(self) -> Dict:
+        return {'k': self.k, 'levels': self.levels, 'count': self.count, 'offset': self._offset}
+
+    @staticmethod
+    def from_dict(values: Dict) -> 'QuantileSketch':
+        sketch = QuantileSketch(values['k'])
+        sketch.levels = [list(buffer) for buffer in values['levels']]
+        sketch.count = values['count']
+        sketch._offset = values.get('offset', 0)
+        return sketch
+
+class RunningStats:
+    """단일 지표의 스트리밍 통계 (개수, 합계, 최소, 최대, Welford 평균/분산, 분위수)"""
+
+    __slots__ = ('count', 'total', 'min', 'max', '_mean', '_m2', 'sketch')
+
+    def __init__(self, sketch_size: int = DEFAULT_SKETCH_SIZE):
+        self.count = 0
+        self.total = 0
+        self.min = None
+        self.max = None
+        self._mean = 0.0
+        self._m2 = 0.0
+        self.sketch = QuantileSketch(sketch_size) if sketch_size else None
+
+    def push(self, value: float):
+        self.count += 1
+        self.total += value
+        if self.min is None or value < self.min:
+            self.min = value
+        if self.max is None or value > self.max:
+            self.max = value
+        delta = value - self._mean
+        self._mean += delta / self.count
+        self._m2 += delta * (value - self._mean)
+        if self.sketch is not None:
+            self.sketch.push(value)
+
+    def extend(self, values: Iterable[float]) -> 'RunningStats':
+        for value in values:
+            self.push(value)
+        return self
+
+    def merge(self, other: 'RunningStats') -> 'RunningStats':
+        """Chan 병렬 분산 공식으로 두 누산기 합치기"""
+        if not other.count:
+            return self
+        if not self.count:
+            self.min, self.max = other.min, other.max
+        else:
+            self.min = min(self.min, other.min)
+            self.max = max(self.max, other.max)
+        count = self.count + other.count
+        delta = other._mean - self._mean
+        self._m2 += other._m2 + delta * delta * self.count * other.count / count
+        self._mean += delta * other.count / count
+        self.count = count
+        self.total += other.total
+        if self.sketch is not None and other.sketch is not None:
+            self.sketch.merge(other.sketch)
+        return self
+
+    @property
+    def mean(self) -> float:
+        # 정수 입력에서는 합계/개수가 Welford 누적 평균보다 정확
+        return self.total / self.count if self.count else 0.0
+
+    @property
+    def variance(self) -> float:
+        return self._m2 / (self.count - 1) if self.count > 1 else 0.0
+
+    @property
+    def stdev(self) -> float:
+        return math.sqrt(self.variance)
+
+    def quantile(self, q: float) -> Optional[float]:
+        return self.sketch.quantile(q) if self.sketch is not None else None
+
+    @property
+    def median(self) -> Optional[float]:
+        return self.quantile(0.5)
+
+    def summary(self, with_stdev: bool = False, percentiles: Sequence[int] = ()) -> Dict:
+        """analyze_balance 리포트 형식의 요약 (min/max/avg/median[/stdev][/pNN])"""
+        summary = {'min': self.min, 'max': self.max, 'avg': self.mean, 'median': self.median}
+        if with_stdev:
+            summary['stdev'] = self.stdev
+        for p in percentiles:
+            summary[f'p{p}'] = self.quantile(p / 100)
+        return summary
+
+    def to_dict(self) -> Dict:
+        return {'count': self.count, 'total': self.total, 'min': self.min, 'max': self.max,
+                'mean': self._mean, 'm2': self._m2,
+                'sketch': self.sketch.to_dict() if self.sketch is not None else None}
+
+    @staticmethod
+    def from_dict(values: Dict) -> 'RunningStats':
+        stats = RunningStats(sketch_size=0)
+        stats.count = values['count']
+        stats.total = values['total']
+        stats.min = values['min']
+        stats.max = values['max']
+        stats._mean = values['mean']
+        stats._m2 = values['m2']
+        if values.get('sketch') is not None:
+            stats.sketch = QuantileSketch.from_dict(values['sketch'])
+        return stats
+
+class StatsTable:
+    """(그룹, 지표) → RunningStats
+
+    레코드 하나를 받아 여러 그룹(전체, 턴, 카테고리 등)에 동시에 누적하므로
+    리포트에 필요한 모든 통계를 한 번의 순회로 계산합니다.
+    """
+
+    def __init__(self, metrics: Sequence[str], sketch_size: int = DEFAULT_SKETCH_SIZE):
+        self.metrics = tuple(metrics)
+        self.sketch_size = sketch_size
+        self.groups: Dict = {}
+
+    def group(self, key) -> Dict[str, RunningStats]:
+        group = self.groups.get(key)
+        if group is None:
+            group = {metric: RunningStats(self.sketch_size) for metric in self.metrics}
+            self.groups[key] = group
+        return group
+
+    def push(self, keys: Iterable, record: Dict, default: float = 0):
+        values = [(metric, record.get(metric, default)) for metric in self.metrics]
+        for key in keys:
+            group = self.group(key)
+            for metric, value in values:
+                if value is not None:
+                    group[metric].push(value)
+
+    def consume(self, records: Iterable[Dict], keys: Callable[[Dict], Iterable]) -> 'StatsTable':
+        """레코드 스트림(제너레이터 가능)을 한 번만 순회하며 누적"""
+        for record in records:
+            self.push(keys(record), record)
+        return self
+
+    def merge(self, other: 'StatsTable') -> 'StatsTable':
+        for key, group in other.groups.items():
+            target = self.group(key)
+            for metric, stats in group.items():
+                target[metric].merge(stats)
+        return self
+
+    def summary(self, key, with_stdev: bool = False, percentiles: Sequence[int] = ()) -> Dict:
+        return {metric: stats.summary(with_stdev, percentiles) for metric, stats in self.group(key).items()}
+
+    def to_dict(self) -> Dict:
+        return {'metrics': list(self.metrics), 'sketch_size': self.sketch_size,
+                'groups': [[key, {m: s.to_dict() for m, s in group.items()}]
+                           for key, group in self.groups.items()]}
+
+    @staticmethod
+    def from_dict(values: Dict) -> 'StatsTable':
+        table = StatsTable(values['metrics'], values['sketch_size'])
+        for key, group in values['groups']:
+            key = tuple(key) if isinstance(key, list) else key
+            table.groups[key] = {m: RunningStats.from_dict(s) for m, s in group.items()}
+        return table
+
+def iter_jsonl(path: str) -> Iterable[Dict]:
+    """JSONL 파일을 한 줄씩 읽는 레코드 스트림 ('-' 이면 표준 입력)"""
+    f = sys.stdin if path == '-' else open(path, 'r', encoding='utf-8')
+    try:
+        for line in f:
+            line = line.strip()
+            if line:
+                yield json.loads(line)
+    finally:
+        if f is not sys.stdin:
+            f.close()
+
+def parse_args():
+    parser = argparse.ArgumentParser(description='JSONL 레코드 스트림 통계 요약')
+    parser.add_argument('--input', default='-', help="JSONL 파일 경로 ('-' 이면 표준 입력)")
+    parser.add_argument('--metrics', nargs='+', default=['users', 'cash', 'trust'], help='요약할 숫자 필드')
+    parser.add_argument('--group-by', nargs='*', default=[], help='그룹 키로 쓸 필드')
+    parser.add_argument('--percentiles', nargs='+', type=int, default=[10, 25, 50, 75, 90])
+    parser.add_argument('--sketch-size', type=int, default=DEFAULT_SKETCH_SIZE,
+                        help='분위수 스케치 레벨당 버퍼 크기 (클수록 정확, 메모리 증가)')
+    parser.add_argument('--output', help='결과 JSON 저장 경로 (없으면 표준 출력)')
+    return parser.parse_args()
+
+def main():
+    args = parse_args()
+    table = StatsTable(args.metrics, args.sketch_size)
+
+    def keys(record: Dict) -> Iterable[str]:
+        yield 'overall'
+        for field in args.group_by:
+            yield f'{field}={record.get(field)}'
+
+    table.consume(iter_jsonl(args.input), keys)
+    report = {key: table.summary(key, with_stdev=True, percentiles=args.percentiles) for key in table.groups}
+    for key, group in table.groups.items():
+        report[key]['count'] = next(iter(group.values())).count
+
+    text = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(text)
+        print(f"✅ {len(report)}개 그룹 요약이 {args.output}에 저장되었습니다.")
+    else:
+        print(text)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+AWS CTO Game - Synthetic Scenario Generator
+밸런스 도구 확장성 측정용 합성 선택지 그래프 생성
+
+실제 데이터(game_choices_db.json)를 템플릿으로 삼아 구조적으로 유효한 큰 데이터를 만듭니다.
+- 일반 턴: 1 부터 차례로 번호를 매기되 특수 턴 번호(888~890, 900~903, 950, 999)는 건너뜀
+- 선택지 수: 턴마다 평균 주위로 흔들리게 분배 (전체 합은 정확히 --choices)
+- next_turn: 기본은 다음 일반 턴, --branching 확률로 2~3턴 건너뛰는 분기,
+  마지막 일반 턴은 IPO 선택 턴(950)으로 연결
+- 효과/텍스트/카테고리/인프라: 템플릿 일반 턴 선택지에서 뽑아 효과 크기만 흔듦
+- 특수 턴(긴급 888, 게임 오버 900~903, IPO 950/999)은 템플릿 그대로 포함
+같은 파라미터와 시드는 항상 같은 데이터를 만듭니다.
+
+사용 예:
+    python3 synthetic_scenarios.py --turns 1000 --choices 100000 --output /tmp/synthetic_large.json
+    python3 synthetic_scenarios.py --preset medium --output /tmp/synthetic_medium.json
+"""
+
+import argparse
+import json
+import os
+import random
+from typing import Dict, List
+
+from game_engine import GAME_CONSTANTS, load_game_data
+
+DEFAULT_TEMPLATE = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'game_choices_db.json')
+
+# 크기 프리셋: (일반 턴 수, 전체 선택지 수)
+PRESETS = {
+    'small': (32, 150),
+    'medium': (200, 10_000),
+    'large': (1000, 100_000),
+}
+
+def save_game_data(filepath: str, data: List[Dict]):
+    """게임 데이터 저장"""
+    with open(filepath, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+
+def reserved_turns() -> set:
+    """일반 턴 번호로 쓰면 안 되는 특수 턴 번호"""
+    reserved = set(range(GAME_CONSTANTS['EMERGENCY_TURN_START'], GAME_CONSTANTS['EMERGENCY_TURN_END'] + 1))
+    reserved.update(range(900, 904))
+    reserved.update((GAME_CONSTANTS['IPO_SELECTION_TURN'], GAME_CONSTANTS['IPO_FINAL_SUCCESS_TURN']))
+    return reserved
+
+def _split_counts(total: int, parts: int, rng: random.Random, spread: float = 0.5) -> List[int]:
+    """total 을 parts 개로 (평균 ± spread) 나눔 — 각 턴에 최소 1개, 합은 정확히 total"""
+    weights = [1.0 + rng.uniform(-spread, spread) for _ in range(parts)]
+    scale = (total - parts) / sum(weights)
+    counts = [1 + int(w * scale) for w in weights]
+    for i in range(total - sum(counts)):
+        counts[i % parts] += 1
+    return counts
+
+def _jitter(value: int, rng: random.Random, spread: float) -> int:
+    if not value:
+        return 0
+    return int(round(value * rng.lognormvariate(0.0, spread)))
+
+def generate(turns: int, choices: int, seed: int = 0, branching: float = 0.2,
+             effect_spread: float = 0.3, template: List[Dict] = None) -> List[Dict]:
+    """합성 게임 데이터 생성 (turn/choices 레이아웃)"""
+    template = template if template is not None else load_game_data(DEFAULT_TEMPLATE)
+    reserved = reserved_turns()
+    special = [t for t in template if t['turn'] in reserved]
+    pool = [c for t in template if t['turn'] not in reserved for c in t['choices']]
+    events = [t['event'] for t in template if t['turn'] not in reserved]
+    special_choices = sum(len(t['choices']) for t in special)
+    if choices - special_choices < turns:
+        raise ValueError(f'선택지 수({choices})는 일반 턴 수 + 특수 턴 선택지({turns + special_choices}) 이상이어야 합니다')
+
+    rng = random.Random(seed)
+    numbers, candidate = [], 1
+    while len(numbers) < turns:
+        if candidate not in reserved:
+            numbers.append(candidate)
+        candidate += 1
+
+    # 특수 턴 선택지 id 와 겹치지 않게 일반 선택지 id 할당
+    reserved_ids = {int(c['id']) for t in special for c in t['choices']}
+    next_id = 1
+
+    data = []
+    counts = _split_counts(choices - special_choices, turns, rng)
+    for index, (turn, count) in enumerate(zip(numbers, counts)):
+        turn_choices = []
+        for _ in range(count):
+            while next_id in reserved_ids:
+                next_id += 1
+            source = pool[rng.randrange(len(pool))]
+            effects = source['effects']
+            if index + 1 >= len(numbers):
+                next_turn = GAME_CONSTANTS['IPO_SELECTION_TURN']
+            elif rng.random() < branching:
+                next_turn = numbers[min(index + rng.choice((2, 3)), len(numbers) - 1)]
+            else:
+                next_turn = numbers[index + 1]
+            choice = {
+                'id': next_id,
+                'text': source['text'],
+                'effects': {
+                    'users': _jitter(effects.get('users', 0), rng, effect_spread),
+                    'cash': _jitter(effects.get('cash', 0), rng, effect_spread),
+                    'trust': _jitter(effects.get('trust', 0), rng, effect_spread),
+                    'infra': list(effects.get('infra', [])),
+                },
+                'next_turn': next_turn,
+            }
+            if 'category' in source:
+                choice['category'] = source['category']
+            turn_choices.append(choice)
+            next_id += 1
+        data.append({'turn': turn, 'event': events[index % len(events)], 'choices': turn_choices})
+
+    return data + [dict(t, choices=[dict(c) for c in t['choices']]) for t in special]
+
+def parse_args():
+    parser = argparse.ArgumentParser(description='합성 선택지 그래프 생성')
+    parser.add_argument('--preset', choices=sorted(PRESETS), help='크기 프리셋 (--turns/--choices 대신)')
+    parser.add_argument('--turns', type=int, default=1000, help='일반 턴 수')
+    parser.add_argument('--choices', type=int, default=100_000, help='전체 선택지 수 (특수 턴 포함)')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--branching', type=float, default=0.2, help='2~3턴 건너뛰는 next_turn 비율')
+    parser.add_argument('--template', default=DEFAULT_TEMPLATE, help='효과/텍스트를 뽑을 실제 데이터')
+    parser.add_argument('--output', required=True, help='저장 경로')
+    return parser.parse_args()
+
+def main():
+    args = parse_args()
+    turns, choices = PRESETS[args.preset] if args.preset else (args.turns, args.choices)
+
+    data = generate(turns, choices, args.seed, args.branching, template=load_game_data(args.template))
+    save_game_data(args.output, data)
+
+    total = sum(len(t['choices']) for t in data)
+    print(f"✅ 합성 데이터 생성: 턴 {len(data)}개 (일반 {turns}개), 선택지 {total}개")
+    print(f"📝 저장: {args.output} ({os.path.getsize(args.output) / 1024 / 1024:.1f}MB)")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,17 @@
+"""공용 픽스처 — 저장소의 게임 데이터(game_choices_db.json)"""
+
+import json
+import os
+
+import pytest
+
+DATA_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', '..', 'game_choices_db.json')
+
+@pytest.fixture(scope='session')
+def data_path():
+    return DATA_PATH
+
+@pytest.fixture(scope='session')
+def game_data():
+    with open(DATA_PATH, 'r', encoding='utf-8') as f:
+        return json.load(f)
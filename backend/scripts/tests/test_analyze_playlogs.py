@@ -0,0 +1,67 @@
+"""analyze_playlogs — JSON 배열 증분 파싱, 기록 순서 키, 난이도별 trust_history 집계"""
+
+import io
+import json
+
+import pytest
+
+from analyze_playlogs import (
+    PlayLogReport, _iter_json_array, ingest_choice_history, ingest_trust_history, iter_games, iter_records,
+)
+
+RECORDS = [
+    {'game_id': 'g1', 'turn_number': 1, 'choice_id': 1, 'note': '배열 ] 과 , 가 든 "문자열"'},
+    {'game_id': 'g1', 'turn_number': 2, 'choice_id': 1123, 'score': 12345678901234567890},
+    {'game_id': 'g2', 'turn_number': 1, 'choice_id': 2, 'flags': [True, False, None], 'ratio': -1.5e-3},
+]
+
+@pytest.mark.parametrize('chunk_size', [1, 3, 7, 64, 1 << 16])
+def test_json_array_is_parsed_incrementally(chunk_size):
+    text = json.dumps(RECORDS, ensure_ascii=False, indent=2)
+    assert list(_iter_json_array(io.StringIO(text), chunk_size)) == RECORDS
+    assert list(_iter_json_array(io.StringIO('[1, 23, true, "x"]'), 2)) == [1, 23, True, 'x']
+    assert list(_iter_json_array(io.StringIO(' [ ] '), chunk_size)) == []
+
+def test_json_array_rejects_truncated_input():
+    with pytest.raises(ValueError):
+        list(_iter_json_array(io.StringIO('[{"a": 1}, {"b"'), 4))
+    with pytest.raises(ValueError):
+        list(_iter_json_array(io.StringIO('{"a": 1}'), 4))
+
+def test_iter_records_streams_json_file(tmp_path):
+    path = tmp_path / 'choice_history.json'
+    path.write_text(json.dumps(RECORDS, ensure_ascii=False), encoding='utf-8')
+    records = list(iter_records(str(path)))
+    assert [r['choiceId'] for r in records] == [1, 1123, 2]
+    assert records[0]['gameId'] == 'g1'
+
+@pytest.mark.parametrize('partitions', [1, 4])
+def test_history_order_mixes_ids_and_timestamps(partitions):
+    choices = [
+        {'gameId': 'g', 'timestamp': '2025-10-10T12:00:02', 'turnNumber': 3, 'choiceId': 30},
+        {'gameId': 'g', 'historyId': '12', 'turnNumber': 2, 'choiceId': 20},
+        {'gameId': 'g', 'historyId': 5, 'turnNumber': 1, 'choiceId': 10},
+        {'gameId': 'g', 'timestamp': '2025-10-10T12:00:01', 'turnNumber': 4, 'choiceId': 40},
+    ]
+    [(_, history, _)] = list(iter_games(choices, [], partitions))
+    # id 가 있는 기록이 먼저 (id 순), 그 다음 시각 순
+    assert [choice for _, _, choice in history] == [10, 20, 40, 30]
+
+def test_trust_history_is_filtered_by_difficulty():
+    games = [{'gameId': 'easy', 'difficultyMode': 'EASY', 'status': 'PLAYING', 'currentTurn': 3},
+             {'gameId': 'normal', 'difficultyMode': None, 'status': 'PLAYING', 'currentTurn': 3}]
+    trust = [{'gameId': 'easy', 'id': 1, 'turnNumber': 1, 'change': 9},
+             {'gameId': 'normal', 'id': 2, 'turnNumber': 1, 'change': -2},
+             {'gameId': 'normal', 'id': 3, 'turnNumber': 2, 'change': 4},
+             {'gameId': 'unknown', 'id': 4, 'turnNumber': 1, 'change': 7}]
+
+    report = ingest_trust_history(PlayLogReport(25), trust, games, partitions=2, difficulty='NORMAL')
+    assert {turn: row['total'] for turn, row in report.trust_by_turn().items()} == {1: -2, 2: 4}
+    assert report.trust_skipped == 2
+
+    unfiltered = ingest_trust_history(PlayLogReport(25), trust)
+    assert unfiltered.trust_by_turn()[1]['total'] == 14
+
+    choices = [{'gameId': 'easy', 'historyId': 1, 'turnNumber': 1, 'choiceId': 1}]
+    report = ingest_choice_history(PlayLogReport(25), choices, games, partitions=1, difficulty='NORMAL')
+    assert report.skipped == 1 and report.games == 1
@@ -0,0 +1,79 @@
+"""apply_choice_updates — SQLite 반영 경로 (스테이징 + UPDATE ... FROM + INSERT, 단일 트랜잭션)"""
+
+import json
+import sqlite3
+
+import pytest
+
+from apply_choice_updates import apply_updates, connect, normalize_updates
+
+GAME_DATA = [
+    {'turn': 1, 'choices': [
+        {'id': 1, 'text': '인프라 투자', 'effects': {'users': 1000, 'cash': -5000000, 'trust': 2, 'infra': ['EC2']},
+         'next_turn': 2, 'category': '인프라'},
+        {'id': '2', 'text': '마케팅', 'effects': {'users': 3000, 'cash': -3000000, 'trust': 0},
+         'next_turn': 2},
+    ]},
+    {'turn': 2, 'choices': [
+        {'id': 3, 'text': '채용', 'effects': {'cash': -2000000, 'trust': 1}, 'next_turn': 3, 'tags': ['hire']},
+    ]},
+]
+
+def _apply(path, data, **kwargs):
+    backend = connect(f'sqlite:///{path}')
+    backend.create_table()
+    try:
+        return apply_updates(backend, normalize_updates(data), **kwargs)
+    finally:
+        backend.close()
+
+def _rows(path):
+    conn = sqlite3.connect(path)
+    try:
+        return {row[0]: row[1:] for row in conn.execute(
+            'SELECT "choiceId", "turnNumber", text, effects, "nextTurn", tags FROM choices ORDER BY "choiceId"')}
+    finally:
+        conn.close()
+
+def test_insert_then_update_only_changed_rows(tmp_path):
+    path = tmp_path / 'cto.db'
+    result = _apply(path, GAME_DATA, insert_missing=True)
+    assert result['inserted'] == 3 and result['updated'] == 0
+
+    rows = _rows(path)
+    assert rows[1][:3] == (1, '인프라 투자', '{"users":1000,"cash":-5000000,"trust":2,"infra":["EC2"]}')
+    assert rows[3][4] == '["hire"]'
+
+    # 같은 입력을 다시 넣으면 해시가 같아 아무 것도 쓰지 않음
+    again = _apply(path, GAME_DATA)
+    assert again['unchanged'] == 3 and again['updated'] == 0
+
+    # 텍스트 매핑은 text 열만 바꾸고 나머지 열은 유지
+    result = _apply(path, {'2': '바이럴 마케팅'})
+    assert result['updated'] == 1 and result['changed_columns'] == {'text': 1}
+    rows = _rows(path)
+    assert rows[2][1] == '바이럴 마케팅'
+    assert json.loads(rows[2][2]) == {'users': 3000, 'cash': -3000000, 'trust': 0, 'infra': []}
+
+def test_dry_run_and_missing_rows_leave_database_untouched(tmp_path):
+    path = tmp_path / 'cto.db'
+    _apply(path, GAME_DATA, insert_missing=True)
+
+    result = _apply(path, {'1': '변경', '99': '없는 선택지'}, dry_run=True)
+    assert result['planned_updates'] == 1 and result['missing'] == [99]
+    assert _rows(path)[1][1] == '인프라 투자'
+
+def test_insert_missing_requires_full_rows(tmp_path):
+    path = tmp_path / 'cto.db'
+    _apply(path, GAME_DATA, insert_missing=True)
+
+    # 텍스트 매핑만으로는 새 행을 만들 수 없음 — 트랜잭션 전체가 롤백됨
+    with pytest.raises(SystemExit, match='turnNumber'):
+        _apply(path, {'1': '변경', '99': '새 선택지'}, insert_missing=True)
+    assert _rows(path)[1][1] == '인프라 투자'
+    assert 99 not in _rows(path)
+
+def test_duplicate_ids_are_rejected():
+    data = [{'choiceId': 1, 'text': 'a'}, {'choiceId': '1', 'text': 'b'}, {'choiceId': 2, 'text': 'c'}]
+    with pytest.raises(SystemExit, match=r'1\(2회\)'):
+        normalize_updates(data)
@@ -0,0 +1,123 @@
+"""batch_engine — 같은 선택 순서로 진행하면 game_engine.play 와 최종 상태가 같아야 함"""
+
+import numpy as np
+import pytest
+
+from analyze_balance import monte_carlo
+from batch_engine import BatchTable, play_batch, uniform_picker, weighted_picker
+from game_engine import DIFFICULTIES, STRATEGIES, Rules, choice_preference, compile_turns, greedy_policy, play
+
+GAMES = 400
+MAX_STEPS = 200
+
+@pytest.fixture(scope='module')
+def turns(game_data):
+    return compile_turns(game_data)
+
+@pytest.fixture(scope='module')
+def table(turns):
+    return BatchTable(turns)
+
+def _rule_data():
+    """실제 데이터에 없는 규칙(디자이너/기획자 채용, transparency, IPO 계속 성장 9502, 긴급 턴 우회,
+    초기 피치 8, 컨설팅 68, 투자 배율)을 모두 지나가는 합성 데이터"""
+    data = []
+    for turn in range(1, 26):
+        nxt = turn + 1
+        choices = [
+            {'id': turn * 10 + 1, 'text': '디자이너 채용', 'next_turn': nxt, 'tags': ['transparency'],
+             'effects': {'users': 9000 * turn, 'cash': -2_000_000, 'trust': 6, 'infra': ['RDS']}},
+            {'id': turn * 10 + 2, 'text': '기획자 채용', 'next_turn': nxt,
+             'effects': {'users': 0, 'cash': 60_000_000, 'trust': -7, 'infra': ['EKS']}},
+            {'id': turn * 10 + 3, 'text': '개발자 채용', 'next_turn': nxt,
+             'effects': {'users': 4000, 'cash': 4_000_000_000, 'trust': 12, 'infra': ['dr-configured']}},
+            {'id': turn * 10 + 4, 'text': '긴축', 'next_turn': nxt, 'tags': ['transparency'],
+             'effects': {'users': -3000, 'cash': -25_000_000, 'trust': 3}},
+        ]
+        data.append({'turn': turn, 'choices': choices})
+    data[1]['choices'][0]['id'] = 8
+    data[4]['choices'][1]['id'] = 68
+    data.append({'turn': 888, 'choices': [
+        {'id': 8881, 'text': '복구', 'next_turn': 19, 'effects': {'users': 0, 'cash': -5_000_000, 'trust': 4}},
+        {'id': 8882, 'text': 'DR 구성', 'next_turn': 20,
+         'effects': {'users': 0, 'cash': -5_000_000, 'trust': 2, 'infra': ['dr-configured']}}]})
+    data.append({'turn': 950, 'choices': [
+        {'id': 9501, 'text': '상장', 'next_turn': 999, 'effects': {'users': 0, 'cash': 0, 'trust': 0}},
+        {'id': 9502, 'text': '계속 성장', 'next_turn': 0, 'effects': {'users': 0, 'cash': 0, 'trust': 0}}]})
+    data.append({'turn': 999, 'choices': [
+        {'id': 9991, 'text': '마무리', 'next_turn': 25, 'effects': {'users': 1000, 'cash': 0, 'trust': 1}}]})
+    return data
+
+def _key(state):
+    """비교용 상태 키 (배치 상태는 채용 순서를 보존하지 않으므로 직원 목록은 정렬)"""
+    values = state.to_dict()
+    values['hired_staff'] = sorted(values['hired_staff'])
+    return values
+
+def _assert_same(batch, expected):
+    for i, state in enumerate(expected):
+        assert _key(batch.state(i)) == _key(state), f'game {i}'
+
+def _check_random_choices(turns, difficulty, seed):
+    """게임별로 미리 뽑은 난수열로 같은 선택을 하게 해서 배치 진행과 play() 를 비교"""
+    table = BatchTable(turns)
+    rules = Rules(difficulty)
+    plan = np.random.default_rng(seed).integers(0, 1 << 30, size=(GAMES, MAX_STEPS + 1))
+
+    def pick(batch, games, rows):
+        return plan[games, batch.steps[games]] % table.count[rows]
+
+    batch = play_batch(table, rules, GAMES, pick, max_steps=MAX_STEPS)
+    expected = [play(turns, rules, lambda state, choices, g=g: choices[plan[g, state.steps] % len(choices)],
+                     max_steps=MAX_STEPS)
+                for g in range(GAMES)]
+    _assert_same(batch, expected)
+    return batch
+
+@pytest.mark.parametrize('difficulty', DIFFICULTIES)
+def test_random_choices_match_play(turns, difficulty):
+    _check_random_choices(turns, difficulty, seed=7)
+
+@pytest.mark.parametrize('difficulty', DIFFICULTIES)
+def test_rule_branches_match_play(difficulty):
+    batch = _check_random_choices(compile_turns(_rule_data()), difficulty, seed=3)
+    assert batch.has_consulting.any() and batch.ipo_achieved_turn.any() and batch.capacity_warning.any()
+    assert batch.staff.any(axis=1).all()
+
+@pytest.mark.parametrize('difficulty', DIFFICULTIES)
+def test_greedy_strategies_match_play(turns, table, difficulty):
+    """전략별 탐욕 선택 — 승리/IPO 경로까지 가는 게임을 포함"""
+    rules = Rules(difficulty)
+    for strategy in STRATEGIES:
+        best = np.array([max(range(len(choices)), key=lambda j: choice_preference(choices[j], strategy))
+                         for choices in table.choices])
+        batch = play_batch(table, rules, 1, lambda batch, games, rows: best[rows])
+        _assert_same(batch, [play(turns, rules, greedy_policy(strategy))])
+
+def test_max_steps_stops_like_play(turns, table):
+    rules = Rules('NORMAL')
+    batch = play_batch(table, rules, 3, lambda batch, games, rows: np.zeros(len(rows), dtype=np.int64),
+                       max_steps=4)
+    expected = play(turns, rules, lambda state, choices: choices[0], max_steps=4)
+    _assert_same(batch, [expected] * 3)
+
+def test_pickers_stay_inside_each_turn(table):
+    rng = np.random.default_rng(0)
+    rows = np.repeat(np.arange(len(table.choices)), 200)
+    for pick in (uniform_picker(table, rng), weighted_picker(table, rng, {})):
+        cols = pick(None, rows, rows)
+        assert ((cols >= 0) & (cols < table.count[rows])).all()
+
+    # 가중치 0 인 선택지는 고르지 않음
+    first = {choices[0].id: 1.0 for choices in table.choices}
+    cols = weighted_picker(table, rng, first)(None, rows, rows)
+    assert (cols == 0).all()
+
+def test_monte_carlo_engines_agree(game_data):
+    """analyze_balance.monte_carlo — numpy 엔진과 play() 엔진의 승률 분포가 표본 오차 안에서 같음"""
+    runs = {engine: monte_carlo(game_data, 4000, difficulties=('NORMAL', 'HARD'), engine=engine)
+            for engine in ('numpy', 'python')}
+    for difficulty in ('NORMAL', 'HARD'):
+        fast, slow = (runs[engine]['by_difficulty'][difficulty] for engine in ('numpy', 'python'))
+        assert abs(fast['win_rate'] - slow['win_rate']) < 0.03
+        assert abs(fast['loss_rate'] - slow['loss_rate']) < 0.03
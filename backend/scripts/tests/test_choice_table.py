@@ -0,0 +1,62 @@
+"""choice_table — 바이너리 캐시 왕복, compile_turns 와의 id/효과 일치, 형식/엔진 버전 검사"""
+
+import copy
+import os
+import struct
+
+import pytest
+
+import choice_table
+from choice_table import ChoiceTable, cache_path, compile_choice_table, load_choice_table
+from game_engine import compile_turns
+
+def _signature(turns):
+    return {turn: [(c.id, type(c.id), c.users, c.cash, c.trust, c.infra, c.next_turn, c.tags,
+                    c.hires_developer, c.hires_designer, c.hires_planner, c.text) for c in choices]
+            for turn, choices in turns.items()}
+
+@pytest.fixture
+def mixed_data(game_data):
+    """문자열 숫자 id('1123')와 숫자가 아닌 id(rebalance_game 의 투자 라운드)가 섞인 데이터"""
+    data = copy.deepcopy(game_data)
+    extra = dict(data[5]['choices'][0], id='invest_6_conservative')
+    data[5]['choices'].append(extra)
+    return data
+
+def test_binary_round_trip_matches_compile_turns(mixed_data, tmp_path):
+    expected = _signature(compile_turns(mixed_data))
+    table = compile_choice_table(mixed_data, '0' * 16)
+    assert _signature(table.turns()) == expected
+
+    path = str(tmp_path / 'table.bin')
+    table.save(path)
+    loaded = ChoiceTable.open(path)
+    assert _signature(loaded.turns()) == expected
+    assert list(loaded.users) == list(table.users) and list(loaded.infra) == list(table.infra)
+
+def test_choice_ids_are_normalized(mixed_data):
+    ids = {c.id for choices in compile_turns(mixed_data).values() for c in choices}
+    assert 1123 in ids and '1123' not in ids
+    assert 'invest_6_conservative' in ids
+
+def test_cache_rejects_other_format_or_engine(game_data, tmp_path, monkeypatch):
+    table = compile_choice_table(game_data, '0' * 16)
+    path = str(tmp_path / 'table.bin')
+    table.save(path)
+
+    monkeypatch.setattr(choice_table, 'CONSTANTS_HASH', 'f' * 16)
+    with pytest.raises(ValueError, match='엔진'):
+        ChoiceTable.open(path)
+    monkeypatch.undo()
+
+    with open(path, 'r+b') as f:
+        f.seek(6)
+        f.write(struct.pack('<H', choice_table.FORMAT_VERSION + 1))
+    with pytest.raises(ValueError, match='형식 버전'):
+        ChoiceTable.open(path)
+
+def test_load_choice_table_keys_cache_by_engine(data_path, tmp_path):
+    cache_dir = str(tmp_path / 'cache')
+    first = load_choice_table(data_path, cache_dir)
+    assert os.path.exists(cache_path(cache_dir, first.source_hash))
+    assert _signature(load_choice_table(data_path, cache_dir).turns()) == _signature(first.turns())
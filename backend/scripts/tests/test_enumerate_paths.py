@@ -0,0 +1,68 @@
+"""analyze_balance.enumerate_paths — 정확 모드는 모든 경로를 하나씩 진행한 결과와 같아야 함"""
+
+from collections import Counter
+
+import pytest
+
+from analyze_balance import StateLimitExceeded, _finished, _weighted_percentiles, enumerate_paths
+from game_engine import Rules, compile_turns, new_game, step
+
+def _small_data():
+    """턴 1~5, 턴마다 선택지 3개 (같은 효과의 선택지가 있어 병합이 일어남), 턴 3 에서 888 로 갈 수 있음"""
+    data = []
+    for turn in range(1, 6):
+        choices = [
+            {'id': turn * 10 + 1, 'text': '투자', 'next_turn': turn + 1,
+             'effects': {'users': 1000 * turn, 'cash': -3_000_000, 'trust': 2, 'infra': ['EC2']}},
+            {'id': turn * 10 + 2, 'text': '절약', 'next_turn': turn + 1,
+             'effects': {'users': 0, 'cash': 1_000_000, 'trust': -1}},
+            {'id': turn * 10 + 3, 'text': '절약 (중복)', 'next_turn': 888 if turn == 3 else turn + 1,
+             'effects': {'users': 0, 'cash': 1_000_000, 'trust': -1}},
+        ]
+        data.append({'turn': turn, 'choices': choices})
+    data.append({'turn': 888, 'choices': [
+        {'id': 8881, 'text': '복귀', 'next_turn': 4, 'effects': {'users': 500, 'cash': 0, 'trust': 1}}]})
+    return data
+
+def _brute_force(turns, rules, max_steps=200):
+    """모든 선택 순서를 하나씩 끝까지 진행"""
+    statuses, probabilities, outcomes = Counter(), Counter(), {'users': [], 'cash': [], 'trust': []}
+
+    def walk(state, probability):
+        if _finished(state, turns, max_steps):
+            statuses[state.status] += 1
+            probabilities[state.status] += probability
+            for metric in outcomes:
+                outcomes[metric].append((getattr(state, metric), 1))
+            return
+        choices = turns[state.turn]
+        for choice in choices:
+            walk(step(state.copy(), choice, rules), probability / len(choices))
+
+    walk(new_game(rules), 1.0)
+    return statuses, probabilities, outcomes
+
+@pytest.mark.parametrize('difficulty', ['NORMAL', 'HARD'])
+def test_exact_enumeration_matches_brute_force(difficulty):
+    data = _small_data()
+    turns = compile_turns(data)
+    report = enumerate_paths(data, difficulty=difficulty, turns=turns)
+    statuses, probabilities, outcomes = _brute_force(turns, Rules(difficulty))
+
+    assert report['exact'] and report['resolution'] is None
+    assert report['total_paths'] == sum(statuses.values())
+    assert report['expanded_states'] < report['total_paths']  # 같은 상태가 실제로 병합됨
+    assert report['status'] == pytest.approx({s: n / report['total_paths'] for s, n in statuses.items()})
+    assert report['random_status'] == pytest.approx(dict(probabilities))
+    for metric, values in outcomes.items():
+        expected = {'min': min(v for v, _ in values), 'max': max(v for v, _ in values)}
+        expected.update(_weighted_percentiles(values, [10, 25, 50, 75, 90]))
+        assert report[metric] == expected
+
+def test_exact_enumeration_stops_at_state_limit(game_data):
+    with pytest.raises(StateLimitExceeded):
+        enumerate_paths(game_data, max_states=1_000)
+
+def test_lumped_enumeration_is_labelled_approximate():
+    report = enumerate_paths(_small_data(), resolution=0.5, trust_resolution=10)
+    assert report['exact'] is False and report['resolution'] == 0.5
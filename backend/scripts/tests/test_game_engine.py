@@ -0,0 +1,58 @@
+"""game_engine — 미리 계산한 표/경계가 game.service.ts 의 원래 식과 같은지, 상태 직렬화 왕복"""
+
+import random
+
+import pytest
+
+from game_engine import (
+    GAME_CONSTANTS, GameState, Rules, calculate_capacity_penalty, calculate_max_capacity, choice_id,
+    compile_turns, infra_mask, infra_names, play, random_policy,
+)
+
+def _penalty_formula(users, max_capacity):
+    """calculateCapacityPenalty 그대로 (가장 높은 단계부터 excessRatio 비교)"""
+    if max_capacity <= 0:
+        return GAME_CONSTANTS['CAPACITY_EXCEEDED_TRUST_PENALTY']
+    ratio = (users - max_capacity) / max_capacity
+    for tier in reversed(GAME_CONSTANTS['CAPACITY_PENALTY_TIERS']):
+        if ratio >= tier['excessRatio']:
+            return tier['penalty']
+    return GAME_CONSTANTS['CAPACITY_PENALTY_TIERS'][0]['penalty']
+
+def test_capacity_penalty_matches_formula():
+    rng = random.Random(0)
+    for _ in range(20000):
+        capacity = rng.choice([0, 1, 3, 7, 10000, 15750, 33333, rng.randrange(1, 10 ** 7)])
+        users = rng.randrange(capacity, 3 * capacity + 2)
+        assert calculate_capacity_penalty(users, capacity) == _penalty_formula(users, capacity), (users, capacity)
+
+def test_capacity_table_matches_sum():
+    capacities = GAME_CONSTANTS['INFRASTRUCTURE_CAPACITY']
+    names = list(capacities) + ['ALB', 'SageMaker']   # 용량 표에 없는 인프라는 0
+    rng = random.Random(1)
+    for _ in range(500):
+        chosen = rng.sample(names, rng.randrange(len(names)))
+        expected = GAME_CONSTANTS['BASE_CAPACITY'] + sum(capacities.get(name, 0) for name in chosen)
+        assert calculate_max_capacity(infra_mask(chosen), False) == expected
+        assert calculate_max_capacity(infra_mask(chosen), True) == (
+            expected * GAME_CONSTANTS['CONSULTING_CAPACITY_MULTIPLIER'])
+        assert infra_names(infra_mask(chosen)) == frozenset(chosen)
+
+@pytest.mark.parametrize('difficulty', ['EASY', 'NORMAL', 'HARD'])
+def test_state_dict_round_trip(game_data, difficulty):
+    turns = compile_turns(game_data)
+    rules = Rules(difficulty)
+    rng = random.Random(difficulty)
+    for _ in range(50):
+        state = play(turns, rules, random_policy(rng))
+        restored = GameState.from_dict(state.to_dict())
+        assert restored.key() == state.key()
+        assert restored.steps == state.steps
+
+def test_choice_ids_are_normalized():
+    assert choice_id('1123') == 1123 and choice_id(1123) == 1123
+    assert choice_id('invest_6_conservative') == 'invest_6_conservative'
+    turns = compile_turns([{'turn': 1, 'choices': [
+        {'id': '12', 'text': '', 'next_turn': 2, 'effects': {}},
+        {'id': 'invest_6_conservative', 'text': '', 'next_turn': 2, 'effects': {}}]}])
+    assert [choice.id for choice in turns[1]] == [12, 'invest_6_conservative']
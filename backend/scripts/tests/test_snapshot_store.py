@@ -0,0 +1,57 @@
+"""snapshot_store — 저장/복원 왕복, 같은 내용 재저장, 구조적 diff, gc"""
+
+import copy
+
+from snapshot_store import SnapshotStore, diff_manifests
+
+def test_save_restore_round_trip(tmp_path, game_data):
+    store = SnapshotStore(str(tmp_path))
+    manifest, written = store.save(game_data, label='base')
+    assert written > 0
+    assert SnapshotStore(str(tmp_path)).restore(store.resolve('base')) == game_data
+
+    # 같은 내용은 같은 버전 id, 새로 쓰는 객체 없음
+    again, written = store.save(copy.deepcopy(game_data))
+    assert again['id'] == manifest['id']
+    assert written == 0
+
+def test_structural_diff(tmp_path, game_data):
+    store = SnapshotStore(str(tmp_path))
+    old, _ = store.save(game_data, label='old')
+
+    data = copy.deepcopy(game_data)
+    first, second = data[0]['choices'][0], data[1]['choices'][0]
+    first['effects']['cash'] = first['effects'].get('cash', 0) + 1
+    second['next_turn'] = second['next_turn'] + 1
+    removed = data[2]['choices'].pop()
+    data[3]['choices'].append({'id': 999999, 'text': '새 선택지', 'next_turn': 5, 'effects': {}})
+    new, _ = store.save(data, label='new')
+
+    diff = diff_manifests(store, old, new)
+    assert diff['added'] == ['999999']
+    assert diff['removed'] == [str(removed['id'])]
+    assert set(diff['changed']) == {str(first['id']), str(second['id'])}
+    assert diff['changed'][str(first['id'])]['effects']['cash'][1] == first['effects']['cash']
+    assert 'next_turn' in diff['changed'][str(second['id'])]
+    assert diff_manifests(store, new, new) == {'added': [], 'removed': [], 'changed': {}, 'turns': {}}
+
+def test_flat_layout_round_trip(tmp_path, game_data):
+    flat = [{'choiceId': choice['id'], 'turnNumber': turn['turn'], 'nextTurn': choice['next_turn'],
+             'text': choice.get('text', ''), 'effects': choice['effects']}
+            for turn in game_data for choice in turn['choices']]
+    store = SnapshotStore(str(tmp_path))
+    manifest, _ = store.save(flat)
+    assert manifest['layout'] == 'flat'
+    assert store.restore(manifest) == flat
+
+def test_forget_and_gc_keep_remaining_versions(tmp_path, game_data):
+    store = SnapshotStore(str(tmp_path))
+    store.save(game_data, label='keep')
+    data = copy.deepcopy(game_data)
+    data[0]['choices'][0]['text'] = '바뀐 텍스트'
+    store.save(data, label='drop')
+
+    store.forget('drop')
+    removed, freed = store.gc()
+    assert removed == 1 and freed > 0
+    assert SnapshotStore(str(tmp_path)).restore(store.resolve('keep')) == game_data
@@ -0,0 +1,34 @@
+"""solve_victory_paths — 'found' 는 정확한 엔진 재생이 목표 상태에 도달했을 때만"""
+
+import sys
+
+import pytest
+
+from game_engine import VICTORY_STATUS, Rules, compile_turns, new_game, step
+from solve_victory_paths import VictoryPathSolver
+
+@pytest.fixture(scope='module')
+def turns(game_data):
+    sys.setrecursionlimit(max(sys.getrecursionlimit(), 2000))
+    return compile_turns(game_data)
+
+def _replay(turns, rules, sequence):
+    state = new_game(rules)
+    for entry in sequence:
+        assert state.turn == entry['turn']
+        choice = next(c for c in turns[state.turn] if c.id == entry['choice_id'])
+        step(state, choice, rules)
+    return state
+
+@pytest.mark.parametrize('difficulty', ['EASY', 'HARD'])
+def test_found_only_when_exact_replay_reaches_target(turns, difficulty):
+    rules = Rules(difficulty)
+    # 거친 이산화로 빠르게 — 예측이 틀려도 결과는 재생 기준이어야 함
+    report = VictoryPathSolver(turns, rules, resolution=4.0, trust_resolution=25).solve()
+    for path, result in report.items():
+        state = _replay(turns, rules, result['sequence'])
+        reached = state.status == VICTORY_STATUS[path]
+        assert result['verified'] is reached and result['reachable'] is reached
+        assert result['result'] == ('found' if reached else 'not found')
+        assert (result['reason'] is None) is reached
+        assert result['final']['status'] == state.status
@@ -0,0 +1,44 @@
+"""trajectory_store — 열 인코딩 왕복, 기록한 판을 다시 열어 엔진 재생과 비교"""
+
+import numpy as np
+import pytest
+
+from trajectory_store import TrajectoryStore, delta_decode, delta_encode, record, verify
+
+def test_delta_round_trip():
+    rng = np.random.default_rng(0)
+    steps = rng.integers(0, 6, size=200)
+    steps[:3] = 0   # 스텝 없는 판이 앞/중간에 있어도 판마다 다시 시작
+    values = rng.integers(-10 ** 12, 10 ** 12, size=int(steps.sum()))
+    assert np.array_equal(delta_decode(delta_encode(values.copy(), steps), steps), values)
+
+@pytest.mark.parametrize('compress', [False, True])
+def test_record_reopen_and_replay(tmp_path, data_path, compress):
+    store = TrajectoryStore(str(tmp_path))
+    entries = record(store, data_path, ['NORMAL', 'HARD'], games=150, seed=3, chunk=64, compress=compress)
+    assert [entry['games'] for entry in entries] == [64, 64, 22, 64, 64, 22]
+
+    reopened = TrajectoryStore(str(tmp_path))
+    assert len(reopened) == 300
+    # 저장된 선택 순서를 엔진으로 다시 재생하면 스텝별 값/결과/점수가 같음
+    assert verify(reopened, sample=60, seed=1) == (60, 0)
+
+    for game in (0, 63, 64, 149, 150, 299):
+        trajectory = reopened.trajectory(game)
+        assert trajectory['difficulty'] == ('NORMAL' if game < 150 else 'HARD')
+        last = trajectory['history'][-1]
+        assert trajectory['final'] == {metric: last[metric] for metric in ('users', 'cash', 'trust')}
+
+def test_query_matches_summary(tmp_path, data_path):
+    store = TrajectoryStore(str(tmp_path))
+    record(store, data_path, ['NORMAL'], games=120, seed=5, chunk=50)
+    summary = store.summarize(np.arange(len(store)))
+    assert summary['count'] == 120
+    for outcome, count in summary['outcomes'].items():
+        ids = store.query(outcome=outcome)
+        assert len(ids) == count
+        assert all(store.trajectory(int(game))['outcome'] == outcome for game in ids[:5])
+
+    chosen = store.trajectory(0)['history'][0]['choice']
+    for game in store.query(choice=chosen, limit=10):
+        assert chosen in [row['choice'] for row in store.trajectory(int(game))['history']]
@@ -0,0 +1,700 @@
+#!/usr/bin/env python3
+"""
+AWS CTO Game - Trajectory Store
+수백만 판 시뮬레이션의 턴별 기록을 압축 열(column) 청크 파일로 저장하고 질의
+
+analyze_balance.simulate_path 처럼 턴마다 dict 를 복사해 두는 history 는 전략 6개에는 충분하지만,
+밸런스 회귀를 디버깅할 때 들여다보는 수백만 판 규모에서는 수 GB 가 됩니다. 이 저장소는
+- 판(game) 열: 난이도, 결과(status), 마지막 턴, 스텝 수, 최종 유저/현금/신뢰도, 리더보드 점수
+- 스텝 열: 선택한 턴, 선택지 id, 선택 후 유저/현금/신뢰도, 인프라 비트마스크
+를 고정 폭 정수 열로 만들어 청크 파일(chunk-NNNNNN.trj)에 나눠 씁니다.
+- 턴/유저/현금/신뢰도 열은 판의 첫 스텝만 원래 값, 이후는 직전 스텝과의 차이(delta)입니다.
+  판 하나를 따로 복원할 수 있고, 값이 작아져 열 폭(int8/16/32/64 중 가장 좁은 것)과 압축률이 좋아집니다.
+  현금처럼 열의 모든 값이 공약수(10,000 등)를 가지면 그 수로 나눠 저장합니다.
+- 열은 8바이트 정렬 원본(mmap 위에서 복사 없이 읽음) 또는 zlib 압축(--compress)으로 저장합니다.
+- manifest.json 에 청크별 요약(결과/난이도별 판 수, 나온 턴과 선택지 id)을 두어
+  질의와 맞지 않는 청크는 열지 않고, 맞는 청크에서도 질의에 필요한 열만 읽습니다.
+
+사용 예:
+    python3 trajectory_store.py record --games 1000000 --difficulties NORMAL HARD --compress
+    python3 trajectory_store.py info
+    python3 trajectory_store.py query --outcome WON_IPO --choice 1123 --show 3
+    python3 trajectory_store.py query --difficulty HARD --reached 950 --outcome LOST_FAILED_IPO
+    python3 trajectory_store.py verify --sample 2000      # 저장된 선택 순서를 엔진으로 다시 재생해 비교
+"""
+
+import argparse
+import array
+import hashlib
+import json
+import mmap
+import os
+import random
+import struct
+import time
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from game_engine import (
+    CONSTANTS_HASH, DIFFICULTIES, VICTORY_STATUS, GameStatus, Rules,
+    compile_turns, final_score, infra_bit_names, load_game_data, new_game, play, random_policy, step,
+)
+from event_matcher import EVENTS_FILE, EventMatcher, EventRunner, load_events
+from profiler import PROFILER, add_arguments as add_profile_arguments, enable, enable_from_args, finish_from_args
+
+STORE_VERSION = 1
+DEFAULT_STORE = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.cache', 'trajectories')
+MANIFEST = 'manifest.json'
+OPEN_CHUNKS = 4   # trajectory() 연속 호출에 대비해 열어 둘 청크 수
+
+MAGIC = b'CTOTRJ01'
+# magic, 판 수, 스텝 수, 열 목록(JSON) 길이
+_HEADER = struct.Struct('<8sIQQ')
+_ALIGN = 8
+
+# 결과 번호 = 이 목록의 위치 (파일에는 번호만 저장)
+OUTCOMES = tuple(VICTORY_STATUS.values()) + (
+    GameStatus.LOST_BANKRUPT, GameStatus.LOST_OUTAGE, GameStatus.LOST_FAILED_IPO,
+    GameStatus.LOST_EQUITY, GameStatus.LOST_FIRED_CTO, GameStatus.PLAYING,
+)
+OUTCOME_CODES = {status: i for i, status in enumerate(OUTCOMES)}
+DIFFICULTY_CODES = {mode: i for i, mode in enumerate(DIFFICULTIES)}
+
+GAME_COLUMNS = ('difficulty', 'outcome', 'final_turn', 'steps', 'users', 'cash', 'trust', 'score')
+STEP_COLUMNS = ('turn', 'choice', 'users', 'cash', 'trust', 'infra')
+DELTA_COLUMNS = frozenset(('turn', 'users', 'cash', 'trust'))
+_WIDTHS = (np.int8, np.int16, np.int32, np.int64)
+
+def file_hash(path: str) -> str:
+    with open(path, 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()[:16]
+
+# ---------------------------------------------------------------------------
+# 열 인코딩
+# ---------------------------------------------------------------------------
+
+def _aligned(offset: int) -> int:
+    return (offset + _ALIGN - 1) // _ALIGN * _ALIGN
+
+def _narrowest(values: np.ndarray):
+    """값 범위를 담을 수 있는 가장 좁은 정수형"""
+    if not len(values):
+        return np.int8
+    low, high = int(values.min()), int(values.max())
+    for dtype in _WIDTHS:
+        info = np.iinfo(dtype)
+        if info.min <= low and high <= info.max:
+            return dtype
+    raise ValueError(f'int64 범위를 벗어난 값 ({low}..{high})')
+
+def _game_starts(steps: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """(판별 첫 스텝 위치, 스텝이 하나 이상인 판 여부)"""
+    offsets = np.zeros(len(steps) + 1, dtype=np.int64)
+    np.cumsum(steps, out=offsets[1:])
+    return offsets[:-1], steps > 0
+
+def delta_encode(values: np.ndarray, steps: np.ndarray) -> np.ndarray:
+    """판마다 첫 값은 그대로, 나머지는 직전 스텝과의 차이"""
+    deltas = np.diff(values, prepend=0)
+    starts, nonempty = _game_starts(steps)
+    starts = starts[nonempty]
+    deltas[starts] = values[starts]
+    return deltas
+
+def delta_decode(deltas: np.ndarray, steps: np.ndarray) -> np.ndarray:
+    """delta_encode 의 역 — 누적합에서 판 시작 직전까지의 누적합을 빼서 판마다 다시 시작"""
+    total = np.cumsum(deltas, dtype=np.int64)
+    starts, nonempty = _game_starts(steps)
+    starts = starts[nonempty]
+    before = total[starts] - deltas[starts]
+    return total - np.repeat(before, steps[nonempty])
+
+def write_chunk(path: str, games: Dict[str, np.ndarray], rows: Dict[str, np.ndarray],
+                infra_names: Sequence[str], compress: bool = False) -> int:
+    """판/스텝 열을 청크 파일 하나로 저장 (쓴 바이트 수)"""
+    steps = games['steps']
+    blobs, columns, offset = [], {}, 0
+    for kind, values in (('game', games), ('step', rows)):
+        for name, column in values.items():
+            column = np.asarray(column, dtype=np.int64)
+            if kind == 'step' and name in DELTA_COLUMNS:
+                column = delta_encode(column, steps)
+            # 현금처럼 모든 값이 같은 수(10,000 등)의 배수면 나눠서 저장 — 열 폭이 한두 단계 줄어듦
+            scale = int(np.gcd.reduce(column)) if len(column) else 1
+            if scale > 1:
+                column = column // scale
+            column = column.astype(_narrowest(column))
+            payload = column.tobytes()
+            codec = 'raw'
+            if compress:
+                payload, codec = zlib.compress(payload, 6), 'zlib'
+            columns[f'{kind}:{name}'] = {'offset': offset, 'size': len(payload), 'count': len(column),
+                                         'dtype': column.dtype.str, 'scale': max(scale, 1), 'codec': codec}
+            blobs.append((offset, payload))
+            offset = _aligned(offset + len(payload))
+    directory = json.dumps({'columns': columns, 'infra_names': list(infra_names)}).encode('utf-8')
+    data_start = _aligned(_HEADER.size + len(directory))
+
+    tmp = path + '.tmp'
+    with open(tmp, 'wb') as f:
+        f.write(_HEADER.pack(MAGIC, len(steps), int(steps.sum()), len(directory)))
+        f.write(directory)
+        for start, payload in blobs:
+            f.seek(data_start + start)
+            f.write(payload)
+        f.truncate(data_start + offset)
+    os.replace(tmp, path)
+    return data_start + offset
+
+class TrajectoryChunk:
+    """청크 파일 하나 (mmap) — 열은 처음 접근할 때 풀고 기억"""
+
+    def __init__(self, path: str):
+        with open(path, 'rb') as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, self.games, self.rows, directory_size = _HEADER.unpack_from(self._mm)
+        if magic != MAGIC:
+            raise ValueError(f'궤적 청크 파일이 아닙니다: {path}')
+        directory = json.loads(self._mm[_HEADER.size:_HEADER.size + directory_size])
+        self.columns = directory['columns']
+        self.infra_names = directory['infra_names']
+        self._data = _aligned(_HEADER.size + directory_size)
+        self._decoded: Dict[str, np.ndarray] = {}
+        self._stored: Dict[str, np.ndarray] = {}
+
+    def stored(self, key: str) -> np.ndarray:
+        """저장된 열 ('game:users', 'step:cash' 등 — delta 열은 차이값, 배율은 곱해서 돌려줌)"""
+        values = self._stored.get(key)
+        if values is not None:
+            return values
+        spec = self.columns[key]
+        start = self._data + spec['offset']
+        if spec['codec'] == 'zlib':
+            values = np.frombuffer(zlib.decompress(self._mm[start:start + spec['size']]), dtype=spec['dtype'])
+        else:
+            values = np.frombuffer(self._mm, dtype=spec['dtype'], count=spec['count'], offset=start)
+        if spec['scale'] != 1:
+            values = values * np.int64(spec['scale'])
+        if spec['codec'] != 'raw' or spec['scale'] != 1:
+            self._stored[key] = values  # 원본 열은 mmap 위의 보기라 기억할 필요 없음
+        return values
+
+    def game(self, name: str) -> np.ndarray:
+        key = f'game:{name}'
+        if key not in self._decoded:
+            self._decoded[key] = self.stored(key)
+        return self._decoded[key]
+
+    def step(self, name: str) -> np.ndarray:
+        """스텝 열 (delta 열은 원래 값으로 복원)"""
+        key = f'step:{name}'
+        if key not in self._decoded:
+            values = self.stored(key)
+            if name in DELTA_COLUMNS:
+                values = delta_decode(values, self.game('steps'))
+            self._decoded[key] = values
+        return self._decoded[key]
+
+    @property
+    def offsets(self) -> np.ndarray:
+        if 'offsets' not in self._decoded:
+            offsets = np.zeros(self.games + 1, dtype=np.int64)
+            np.cumsum(self.game('steps'), out=offsets[1:])
+            self._decoded['offsets'] = offsets
+        return self._decoded['offsets']
+
+    def any_step(self, name: str, values: Sequence[int]) -> np.ndarray:
+        """판마다 스텝 열에 values 중 하나가 나왔는지"""
+        hit = np.isin(self.step(name), values)
+        owner = np.repeat(np.arange(self.games), self.game('steps'))
+        return np.bincount(owner[hit], minlength=self.games) > 0
+
+    def history(self, index: int) -> Dict[str, np.ndarray]:
+        """판 하나의 스텝 열 (delta 열은 그 판의 구간만 누적합 — 청크 전체를 풀지 않음)"""
+        start, end = self.offsets[index], self.offsets[index + 1]
+        result = {}
+        for name in STEP_COLUMNS:
+            values = self.stored(f'step:{name}')[start:end]
+            result[name] = np.cumsum(values, dtype=np.int64) if name in DELTA_COLUMNS else values
+        return result
+
+# ---------------------------------------------------------------------------
+# 저장소
+# ---------------------------------------------------------------------------
+
+Filter = Union[None, int, str, Iterable]
+
+def _as_list(value: Filter) -> Optional[list]:
+    if value is None:
+        return None
+    if isinstance(value, (int, str)):
+        return [value]
+    return list(value)
+
+class TrajectoryStore:
+    """청크 디렉터리 + manifest.json"""
+
+    def __init__(self, root: str = DEFAULT_STORE):
+        self.root = root
+        try:
+            with open(os.path.join(root, MANIFEST), 'r', encoding='utf-8') as f:
+                self.manifest = json.load(f)
+        except FileNotFoundError:
+            self.manifest = {'version': STORE_VERSION, 'constants': CONSTANTS_HASH, 'outcomes': list(OUTCOMES),
+                             'difficulties': list(DIFFICULTIES), 'records': [], 'chunks': []}
+        if self.manifest['version'] != STORE_VERSION:
+            raise ValueError(f"저장소 버전 {self.manifest['version']} 은 지원하지 않습니다 (현재 {STORE_VERSION})")
+        self._starts = np.cumsum([0] + [entry['games'] for entry in self.chunks])
+        self._open: Dict[int, TrajectoryChunk] = {}
+
+    @property
+    def chunks(self) -> List[Dict]:
+        return self.manifest['chunks']
+
+    def __len__(self) -> int:
+        return int(self._starts[-1])
+
+    def save_manifest(self):
+        os.makedirs(self.root, exist_ok=True)
+        path = os.path.join(self.root, MANIFEST)
+        with open(path + '.tmp', 'w', encoding='utf-8') as f:
+            json.dump(self.manifest, f, ensure_ascii=False, indent=1)
+        os.replace(path + '.tmp', path)
+        self._starts = np.cumsum([0] + [entry['games'] for entry in self.chunks])
+
+    def clear(self):
+        """manifest 에 있는 청크 파일과 manifest 삭제"""
+        for entry in self.chunks:
+            path = os.path.join(self.root, entry['file'])
+            if os.path.exists(path):
+                os.remove(path)
+        self.manifest['records'] = []
+        self.manifest['chunks'] = []
+        self.manifest['constants'] = CONSTANTS_HASH
+        self._open.clear()
+        self.save_manifest()
+
+    def chunk(self, index: int) -> TrajectoryChunk:
+        chunk = self._open.pop(index, None)
+        if chunk is None:
+            chunk = TrajectoryChunk(os.path.join(self.root, self.chunks[index]['file']))
+            if len(self._open) >= OPEN_CHUNKS:
+                del self._open[next(iter(self._open))]
+        self._open[index] = chunk  # 최근에 쓴 청크를 뒤로
+        return chunk
+
+    def disk_usage(self) -> int:
+        return sum(entry['bytes'] for entry in self.chunks)
+
+    # -- 질의 ----------------------------------------------------------------
+
+    def _might_match(self, entry: Dict, outcomes, difficulties, reached, choices) -> bool:
+        """청크 요약(zone map)으로 확실히 맞지 않는 청크 거르기"""
+        if outcomes is not None and not any(entry['outcomes'].get(s) for s in outcomes):
+            return False
+        if difficulties is not None and not any(entry['difficulties'].get(d) for d in difficulties):
+            return False
+        if reached is not None and not set(reached) & set(entry['turns']):
+            return False
+        if choices is not None and not set(choices) & set(entry['choices']):
+            return False
+        return True
+
+    def query(self, outcome: Filter = None, difficulty: Filter = None, reached: Filter = None,
+              choice: Filter = None, limit: Optional[int] = None) -> np.ndarray:
+        """조건을 모두 만족하는 판 번호 (저장 순서)
+
+        각 조건은 값 하나 또는 목록(그중 하나면 만족)이며 None 이면 조건 없음입니다.
+        - outcome: 최종 status ('WON_IPO', 'LOST_BANKRUPT', 진행 중으로 끝난 판은 'PLAYING')
+        - difficulty: 'EASY' / 'NORMAL' / 'HARD'
+        - reached: 그 턴에서 선택했거나 그 턴에서 끝난 판
+        - choice: 그 선택지 id 를 한 번이라도 고른 판
+        """
+        outcomes, difficulties = _as_list(outcome), _as_list(difficulty)
+        reached, choices = _as_list(reached), _as_list(choice)
+        for status in outcomes or ():
+            if status not in OUTCOME_CODES:
+                raise ValueError(f'알 수 없는 결과: {status}')
+        found: List[np.ndarray] = []
+        total = 0
+        for index, entry in enumerate(self.chunks):
+            if limit is not None and total >= limit:
+                break
+            if not self._might_match(entry, outcomes, difficulties, reached, choices):
+                PROFILER.count('query:chunk skipped')
+                continue
+            PROFILER.count('query:chunk scanned')
+            with PROFILER.stage('query'):
+                chunk = self.chunk(index)
+                keep = np.ones(chunk.games, dtype=bool)
+                if outcomes is not None:
+                    keep &= np.isin(chunk.game('outcome'), [OUTCOME_CODES[s] for s in outcomes])
+                if difficulties is not None:
+                    keep &= np.isin(chunk.game('difficulty'), [DIFFICULTY_CODES[d] for d in difficulties])
+                if choices is not None and keep.any():
+                    keep &= chunk.any_step('choice', choices)
+                if reached is not None and keep.any():
+                    keep &= chunk.any_step('turn', reached) | np.isin(chunk.game('final_turn'), reached)
+                ids = np.flatnonzero(keep) + self._starts[index]
+            found.append(ids)
+            total += len(ids)
+        ids = np.concatenate(found) if found else np.empty(0, dtype=np.int64)
+        return ids[:limit] if limit is not None else ids
+
+    def _locate(self, game: int) -> Tuple[int, int]:
+        if not 0 <= game < len(self):
+            raise IndexError(f'판 번호 범위 밖: {game}')
+        index = int(np.searchsorted(self._starts, game, side='right')) - 1
+        return index, game - int(self._starts[index])
+
+    def trajectory(self, game: int) -> Dict:
+        """판 하나의 기록 (simulate_path 의 history 와 비슷한 dict)"""
+        index, local = self._locate(game)
+        chunk = self.chunk(index)
+        columns = chunk.history(local)
+        infra_names = chunk.infra_names
+        history = []
+        for i in range(len(columns['turn'])):
+            infra = int(columns['infra'][i])
+            history.append({'turn': int(columns['turn'][i]), 'choice': int(columns['choice'][i]),
+                            'users': int(columns['users'][i]), 'cash': int(columns['cash'][i]),
+                            'trust': int(columns['trust'][i]),
+                            'infra': [name for bit, name in enumerate(infra_names) if infra >> bit & 1]})
+        return {
+            'game': game,
+            'difficulty': DIFFICULTIES[int(chunk.game('difficulty')[local])],
+            'outcome': OUTCOMES[int(chunk.game('outcome')[local])],
+            'final_turn': int(chunk.game('final_turn')[local]),
+            'score': int(chunk.game('score')[local]),
+            'final': {name: int(chunk.game(name)[local]) for name in ('users', 'cash', 'trust')},
+            'history': history,
+        }
+
+    def summarize(self, ids: np.ndarray) -> Dict:
+        """판 번호 목록의 결과/난이도별 수와 평균 스텝/점수 (판 열만 읽음)"""
+        outcomes = np.zeros(len(OUTCOMES), dtype=np.int64)
+        difficulties = np.zeros(len(DIFFICULTIES), dtype=np.int64)
+        steps = score = 0
+        chunk_of = np.searchsorted(self._starts, ids, side='right') - 1
+        for index in np.unique(chunk_of):
+            chunk = self.chunk(int(index))
+            local = ids[chunk_of == index] - self._starts[index]
+            outcomes += np.bincount(chunk.game('outcome')[local], minlength=len(OUTCOMES))
+            difficulties += np.bincount(chunk.game('difficulty')[local], minlength=len(DIFFICULTIES))
+            steps += int(chunk.game('steps')[local].sum())
+            score += int(chunk.game('score')[local].astype(np.int64).sum())
+        count = len(ids)
+        return {
+            'count': count,
+            'outcomes': {status: int(n) for status, n in zip(OUTCOMES, outcomes) if n},
+            'difficulties': {mode: int(n) for mode, n in zip(DIFFICULTIES, difficulties) if n},
+            'mean_steps': steps / count if count else 0.0,
+            'mean_score': score / count if count else 0.0,
+        }
+
+# ---------------------------------------------------------------------------
+# 기록 (balance_sweep.py 와 같은 워커 전역 상태 패턴 — 워커가 청크 파일을 직접 씀)
+# ---------------------------------------------------------------------------
+
+_TURNS: Dict = {}
+_EVENTS: Optional[EventMatcher] = None
+_IN_WORKER = False
+
+def _load_tables(data_path: str, events_path: Optional[str] = None):
+    global _TURNS, _EVENTS
+    if not _TURNS:
+        _TURNS = compile_turns(load_game_data(data_path))
+    if events_path and _EVENTS is None:
+        _EVENTS = EventMatcher(load_events(events_path))
+
+def _init_worker(data_path: str, profile: bool = False, events_path: Optional[str] = None):
+    global _IN_WORKER
+    _IN_WORKER = True
+    if profile:
+        enable()
+    _load_tables(data_path, events_path)
+
+class _Recorder:
+    """play 의 on_step 훅 — (이벤트 적용 후) 스텝 열에 한 줄 추가"""
+
+    __slots__ = ('runner',) + STEP_COLUMNS
+
+    def __init__(self, runner: Optional[EventRunner] = None):
+        self.runner = runner
+        for name in STEP_COLUMNS:
+            setattr(self, name, array.array('q'))
+
+    def __call__(self, state, choice):
+        if self.runner is not None:
+            self.runner(state, choice)
+        self.turn.append(choice.turn)
+        self.choice.append(int(choice.id))
+        self.users.append(state.users)
+        self.cash.append(state.cash)
+        self.trust.append(state.trust)
+        self.infra.append(state.infra)
+
+def _record_job(job: Tuple[str, str, int, int, bool, int]) -> Dict:
+    """(청크 경로, 난이도, 시드, 판 수, 압축 여부, 최대 스텝) → manifest 청크 항목"""
+    path, difficulty, seed, games, compress, max_steps = job
+    started = time.perf_counter()
+    rules = Rules(difficulty)
+    policy = random_policy(random.Random(seed))
+    runner = None
+    if _EVENTS is not None:
+        runner = EventRunner(_EVENTS, difficulty, random.Random(f'events:{seed}'))
+    recorder = _Recorder(runner)
+    columns = {name: np.empty(games, dtype=np.int64) for name in GAME_COLUMNS}
+    columns['difficulty'][:] = DIFFICULTY_CODES[difficulty]
+    with PROFILER.stage('simulate'), PROFILER.stage(difficulty):
+        for g in range(games):
+            if runner is not None:
+                runner.reset()
+            before = len(recorder.turn)
+            final = play(_TURNS, rules, policy, max_steps=max_steps, on_step=recorder)
+            columns['outcome'][g] = OUTCOME_CODES[final.status]
+            columns['final_turn'][g] = final.turn
+            columns['steps'][g] = len(recorder.turn) - before
+            columns['users'][g], columns['cash'][g], columns['trust'][g] = final.users, final.cash, final.trust
+            columns['score'][g] = final_score(final, rules)
+    rows = {name: np.frombuffer(getattr(recorder, name), dtype=np.int64) for name in STEP_COLUMNS}
+    with PROFILER.stage('write'):
+        size = write_chunk(path, columns, rows, infra_bit_names(), compress)
+    entry = {
+        'file': os.path.basename(path),
+        'games': games,
+        'rows': int(columns['steps'].sum()),
+        'bytes': size,
+        'outcomes': {OUTCOMES[code]: int(n) for code, n in enumerate(np.bincount(columns['outcome'])) if n},
+        'difficulties': {difficulty: games},
+        'turns': sorted(set(np.unique(rows['turn']).tolist()) | set(np.unique(columns['final_turn']).tolist())),
+        'choices': np.unique(rows['choice']).tolist(),
+    }
+    if PROFILER.enabled:
+        PROFILER.worker_task(os.getpid(), time.perf_counter() - started)
+        if _IN_WORKER:
+            entry['profile'] = PROFILER.drain()
+    return entry
+
+def record(store: TrajectoryStore, data_path: str, difficulties: Sequence[str], games: int,
+           seed: int = 0, workers: int = 1, chunk: int = 65536, compress: bool = False,
+           events_path: Optional[str] = None, max_steps: int = 200) -> List[Dict]:
+    """난이도별 games 판을 random 정책으로 진행해 청크를 추가하고 manifest 저장 (추가된 청크 항목)"""
+    if store.chunks and store.manifest['constants'] != CONSTANTS_HASH:
+        raise ValueError('game_constants.json 이 바뀌어 기존 기록에 이어 쓸 수 없습니다 (--append 없이 다시 기록)')
+    os.makedirs(store.root, exist_ok=True)
+    first = len(store.chunks)
+    jobs = [(os.path.join(store.root, f'chunk-{first + i:06d}.trj'), difficulty, seed * 100003 + start,
+             min(chunk, games - start), compress, max_steps)
+            for i, (difficulty, start) in enumerate((d, s) for d in difficulties for s in range(0, games, chunk))]
+    _load_tables(data_path, events_path)  # fork 시 워커가 그대로 상속
+    PROFILER.pool_start('record')
+    started = time.perf_counter()
+    entries = []
+
+    if workers == 1:
+        results = map(_record_job, jobs)
+    else:
+        pool = ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                   initargs=(data_path, PROFILER.enabled, events_path))
+        results = pool.map(_record_job, jobs)
+    try:
+        for entry in results:
+            profile = entry.pop('profile', None)
+            if profile is not None:
+                PROFILER.merge(profile)
+            entries.append(entry)
+    finally:
+        if workers != 1:
+            pool.shutdown()
+    PROFILER.pool('record', workers, time.perf_counter() - started)
+
+    store.chunks.extend(entries)
+    store.manifest['records'].append({
+        'data': data_path, 'data_hash': file_hash(data_path), 'difficulties': list(difficulties),
+        'games': games, 'seed': seed, 'events': events_path, 'max_steps': max_steps,
+        'chunks': [first, first + len(entries)],
+    })
+    store.save_manifest()
+    return entries
+
+# ---------------------------------------------------------------------------
+# 검증
+# ---------------------------------------------------------------------------
+
+def verify(store: TrajectoryStore, sample: int, seed: int = 0) -> Tuple[int, int]:
+    """저장된 선택 순서를 엔진으로 다시 재생해 스텝별 값과 결과 비교 → (검사한 판 수, 불일치 판 수)
+
+    랜덤 이벤트를 포함해 기록한 판은 선택만으로 재현되지 않으므로 건너뜁니다.
+    """
+    candidates = []
+    for record_entry in store.manifest['records']:
+        if record_entry['events']:
+            continue
+        if file_hash(record_entry['data']) != record_entry['data_hash']:
+            print(f"   ⏭️  {record_entry['data']} 이 기록 이후 바뀌어 검증에서 제외")
+            continue
+        low, high = record_entry['chunks']
+        candidates.append((record_entry, int(store._starts[low]), int(store._starts[high])))
+    if not candidates:
+        return 0, 0
+    rng = random.Random(seed)
+    checked = mismatches = 0
+    tables: Dict[str, Dict] = {}
+    picks = []
+    for _ in range(sample):
+        record_entry, low, high = rng.choice(candidates)
+        picks.append((rng.randrange(low, high), record_entry))
+    picks.sort(key=lambda pick: pick[0])  # 청크 순서대로 읽기
+    for game, record_entry in picks:
+        turns = tables.get(record_entry['data'])
+        if turns is None:
+            turns = tables[record_entry['data']] = compile_turns(load_game_data(record_entry['data']))
+        stored = store.trajectory(game)
+        rules = Rules(stored['difficulty'])
+        state = new_game(rules)
+        ok = True
+        for row in stored['history']:
+            choices = {int(c.id): c for c in turns.get(state.turn) or ()}
+            choice = choices.get(row['choice'])
+            if choice is None or state.turn != row['turn']:
+                ok = False
+                break
+            step(state, choice, rules)
+            if ((state.users, state.cash, state.trust) != (row['users'], row['cash'], row['trust'])
+                    or state.to_dict()['infra'] != sorted(row['infra'])):
+                ok = False
+                break
+        ok = ok and state.status == stored['outcome'] and final_score(state, rules) == stored['score']
+        checked += 1
+        mismatches += not ok
+    return checked, mismatches
+
+# ---------------------------------------------------------------------------
+# CLI
+# ---------------------------------------------------------------------------
+
+def _format_bytes(size: float) -> str:
+    for unit in ('B', 'KB', 'MB'):
+        if size < 1024:
+            return f'{size:.0f}{unit}' if unit == 'B' else f'{size:.1f}{unit}'
+        size /= 1024
+    return f'{size:.1f}GB'
+
+def _print_usage(store: TrajectoryStore):
+    games = len(store)
+    rows = sum(entry['rows'] for entry in store.chunks)
+    usage = store.disk_usage()
+    print(f"📦 {games:,}판 / {rows:,}스텝, 청크 {len(store.chunks)}개 → {_format_bytes(usage)}"
+          + (f" (판당 {usage / games:.1f}B, 스텝당 {usage / max(rows, 1):.2f}B)" if games else ''))
+
+def cmd_record(store: TrajectoryStore, args):
+    if store.chunks and not args.append:
+        store.clear()
+    workers = args.workers or os.cpu_count() or 1
+    print(f"🎲 난이도별 {args.games:,}판 기록 (워커 {workers}개"
+          + (", 랜덤 이벤트 포함" if args.events else "") + (", zlib 압축" if args.compress else "") + ")")
+    started = time.perf_counter()
+    entries = record(store, args.data, args.difficulties, args.games, seed=args.seed, workers=workers,
+                     chunk=args.chunk, compress=args.compress, events_path=args.events, max_steps=args.max_steps)
+    elapsed = time.perf_counter() - started
+    games = sum(entry['games'] for entry in entries)
+    written = sum(entry['bytes'] for entry in entries)
+    print(f"   {elapsed:.1f}초 ({games / max(elapsed, 1e-9):,.0f}판/초), 새 청크 {len(entries)}개 {_format_bytes(written)}")
+    _print_usage(store)
+
+def cmd_info(store: TrajectoryStore, args):
+    _print_usage(store)
+    outcomes: Dict[str, int] = {}
+    for entry in store.chunks:
+        for status, n in entry['outcomes'].items():
+            outcomes[status] = outcomes.get(status, 0) + n
+    for status in OUTCOMES:
+        if outcomes.get(status):
+            print(f"   {status}: {outcomes[status]:,} ({100 * outcomes[status] / len(store):.2f}%)")
+    for record_entry in store.manifest['records']:
+        print(f"   📝 {record_entry['data']} {','.join(record_entry['difficulties'])} × {record_entry['games']:,}판 "
+              f"(seed {record_entry['seed']}" + (", 이벤트" if record_entry['events'] else "") + ")")
+
+def _print_trajectory(trajectory: Dict):
+    print(f"\n   #{trajectory['game']} [{trajectory['difficulty']}] {trajectory['outcome']} "
+          f"턴 {trajectory['final_turn']}, 점수 {trajectory['score']:,}")
+    for row in trajectory['history']:
+        print(f"     턴 {row['turn']:>3} → 선택 {row['choice']:>5}  유저 {row['users']:>9,}  "
+              f"현금 {row['cash']:>14,}  신뢰도 {row['trust']:>3}  인프라 {len(row['infra'])}")
+
+def cmd_query(store: TrajectoryStore, args):
+    started = time.perf_counter()
+    ids = store.query(outcome=args.outcome, difficulty=args.difficulty, reached=args.reached,
+                      choice=args.choice, limit=args.limit)
+    elapsed = time.perf_counter() - started
+    summary = store.summarize(ids)
+    print(f"🔍 {len(store):,}판 중 {summary['count']:,}판 일치 ({elapsed * 1000:.0f}ms)")
+    if summary['count']:
+        print(f"   평균 {summary['mean_steps']:.1f}스텝, 평균 점수 {summary['mean_score']:,.0f}")
+        for status, n in summary['outcomes'].items():
+            print(f"   {status}: {n:,} ({100 * n / summary['count']:.2f}%)")
+    shown = [store.trajectory(int(game)) for game in ids[:args.show]]
+    for trajectory in shown:
+        _print_trajectory(trajectory)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump({'summary': summary, 'games': ids.tolist(), 'trajectories': shown}, f, ensure_ascii=False, indent=2)
+        print(f"\n💾 결과 저장: {args.output}")
+
+def cmd_verify(store: TrajectoryStore, args):
+    started = time.perf_counter()
+    checked, mismatches = verify(store, args.sample, args.seed)
+    if not checked:
+        print("⏭️  재생으로 검증할 수 있는 기록이 없습니다 (랜덤 이벤트 기록만 있음)")
+        return
+    print(f"{'✅' if not mismatches else '❌'} {checked:,}판 재생, 불일치 {mismatches}판 "
+          f"({time.perf_counter() - started:.1f}초)")
+
+def main():
+    parser = argparse.ArgumentParser(description='시뮬레이션 궤적 압축 열 저장소 (기록 + 질의)')
+    parser.add_argument('--store', default=DEFAULT_STORE, help='저장소 디렉터리')
+    add_profile_arguments(parser)
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    rec = commands.add_parser('record', help='random 정책 시뮬레이션을 기록 (기존 기록은 지움)')
+    rec.add_argument('--data', default='../game_choices_db.json', help='게임 데이터 JSON 경로')
+    rec.add_argument('--difficulties', nargs='+', default=['NORMAL'], choices=DIFFICULTIES)
+    rec.add_argument('--games', type=int, default=100000, help='난이도별 게임 수')
+    rec.add_argument('--chunk', type=int, default=65536, help='청크 하나의 게임 수')
+    rec.add_argument('--compress', action='store_true', help='열을 zlib 으로 압축 (mmap 직접 읽기 대신 압축 해제)')
+    rec.add_argument('--events', nargs='?', const=EVENTS_FILE,
+                     help='랜덤 이벤트 발동 포함 (이벤트 정의 JSON, 값 생략 시 random_events.json)')
+    rec.add_argument('--max-steps', type=int, default=200)
+    rec.add_argument('--append', action='store_true', help='기존 기록 뒤에 이어 쓰기')
+    rec.add_argument('--workers', type=int, default=1, help='워커 프로세스 수 (0이면 CPU 코어 수)')
+    rec.add_argument('--seed', type=int, default=0)
+    rec.set_defaults(handler=cmd_record)
+
+    commands.add_parser('info', help='저장소 크기와 결과 분포').set_defaults(handler=cmd_info)
+
+    query = commands.add_parser('query', help='결과/난이도/도달 턴/선택지로 판 찾기')
+    query.add_argument('--outcome', nargs='+', choices=OUTCOMES, help='최종 status (여러 개면 그중 하나)')
+    query.add_argument('--difficulty', nargs='+', choices=DIFFICULTIES)
+    query.add_argument('--reached', nargs='+', type=int, help='그 턴에서 선택했거나 끝난 판')
+    query.add_argument('--choice', nargs='+', type=int, help='그 선택지 id 를 고른 판')
+    query.add_argument('--limit', type=int, help='찾을 최대 판 수')
+    query.add_argument('--show', type=int, default=0, help='턴별 기록을 출력할 판 수')
+    query.add_argument('--output', help='일치한 판 번호와 출력한 기록 JSON 저장 경로')
+    query.set_defaults(handler=cmd_query)
+
+    check = commands.add_parser('verify', help='저장된 선택 순서를 엔진으로 재생해 기록과 비교')
+    check.add_argument('--sample', type=int, default=1000, help='검사할 판 수')
+    check.add_argument('--seed', type=int, default=0)
+    check.set_defaults(handler=cmd_verify)
+
+    args = parser.parse_args()
+    enable_from_args(args)
+    args.handler(TrajectoryStore(args.store), args)
+    finish_from_args(args)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,295 @@
+#!/usr/bin/env python3
+"""
+AWS CTO Game - Rebalance Auto-Tuner
+rebalance_game.py 파이프라인 파라미터 자동 탐색
+
+1. 파라미터 공간(예: adjust_costs.reduction_factor, adjust_trust_growth.factor)을
+   Latin hypercube 로 고르게 샘플링하고
+2. 점수가 좋은 후보 주변을 패턴 탐색(좌표별 ± 스텝, 스텝 반감)으로 다듬습니다.
+
+후보 하나의 점수 = 재조정 파이프라인 적용 → game_engine 으로 난이도별 게임 시뮬레이션 →
+목표 구간(예: NORMAL IPO 승률 20~40%, HARD 파산율 60% 이하)을 벗어난 거리의 제곱합 (0 이면 모든 목표 충족).
+모든 후보는 같은 시드(공통 난수)로 평가되어 후보 간 차이가 잡음보다 파라미터를 반영하고,
+점수는 (데이터, 상수, 목표, 시뮬레이션 설정, 파라미터 벡터) 해시별로 디스크에 캐시되어
+중단 후 다시 실행하면 이미 평가한 후보는 건너뜁니다.
+
+사용 예:
+    python3 tune_rebalance.py --samples 64 --refine-rounds 6 --games 400
+    python3 tune_rebalance.py --spec tune_spec.json --output ../rebalance_tuned.json
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+from game_engine import CONSTANTS_HASH, GameStatus, Rules, compile_turns, load_game_data, play, random_policy
+from rebalance_game import DEFAULT_PIPELINE, apply_overrides, compile_pipeline, run_pipeline
+
+DEFAULT_CACHE = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.cache', 'tuner_scores.json')
+
+# 탐색 공간: 이름(stage.param) → [하한, 상한, 'float' | 'int']
+DEFAULT_SPACE = {
+    'adjust_costs.reduction_factor': [0.2, 0.9, 'float'],
+    'adjust_costs.mid_game_factor': [0.1, 0.8, 'float'],
+    'normalize_user_effects.max_users': [50000, 300000, 'int'],
+    'adjust_trust_growth.factor': [0.2, 1.0, 'float'],
+}
+
+# 목표: 난이도별 지표가 [min, max] 안에 들어오도록
+#   metric: 'win_rate' 또는 'status:<GameStatus>' (해당 종료 상태 비율)
+DEFAULT_TARGETS = [
+    {'difficulty': 'NORMAL', 'metric': f'status:{GameStatus.WON_IPO}', 'min': 0.15, 'max': 0.35},
+    {'difficulty': 'NORMAL', 'metric': 'win_rate', 'min': 0.3, 'max': 0.6},
+    {'difficulty': 'HARD', 'metric': f'status:{GameStatus.LOST_BANKRUPT}', 'min': 0.0, 'max': 0.6},
+]
+
+# 워커 프로세스 전역 상태 (balance_sweep 과 같은 방식: 기본 데이터는 프로세스당 한 번만 로드)
+_BASE_DATA: Optional[List[Dict]] = None
+_SETTINGS: Dict = {}
+
+def _init_worker(data_path: str, settings: Dict):
+    global _BASE_DATA, _SETTINGS
+    _BASE_DATA = load_game_data(data_path)
+    _SETTINGS = settings
+
+def _pipeline_for(params: Dict) -> List[Dict]:
+    stages = [dict(entry) for entry in _SETTINGS['pipeline']]
+    apply_overrides(stages, [f'{name}={json.dumps(value)}' for name, value in params.items()])
+    return stages
+
+def measure(data: List[Dict], targets: List[Dict], games: int, seed: int) -> Dict[str, float]:
+    """목표에 쓰이는 (난이도, 지표) 값 측정 — 무작위 정책, 난이도별 같은 시드"""
+    turns = compile_turns(data)
+    measured = {}
+    for difficulty in sorted({t['difficulty'] for t in targets}):
+        rules = Rules(difficulty)
+        rng = random.Random(seed)
+        policy = random_policy(rng)
+        status = {}
+        for _ in range(games):
+            final = play(turns, rules, policy)
+            status[final.status] = status.get(final.status, 0) + 1
+        wins = sum(count for s, count in status.items() if s.startswith('WON_'))
+        measured[f'{difficulty}:win_rate'] = wins / games
+        for s, count in status.items():
+            measured[f'{difficulty}:status:{s}'] = count / games
+    return measured
+
+def score(measured: Dict[str, float], targets: List[Dict]) -> float:
+    """목표 구간을 벗어난 거리의 제곱합 (가중치 weight, 기본 1)"""
+    total = 0.0
+    for target in targets:
+        value = measured.get(f"{target['difficulty']}:{target['metric']}", 0.0)
+        miss = max(target.get('min', 0.0) - value, 0.0, value - target.get('max', 1.0))
+        total += target.get('weight', 1.0) * miss * miss
+    return total
+
+def _evaluate(params: Dict) -> Tuple[Dict, float, Dict]:
+    data = run_pipeline(_BASE_DATA, _pipeline_for(params))
+    measured = measure(data, _SETTINGS['targets'], _SETTINGS['games'], _SETTINGS['seed'])
+    return params, score(measured, _SETTINGS['targets']), measured
+
+# ---------------------------------------------------------------------------
+# 탐색 공간
+# ---------------------------------------------------------------------------
+
+def _clip(space: Dict, name: str, value: float):
+    low, high, kind = space[name]
+    value = min(max(value, low), high)
+    return int(round(value)) if kind == 'int' else round(value, 4)
+
+def latin_hypercube(space: Dict, samples: int, rng: random.Random) -> List[Dict]:
+    """각 차원을 samples 개 구간으로 나누고 구간마다 한 점씩, 차원별 순서는 무작위로 섞음"""
+    names = sorted(space)
+    columns = {}
+    for name in names:
+        low, high, _ = space[name]
+        strata = [(i + rng.random()) / samples for i in range(samples)]
+        rng.shuffle(strata)
+        columns[name] = [low + (high - low) * u for u in strata]
+    return [{name: _clip(space, name, columns[name][i]) for name in names} for i in range(samples)]
+
+def neighbors(space: Dict, center: Dict, steps: Dict) -> List[Dict]:
+    """패턴 탐색 이웃: 좌표 하나씩 ± 스텝"""
+    result = []
+    for name in sorted(space):
+        for direction in (-1, 1):
+            candidate = dict(center)
+            candidate[name] = _clip(space, name, center[name] + direction * steps[name])
+            if candidate[name] != center[name]:
+                result.append(candidate)
+    return result
+
+# ---------------------------------------------------------------------------
+# 점수 캐시 + 병렬 평가
+# ---------------------------------------------------------------------------
+
+def _file_hash(path: str) -> str:
+    with open(path, 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()[:16]
+
+class Tuner:
+    def __init__(self, data_path: str, space: Dict, targets: List[Dict], pipeline: List[Dict],
+                 games: int = 400, seed: int = 0, workers: int = 0, cache_path: Optional[str] = DEFAULT_CACHE):
+        compile_pipeline(pipeline)  # 잘못된 스테이지는 워커를 띄우기 전에 확인
+        self.data_path = data_path
+        self.space = space
+        self.targets = targets
+        self.settings = {'pipeline': pipeline, 'targets': targets, 'games': games, 'seed': seed}
+        self.workers = workers or os.cpu_count() or 1
+        self.cache_path = cache_path
+        self.cache = self._load_cache()
+        self.results: Dict[str, Dict] = {}
+        self.evaluated = 0
+        self.cached = 0
+        context = json.dumps([_file_hash(data_path), CONSTANTS_HASH, self.settings], sort_keys=True)
+        self.context = hashlib.sha1(context.encode('utf-8')).hexdigest()[:16]
+
+    def _load_cache(self) -> Dict:
+        if not self.cache_path or not os.path.exists(self.cache_path):
+            return {}
+        with open(self.cache_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    def _save_cache(self):
+        if not self.cache_path:
+            return
+        os.makedirs(os.path.dirname(self.cache_path), exist_ok=True)
+        tmp = self.cache_path + '.tmp'
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump(self.cache, f)
+        os.replace(tmp, self.cache_path)
+
+    def _key(self, params: Dict) -> str:
+        return f"{self.context}:{json.dumps(params, sort_keys=True)}"
+
+    def evaluate(self, pool, candidates: List[Dict]) -> List[Dict]:
+        """후보 묶음 평가 (캐시에 없는 것만 풀에 제출) → 결과 목록"""
+        pending = []
+        for params in candidates:
+            key = self._key(params)
+            if key in self.results:
+                continue
+            if key in self.cache:
+                self.results[key] = self.cache[key]
+                self.cached += 1
+            elif key not in {self._key(p) for p in pending}:
+                pending.append(params)
+
+        if pending:
+            evaluated = pool.map(_evaluate, pending) if pool else map(_evaluate, pending)
+            for params, value, measured in evaluated:
+                entry = {'params': params, 'score': value, 'measured': measured}
+                key = self._key(params)
+                self.results[key] = entry
+                self.cache[key] = entry
+                self.evaluated += 1
+            self._save_cache()
+        return [self.results[self._key(params)] for params in candidates]
+
+    def best(self, count: int = 1) -> List[Dict]:
+        return sorted(self.results.values(), key=lambda e: (e['score'], json.dumps(e['params'], sort_keys=True)))[:count]
+
+    def run(self, samples: int = 64, refine_starts: int = 3, refine_rounds: int = 6,
+            initial_step: float = 0.25, log=print) -> Dict:
+        rng = random.Random(self.settings['seed'])
+        pool = None
+        if self.workers > 1:
+            pool = ProcessPoolExecutor(max_workers=self.workers, initializer=_init_worker,
+                                       initargs=(self.data_path, self.settings))
+        else:
+            _init_worker(self.data_path, self.settings)
+        try:
+            started = time.perf_counter()
+            self.evaluate(pool, latin_hypercube(self.space, samples, rng))
+            log(f"  🎲 Latin hypercube {samples}개 평가 — 최고 점수 {self.best()[0]['score']:.5f} "
+                f"({time.perf_counter() - started:.1f}초)")
+
+            # 상위 후보 여러 개에서 동시에 패턴 탐색 (스텝은 공간 폭의 비율)
+            starts = [entry['params'] for entry in self.best(refine_starts)]
+            steps = [{name: (high - low) * initial_step for name, (low, high, _) in self.space.items()}
+                     for _ in starts]
+            for round_index in range(refine_rounds):
+                candidates = [n for center, step in zip(starts, steps) for n in neighbors(self.space, center, step)]
+                self.evaluate(pool, candidates)
+                for i, center in enumerate(starts):
+                    local = [center] + neighbors(self.space, center, steps[i])
+                    scored = sorted(self.evaluate(pool, local), key=lambda e: e['score'])
+                    if scored[0]['score'] < self.results[self._key(center)]['score']:
+                        starts[i] = scored[0]['params']
+                    else:
+                        steps[i] = {name: step / 2 for name, step in steps[i].items()}
+                log(f"  🔍 다듬기 {round_index + 1}/{refine_rounds} — 최고 점수 {self.best()[0]['score']:.5f}")
+                if self.best()[0]['score'] == 0:
+                    break
+        finally:
+            if pool:
+                pool.shutdown()
+        return self.best()[0]
+
+def load_spec(path: Optional[str]) -> Dict:
+    """탐색 설정 {"space": {...}, "targets": [...], "pipeline": [...]} (빠진 항목은 기본값)"""
+    spec = {'space': DEFAULT_SPACE, 'targets': DEFAULT_TARGETS, 'pipeline': DEFAULT_PIPELINE}
+    if path:
+        with open(path, 'r', encoding='utf-8') as f:
+            spec.update(json.load(f))
+    return spec
+
+def parse_args():
+    parser = argparse.ArgumentParser(description='AWS CTO Game 재조정 파라미터 자동 탐색')
+    parser.add_argument('--data', default='../game_choices_db.json', help='기준 게임 데이터 JSON')
+    parser.add_argument('--spec', help='탐색 공간/목표/파이프라인 설정 JSON')
+    parser.add_argument('--samples', type=int, default=64, help='Latin hypercube 샘플 수')
+    parser.add_argument('--refine-starts', type=int, default=3, help='패턴 탐색을 시작할 상위 후보 수')
+    parser.add_argument('--refine-rounds', type=int, default=6, help='패턴 탐색 라운드 수')
+    parser.add_argument('--games', type=int, default=400, help='후보·난이도당 시뮬레이션 게임 수')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--workers', type=int, default=0, help='워커 프로세스 수 (0이면 CPU 코어 수)')
+    parser.add_argument('--cache', default=DEFAULT_CACHE, help='점수 캐시 파일')
+    parser.add_argument('--no-cache', action='store_true', help='캐시를 읽지도 쓰지도 않음')
+    parser.add_argument('--output', default='../rebalance_tuned.json',
+                        help='최적 파라미터를 반영한 rebalance_game.py 설정 파일 경로')
+    return parser.parse_args()
+
+def main():
+    args = parse_args()
+    spec = load_spec(args.spec)
+
+    print("🎮 AWS CTO Game - Rebalance Auto-Tuner")
+    print("=" * 60)
+    print(f"\n📐 파라미터 {len(spec['space'])}개, 목표 {len(spec['targets'])}개, "
+          f"후보당 {args.games}게임 × 난이도 {len({t['difficulty'] for t in spec['targets']})}개")
+
+    tuner = Tuner(args.data, spec['space'], spec['targets'], spec['pipeline'], games=args.games,
+                  seed=args.seed, workers=args.workers, cache_path=None if args.no_cache else args.cache)
+    started = time.perf_counter()
+    best = tuner.run(samples=args.samples, refine_starts=args.refine_starts, refine_rounds=args.refine_rounds)
+    elapsed = time.perf_counter() - started
+
+    print(f"\n🏆 최적 후보 (점수 {best['score']:.5f}, 0 이면 모든 목표 충족):")
+    for name, value in best['params'].items():
+        print(f"  - {name} = {value}")
+    print("\n🎯 목표 대비:")
+    for target in spec['targets']:
+        value = best['measured'].get(f"{target['difficulty']}:{target['metric']}", 0.0)
+        mark = '✅' if target.get('min', 0) <= value <= target.get('max', 1) else '❌'
+        print(f"  {mark} {target['difficulty']} {target['metric']}: {value:.1%} "
+              f"(목표 {target.get('min', 0):.0%}~{target.get('max', 1):.0%})")
+
+    stages = [dict(entry) for entry in spec['pipeline']]
+    apply_overrides(stages, [f'{name}={json.dumps(value)}' for name, value in best['params'].items()])
+    config = {'input': os.path.relpath(args.data), 'stages': stages,
+              'tuning': {'score': best['score'], 'measured': best['measured'], 'targets': spec['targets']}}
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(config, f, ensure_ascii=False, indent=2)
+
+    print(f"\n\n✅ 탐색 완료 ({elapsed:.1f}초, 새로 평가 {tuner.evaluated}개, 캐시 재사용 {tuner.cached}개)!")
+    print(f"   설정이 {args.output}에 저장되었습니다: python3 rebalance_game.py --config {args.output} --dry-run")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,266 @@
+#!/usr/bin/env python3
+"""
+AWS CTO Game - Choice Graph Validator
+선택지 그래프 무결성 검증 (파일 / 디렉터리 / 스냅샷 저장소)
+
+턴 번호와 선택지 id 색인을 한 번만 만들고 선택지를 한 번 순회하므로 데이터 크기에 선형입니다.
+validate-data.js 는 id 목록을 배열로 검색해서 선택지 수의 제곱에 비례하고 중복 id 만 봅니다.
+
+오류 (재조정/시딩 중단):
+- next_turn 이 없는 턴을 가리킴 (-1 은 IPO 계속 진행 선택지만 허용)
+- 선택지 id 중복 ('1123' 과 1123 은 같은 id) 또는 정수가 아닌 id (choices.choiceId 는 정수)
+- 같은 턴 번호가 두 번 나옴
+- 필수 특수 턴 누락 (긴급 888, IPO 선택 950, IPO 성공 999)
+경고 (--strict 이면 오류로 취급):
+- 시작 턴과 엔진이 직접 보내는 턴(긴급/게임 오버/IPO)에서 도달할 수 없는 턴
+- INFRASTRUCTURE_CAPACITY 에 없는 인프라 이름 (용량 0 으로 계산됨)
+
+선택지가 없는 종료 턴(게임 오버 900~903, IPO 성공 999)은 flat(DB 행) 레이아웃에 나타나지 않으므로
+flat 데이터에서는 있는 것으로 봅니다. 선택지 DB 가 아닌 JSON (package.json 등)은 건너뜁니다.
+
+사용 예:
+    python3 validate_choices.py                               # backend/ 의 모든 JSON
+    python3 validate_choices.py ../game_choices_db.json --strict
+    python3 validate_choices.py --snapshots --workers 4       # 스냅샷 저장소의 모든 버전
+"""
+
+import argparse
+import glob
+import json
+import os
+import sys
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from game_engine import GAME_CONSTANTS, load_game_data
+from snapshot_store import DEFAULT_STORE, FLAT_FIELDS, SnapshotStore, _choice_key, detect_layout
+from synthetic_scenarios import reserved_turns
+
+DEFAULT_DIR = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+START_TURN = 1
+IPO_CONTINUE_CHOICE_ID = GAME_CONSTANTS['IPO_CONTINUE_CHOICE_ID']
+IPO_CONTINUE_NEXT_TURN = -1
+REQUIRED_TURNS = (
+    GAME_CONSTANTS['EMERGENCY_REDIRECT_TURN'],
+    GAME_CONSTANTS['IPO_SELECTION_TURN'],
+    GAME_CONSTANTS['IPO_FINAL_SUCCESS_TURN'],
+)
+# 선택지 없이 게임이 끝나는 턴 (flat 레이아웃에는 행이 없음)
+TERMINAL_TURNS = frozenset(range(900, 904)) | {GAME_CONSTANTS['IPO_FINAL_SUCCESS_TURN']}
+# 데이터의 next_turn 이 아니라 엔진이 직접 보내는 턴 (도달 가능성 탐색의 시작점)
+ENGINE_ENTRY_TURNS = frozenset(reserved_turns())
+KNOWN_INFRA = frozenset(GAME_CONSTANTS['INFRASTRUCTURE_CAPACITY']) | frozenset(GAME_CONSTANTS['IPO_REQUIRED_INFRA'])
+
+def _issue(check: str, message: str, turn=None, choice_id=None) -> Dict:
+    issue = {'check': check, 'message': message}
+    if turn is not None:
+        issue['turn'] = turn
+    if choice_id is not None:
+        issue['choice_id'] = choice_id
+    return issue
+
+def _iter_choices(data: List[Dict], layout: str) -> Iterable[Tuple[int, Dict]]:
+    """(턴 번호, turns 필드 이름의 선택지) — flat 행은 필드 이름만 바꿈"""
+    if layout == 'flat':
+        for record in data:
+            yield record.get('turnNumber'), {FLAT_FIELDS.get(k, k): v for k, v in record.items()
+                                              if k in FLAT_FIELDS or k == 'effects'}
+    else:
+        for turn_data in data:
+            for choice in turn_data['choices']:
+                yield turn_data['turn'], choice
+
+def validate(data: List[Dict]) -> Dict:
+    """선택지 그래프 검증 → {'layout', 'turns', 'choices', 'errors': [...], 'warnings': [...]}"""
+    layout = detect_layout(data)
+    errors: List[Dict] = []
+    warnings: List[Dict] = []
+
+    # 1. 턴 색인
+    if layout == 'flat':
+        turns = {record.get('turnNumber') for record in data}
+        known_turns = turns | TERMINAL_TURNS
+    else:
+        turns = set()
+        for turn_data in data:
+            if turn_data['turn'] in turns:
+                errors.append(_issue('duplicate_turn', f"턴 {turn_data['turn']} 이 두 번 이상 나옵니다",
+                                     turn=turn_data['turn']))
+            turns.add(turn_data['turn'])
+        known_turns = turns
+
+    for turn in REQUIRED_TURNS:
+        if turn not in known_turns:
+            errors.append(_issue('missing_special_turn', f'필수 특수 턴 {turn} 이 없습니다', turn=turn))
+
+    regular = [turn for turn in turns if isinstance(turn, int) and turn not in ENGINE_ENTRY_TURNS]
+    end_turn = max(regular) + 1 if regular else None
+
+    # 2. 선택지 한 번 순회: id 색인, next_turn 간선, 인프라 이름
+    first_seen: Dict[str, int] = {}
+    edges: Dict[int, set] = {}
+    unknown_infra: Dict[str, List] = {}   # 이름 → [선택지 수, 첫 턴, 첫 id]
+    choices = 0
+    for turn, choice in _iter_choices(data, layout):
+        choices += 1
+        choice_id = choice.get('id')
+        key = _choice_key(choice_id)
+        if not key.lstrip('-').isdigit():
+            errors.append(_issue('invalid_id', f'정수가 아닌 선택지 id: {choice_id!r}', turn, choice_id))
+        if key in first_seen:
+            where = f'턴 {turn} 안에서' if first_seen[key] == turn else f'턴 {first_seen[key]} 과 턴 {turn} 에'
+            errors.append(_issue('duplicate_id', f'선택지 id {key} 가 {where} 중복', turn, choice_id))
+        else:
+            first_seen[key] = turn
+
+        next_turn = choice.get('next_turn')
+        if next_turn is None:
+            errors.append(_issue('missing_next_turn', 'next_turn 이 없습니다', turn, choice_id))
+        elif next_turn == IPO_CONTINUE_NEXT_TURN and key == str(IPO_CONTINUE_CHOICE_ID):
+            pass  # 엔진이 IPO 달성 턴으로 되돌림
+        elif next_turn == end_turn:
+            pass  # 마지막 일반 턴 다음 — 엔진이 max_turns 로 맞추고 게임 종료
+        elif next_turn not in known_turns:
+            errors.append(_issue('dangling_next_turn', f'next_turn {next_turn} 턴이 없습니다', turn, choice_id))
+        else:
+            edges.setdefault(turn, set()).add(next_turn)
+
+        effects = choice.get('effects') or {}
+        for name in effects.get('infra') or ():
+            if name not in KNOWN_INFRA:
+                entry = unknown_infra.get(name)
+                if entry is None:
+                    unknown_infra[name] = [1, turn, choice_id]
+                else:
+                    entry[0] += 1
+
+    for name, (count, turn, choice_id) in sorted(unknown_infra.items()):
+        warnings.append(_issue('unknown_infra', f"INFRASTRUCTURE_CAPACITY 에 없는 인프라 '{name}' "
+                                                f"(선택지 {count}개, 용량 0 으로 계산)", turn, choice_id))
+
+    # 3. 도달 가능성 (시작 턴 + 엔진이 직접 보내는 턴에서 BFS)
+    roots = [turn for turn in [START_TURN, *sorted(ENGINE_ENTRY_TURNS)] if turn in turns]
+    reached = set(roots)
+    queue = deque(roots)
+    while queue:
+        for target in edges.get(queue.popleft(), ()):
+            if target not in reached:
+                reached.add(target)
+                queue.append(target)
+    for turn in sorted(turns - reached, key=lambda t: (t is None, t if isinstance(t, int) else 0)):
+        warnings.append(_issue('unreachable_turn', f'턴 {turn} 에 도달할 수 없습니다', turn=turn))
+
+    return {'layout': layout, 'turns': len(turns), 'choices': choices,
+            'errors': errors, 'warnings': warnings}
+
+# ---------------------------------------------------------------------------
+# 여러 파일 / 스냅샷 병렬 검증
+# ---------------------------------------------------------------------------
+
+def _validate_target(target: Tuple[str, str, Optional[str]]) -> Dict:
+    """('file', 경로, None) 또는 ('snapshot', 버전 id, 저장소 경로) → 리포트 (선택지 DB 가 아니면 skipped)"""
+    kind, ref, root = target
+    try:
+        if kind == 'snapshot':
+            store = SnapshotStore(root)
+            data = store.restore(store.manifest(ref))
+        else:
+            data = load_game_data(ref)
+        detect_layout(data)
+    except ValueError as e:  # JSON 오류 포함
+        return {'target': ref, 'kind': kind, 'skipped': str(e)}
+    return dict(validate(data), target=ref, kind=kind)
+
+def collect_targets(paths: List[str], snapshots: bool = False, store_root: str = DEFAULT_STORE) -> List[Tuple]:
+    targets = []
+    for path in paths:
+        if os.path.isdir(path):
+            targets.extend(('file', p, None) for p in sorted(glob.glob(os.path.join(path, '*.json'))))
+        elif glob.has_magic(path):
+            targets.extend(('file', p, None) for p in sorted(glob.glob(path)))
+        elif os.path.exists(path):
+            targets.append(('file', path, None))
+        else:
+            raise SystemExit(f"❌ 파일을 찾을 수 없습니다: {path}")
+    if snapshots:
+        store = SnapshotStore(store_root)
+        seen = set()
+        for entry in store.refs['log']:
+            if entry['id'] not in seen:
+                seen.add(entry['id'])
+                targets.append(('snapshot', entry['id'], store_root))
+    return targets
+
+def validate_targets(targets: List[Tuple], workers: int = 0) -> List[Dict]:
+    """대상별 검증을 프로세스 풀에 분산 (입력 순서대로 결과 반환)"""
+    workers = min(workers or os.cpu_count() or 1, len(targets)) or 1
+    if workers == 1:
+        return list(map(_validate_target, targets))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(_validate_target, targets))
+
+def _format_issue(issue: Dict) -> str:
+    where = []
+    if 'turn' in issue:
+        where.append(f"턴 {issue['turn']}")
+    if 'choice_id' in issue:
+        where.append(f"#{issue['choice_id']}")
+    return f"[{issue['check']}] {' '.join(where) + ': ' if where else ''}{issue['message']}"
+
+def print_report(report: Dict, limit: int = 20, label: Optional[str] = None):
+    label = label or report.get('target', '데이터')
+    if 'skipped' in report:
+        print(f"   ⏭️  {label}: 선택지 DB 아님 ({report['skipped']})")
+        return
+    icon = '❌' if report['errors'] else '⚠️ ' if report['warnings'] else '✅'
+    print(f"   {icon} {label} [{report['layout']}]: 턴 {report['turns']}개, 선택지 {report['choices']}개 — "
+          f"오류 {len(report['errors'])}건, 경고 {len(report['warnings'])}건")
+    for level, issues in (('오류', report['errors']), ('경고', report['warnings'])):
+        for issue in issues[:limit]:
+            print(f"      - {level} {_format_issue(issue)}")
+        if len(issues) > limit:
+            print(f"      … {level} {len(issues) - limit}건 더")
+
+def parse_args():
+    parser = argparse.ArgumentParser(description='선택지 그래프 무결성 검증')
+    parser.add_argument('paths', nargs='*', default=[DEFAULT_DIR],
+                        help='JSON 파일 / 디렉터리 / glob 패턴 (기본: backend/)')
+    parser.add_argument('--snapshots', action='store_true', help='스냅샷 저장소의 모든 버전도 검증')
+    parser.add_argument('--store', default=DEFAULT_STORE, help='스냅샷 저장소 경로')
+    parser.add_argument('--workers', type=int, default=0, help='워커 프로세스 수 (0이면 CPU 코어 수)')
+    parser.add_argument('--strict', action='store_true', help='경고도 실패로 처리')
+    parser.add_argument('--limit', type=int, default=20, help='대상별로 출력할 최대 항목 수')
+    parser.add_argument('--output', help='전체 리포트 JSON 저장 경로')
+    return parser.parse_args()
+
+def main():
+    args = parse_args()
+
+    print("🔍 AWS CTO Game - Choice Graph Validator")
+    print("=" * 60)
+
+    targets = collect_targets(args.paths, args.snapshots, args.store)
+    if not targets:
+        print("❌ 검증할 대상이 없습니다")
+        sys.exit(1)
+    reports = validate_targets(targets, args.workers)
+
+    print()
+    for report in reports:
+        print_report(report, args.limit)
+
+    checked = [r for r in reports if 'skipped' not in r]
+    failed = [r for r in checked if r['errors'] or (args.strict and r['warnings'])]
+    print(f"\n📊 검증 {len(checked)}개 (건너뜀 {len(reports) - len(checked)}개), 실패 {len(failed)}개")
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(reports, f, ensure_ascii=False, indent=2)
+        print(f"📝 리포트 저장: {args.output}")
+
+    sys.exit(1 if failed else 0)
+
+if __name__ == '__main__':
+    main()
@@ -8,6 +8,8 @@ export const LLMConfig = {
   cache: {
     ttlSeconds: parseInt(process.env.EVENT_CACHE_TTL_SECONDS || '300', 10),
     maxSize: parseInt(process.env.EVENT_CACHE_MAX_SIZE || '1000', 10),
+    // Pre-generated event pool (backend/scripts/event_pool_generator.py output, JSONL)
+    poolPath: process.env.LLM_EVENT_POOL_PATH || 'llm_event_pool.jsonl',
   },
   features: {
     // Disable LLM events in test environment by default
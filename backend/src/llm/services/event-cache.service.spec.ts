@@ -1,4 +1,7 @@
 import { Test, TestingModule } from '@nestjs/testing';
+import * as fs from 'fs';
+import * as os from 'os';
+import * as path from 'path';
 import { EventCacheService } from './event-cache.service';
 
 describe('EventCacheService', () => {
@@ -64,6 +67,39 @@ describe('EventCacheService', () => {
     });
   });
 
+  describe('event pool', () => {
+    let dir: string;
+
+    beforeEach(() => {
+      dir = fs.mkdtempSync(path.join(os.tmpdir(), 'event-pool-'));
+    });
+
+    afterEach(() => {
+      fs.rmSync(dir, { recursive: true, force: true });
+    });
+
+    it('should serve pooled events for the matching bucket', async () => {
+      const state = { currentTurn: 3, cash: 100000000, users: 5000, trust: 60 };
+      const event = { eventType: 'MARKET_OPPORTUNITY', title: 'pooled', description: 'd', choices: [] };
+      const file = path.join(dir, 'pool.jsonl');
+      fs.writeFileSync(
+        file,
+        JSON.stringify({ bucket: service['getCacheKey'](state), event }) + '\n' + '{"bucket": "event:0:lo',
+      );
+
+      expect(service.loadEventPool(file)).toBe(1);
+      expect(service.getPoolSize()).toBe(1);
+      expect(await service.get(state)).toEqual(event);
+      expect(await service.get({ ...state, currentTurn: 18 })).toBeNull();
+      expect(service.getMetrics().hits).toBe(1);
+    });
+
+    it('should start with an empty pool when the file is missing', () => {
+      expect(service.loadEventPool(path.join(dir, 'missing.jsonl'))).toBe(0);
+      expect(service.getPoolSize()).toBe(0);
+    });
+  });
+
   describe('metrics', () => {
     it('should track cache metrics correctly', () => {
       const initialMetrics = service.getMetrics();
@@ -1,4 +1,5 @@
 import { Injectable, Logger, OnModuleInit } from '@nestjs/common';
+import * as fs from 'fs';
 import Redis from 'ioredis';
 import { LLMConfig } from '../../config/llm.config';
 import { LLMGeneratedEvent } from '../dto/llm-response.dto';
@@ -15,6 +16,8 @@ export class EventCacheService implements OnModuleInit {
   private readonly logger = new Logger(EventCacheService.name);
   private redis: Redis | null = null;
   private inMemoryCache: Map<string, { event: LLMGeneratedEvent; expiresAt: number }> = new Map();
+  // Pre-generated events by cache key (read-only, loaded once on startup)
+  private eventPool: Map<string, LLMGeneratedEvent[]> = new Map();
   private metrics: CacheMetrics = {
     hits: 0,
     misses: 0,
@@ -23,6 +26,8 @@ export class EventCacheService implements OnModuleInit {
   };
 
   async onModuleInit() {
+    this.loadEventPool(LLMConfig.cache.poolPath);
+
     try {
       // Try to connect to Redis, but don't fail if not available
       this.redis = new Redis({
@@ -87,12 +92,67 @@ export class EventCacheService implements OnModuleInit {
       }
     }
 
+    // Fall back to the pre-generated pool
+    const pooled = this.eventPool.get(key);
+    if (pooled && pooled.length > 0) {
+      this.metrics.hits++;
+      this.updateHitRate();
+      this.logger.debug(`Cache hit (pool) for key: ${key}`);
+      return pooled[Math.floor(Math.random() * pooled.length)];
+    }
+
     this.metrics.misses++;
     this.updateHitRate();
     this.logger.debug(`Cache miss for key: ${key}`);
     return null;
   }
 
+  /**
+   * Load the pre-generated event pool (one JSON object per line with `bucket` and `event`).
+   * The bucket is the same key getCacheKey() produces. A missing file leaves the pool empty.
+   */
+  loadEventPool(path: string): number {
+    this.eventPool.clear();
+    if (!path || !fs.existsSync(path)) {
+      this.logger.log(`Event pool not found at ${path}, using live generation only`);
+      return 0;
+    }
+
+    let loaded = 0;
+    let skipped = 0;
+    for (const line of fs.readFileSync(path, 'utf-8').split('\n')) {
+      if (!line.trim()) {
+        continue;
+      }
+      try {
+        const entry = JSON.parse(line);
+        if (typeof entry.bucket !== 'string' || !entry.event) {
+          skipped++;
+          continue;
+        }
+        const events = this.eventPool.get(entry.bucket) ?? [];
+        events.push(entry.event);
+        this.eventPool.set(entry.bucket, events);
+        loaded++;
+      } catch {
+        // A run interrupted mid-write can leave a truncated last line
+        skipped++;
+      }
+    }
+
+    this.logger.log(
+      `Loaded ${loaded} pooled events across ${this.eventPool.size} buckets from ${path}` +
+        (skipped > 0 ? ` (${skipped} lines skipped)` : ''),
+    );
+    return loaded;
+  }
+
+  getPoolSize(): number {
+    let size = 0;
+    this.eventPool.forEach((events) => (size += events.length));
+    return size;
+  }
+
   async set(gameState: any, event: LLMGeneratedEvent): Promise<void> {
     const key = this.getCacheKey(gameState);
     const ttl = LLMConfig.cache.ttlSeconds;